@@ -75,7 +75,12 @@ from .core.mixins import (
 
 # Simplified database and cache
 from .db import Database, create_database
-from .db.work_claim import claim_record, delete_claimed_record, release_claim
+from .db.work_claim import (
+    claim_record,
+    complete_claim,
+    delete_claimed_record,
+    release_claim,
+)
 
 # Observability primitives
 from .observability import MetricsRecorder, NullMetricsRecorder
@@ -121,6 +126,7 @@ __all__ = [
     # Work-claim helpers
     "claim_record",
     "release_claim",
+    "complete_claim",
     "delete_claimed_record",
     # Core entities
     "Object",
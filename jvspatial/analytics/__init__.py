@@ -0,0 +1,51 @@
+"""Whole-graph analytics over an in-memory CSR snapshot.
+
+Walkers cost a database hop per step, which rules them out for PageRank,
+components or shortest paths over a whole graph. This package streams the
+node and edge collections once (``find_iter``) into a compressed sparse
+row (CSR) snapshot, runs vectorized NumPy kernels over it and writes
+results back with ``bulk_save``::
+
+    from jvspatial.analytics import load_snapshot, pagerank, top_k, write_back
+
+    graph = await load_snapshot(nodes=["City"], edges=["Highway"])
+    ranks = pagerank(graph)
+    print(top_k(graph, ranks, k=10))
+    await write_back(graph, "rank", ranks)
+
+Requires NumPy: ``pip install jvspatial[analytics]``.
+"""
+
+try:
+    import numpy  # type: ignore[import-not-found]  # noqa: F401
+except ImportError as exc:  # pragma: no cover - exercised only without NumPy
+    raise ImportError(
+        "jvspatial.analytics requires the 'numpy' package. "
+        "Install it with: pip install jvspatial[analytics]"
+    ) from exc
+
+from .algorithms import (
+    bfs,
+    degree_centrality,
+    degree_histogram,
+    pagerank,
+    shortest_paths,
+    strongly_connected_components,
+    top_k,
+    weakly_connected_components,
+)
+from .snapshot import CSRGraph, load_snapshot, write_back
+
+__all__ = [
+    "CSRGraph",
+    "bfs",
+    "degree_centrality",
+    "degree_histogram",
+    "load_snapshot",
+    "pagerank",
+    "shortest_paths",
+    "strongly_connected_components",
+    "top_k",
+    "weakly_connected_components",
+    "write_back",
+]
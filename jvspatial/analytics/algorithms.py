@@ -0,0 +1,287 @@
+"""Graph algorithms over a :class:`~jvspatial.analytics.snapshot.CSRGraph`.
+
+Results are NumPy arrays aligned with ``graph.ids``, ready for
+:func:`~jvspatial.analytics.snapshot.write_back`. BFS, PageRank, weakly
+connected components and the degree measures are vectorized over whole
+frontiers or edge arrays. Weighted shortest paths (Dijkstra) and strongly
+connected components (Tarjan) are inherently sequential and loop in
+Python, with NumPy doing the per-node relaxation.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .snapshot import CSRGraph
+
+NodeRef = Union[str, int]
+
+
+def _gather(graph: CSRGraph, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """``(parent, neighbor)`` index arrays for every out-edge of ``frontier``."""
+    starts = graph.offsets[frontier]
+    lengths = graph.offsets[frontier + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty
+    run_starts = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    positions = run_starts + np.arange(total)
+    return np.repeat(frontier, lengths), graph.indices[positions]
+
+
+def bfs(
+    graph: CSRGraph,
+    sources: Union[NodeRef, Iterable[NodeRef]],
+    *,
+    direction: str = "out",
+    max_depth: Optional[int] = None,
+) -> np.ndarray:
+    """Hop distance from the nearest source (``int32``, ``-1`` unreached).
+
+    Each level is one vectorized gather over the whole frontier.
+    """
+    view = graph.oriented(direction)
+    depth = np.full(graph.num_nodes, -1, dtype=np.int32)
+    frontier = np.unique(graph.resolve(sources))
+    depth[frontier] = 0
+    level = 0
+    while frontier.size and (max_depth is None or level < max_depth):
+        level += 1
+        _, reached = _gather(view, frontier)
+        frontier = np.unique(reached[depth[reached] < 0])
+        depth[frontier] = level
+    return depth
+
+
+def shortest_paths(
+    graph: CSRGraph,
+    source: NodeRef,
+    *,
+    direction: str = "out",
+    weighted: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Single-source shortest paths.
+
+    Uses Dijkstra over ``graph.weights`` when the snapshot has weights and
+    ``weighted`` is set, otherwise BFS with unit weights.
+
+    Returns:
+        ``(distance, predecessor)``: ``float64`` distances (``inf`` when
+        unreached) and ``int32`` predecessor indices (``-1`` for the source
+        and unreached nodes).
+
+    Raises:
+        ValueError: If the graph has negative weights.
+    """
+    view = graph.oriented(direction)
+    n = graph.num_nodes
+    start = int(graph.resolve(source)[0])
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int32)
+    dist[start] = 0.0
+
+    if view.weights is None or not weighted:
+        frontier = np.asarray([start], dtype=np.int32)
+        level = 0
+        while frontier.size:
+            level += 1
+            parents, reached = _gather(view, frontier)
+            fresh = np.isinf(dist[reached])
+            reached, first = np.unique(reached[fresh], return_index=True)
+            dist[reached] = level
+            pred[reached] = parents[fresh][first]
+            frontier = reached
+        return dist, pred
+
+    if view.weights.size and view.weights.min() < 0:
+        raise ValueError("shortest_paths requires non-negative edge weights")
+    done = np.zeros(n, dtype=bool)
+    heap: List[Tuple[float, int]] = [(0.0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        lo, hi = view.offsets[u], view.offsets[u + 1]
+        peers = view.indices[lo:hi]
+        candidate = d + view.weights[lo:hi]
+        better = candidate < dist[peers]
+        if not better.any():
+            continue
+        # Parallel edges: keep the cheapest candidate per peer.
+        order = np.lexsort((candidate[better], peers[better]))
+        peers, candidate = peers[better][order], candidate[better][order]
+        peers, first = np.unique(peers, return_index=True)
+        candidate = candidate[first]
+        dist[peers] = candidate
+        pred[peers] = u
+        for v, dv in zip(peers.tolist(), candidate.tolist()):
+            heapq.heappush(heap, (dv, v))
+    return dist, pred
+
+
+def pagerank(
+    graph: CSRGraph,
+    *,
+    damping: float = 0.85,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    weighted: bool = False,
+) -> np.ndarray:
+    """Compute PageRank scores (``float64``, summing to 1).
+
+    Power iteration with one ``bincount`` over the edge array per step.
+    Dangling nodes spread their rank evenly. With ``weighted``, a node's
+    rank is split across its out-edges in proportion to their weights.
+    """
+    n = graph.num_nodes
+    if n == 0:
+        return np.zeros(0)
+    sources = graph.sources()
+    out_weight = graph.out_degree().astype(np.float64)
+    share = np.ones(graph.num_edges)
+    if weighted and graph.weights is not None:
+        share = graph.weights.astype(np.float64)
+        out_weight = np.bincount(sources, weights=share, minlength=n)
+    dangling = out_weight == 0
+    safe = np.where(dangling, 1.0, out_weight)
+    share = share / safe[sources]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(graph.indices, weights=rank[sources] * share, minlength=n)
+        updated = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+        converged = np.abs(updated - rank).sum() < tol
+        rank = updated
+        if converged:
+            break
+    return rank / rank.sum()
+
+
+def weakly_connected_components(graph: CSRGraph) -> np.ndarray:
+    """Component label per node (``int32``): the smallest index in it.
+
+    Min-label propagation over the edge array with pointer jumping, so the
+    number of rounds grows with the logarithm of the diameter rather than
+    the diameter itself.
+    """
+    labels = np.arange(graph.num_nodes, dtype=np.int32)
+    sources, targets = graph.sources(), graph.indices
+    while True:
+        previous = labels.copy()
+        low = np.minimum(labels[sources], labels[targets])
+        np.minimum.at(labels, sources, low)
+        np.minimum.at(labels, targets, low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def strongly_connected_components(graph: CSRGraph) -> np.ndarray:
+    """Component label per node (``int32``): the smallest index in it.
+
+    Iterative Tarjan, O(V + E).
+    """
+    n = graph.num_nodes
+    offsets, indices = graph.offsets.tolist(), graph.indices.tolist()
+    order = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    labels = np.full(n, -1, dtype=np.int32)
+    counter = 0
+    for root in range(n):
+        if order[root] >= 0:
+            continue
+        work = [(root, offsets[root])]
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            node, cursor = work[-1]
+            if cursor < offsets[node + 1]:
+                work[-1] = (node, cursor + 1)
+                peer = indices[cursor]
+                if order[peer] < 0:
+                    order[peer] = low[peer] = counter
+                    counter += 1
+                    stack.append(peer)
+                    on_stack[peer] = True
+                    work.append((peer, offsets[peer]))
+                elif on_stack[peer]:
+                    low[node] = min(low[node], order[peer])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == order[node]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    members.append(member)
+                    if member == node:
+                        break
+                labels[members] = min(members)
+    return labels
+
+
+def degree_histogram(graph: CSRGraph, direction: str = "out") -> np.ndarray:
+    """``hist[d]`` is the number of nodes with degree ``d``.
+
+    ``both`` counts in- plus out-degree (a self-loop twice).
+    """
+    if direction == "in":
+        degree = graph.in_degree()
+    elif direction == "both":
+        degree = graph.in_degree() + graph.out_degree()
+    else:
+        degree = graph.out_degree()
+    return np.bincount(degree, minlength=1)
+
+
+def degree_centrality(graph: CSRGraph, direction: str = "both") -> np.ndarray:
+    """Degree divided by ``n - 1`` (``float64``)."""
+    if direction == "in":
+        degree = graph.in_degree()
+    elif direction == "out":
+        degree = graph.out_degree()
+    else:
+        degree = graph.in_degree() + graph.out_degree()
+    return degree / max(graph.num_nodes - 1, 1)
+
+
+def top_k(graph: CSRGraph, scores: np.ndarray, k: int = 10) -> List[Tuple[str, float]]:
+    """The ``k`` highest-scoring ``(node id, score)`` pairs, best first.
+
+    Selection is ``argpartition`` (linear), so only the ``k`` winners are
+    sorted; ties among them are ordered by index.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return []
+    head = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(k)
+    head = head[np.lexsort((head, -scores[head]))]
+    return [(graph.ids[i], float(scores[i])) for i in head.tolist()]
+
+
+__all__ = [
+    "bfs",
+    "degree_centrality",
+    "degree_histogram",
+    "pagerank",
+    "shortest_paths",
+    "strongly_connected_components",
+    "top_k",
+    "weakly_connected_components",
+]
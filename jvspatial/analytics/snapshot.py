@@ -0,0 +1,321 @@
+"""CSR snapshots of the graph, and writing results back to nodes.
+
+A :class:`CSRGraph` holds the out-edges of ``n`` nodes in two arrays:
+``indices`` lists every edge's target index grouped by source, and
+``offsets[i]:offsets[i + 1]`` is the slice of node ``i``'s edges. With
+``int32`` arrays that is 4 bytes per edge plus 4 per node (8 more per edge
+with weights), so tens of millions of edges take a few hundred MB. The
+``ids`` list and its reverse map are the only per-node Python objects.
+
+Edges point from ``source`` to ``target``, as for ``Node.nodes()``;
+:meth:`CSRGraph.reverse` and :meth:`CSRGraph.undirected` give the other
+views.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from contextlib import AsyncExitStack
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+
+logger = logging.getLogger(__name__)
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _entity_names(entities: Optional[Iterable[Union[str, type]]]) -> List[str]:
+    return [e if isinstance(e, str) else e.__name__ for e in entities or ()]
+
+
+class CSRGraph:
+    """Directed graph in compressed sparse row form.
+
+    Attributes:
+        ids: Node id of every index.
+        offsets: ``n + 1`` edge offsets (``int32``, or ``int64`` past
+            2**31 edges).
+        indices: Target index of every edge, grouped by source (``int32``).
+        weights: Per-edge weights aligned with ``indices``, or None.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        offsets: np.ndarray,
+        indices: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> None:
+        self.ids = ids
+        self.offsets = offsets
+        self.indices = indices
+        self.weights = weights
+        self._index: Optional[Dict[str, int]] = None
+        self._reverse: Optional[CSRGraph] = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        ids: List[str],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> "CSRGraph":
+        """Build from parallel source/target index arrays (any order)."""
+        n = len(ids)
+        order = np.argsort(sources, kind="stable")
+        counts = np.bincount(sources, minlength=n)
+        dtype = np.int32 if len(sources) <= _INT32_MAX else np.int64
+        offsets = np.zeros(n + 1, dtype=dtype)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(
+            ids,
+            offsets,
+            np.ascontiguousarray(targets[order], dtype=np.int32),
+            None if weights is None else np.ascontiguousarray(weights[order]),
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the snapshot."""
+        return len(self.ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of directed edges in the snapshot."""
+        return int(self.offsets[-1])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays (ids excluded)."""
+        total = self.offsets.nbytes + self.indices.nbytes
+        return total + (self.weights.nbytes if self.weights is not None else 0)
+
+    def index_of(self, node_id: str) -> int:
+        """Index of ``node_id``; raises ``KeyError`` when not in the snapshot."""
+        if self._index is None:
+            self._index = {node_id: i for i, node_id in enumerate(self.ids)}
+        return self._index[node_id]
+
+    def resolve(self, nodes: Union[str, int, Iterable[Union[str, int]]]) -> np.ndarray:
+        """Indices of node ids (or indices) as an ``int32`` array."""
+        if isinstance(nodes, (str, int, np.integer)):
+            nodes = [nodes]
+        return np.asarray(
+            [
+                n if isinstance(n, (int, np.integer)) else self.index_of(n)
+                for n in nodes
+            ],
+            dtype=np.int32,
+        )
+
+    def sources(self) -> np.ndarray:
+        """Source index of every edge, aligned with ``indices``."""
+        return np.repeat(
+            np.arange(self.num_nodes, dtype=np.int32), np.diff(self.offsets)
+        )
+
+    def out_degree(self) -> np.ndarray:
+        """Out-degree of every node."""
+        return np.diff(self.offsets)
+
+    def in_degree(self) -> np.ndarray:
+        """In-degree of every node."""
+        return np.bincount(self.indices, minlength=self.num_nodes)
+
+    def neighbors(self, node: Union[str, int]) -> np.ndarray:
+        """Out-neighbor indices of one node."""
+        i = node if isinstance(node, (int, np.integer)) else self.index_of(node)
+        return self.indices[self.offsets[i] : self.offsets[i + 1]]
+
+    def reverse(self) -> "CSRGraph":
+        """The transposed graph (in-edges become out-edges); cached."""
+        if self._reverse is None:
+            self._reverse = CSRGraph.from_edges(
+                self.ids, self.indices, self.sources(), self.weights
+            )
+            self._reverse._index = self._index
+            self._reverse._reverse = self
+        return self._reverse
+
+    def undirected(self) -> "CSRGraph":
+        """Every edge in both directions (self-loops once)."""
+        src, dst = self.sources(), self.indices
+        keep = src != dst
+        weights = None
+        if self.weights is not None:
+            weights = np.concatenate([self.weights, self.weights[keep]])
+        graph = CSRGraph.from_edges(
+            self.ids,
+            np.concatenate([src, dst[keep]]),
+            np.concatenate([dst, src[keep]]),
+            weights,
+        )
+        graph._index = self._index
+        return graph
+
+    def oriented(self, direction: str) -> "CSRGraph":
+        """``out`` (self), ``in`` (:meth:`reverse`) or ``both`` (:meth:`undirected`)."""
+        if direction == "in":
+            return self.reverse()
+        if direction == "both":
+            return self.undirected()
+        return self
+
+    def __repr__(self) -> str:
+        """Node and edge counts; the arrays are not printed."""
+        return f"CSRGraph(nodes={self.num_nodes}, edges={self.num_edges})"
+
+
+async def load_snapshot(
+    context: Optional["GraphContext"] = None,
+    *,
+    nodes: Optional[Iterable[Union[str, type]]] = None,
+    edges: Optional[Iterable[Union[str, type]]] = None,
+    weight: Optional[str] = None,
+    default_weight: float = 1.0,
+    batch_size: int = 1000,
+) -> CSRGraph:
+    """Stream the node and edge collections into a :class:`CSRGraph`.
+
+    Args:
+        context: Graph context to read through (default context if None).
+        nodes: Node entity names or classes to include (all when None).
+        edges: Edge entity names or classes to include (all when None).
+        weight: Edge property to read as the edge weight.
+        default_weight: Weight of edges without a numeric ``weight``.
+        batch_size: ``find_iter`` page size.
+
+    Returns:
+        The snapshot. Edges with an endpoint outside the node set are
+        dropped.
+    """
+    if context is None:
+        from jvspatial.core.context import get_default_context
+
+        context = get_default_context()
+    db = context.database
+
+    node_names, edge_names = _entity_names(nodes), _entity_names(edges)
+    node_query: Dict[str, Any] = {"entity": {"$in": node_names}} if node_names else {}
+    edge_query: Dict[str, Any] = {"entity": {"$in": edge_names}} if edge_names else {}
+
+    ids: List[str] = []
+    index: Dict[str, int] = {}
+    async for record in db.find_iter(
+        context._get_collection_name("n"), node_query, batch_size=batch_size
+    ):
+        node_id = str(record.get("id") or record.get("_id") or "")
+        if node_id and node_id not in index:
+            index[node_id] = len(ids)
+            ids.append(node_id)
+
+    # Typed arrays keep the streamed edges compact until they become NumPy.
+    sources, targets = array("i"), array("i")
+    weights = array("d") if weight else None
+    dropped = 0
+    async for record in db.find_iter(
+        context._get_collection_name("e"), edge_query, batch_size=batch_size
+    ):
+        source = index.get(record.get("source"))
+        target = index.get(record.get("target"))
+        if source is None or target is None:
+            dropped += 1
+            continue
+        sources.append(source)
+        targets.append(target)
+        if weights is not None:
+            value = (record.get("context") or {}).get(weight)
+            numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+            weights.append(float(value) if numeric else default_weight)
+    if dropped:
+        logger.debug("load_snapshot dropped %d edges outside the node set", dropped)
+
+    graph = CSRGraph.from_edges(
+        ids,
+        np.frombuffer(sources, dtype=np.intc),
+        np.frombuffer(targets, dtype=np.intc),
+        None if weights is None else np.frombuffer(weights, dtype=np.float64),
+    )
+    graph._index = index
+    return graph
+
+
+async def write_back(
+    graph: CSRGraph,
+    field: str,
+    values: Union[np.ndarray, Sequence[Any]],
+    context: Optional["GraphContext"] = None,
+    *,
+    batch_size: int = 500,
+) -> int:
+    """Store ``values[i]`` as property ``field`` of node ``graph.ids[i]``.
+
+    Node documents are read with ``find_many`` and written with
+    ``bulk_save`` in chunks of ``batch_size``, each under the per-node edge
+    write guards so in-process edge writes cannot interleave. Cached
+    instances of the written nodes are evicted.
+
+    Args:
+        graph: Snapshot the values are aligned with.
+        field: Node property to set.
+        values: One value per node (NumPy scalars are converted).
+        context: Graph context to write through (default context if None).
+        batch_size: Nodes per ``find_many``/``bulk_save`` round trip.
+
+    Returns:
+        Number of node documents written.
+    """
+    if context is None:
+        from jvspatial.core.context import get_default_context
+
+        context = get_default_context()
+    if len(values) != graph.num_nodes:
+        raise ValueError(
+            f"write_back got {len(values)} values for {graph.num_nodes} nodes"
+        )
+    plain = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    collection = context._get_collection_name("n")
+    db = context.database
+    written = 0
+    for start in range(0, graph.num_nodes, batch_size):
+        chunk = sorted(
+            range(start, min(start + batch_size, graph.num_nodes)),
+            key=graph.ids.__getitem__,
+        )
+        async with AsyncExitStack() as stack:
+            for i in chunk:
+                await stack.enter_async_context(
+                    context._node_edge_write_guard(graph.ids[i])
+                )
+            docs = await db.find_many(collection, [graph.ids[i] for i in chunk])
+            changed = []
+            for i in chunk:
+                doc = docs.get(graph.ids[i])
+                if doc is None:
+                    continue
+                doc.setdefault("context", {})[field] = plain[i]
+                changed.append(doc)
+            if changed:
+                await db.bulk_save(collection, changed)
+        for doc in changed:
+            await context._evict_from_cache(str(doc.get("id")))
+        written += len(changed)
+    return written
+
+
+__all__ = ["CSRGraph", "load_snapshot", "write_back"]
@@ -48,20 +48,23 @@ class TokenCleanupService:
 
             results = await self.context.database.find(collection, final_query)
 
-            removed_count = 0
+            expired = []
             for data in results:
                 try:
                     blacklist_entry = await self.context._deserialize_entity(
                         TokenBlacklist, data
                     )
                     if blacklist_entry and blacklist_entry.expires_at < now:
-                        blacklist_entry._graph_context = self.context
-                        await self.context.delete(blacklist_entry)
-                        removed_count += 1
+                        expired.append(blacklist_entry)
                 except Exception as e:
-                    self._logger.warning(f"Error deleting blacklist entry: {e}")
+                    self._logger.warning(f"Error reading blacklist entry: {e}")
                     continue
 
+            # One bulk delete for the whole expired set
+            if expired:
+                await self.context.delete_batch(expired)
+            removed_count = len(expired)
+
             if removed_count > 0:
                 self._logger.info(
                     f"Cleaned up {removed_count} expired blacklist entries"
@@ -90,20 +93,23 @@ class TokenCleanupService:
 
             results = await self.context.database.find(collection, final_query)
 
-            removed_count = 0
+            expired = []
             for data in results:
                 try:
                     refresh_token = await self.context._deserialize_entity(
                         RefreshToken, data
                     )
                     if refresh_token and refresh_token.expires_at < now:
-                        refresh_token._graph_context = self.context
-                        await self.context.delete(refresh_token)
-                        removed_count += 1
+                        expired.append(refresh_token)
                 except Exception as e:
-                    self._logger.warning(f"Error deleting refresh token: {e}")
+                    self._logger.warning(f"Error reading refresh token: {e}")
                     continue
 
+            # One bulk delete for the whole expired set
+            if expired:
+                await self.context.delete_batch(expired)
+            removed_count = len(expired)
+
             if removed_count > 0:
                 self._logger.info(f"Cleaned up {removed_count} expired refresh tokens")
 
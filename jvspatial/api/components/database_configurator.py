@@ -218,6 +218,11 @@ class DatabaseConfigurator:
             # Set as default context so entities can use it automatically
             set_default_context(graph_context)
 
+            if observability_kwargs["observe"]:
+                # Importing registers the admin slow-query endpoint with the
+                # @endpoint module tracker; the app build syncs it.
+                import jvspatial.api.endpoints.db_status  # noqa: F401
+
             self._logger.debug(
                 f"🎯 GraphContext initialized with {db_type} database (prime) and set as default"
             )
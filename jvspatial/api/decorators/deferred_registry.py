@@ -158,6 +158,7 @@ def _register_deferred_endpoint(server: "Server", deferred: DeferredEndpoint) ->
             "signature_required",
             "webhook_auth",
             "response",
+            "stream",
             "rate_limit",
             "kwargs",
         ]
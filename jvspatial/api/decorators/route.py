@@ -51,6 +51,8 @@ def endpoint(
     webhook_auth: Optional[Union[str, bool]] = None,
     # Response schema
     response: Optional[Any] = None,
+    # Streaming walker reports
+    stream: Optional[str] = None,
     # Rate limiting
     rate_limit: Optional[Dict[str, int]] = None,
     # Additional configuration
@@ -74,6 +76,9 @@ def endpoint(
             - "api_key_path": Authenticate via API key in URL path
             - False/None: No API key authentication
         response: Response schema definition (ResponseSchema instance)
+        stream: For traversal walkers, send report items as they are
+            produced: ``"ndjson"`` (one JSON document per line) or
+            ``"sse"`` (server-sent events). Default is one JSON body.
         rate_limit: Rate limit configuration dict with "requests" and "window" keys
         **kwargs: Additional configuration options
 
@@ -106,6 +111,11 @@ def endpoint(
         async def get_users():
             return {"users": [], "count": 0}
 
+        # Walker streaming its reports as NDJSON
+        @endpoint("/api/crawl", methods=["POST"], stream="ndjson")
+        class Crawler(Walker):
+            ...
+
         # Webhook endpoint
         @endpoint("/webhook", webhook=True, signature_required=True)
         async def webhook_handler():
@@ -117,6 +127,9 @@ def endpoint(
             return {"status": "received"}
     """
 
+    if stream is not None and stream not in ("ndjson", "sse"):
+        raise ValueError(f"stream must be 'ndjson' or 'sse', got {stream!r}")
+
     def decorator(
         target: Union[Callable, type], _path: str = path
     ) -> Union[Callable, type]:
@@ -160,6 +173,7 @@ def endpoint(
                 "signature_required",
                 "webhook_auth",
                 "response",
+                "stream",
                 "rate_limit",
                 "is_function",
             ]
@@ -174,6 +188,7 @@ def endpoint(
             "signature_required": signature_required,
             "webhook_auth": webhook_auth,
             "response": response,
+            "stream": stream,
             "rate_limit": rate_limit,
             "is_function": is_func,
             "kwargs": config_kwargs,
@@ -0,0 +1,93 @@
+"""Admin endpoint exposing the database slow-query log and index advice.
+
+Registered only when database observability is enabled
+(``JVSPATIAL_OBSERVABILITY_ENABLED``): importing this module from
+:class:`~jvspatial.api.components.database_configurator.DatabaseConfigurator`
+lets the ``@endpoint`` module tracker pick it up when the app is built.
+The path lives under ``/status`` so the auth middleware keeps it
+admin-only even if the route config were to lose its ``roles``.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import Query
+
+from jvspatial.api.decorators.route import endpoint
+from jvspatial.db._observable import ObservableDatabase, find_observable
+from jvspatial.db.manager import get_database_manager
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_observable() -> Optional[ObservableDatabase]:
+    """Locate the observability wrapper on the current (then prime) database."""
+    manager = get_database_manager()
+    for getter in (manager.get_current_database, manager.get_prime_database):
+        try:
+            found = find_observable(getter())
+        except Exception:
+            found = None
+        if found is not None:
+            return found
+    return None
+
+
+def slow_query_report(
+    observed: Optional[ObservableDatabase],
+    *,
+    limit: int = 50,
+    min_occurrences: int = 1,
+) -> Dict[str, Any]:
+    """Build the JSON payload shared by the admin endpoint and the CLI."""
+    if observed is None:
+        return {"enabled": False, "entries": [], "suggestions": []}
+    entries = observed.slow_queries.entries()
+    return {
+        "enabled": True,
+        "backend": observed.backend,
+        "slow_query_ms": observed.slow_query_ms,
+        "capacity": observed.slow_queries.maxlen,
+        "dropped": observed.slow_queries.dropped,
+        "entries": [e.to_dict() for e in entries[-limit:]][::-1],
+        "suggestions": [
+            s.to_dict()
+            for s in observed.suggest_indexes(min_occurrences=min_occurrences)
+        ],
+    }
+
+
+@endpoint(
+    "/status/db/slow-queries",
+    methods=["GET"],
+    auth=True,
+    roles=["admin"],
+    tags=["App"],
+)
+async def get_slow_queries(
+    limit: int = Query(  # noqa: B008
+        50, ge=1, le=1000, description="Most recent slow entries to return"
+    ),
+    min_occurrences: int = Query(  # noqa: B008
+        1, ge=1, description="Only suggest indexes seen at least this often"
+    ),
+) -> Dict[str, Any]:
+    """Return recent slow database operations and suggested indexes.
+
+    **Returns:**
+    - `enabled`: whether the database is wrapped in `ObservableDatabase`
+    - `entries`: newest-first slow operations (normalized query shape,
+      sort, row count, `pushed_down`)
+    - `suggestions`: ranked `create_index` declarations
+
+    **Example:**
+    ```
+    GET /api/status/db/slow-queries?limit=20&min_occurrences=2
+    ```
+    """
+    return slow_query_report(
+        _resolve_observable(), limit=limit, min_occurrences=min_occurrences
+    )
+
+
+__all__ = ["get_slow_queries", "slow_query_report"]
@@ -23,6 +23,7 @@ from typing import (
 
 from fastapi import APIRouter, Body, Depends, HTTPException
 from fastapi.params import Query
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from jvspatial.core.entities import Walker
@@ -183,6 +184,7 @@ class BaseRouter:
                 "signature_required",
                 "webhook_auth",
                 "response",
+                "stream",
                 "rate_limit",
             ]
         }
@@ -474,7 +476,7 @@ class EndpointRouter(BaseRouter):
             else f"Execute {walker_cls.__name__} Walker"
         )
 
-        async def get_handler(**kwargs) -> Dict[str, Any]:
+        async def get_handler(**kwargs) -> Union[Dict[str, Any], StreamingResponse]:
             try:
                 # Create walker instance
                 start_node = kwargs.pop("start_node", None)
@@ -574,7 +576,7 @@ class EndpointRouter(BaseRouter):
             # We'll set the proper type annotation after function creation
             async def post_handler(
                 params: Any = DEFAULT_BODY,  # type: ignore[assignment]
-            ) -> Dict[str, Any]:  # noqa: B008
+            ) -> Union[Dict[str, Any], StreamingResponse]:  # noqa: B008
                 # Copy auth metadata from walker class to handler
                 from typing import cast as cast_fn
 
@@ -670,7 +672,7 @@ class EndpointRouter(BaseRouter):
             # This allows FastAPI to generate proper request body schema with field definitions
             post_handler.__annotations__ = {
                 "params": param_model,
-                "return": Dict[str, Any],
+                "return": Union[Dict[str, Any], StreamingResponse],
             }
 
         else:
@@ -682,7 +684,9 @@ class EndpointRouter(BaseRouter):
                 else f"Execute {walker_cls.__name__} Walker"
             )
 
-            async def post_handler() -> Dict[str, Any]:  # type: ignore[misc]
+            async def post_handler() -> (  # type: ignore[misc]
+                Union[Dict[str, Any], StreamingResponse]
+            ):
                 # Copy auth metadata from walker class to handler
                 from typing import cast as cast_fn
 
@@ -748,6 +752,10 @@ class EndpointRouter(BaseRouter):
             post_handler.__doc__ = walker_docstring
             post_handler.__name__ = f"{walker_cls.__name__}_endpoint"
 
+        # A stream walker's StreamingResponse is sent as is; JSON results
+        # keep the Dict response model
+        kwargs.setdefault("response_model", Dict[str, Any])
+
         # Add route
         self.add_route(
             path=path,
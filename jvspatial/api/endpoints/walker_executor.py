@@ -2,13 +2,34 @@
 
 This module provides a unified execution path for walkers, eliminating
 duplication between GET and POST handlers.
+
+Traversal walkers registered with ``@endpoint(..., stream="ndjson")`` or
+``stream="sse"`` answer with a chunked response that carries each report
+item as it is produced (see :meth:`Walker.stream`), instead of one JSON
+body after the whole traversal.
 """
 
-from typing import Any, Dict, Optional, Protocol, runtime_checkable
+import json
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from jvspatial.core.context import get_default_context
 from jvspatial.core.entities import Node, Walker
 
+STREAM_FORMATS = ("ndjson", "sse")
+
+_STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
 
 @runtime_checkable
 class DirectExecutionWalker(Protocol):
@@ -47,7 +68,7 @@ class WalkerExecutor:
         walker: Walker,
         walker_cls: type[Walker],
         start_node: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], StreamingResponse]:
         """Execute a walker instance and return formatted result.
 
         Args:
@@ -56,24 +77,29 @@ class WalkerExecutor:
             start_node: Optional start node ID for graph traversal
 
         Returns:
-            Formatted response dictionary
+            Formatted response dictionary, or a ``StreamingResponse`` for
+            walkers registered with ``stream=``
 
         Raises:
             HTTPException: For various error conditions
         """
+        config = getattr(walker_cls, "_jvspatial_endpoint_config", None) or {}
+
         # Check if walker implements direct execution protocol
         if isinstance(walker, DirectExecutionWalker) or (
             hasattr(walker, "execute") and callable(walker.execute)
         ):
             result = await walker.execute()
+        elif config.get("stream"):
+            return await self._stream_traversal_walker(
+                walker, config["stream"], start_node
+            )
         else:
             # Traditional graph traversal walker
             result = await self._execute_traversal_walker(walker, start_node)
 
         # Check if response schema is defined
-        has_response_schema = bool(
-            getattr(walker_cls, "_jvspatial_endpoint_config", {}).get("response")
-        )
+        has_response_schema = bool(config.get("response"))
 
         # Return result directly if schema defined, otherwise format it
         if has_response_schema:
@@ -96,19 +122,7 @@ class WalkerExecutor:
         Raises:
             HTTPException: For various error conditions
         """
-        # Resolve start node
-        if start_node:
-            start = await get_default_context().get(Node, start_node)
-            if not start:
-                self.router.raise_error(404, f"Start node '{start_node}' not found")
-        else:
-            # Default to root node
-            start = await get_default_context().get(Node, "n.Root.root")
-            if not start:
-                self.router.raise_error(
-                    500,
-                    "Root node not found - database may not be properly initialized",
-                )
+        start = await self._resolve_start_node(start_node)
 
         # Execute walker
         result = await walker.spawn(start)
@@ -165,5 +179,87 @@ class WalkerExecutor:
 
         return response
 
+    async def _resolve_start_node(self, start_node: Optional[str]) -> Node:
+        """Load the start node by id, or the root node when none is given.
+
+        Raises:
+            HTTPException: 404 for an unknown start node, 500 without root
+        """
+        # Resolve start node
+        if start_node:
+            start = await get_default_context().get(Node, start_node)
+            if not start:
+                self.router.raise_error(404, f"Start node '{start_node}' not found")
+        else:
+            # Default to root node
+            start = await get_default_context().get(Node, "n.Root.root")
+            if not start:
+                self.router.raise_error(
+                    500,
+                    "Root node not found - database may not be properly initialized",
+                )
+
+        return start
+
+    async def _stream_traversal_walker(
+        self, walker: Walker, fmt: str, start_node: Optional[str] = None
+    ) -> StreamingResponse:
+        """Run a traversal walker and stream its reports as NDJSON or SSE.
+
+        The start node is resolved before the response starts, so a missing
+        node is still a 404. After that the status is fixed at 200: error
+        reports are sent as items (SSE ``event: error``), and an exception
+        ends the stream with a final ``{"error": ...}`` item.
+
+        Args:
+            walker: Walker instance
+            fmt: ``"ndjson"`` or ``"sse"``
+            start_node: Optional start node ID
+
+        Returns:
+            Chunked response that traverses while the client reads
+        """
+        if fmt not in STREAM_FORMATS:
+            self.router.raise_error(500, f"Unknown stream format '{fmt}'")
+        start = await self._resolve_start_node(start_node)
+        headers = {"Cache-Control": "no-cache"}
+        if fmt == "sse":
+            # Keep reverse proxies from buffering the event stream.
+            headers["X-Accel-Buffering"] = "no"
+        return StreamingResponse(
+            self._encode_stream(walker.stream(start), fmt),
+            media_type=_STREAM_MEDIA_TYPES[fmt],
+            headers=headers,
+        )
 
-__all__ = ["WalkerExecutor", "DirectExecutionWalker"]
+    @staticmethod
+    async def _encode_stream(items: AsyncIterator[Any], fmt: str) -> AsyncIterator[str]:
+        """Serialize report items into NDJSON lines or SSE events."""
+
+        def _frame(item: Any, event: Optional[str] = None) -> str:
+            payload = json.dumps(jsonable_encoder(item))
+            if fmt == "ndjson":
+                return payload + "\n"
+            prefix = f"event: {event}\n" if event else ""
+            return f"{prefix}data: {payload}\n\n"
+
+        try:
+            async for item in items:
+                is_error = isinstance(item, dict) and bool(
+                    item.get("error") or item.get("hook_error")
+                )
+                yield _frame(item, "error" if is_error else None)
+        except Exception as exc:
+            yield _frame({"error": str(exc)}, "error")
+            return
+        finally:
+            # A client that disconnects closes this generator; closing the
+            # walker's stream cancels the traversal behind it.
+            aclose = getattr(items, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        if fmt == "sse":
+            yield "event: end\ndata: {}\n\n"
+
+
+__all__ = ["WalkerExecutor", "DirectExecutionWalker", "STREAM_FORMATS"]
@@ -376,31 +376,32 @@ async def mark_idempotency_key_processed(
 async def cleanup_expired_webhook_data() -> Dict[str, int]:
     """Clean up expired webhook events and idempotency keys.
 
+    Each category is resolved with one query and removed with one
+    :meth:`GraphContext.delete_batch` (a single ``delete_many`` round
+    trip) instead of a delete per record.
+
     Returns:
         Dictionary with counts of cleaned up records
     """
+    from jvspatial.core.context import get_default_context
+
+    context = get_default_context()
     now = datetime.now(timezone.utc)
 
     # Clean up expired webhook events
     expired_events = await WebhookEvent.find({"expires_at": {"$lt": now}})
-
-    for _event_count, event in enumerate(expired_events, 1):
-        await event.delete()
+    await context.delete_batch(expired_events)
 
     # Clean up expired idempotency keys
     expired_keys = await WebhookIdempotencyKey.find({"expires_at": {"$lt": now}})
-
-    for _key_count, key in enumerate(expired_keys, 1):
-        await key.delete()
+    await context.delete_batch(expired_keys)
 
     # Clean up exhausted retry records older than 7 days
     week_ago = now - timedelta(days=7)
     old_retries = await WebhookRetryRecord.find(
         {"is_exhausted": True, "updated_at": {"$lt": week_ago}}
     )
-
-    for _retry_count, retry in enumerate(old_retries, 1):
-        await retry.delete()
+    await context.delete_batch(old_retries)
 
     return {
         "events_cleaned": len(expired_events),
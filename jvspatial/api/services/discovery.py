@@ -264,6 +264,7 @@ class EndpointDiscoveryService:
                     "signature_required",
                     "webhook_auth",
                     "response",
+                    "stream",
                     "rate_limit",
                 ]
             }
@@ -385,6 +386,7 @@ class EndpointDiscoveryService:
                     "signature_required",
                     "webhook_auth",
                     "response",
+                    "stream",
                     "rate_limit",
                 ]
             }
@@ -1,8 +1,10 @@
 """``jvspatial`` command-line interface.
 
-Entry point for operational tooling shipped with the library. Today
-hosts the ``migrate`` subcommand for bulk schema-migration application;
-expected to grow over time.
+Entry point for operational tooling shipped with the library. Hosts
+the ``migrate`` subcommand for bulk schema-migration application,
+``repair-degrees`` for recomputing node degree counters and
+``slow-queries`` for reading the database slow-query log and index
+advice; expected to grow over time.
 
 Wiring (in ``pyproject.toml``)::
 
@@ -14,6 +16,9 @@ Usage::
     jvspatial migrate --collection node --entity User --dry-run
     jvspatial migrate --collection node          # all entities in collection
     jvspatial migrate --collection node --apply  # actually persist changes
+    jvspatial repair-degrees --entity City --apply
+    jvspatial slow-queries --url http://localhost:8000 --token $ADMIN_JWT
+    jvspatial slow-queries --file slow.json --min-occurrences 3
 """
 
 from __future__ import annotations
@@ -21,9 +26,10 @@ from __future__ import annotations
 import argparse
 import asyncio
 import importlib
+import json
 import logging
 import sys
-from typing import Iterable, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Type
 
 logger = logging.getLogger("jvspatial.cli")
 
@@ -101,6 +107,8 @@ async def _run_migrate(args: argparse.Namespace) -> int:
 
     Returns process exit code (0 on success, >0 on failure).
     """
+    from jvspatial.core.adjacency import layout_for, needs_spill, spill
+    from jvspatial.core.adjacency_entries import fill_entries, needs_entries
     from jvspatial.core.migrations import (
         MigrationError,
         apply_migrations,
@@ -167,7 +175,14 @@ async def _run_migrate(args: argparse.Namespace) -> int:
             skipped += 1
             continue
 
-        if not needs_migration(row, target):
+        # Oversized inline edge lists of bucket-layout node classes spill
+        # into adjacency buckets, and classes keeping typed adjacency entries
+        # get missing ones backfilled, as part of the same pass.
+        layout = layout_for(target)
+        spill_edges = needs_spill(row, target)
+        fill = needs_entries(row, target)
+        adjacency_work = spill_edges or fill
+        if not needs_migration(row, target) and not adjacency_work:
             skipped += 1
             continue
 
@@ -183,7 +198,7 @@ async def _run_migrate(args: argparse.Namespace) -> int:
             failed += 1
             continue
 
-        if not changed:
+        if not changed and not adjacency_work:
             skipped += 1
             continue
 
@@ -194,6 +209,10 @@ async def _run_migrate(args: argparse.Namespace) -> int:
                 row.get("id"),
             )
         else:
+            if spill_edges and layout is not None:
+                await spill(db, upgraded, layout)
+            if fill:
+                await fill_entries(db, upgraded)
             await db.save(args.collection, upgraded)
             logger.info(
                 "migrated %s %s",
@@ -220,6 +239,166 @@ async def _run_migrate(args: argparse.Namespace) -> int:
     return 0 if failed == 0 else 1
 
 
+# ---- repair-degrees subcommand ---------------------------------------------
+
+
+async def _run_repair_degrees(args: argparse.Namespace) -> int:
+    """Recompute the degree counters of nodes whose class keeps them.
+
+    Counters are rebuilt from the edge documents of each node's full edge
+    list and written back with ``$set``. Run while edge writes to the
+    affected nodes are quiet; a concurrent write at worst leaves counters
+    out of step, which readers detect and rebuild lazily.
+
+    Returns process exit code (0 on success, >0 on failure).
+    """
+    from jvspatial.core.degree_counters import DEGREE_FIELD, enabled, recompute
+    from jvspatial.db.factory import create_database
+    from jvspatial.db.manager import get_database_manager
+
+    if args.import_module:
+        _import_paths(args.import_module)
+
+    try:
+        db = get_database_manager().get_prime_database()
+    except Exception:
+        db = create_database("json")  # final fallback for dev
+    logger.info("Using database: %s", type(db).__name__)
+
+    classes = [k for k in _discover_classes("node") if enabled(k)]
+    if args.entity:
+        wanted = _entity_name_to_class(args.entity, classes)
+        if wanted is None:
+            logger.error(
+                "No Node subclass with entity name %r keeps degree counters "
+                "(__degree_counters__ = True). Use --import-module to load "
+                "the module that defines it.",
+                args.entity,
+            )
+            return 2
+        classes = [wanted]
+    names = sorted({k._entity_name() for k in classes})
+    if not names:
+        logger.error(
+            "No loaded Node subclass keeps degree counters. Use "
+            "--import-module to load your application code."
+        )
+        return 2
+
+    scanned = 0
+    repaired = 0
+    for name in names:
+        for row in await db.find("node", {"entity": name}):
+            scanned += 1
+            counters = await recompute(db, row)
+            if row.get(DEGREE_FIELD) == counters:
+                continue
+            repaired += 1
+            if args.dry_run:
+                logger.info("[dry-run] would repair %s %s", name, row.get("id"))
+                continue
+            await db.find_one_and_update(
+                "node", {"_id": row["id"]}, {"$set": {DEGREE_FIELD: counters}}
+            )
+            logger.info("repaired %s %s", name, row.get("id"))
+
+    logger.info(
+        "summary: scanned=%d repaired=%d (%s)",
+        scanned,
+        repaired,
+        "dry-run" if args.dry_run else "applied",
+    )
+    return 0
+
+
+# ---- slow-queries subcommand -----------------------------------------------
+
+_SLOW_QUERY_PATH = "/api/status/db/slow-queries"
+
+
+def _fetch_slow_query_report(url: str, token: Optional[str]) -> Dict[str, Any]:
+    """GET the admin slow-query endpoint and return its JSON body."""
+    import urllib.request
+
+    target = url.rstrip("/")
+    if not target.endswith(_SLOW_QUERY_PATH):
+        target += _SLOW_QUERY_PATH
+    request = urllib.request.Request(f"{target}?limit=1000")
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(request, timeout=30) as resp:  # nosec B310
+        return json.loads(resp.read().decode("utf-8"))
+
+
+def _load_slow_query_report(path: str) -> Dict[str, Any]:
+    """Read a saved endpoint response (or a bare list of entries) from disk."""
+    if path == "-":
+        data = json.load(sys.stdin)
+    else:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    if isinstance(data, list):
+        return {"enabled": True, "entries": data}
+    return data
+
+
+def _run_slow_queries(args: argparse.Namespace) -> int:
+    """Print recent slow queries and suggested ``create_index`` calls.
+
+    Suggestions are recomputed locally from the entries so
+    ``--min-occurrences`` applies regardless of the source.
+    """
+    from jvspatial.db._slow_query import SlowQuery, suggest_indexes
+
+    try:
+        if args.file:
+            report = _load_slow_query_report(args.file)
+        else:
+            report = _fetch_slow_query_report(args.url, args.token)
+    except Exception as exc:
+        logger.error("Could not load slow-query report: %s", exc)
+        return 2
+
+    if not report.get("enabled", False):
+        logger.error(
+            "Slow-query log is not enabled on the target; set "
+            "JVSPATIAL_OBSERVABILITY_ENABLED=true on the server."
+        )
+        return 1
+
+    entries = [SlowQuery.from_dict(e) for e in report.get("entries", [])]
+    suggestions = suggest_indexes(entries, min_occurrences=args.min_occurrences)
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "entries": [e.to_dict() for e in entries],
+                    "suggestions": [s.to_dict() for s in suggestions],
+                },
+                indent=2,
+            )
+        )
+        return 0
+
+    print(f"{len(entries)} slow operation(s)")
+    for e in entries[: args.limit]:
+        pushed = {True: "pushed", False: "SCAN", None: "-"}[e.pushed_down]
+        print(
+            f"  {e.duration_ms:9.2f}ms  {e.op:<20} {e.collection:<12} "
+            f"{pushed:<6} rows={e.result_count if e.result_count is not None else '-'} "
+            f"{json.dumps(e.shape, sort_keys=True) if e.shape is not None else ''}"
+        )
+    print(f"\n{len(suggestions)} suggested index(es)")
+    for s in suggestions:
+        print(
+            f"  {s.declaration}  "
+            f"# seen={s.occurrences} scans={s.scans} "
+            f"total={s.total_duration_ms:.1f}ms"
+        )
+    return 0
+
+
 # ---- entry point -----------------------------------------------------------
 
 
@@ -273,6 +452,75 @@ def build_parser() -> argparse.ArgumentParser:
         help="Actually persist migrated records back to the database.",
     )
 
+    rep = sub.add_parser(
+        "repair-degrees",
+        help="Recompute degree counters of nodes that keep them",
+    )
+    rep.add_argument(
+        "--entity",
+        help=(
+            "Restrict to nodes of this entity name. Default: every loaded "
+            "Node subclass with __degree_counters__ = True."
+        ),
+    )
+    rep.add_argument(
+        "--import-module",
+        action="append",
+        default=[],
+        help="Dotted import path to load before running. Repeat for each module.",
+    )
+    rep_mode = rep.add_mutually_exclusive_group()
+    rep_mode.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=True,
+        help="Report nodes whose counters are off without writing (default).",
+    )
+    rep_mode.add_argument(
+        "--apply",
+        dest="dry_run",
+        action="store_false",
+        help="Write the recomputed counters back to the database.",
+    )
+
+    slow = sub.add_parser(
+        "slow-queries",
+        help="Show the database slow-query log and suggested indexes",
+    )
+    source = slow.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--url",
+        help=(
+            "Base URL of a running jvspatial server; reads "
+            f"{_SLOW_QUERY_PATH} (admin role required)."
+        ),
+    )
+    source.add_argument(
+        "--file",
+        help=(
+            "JSON file holding a saved endpoint response or a list of "
+            "entries. Use '-' for stdin."
+        ),
+    )
+    slow.add_argument("--token", help="Bearer token for --url (admin user).")
+    slow.add_argument(
+        "--min-occurrences",
+        type=int,
+        default=1,
+        help="Only suggest indexes whose shape was seen at least N times.",
+    )
+    slow.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Number of slow entries to print (default 20).",
+    )
+    slow.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit entries and suggestions as JSON instead of text.",
+    )
+
     return parser
 
 
@@ -284,6 +532,10 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     if args.cmd == "migrate":
         return asyncio.run(_run_migrate(args))
+    if args.cmd == "repair-degrees":
+        return asyncio.run(_run_repair_degrees(args))
+    if args.cmd == "slow-queries":
+        return _run_slow_queries(args)
 
     parser.error(f"Unknown command: {args.cmd!r}")
     return 2  # pragma: no cover
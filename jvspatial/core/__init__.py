@@ -5,6 +5,7 @@ graph operations with simple, elegant API design. The GraphContext
 is handled internally to maintain semantic simplicity.
 """
 
+from .adjacency import EdgeBuckets
 from .context import (
     GraphContext,
     async_graph_context,
@@ -18,6 +19,7 @@ from .context import (
     set_default_context,
 )
 from .decorators import on_exit, on_visit
+from .distributed import DistributedWalk, run_local_workers
 
 # Import all entities from entities/ package
 from .entities import (
@@ -51,6 +53,8 @@ __all__ = [
     "Walker",
     "Root",
     "NodeQuery",
+    # Adjacency layout
+    "EdgeBuckets",
     # Mixins
     "DeferredSaveMixin",
     "deferred_saves_globally_allowed",
@@ -67,6 +71,9 @@ __all__ = [
     "generate_id",
     "find_subclass_by_name",
     "serialize_datetime",
+    # Distributed execution
+    "DistributedWalk",
+    "run_local_workers",
     # Graph Visualization
     "export_graph",
     "generate_graph_dot",
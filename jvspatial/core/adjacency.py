@@ -0,0 +1,489 @@
+"""Bucketed adjacency storage for supernodes.
+
+A node document normally carries its whole ``edges`` id list, so a hub with
+200k edges is re-serialized on every save and re-read (and re-sorted) by the
+save-time edge merge. Node classes that opt in with ``__edge_buckets__``
+keep at most ``threshold`` ids inline; the rest spill into fixed-size
+records in the :data:`BUCKET_COLLECTION` collection::
+
+    class Tag(Node):
+        __edge_buckets__ = EdgeBuckets(threshold=500, bucket_size=1000)
+
+A bucketed node document looks like::
+
+    {"id": ..., "edges": [<head ids>], "edge_count": 200000,
+     "edge_buckets": {"out.Tagged": 150, "in.any": 50}}
+
+and bucket ``seq`` of partition ``p`` has the id
+``b.<node id>.<p>.<seq>``, so buckets are read by primary key. Partitions
+split ids by edge direction relative to the node (``out``/``in``/``both``)
+and/or by edge entity when ``by_direction``/``by_type`` are set, otherwise
+every id lands in ``any.any``.
+
+Writes only touch what changed: additions fill the head and then the tail
+bucket of their partition; removals rewrite just the buckets that hold the
+ids (found with one ``$all`` query). ``Node.edge_ids`` still holds the full
+list in memory, loaded once on hydration. The context remembers which ids
+it last persisted per bucketed node, so ``GraphContext.save`` writes the
+delta instead of merging the whole list against the database.
+
+Existing records migrate transparently: an oversized inline list spills on
+the node's next save, on read when the context has
+``auto_persist_migrations=True``, or in bulk through ``jvspatial migrate``.
+All bucketed writes for a node happen under its
+``_node_edge_write_guard``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from jvspatial.core.graph_payload import (
+    entity_type_from_edge_id,
+    entity_type_from_node_id,
+)
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+
+BUCKET_COLLECTION = "edge_bucket"
+
+# Edge ids per locate query, and how many bucketed nodes' persisted edge
+# sets a context remembers.
+LOCATE_CHUNK_SIZE = 200
+SNAPSHOT_ENTRIES = 256
+
+_ANY = "any"
+
+
+@dataclass(frozen=True)
+class EdgeBuckets:
+    """Adjacency layout for a node class (set as ``__edge_buckets__``).
+
+    Attributes:
+        threshold: Edge ids kept inline on the node document.
+        bucket_size: Edge ids per bucket record.
+        by_direction: Partition buckets by ``out``/``in``/``both``.
+        by_type: Partition buckets by edge entity name.
+    """
+
+    threshold: int = 1000
+    bucket_size: int = 1000
+    by_direction: bool = False
+    by_type: bool = False
+
+    def __post_init__(self) -> None:
+        """Reject a negative threshold or an empty bucket size."""
+        if self.threshold < 0 or self.bucket_size < 1:
+            raise ValueError(
+                "EdgeBuckets needs threshold >= 0 and bucket_size >= 1, got "
+                f"{self.threshold!r} / {self.bucket_size!r}"
+            )
+
+
+def layout_for(node: Any) -> Optional[EdgeBuckets]:
+    """The :class:`EdgeBuckets` layout for a node id, instance or class."""
+    if isinstance(node, str):
+        from .entities.node import Node
+        from .utils import find_subclass_by_name
+
+        cls = find_subclass_by_name(Node, entity_type_from_node_id(node))
+    elif isinstance(node, type):
+        cls = node
+    else:
+        cls = type(node)
+    layout = getattr(cls, "__edge_buckets__", None)
+    return layout if isinstance(layout, EdgeBuckets) else None
+
+
+def is_bucketed(record: Optional[Dict[str, Any]]) -> bool:
+    """Whether a node document has spilled edge ids into buckets."""
+    return bool(record and record.get("edge_buckets"))
+
+
+def edge_count(record: Dict[str, Any]) -> int:
+    """Total edge ids of a node document, inline plus bucketed."""
+    head = _coerce(record.get("edges"))
+    if is_bucketed(record):
+        return int(record.get("edge_count", len(head)))
+    return len(head)
+
+
+def needs_spill(record: Dict[str, Any], cls: Any) -> bool:
+    """Whether a legacy inline list exceeds its class layout's threshold."""
+    layout = layout_for(cls)
+    if layout is None:
+        return False
+    return len(_coerce(record.get("edges"))) > layout.threshold
+
+
+def partition_directions(direction: str) -> Optional[Set[str]]:
+    """Direction partitions that can hold edges matching ``direction``.
+
+    ``None`` means every partition; bidirectional edges match any direction.
+    """
+    d = (direction or "both").lower()
+    if d in ("out", "in"):
+        return {d, "both", _ANY}
+    return None
+
+
+def bucket_ids(
+    record: Dict[str, Any], directions: Optional[Set[str]] = None
+) -> List[str]:
+    """Bucket ids of a node document in read order (partition, then seq)."""
+    node_id = str(record.get("id", ""))
+    out: List[str] = []
+    for partition, n in sorted((record.get("edge_buckets") or {}).items()):
+        if directions is not None and partition.split(".", 1)[0] not in directions:
+            continue
+        out.extend(_bucket_id(node_id, partition, seq) for seq in range(int(n)))
+    return out
+
+
+def _bucket_id(node_id: str, partition: str, seq: int) -> str:
+    return f"b.{node_id}.{partition}.{seq}"
+
+
+def _coerce(value: Any) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(x) for x in value]
+    return []
+
+
+async def read_buckets(db: Any, record: Dict[str, Any]) -> List[str]:
+    """Bucketed edge ids of a node document (excluding the inline head)."""
+    ids = bucket_ids(record)
+    if not ids:
+        return []
+    docs = await db.find_many(BUCKET_COLLECTION, ids)
+    out: List[str] = []
+    for bid in ids:
+        out.extend(_coerce((docs.get(bid) or {}).get("edges")))
+    return out
+
+
+async def _locate(db: Any, node_id: str, edge_ids: Sequence[str]) -> List[Dict]:
+    """Bucket documents of ``node_id`` holding any of ``edge_ids``."""
+    found: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(edge_ids), LOCATE_CHUNK_SIZE):
+        chunk = edge_ids[i : i + LOCATE_CHUNK_SIZE]
+        query = {
+            "node": node_id,
+            "$or": [{"edges": {"$all": [e]}} for e in chunk],
+        }
+        for doc in await db.find(BUCKET_COLLECTION, query):
+            found[str(doc.get("id"))] = doc
+    return list(found.values())
+
+
+async def _partitions(
+    db: Any, node_id: str, layout: EdgeBuckets, edge_ids: Sequence[str]
+) -> Dict[str, str]:
+    """Partition key per edge id; reads edge documents only for ``by_direction``."""
+    docs: Dict[str, Dict[str, Any]] = {}
+    if layout.by_direction and edge_ids:
+        docs = await db.find_many("edge", list(edge_ids))
+    out: Dict[str, str] = {}
+    for eid in edge_ids:
+        direction = _ANY
+        doc = docs.get(eid)
+        if layout.by_direction and doc:
+            if doc.get("bidirectional", True):
+                direction = "both"
+            elif doc.get("source") == node_id:
+                direction = "out"
+            else:
+                direction = "in"
+        kind = entity_type_from_edge_id(eid) if layout.by_type else _ANY
+        out[eid] = f"{direction}.{kind}"
+    return out
+
+
+async def apply_changes(
+    db: Any,
+    record: Dict[str, Any],
+    layout: EdgeBuckets,
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+) -> Tuple[List[str], List[str]]:
+    """Apply edge-id additions/removals to a node document and its buckets.
+
+    Bucket records are written here; ``record`` is updated in place (head,
+    ``edge_buckets``, ``edge_count``) and left for the caller to save. The
+    caller must hold the node's edge write guard.
+
+    Returns:
+        ``(added, removed)``: the ids that actually changed.
+    """
+    node_id = str(record["id"])
+    head = _coerce(record.get("edges"))
+    meta: Dict[str, int] = dict(record.get("edge_buckets") or {})
+    in_buckets = edge_count(record) - len(head)
+    drop = set(remove) - set(add)
+    changed_buckets: Dict[str, Dict[str, Any]] = {}
+
+    removed = [e for e in head if e in drop]
+    head = [e for e in head if e not in drop]
+    missing = sorted(drop - set(removed))
+    if meta and missing:
+        for doc in await _locate(db, node_id, missing):
+            kept = [e for e in _coerce(doc.get("edges")) if e not in drop]
+            gone = [e for e in _coerce(doc.get("edges")) if e in drop]
+            if gone:
+                doc["edges"] = kept
+                changed_buckets[str(doc["id"])] = doc
+                removed.extend(gone)
+                in_buckets -= len(gone)
+
+    in_head = set(head)
+    fresh = [e for e in dict.fromkeys(add) if e not in in_head]
+    if meta and fresh:
+        present = set()
+        for doc in await _locate(db, node_id, fresh):
+            present.update(_coerce(doc.get("edges")))
+        fresh = [e for e in fresh if e not in present]
+
+    # Legacy inline lists longer than the threshold spill along the way.
+    overflow = head[layout.threshold :]
+    del head[layout.threshold :]
+    room = layout.threshold - len(head)
+    head.extend(fresh[:room])
+    spill = overflow + fresh[room:]
+    if spill:
+        partitions = await _partitions(db, node_id, layout, spill)
+        by_partition: Dict[str, List[str]] = {}
+        for eid in spill:
+            by_partition.setdefault(partitions[eid], []).append(eid)
+        for partition, ids in sorted(by_partition.items()):
+            seq = max(0, meta.get(partition, 0) - 1)
+            bid = _bucket_id(node_id, partition, seq)
+            tail = changed_buckets.get(bid)
+            if tail is None and partition in meta:
+                tail = await db.get(BUCKET_COLLECTION, bid)
+            if tail is None:
+                tail = _new_bucket(node_id, partition, seq)
+            while ids:
+                edges = _coerce(tail.get("edges"))
+                take = max(0, layout.bucket_size - len(edges))
+                if take:
+                    tail["edges"] = edges + ids[:take]
+                    changed_buckets[str(tail["id"])] = tail
+                    ids = ids[take:]
+                meta[partition] = max(meta.get(partition, 0), seq + 1)
+                if ids:
+                    seq += 1
+                    tail = _new_bucket(node_id, partition, seq)
+        in_buckets += len(spill)
+
+    if changed_buckets:
+        await db.bulk_save(BUCKET_COLLECTION, list(changed_buckets.values()))
+
+    record["edges"] = head
+    if meta:
+        record["edge_buckets"] = meta
+        record["edge_count"] = len(head) + in_buckets
+    return fresh, removed
+
+
+def _new_bucket(node_id: str, partition: str, seq: int) -> Dict[str, Any]:
+    return {
+        "id": _bucket_id(node_id, partition, seq),
+        "node": node_id,
+        "partition": partition,
+        "seq": seq,
+        "edges": [],
+    }
+
+
+async def spill(db: Any, record: Dict[str, Any], layout: EdgeBuckets) -> bool:
+    """Move ids beyond ``layout.threshold`` out of an inline list into buckets.
+
+    Updates ``record`` in place for the caller to save; returns whether it
+    changed.
+    """
+    if len(_coerce(record.get("edges"))) <= layout.threshold:
+        return False
+    await apply_changes(db, record, layout)
+    return True
+
+
+# ---- context-level entry points ---------------------------------------------
+
+
+def _snapshots(context: "GraphContext") -> "OrderedDict[str, Set[str]]":
+    return context._adjacency_snapshots
+
+
+def remember(context: "GraphContext", node_id: str, edge_ids: Iterable[str]) -> None:
+    """Record the edge ids last persisted for a bucketed node."""
+    snaps = _snapshots(context)
+    snaps[node_id] = set(edge_ids)
+    snaps.move_to_end(node_id)
+    while len(snaps) > SNAPSHOT_ENTRIES:
+        snaps.popitem(last=False)
+
+
+def forget(context: "GraphContext", node_ids: Iterable[str]) -> None:
+    snaps = _snapshots(context)
+    for node_id in node_ids:
+        snaps.pop(node_id, None)
+
+
+async def load_edge_ids(context: "GraphContext", record: Dict[str, Any]) -> List[str]:
+    """Full edge-id list of a node document, reading its buckets if any."""
+    head = _coerce(record.get("edges"))
+    if not is_bucketed(record):
+        return head
+    full = head + await read_buckets(context.database, record)
+    remember(context, str(record["id"]), full)
+    return full
+
+
+async def save_node(
+    context: "GraphContext",
+    entity: Any,
+    record: Dict[str, Any],
+    collection: str,
+    layout: EdgeBuckets,
+    *,
+    merge: bool,
+) -> List[str]:
+    """``GraphContext.save`` for a node class with a bucket layout.
+
+    Writes the node document (head and bucket metadata) plus only the
+    buckets the in-memory edge list changed. With ``merge`` the persisted
+    ids are unioned in, as the inline merge does. The caller holds the
+    node's edge write guard.
+
+    Returns:
+        The node's edge-id list after the save.
+    """
+    from .context import _unwrap_db_get_result
+
+    db = context.database
+    mem = list(dict.fromkeys(_coerce(record.get("edges"))))
+    fresh = await _unwrap_db_get_result(await db.get(collection, entity.id)) or {}
+
+    if not is_bucketed(fresh):
+        persisted = _coerce(fresh.get("edges"))
+        if merge:
+            merged = sorted(set(mem) | set(persisted))
+        else:
+            merged = mem
+        record["edges"] = merged
+        await spill(db, record, layout)
+        await db.save(collection, record)
+        if is_bucketed(record):
+            remember(context, entity.id, merged)
+        return merged
+
+    snapshot = _snapshots(context).get(entity.id)
+    if snapshot is None:
+        snapshot = set(await load_edge_ids(context, fresh))
+    mem_set = set(mem)
+    added = [e for e in mem if e not in snapshot]
+    removed = set() if merge else snapshot - mem_set
+    for key in ("edges", "edge_buckets", "edge_count"):
+        record[key] = fresh.get(key)
+    await apply_changes(db, record, layout, add=added, remove=removed)
+    await db.save(collection, record)
+    merged = mem + sorted(snapshot - mem_set) if merge else mem
+    remember(context, entity.id, merged)
+    return merged
+
+
+async def update_edge_ids(
+    context: "GraphContext",
+    node_id: str,
+    layout: EdgeBuckets,
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+    entries: Optional[Dict[str, Dict[str, str]]] = None,
+) -> bool:
+    """Add/remove edge ids on one bucketed-layout node under its write guard.
+
+    Keeps the cached instance, the persisted-id snapshot and (through
+    ``entries``, typed adjacency entries by edge id) the node's degree
+    counters in step. Returns whether the node exists.
+    """
+    from . import degree_counters
+
+    add, remove = list(add), list(remove)
+    entries = entries or {}
+    counted = degree_counters.enabled(node_id)
+    db = context.database
+    async with context._node_edge_write_guard(node_id):
+        record = await db.get("node", node_id)
+        if record is None:
+            return False
+        snapshot = _snapshots(context).get(node_id)
+        if snapshot is None and not is_bucketed(record):
+            # Still inline: the record itself is the full list.
+            snapshot = set(_coerce(record.get("edges")))
+        added, removed = await apply_changes(db, record, layout, add, remove)
+        if counted:
+            for edge_ids, sign in ((added, 1), (removed, -1)):
+                for edge_id in edge_ids:
+                    degree_counters.apply_record(record, entries.get(edge_id), sign)
+        if added or removed:
+            await db.save("node", record)
+        if snapshot is not None and is_bucketed(record):
+            remember(context, node_id, (snapshot | set(added)) - set(removed))
+    cached = await context._get_from_cache(node_id)
+    if cached is not None and hasattr(cached, "edge_ids"):
+        gone = set(remove)
+        kept = [e for e in cached.edge_ids if e not in gone]
+        have = set(kept)
+        new = [e for e in add if e not in have]
+        for edge_id in set(cached.edge_ids) & gone:
+            degree_counters.note(cached, entries.get(edge_id), -1)
+        cached.edge_ids[:] = kept + new
+        for edge_id in new:
+            degree_counters.note(cached, entries.get(edge_id), 1)
+    return True
+
+
+async def delete_buckets(context: "GraphContext", node_ids: Iterable[str]) -> None:
+    """Drop the bucket records of deleted nodes that use a bucket layout."""
+    ids = sorted(n for n in set(node_ids) if layout_for(n) is not None)
+    if not ids:
+        return
+    forget(context, ids)
+    db = context.database
+    await asyncio.gather(
+        *(
+            db.delete_many(BUCKET_COLLECTION, {"node": {"$in": ids[i : i + 500]}})
+            for i in range(0, len(ids), 500)
+        )
+    )
+
+
+__all__ = [
+    "BUCKET_COLLECTION",
+    "EdgeBuckets",
+    "apply_changes",
+    "bucket_ids",
+    "edge_count",
+    "is_bucketed",
+    "layout_for",
+    "load_edge_ids",
+    "needs_spill",
+    "read_buckets",
+    "save_node",
+    "spill",
+    "update_edge_ids",
+]
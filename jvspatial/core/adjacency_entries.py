@@ -0,0 +1,285 @@
+"""Typed adjacency entries: neighbor ids without edge document fetches.
+
+``Node.nodes()`` normally loads every incident edge document just to read
+``source``/``target`` (and ``entity`` for type filters) before loading the
+neighbors. Node classes that opt in with ``__adjacency_entries__ = True``
+persist one compact entry per edge next to their ``edges`` list::
+
+    {"id": ..., "edges": ["e.Road.1f..", ...],
+     "adjacency": [{"id": "e.Road.1f..", "peer": "n.City.9c..",
+                    "dir": "out", "entity": "Road"}, ...]}
+
+``dir`` is seen from this node: ``out`` when it is the edge's source,
+``in`` when it is the target and ``loop`` for self-loops. ``nodes()``,
+``neighborhood()``, ``count_neighbors()`` and walker prefetch then resolve
+neighbor ids from the node record alone; edge documents are fetched (by
+primary key) only when an edge filter carries property criteria.
+
+Entries cache immutable edge fields, so the only invariant is one-sided:
+for an id in ``edges`` the entry is either right or missing. Readers walk
+``edges`` (entries of removed edges are ignored) and fetch the edge
+documents of ids without an entry in one ``find_many``, filling the
+in-memory map so the next save persists them. That makes writers
+best-effort -- ``connect``, ``connect_many`` and the save-time edge merge
+add entries, removals drop them -- and lets existing records backfill
+lazily or through ``jvspatial migrate``.
+
+Classes with an :class:`~jvspatial.core.adjacency.EdgeBuckets` layout do
+not keep entries; their traversal takes the edge-query path.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from jvspatial.core.adjacency import layout_for
+from jvspatial.core.graph_payload import entity_type_from_node_id
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+
+ENTRIES_FIELD = "adjacency"
+
+_DIRECTIONS = {
+    "out": ("out", "loop"),
+    "in": ("in", "loop"),
+    "both": ("out", "in", "loop"),
+}
+
+# ``edge_filter`` parsed into ``({entity: [criteria, ...]}, any_type)``;
+# an empty criteria list means "any edge of this entity".
+EdgeSpec = Tuple[Dict[str, List[Dict[str, Any]]], bool]
+
+
+def enabled(node: Any) -> bool:
+    """Whether a node id, instance or class keeps adjacency entries."""
+    if isinstance(node, str):
+        from .entities.node import Node
+        from .utils import find_subclass_by_name
+
+        cls = find_subclass_by_name(Node, entity_type_from_node_id(node))
+    elif isinstance(node, type):
+        cls = node
+    else:
+        cls = type(node)
+    if not getattr(cls, "__adjacency_entries__", False):
+        return False
+    return layout_for(cls) is None
+
+
+def entry_for(edge: Any, node_id: str) -> Dict[str, str]:
+    """Entry for ``edge`` (an Edge instance or document) seen from ``node_id``."""
+    if isinstance(edge, dict):
+        edge_id = str(edge.get("id") or edge.get("_id") or "")
+        source, target = edge.get("source"), edge.get("target")
+        entity = edge.get("entity") or ""
+    else:
+        edge_id, source, target = edge.id, edge.source, edge.target
+        entity = type(edge)._entity_name()
+    if source == node_id and target == node_id:
+        direction, peer = "loop", node_id
+    elif source == node_id:
+        direction, peer = "out", target
+    else:
+        direction, peer = "in", source
+    return {"id": edge_id, "peer": str(peer), "dir": direction, "entity": entity}
+
+
+def entries_of(node: Any) -> Optional[Dict[str, Dict[str, str]]]:
+    """A node instance's in-memory ``{edge id: entry}`` map, or None if off."""
+    entries = getattr(node, "_adjacency", None)
+    if entries is None and enabled(node):
+        entries = {}
+        node._adjacency = entries
+    return entries
+
+
+def load(node: Any, data: Dict[str, Any]) -> None:
+    """Populate ``node``'s entry map from its stored document."""
+    if not enabled(node):
+        return
+    node._adjacency = {
+        e["id"]: e
+        for e in data.get(ENTRIES_FIELD) or []
+        if isinstance(e, dict) and e.get("id")
+    }
+
+
+def record(node: Any, entries: Iterable[Dict[str, str]]) -> None:
+    """Add entries to ``node``'s in-memory map (no-op when off)."""
+    current = entries_of(node)
+    if current is not None:
+        for entry in entries:
+            current[entry["id"]] = entry
+
+
+def export(node: Any) -> Optional[List[Dict[str, str]]]:
+    """Persisted form: known entries for ``node.edge_ids``, in edge order."""
+    current = entries_of(node)
+    if current is None:
+        return None
+    return [current[e] for e in node.edge_ids if e in current]
+
+
+def merge(
+    edge_ids: Sequence[str], *entry_lists: Optional[Iterable[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Entries for ``edge_ids`` drawn from ``entry_lists`` (first one wins)."""
+    known: Dict[str, Dict[str, Any]] = {}
+    for entries in entry_lists:
+        for entry in entries or ():
+            if isinstance(entry, dict) and entry.get("id"):
+                known.setdefault(entry["id"], entry)
+    return [known[e] for e in edge_ids if e in known]
+
+
+def needs_entries(data: Dict[str, Any], cls: Any) -> bool:
+    """Whether a stored document of ``cls`` lacks entries for some edge ids."""
+    if not enabled(cls):
+        return False
+    have = {e.get("id") for e in data.get(ENTRIES_FIELD) or [] if isinstance(e, dict)}
+    return any(e not in have for e in data.get("edges") or [])
+
+
+async def fill_entries(db: Any, data: Dict[str, Any]) -> None:
+    """Backfill missing entries of a stored node document in place."""
+    edge_ids = list(data.get("edges") or [])
+    current = merge(edge_ids, data.get(ENTRIES_FIELD))
+    have = {e["id"] for e in current}
+    missing = [e for e in edge_ids if e not in have]
+    docs = await db.find_many("edge", missing) if missing else {}
+    fetched = [entry_for(docs[e], data["id"]) for e in missing if e in docs]
+    data[ENTRIES_FIELD] = merge(edge_ids, current, fetched)
+
+
+def parse_edge_filter(edge_filter: Any) -> EdgeSpec:
+    """Normalize a ``nodes(edge=...)`` filter into an :data:`EdgeSpec`."""
+    if edge_filter is None:
+        return {}, True
+    items = edge_filter if isinstance(edge_filter, list) else [edge_filter]
+    spec: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        if isinstance(item, dict):
+            for name, criteria in item.items():
+                checks = spec.setdefault(entity_name(name), [])
+                if criteria:
+                    checks.append(dict(criteria))
+        else:
+            spec[entity_name(item)] = []
+    return spec, False
+
+
+def entity_name(ref: Union[str, type]) -> str:
+    """Persisted entity name of a class or name (honors ``__entity_name__``)."""
+    if isinstance(ref, type):
+        resolver = getattr(ref, "_entity_name", None)
+        return resolver() if callable(resolver) else ref.__name__
+    return str(ref)
+
+
+async def resolve(context: "GraphContext", node: Any) -> Optional[List[Dict[str, str]]]:
+    """Entries for every id in ``node.edge_ids``, or None when ``node`` is off.
+
+    Ids without an entry are resolved with one edge ``find_many``; ids
+    whose edge document no longer exists are left out.
+    """
+    current = entries_of(node)
+    if current is None:
+        return None
+    missing = [e for e in node.edge_ids if e not in current]
+    if missing:
+        docs = await context.database.find_many(
+            context._get_collection_name("e"), missing
+        )
+        record(node, (entry_for(docs[e], node.id) for e in missing if e in docs))
+    return [current[e] for e in node.edge_ids if e in current]
+
+
+async def neighbor_links(
+    context: "GraphContext",
+    node: Any,
+    direction: str = "out",
+    edge_filter: Any = None,
+) -> Optional[List[Tuple[str, str]]]:
+    """``(edge id, peer id)`` pairs of ``node`` in edge order, or None when off.
+
+    Matches the edge-query traversal of ``Node.nodes``: ``out`` follows
+    edges this node is the source of, ``in`` those it is the target of,
+    ``both`` either. ``edge_filter`` takes the ``nodes(edge=...)`` forms;
+    entries of edges with property criteria are checked against their edge
+    documents, fetched by id.
+    """
+    entries = await resolve(context, node)
+    if entries is None:
+        return None
+    wanted = _DIRECTIONS.get(direction, _DIRECTIONS["out"])
+    spec, any_type = parse_edge_filter(edge_filter)
+    selected = [
+        e
+        for e in entries
+        if e["dir"] in wanted and (any_type or e.get("entity") in spec)
+    ]
+    checked = [e["id"] for e in selected if spec.get(e.get("entity", ""))]
+    if checked:
+        from jvspatial.db.query import QueryEngine
+
+        docs = await context.database.find_many(
+            context._get_collection_name("e"), checked
+        )
+        passed: Set[str] = {
+            edge_id
+            for edge_id, doc in docs.items()
+            if any(QueryEngine.match(doc, c) for c in spec[doc.get("entity", "")])
+        }
+        selected = [
+            e
+            for e in selected
+            if not spec.get(e.get("entity", "")) or e["id"] in passed
+        ]
+    return [(e["id"], e["peer"]) for e in selected]
+
+
+async def neighbor_ids(
+    context: "GraphContext",
+    node: Any,
+    direction: str = "out",
+    edge_filter: Any = None,
+) -> Optional[List[str]]:
+    """Distinct neighbor ids of ``node`` in edge order.
+
+    None when it keeps no entries. See :func:`neighbor_links`.
+    """
+    links = await neighbor_links(context, node, direction, edge_filter)
+    if links is None:
+        return None
+    return list(dict.fromkeys(peer for _, peer in links))
+
+
+__all__ = [
+    "ENTRIES_FIELD",
+    "enabled",
+    "entries_of",
+    "entity_name",
+    "entry_for",
+    "export",
+    "fill_entries",
+    "load",
+    "merge",
+    "needs_entries",
+    "neighbor_ids",
+    "neighbor_links",
+    "parse_edge_filter",
+    "record",
+    "resolve",
+]
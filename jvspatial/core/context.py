@@ -7,12 +7,15 @@ import inspect
 import json
 import logging
 import time
-from contextlib import asynccontextmanager, contextmanager, suppress
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -35,9 +38,22 @@ _request_identity_map: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
 )
 
 
+class _RequestIdentityMap(dict):
+    """Entities loaded in one request, plus the loads still in flight.
+
+    ``loading`` maps an entity id to the future of its pending database
+    read, so tasks of the same request that ask for it concurrently
+    (``Walker.spawn_many``) wait for one read instead of issuing their own.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loading: Dict[str, "asyncio.Future[Any]"] = {}
+
+
 def begin_request_identity_map() -> contextvars.Token[Optional[Dict[str, Any]]]:
     """Start a request-scoped identity map; returns a reset token."""
-    return _request_identity_map.set({})
+    return _request_identity_map.set(_RequestIdentityMap())
 
 
 def end_request_identity_map(
@@ -416,6 +432,10 @@ class GraphContext:
         self._node_edge_write_locks: Dict[str, asyncio.Lock] = {}
         self._node_edge_locks_creation_lock = asyncio.Lock()
 
+        # Edge ids last persisted per bucketed node (LRU, see core.adjacency)
+        # so a save only rewrites the buckets whose membership changed.
+        self._adjacency_snapshots: "OrderedDict[str, Set[str]]" = OrderedDict()
+
     @asynccontextmanager
     async def _node_edge_write_guard(self, node_id: str):
         async with self._node_edge_locks_creation_lock:
@@ -578,6 +598,18 @@ class GraphContext:
             )
         )
 
+    @staticmethod
+    def _legacy_edge_lookup_enabled() -> bool:
+        from jvspatial.env import env, parse_bool_basic
+
+        return bool(
+            env(
+                "JVSPATIAL_EDGE_LEGACY_LOOKUP",
+                default=True,
+                parse=parse_bool_basic,
+            )
+        )
+
     async def _get_from_cache(self, entity_id: str) -> Optional[Any]:
         """Get entity from cache if available."""
         imap = _request_identity_map.get()
@@ -716,6 +748,29 @@ class GraphContext:
         if cached and isinstance(cached, entity_class):
             return cast(T, cached)
 
+        loading = getattr(_request_identity_map.get(), "loading", None)
+        if loading is None:
+            return await self._load(entity_class, entity_id)
+        pending = loading.get(entity_id)
+        if pending is not None:
+            # Another task of this request is reading the same id.
+            loaded = await asyncio.shield(pending)
+            if isinstance(loaded, entity_class):
+                return cast(T, loaded)
+            return await self._load(entity_class, entity_id)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        loading[entity_id] = future
+        entity: Optional[T] = None
+        try:
+            entity = await self._load(entity_class, entity_id)
+            return entity
+        finally:
+            loading.pop(entity_id, None)
+            future.set_result(entity)
+
+    async def _load(self, entity_class: Type[T], entity_id: str) -> Optional[T]:
+        """Read, deserialize and cache one entity; ``get()`` minus the cache."""
         # Import here to avoid circular imports
         from .utils import find_subclass_by_name
 
@@ -892,10 +947,22 @@ class GraphContext:
             hasattr(entity, "type_code") and getattr(entity, "type_code", "") == "n"
         )
 
+        from . import adjacency, adjacency_entries
+
+        entries_field = adjacency_entries.ENTRIES_FIELD
+
         async def _merge_edges_and_write() -> None:
+            layout = adjacency.layout_for(entity) if is_node else None
+            if layout is not None:
+                # Bucketed layout: write the head plus only the changed buckets.
+                merged = await adjacency.save_node(
+                    self, entity, record, collection, layout, merge=merge_node_edges
+                )
+                if hasattr(entity, "edge_ids"):
+                    object.__setattr__(entity, "edge_ids", list(merged))
             # Merge node edge lists with the DB so full-document saves do not clobber
             # edge IDs added concurrently via atomic_add_edge_id (or another writer).
-            if merge_node_edges and is_node:
+            elif merge_node_edges and is_node:
                 merged = _coerce_edge_id_list(record.get("edges"))
                 save_merge = getattr(db, "save_with_edge_merge", None)
                 if callable(save_merge) and self._is_postgres(db):
@@ -911,9 +978,18 @@ class GraphContext:
                     e_db = set(_coerce_edge_id_list((fresh or {}).get("edges")))
                     merged = sorted(e_mem | e_db)
                     record["edges"] = merged
+                    if entries_field in record:
+                        # Keep the typed entries of concurrently added edges.
+                        record[entries_field] = adjacency_entries.merge(
+                            merged,
+                            record[entries_field],
+                            (fresh or {}).get(entries_field),
+                        )
                     await db.save(collection, record)
                 if hasattr(entity, "edge_ids"):
                     object.__setattr__(entity, "edge_ids", list(merged))
+                if entries_field in record:
+                    adjacency_entries.record(entity, record[entries_field])
             elif is_node:
                 # Authoritative save: keep exported edges and mirror them onto the entity.
                 merged = _coerce_edge_id_list(record.get("edges"))
@@ -955,8 +1031,11 @@ class GraphContext:
             # if cascade=False and the node has no edges (cleaned up by Node.delete())
             if not cascade and len(entity.edge_ids) == 0:
                 # Node.delete() has cleaned up edges, just delete the entity
+                from .adjacency import delete_buckets
+
                 collection = self._get_collection_name("n")
                 await self.database.delete(collection, entity.id)
+                await delete_buckets(self, [entity.id])
                 await self._remove_from_cache(entity.id)
                 return
 
@@ -967,13 +1046,19 @@ class GraphContext:
         from .entities.edge import Edge
 
         if isinstance(entity, Edge):
+            from . import adjacency_entries
+
             source_id = getattr(entity, "source", None)
             target_id = getattr(entity, "target", None)
             for node_id in (source_id, target_id):
                 if not node_id:
                     continue
                 try:
-                    await self.atomic_remove_edge_id(node_id, entity.id)
+                    await self.atomic_remove_edge_id(
+                        node_id,
+                        entity.id,
+                        entry=adjacency_entries.entry_for(entity, node_id),
+                    )
                 except Exception:
                     logger.warning(
                         "Failed to remove edge %s from node %s edge_ids",
@@ -1117,6 +1202,122 @@ class GraphContext:
             detail_level=detail_level,  # type: ignore[arg-type]
         )
 
+    async def expand_frontier(
+        self,
+        ids: Iterable[Any],
+        depth: int = 1,
+        *,
+        direction: str = "out",
+        node: Any = None,
+        edge: Any = None,
+        limit: Optional[int] = None,
+        per_node_limit: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Expand many start nodes ``depth`` hops with one batched pass per hop.
+
+        Each hop costs one edge query for the whole frontier (with the edge
+        filter pushed down) and one node ``get_batch``. Returns depth-annotated
+        rows ``{"node", "node_id", "edge_id", "depth", "parent_id"}``. See
+        :func:`~jvspatial.core.graph_frontier.expand_frontier`.
+        """
+        from .graph_frontier import expand_frontier as _expand_frontier
+
+        return await _expand_frontier(
+            self,
+            ids,
+            depth,
+            direction=direction,
+            node=node,
+            edge=edge,
+            limit=limit,
+            per_node_limit=per_node_limit,
+            **kwargs,
+        )
+
+    async def shortest_path(
+        self,
+        source: Any,
+        target: Any,
+        *,
+        weight: Optional[str] = None,
+        direction: str = "out",
+        edge: Any = None,
+        node: Any = None,
+        max_depth: Optional[int] = None,
+        heuristic: Optional[Callable[[Any, Any], float]] = None,
+    ) -> Optional[Any]:
+        """Cheapest path between two nodes (or ids) as a ``GraphPath``.
+
+        Bounded searches (``max_depth`` up to 6) run as one recursive query
+        on SQLite and Postgres; otherwise bidirectional BFS (unweighted),
+        hop-bounded Bellman-Ford, A* (with ``heuristic``) or bidirectional
+        Dijkstra, expanding neighbors in batched edge queries. See
+        :func:`~jvspatial.core.graph_paths.shortest_path`.
+        """
+        from .graph_paths import shortest_path as _shortest_path
+
+        return await _shortest_path(
+            self,
+            source,
+            target,
+            weight=weight,
+            direction=direction,
+            edge=edge,
+            node=node,
+            max_depth=max_depth,
+            heuristic=heuristic,
+        )
+
+    async def reachable(
+        self,
+        start: Any,
+        depth: int = 1,
+        *,
+        direction: str = "out",
+        edge: Any = None,
+        node: Any = None,
+    ) -> Dict[str, int]:
+        """Ids within ``depth`` hops of ``start`` mapped to their hop count.
+
+        See :func:`~jvspatial.core.graph_paths.reachable`.
+        """
+        from .graph_paths import reachable as _reachable
+
+        return await _reachable(
+            self, start, depth, direction=direction, edge=edge, node=node
+        )
+
+    async def connect_many(
+        self, connections: Iterable[Any], *, direction: str = "out"
+    ) -> List[Any]:
+        """Connect many node pairs with batched duplicate checks and writes.
+
+        ``connections`` holds ``(source, target, EdgeClass, props)`` tuples
+        (the last two optional). Idempotent in the same way as
+        ``Node.connect``. See :func:`~jvspatial.core.graph_bulk.connect_many`.
+        """
+        from .graph_bulk import connect_many as _connect_many
+
+        return await _connect_many(self, connections, direction=direction)
+
+    async def create_and_connect_many(
+        self,
+        nodes: List[Any],
+        connections: Iterable[Any],
+        *,
+        direction: str = "out",
+    ) -> Tuple[List[Any], List[Any]]:
+        """Persist new ``nodes`` and ``connections`` between them in bulk.
+
+        See :func:`~jvspatial.core.graph_bulk.create_and_connect_many`.
+        """
+        from .graph_bulk import create_and_connect_many as _create_and_connect_many
+
+        return await _create_and_connect_many(
+            self, nodes, connections, direction=direction
+        )
+
     def _get_collection_name(self, type_code: str) -> str:
         """Get the database collection name for a type code."""
         collection_map = {"n": "node", "e": "edge", "o": "object", "w": "walker"}
@@ -1222,22 +1423,55 @@ class GraphContext:
         except Exception:
             return False
 
-    async def atomic_add_edge_id(self, node_id: str, edge_id: str) -> bool:
+    async def atomic_add_edge_id(
+        self, node_id: str, edge_id: str, *, entry: Optional[Dict[str, str]] = None
+    ) -> bool:
         """Atomically add *edge_id* to a node's ``edges`` list using $addToSet.
 
         Falls back to read-modify-write when the database does not support
         atomic updates or when the document is not found.
 
+        Args:
+            node_id: Node document ID
+            edge_id: Edge ID to add
+            entry: Typed adjacency entry for the edge, stored alongside when
+                the node's class keeps them (see
+                :mod:`jvspatial.core.adjacency_entries`) and counted when it
+                keeps degree counters (see :mod:`jvspatial.core.degree_counters`)
+
         Returns True on success, False on failure.
         """
+        from . import adjacency_entries, degree_counters
+        from .adjacency import layout_for, update_edge_ids
+        from .entities.walker_components.prefetch_pipeline import active_prefetch
+
+        pipeline = active_prefetch.get()
+        if pipeline is not None:
+            pipeline.invalidate(node_id)
+
+        layout = layout_for(node_id)
+        if layout is not None:
+            entries = {edge_id: entry} if entry is not None else None
+            return await update_edge_ids(
+                self, node_id, layout, add=[edge_id], entries=entries
+            )
+
+        typed = entry is not None and adjacency_entries.enabled(node_id)
         db = self.database
         if self._is_mongodb(db) or self._is_postgres(db):
+            query: Dict[str, Any] = {"_id": node_id}
+            update: Dict[str, Any] = {"$addToSet": {"edges": edge_id}}
+            if typed:
+                update["$addToSet"][adjacency_entries.ENTRIES_FIELD] = entry
+            if degree_counters.enabled(node_id):
+                if entry is None:
+                    update["$set"] = degree_counters.stale_update()
+                else:
+                    # Count only if the id is new; a miss takes the fallback.
+                    query["edges"] = {"$not": {"$all": [edge_id]}}
+                    update["$inc"] = degree_counters.increments([(entry, 1)])
             try:
-                result = await db.find_one_and_update(
-                    "node",
-                    {"_id": node_id},
-                    {"$addToSet": {"edges": edge_id}},
-                )
+                result = await db.find_one_and_update("node", query, update)
                 if result is not None:
                     cached = await self._get_from_cache(node_id)
                     if (
@@ -1246,6 +1480,9 @@ class GraphContext:
                         and edge_id not in cached.edge_ids
                     ):
                         cached.edge_ids.append(edge_id)
+                        degree_counters.note(cached, entry, 1)
+                    if cached is not None and typed:
+                        adjacency_entries.record(cached, [entry])
                     return True
             except Exception:
                 logger.warning(
@@ -1260,32 +1497,68 @@ class GraphContext:
 
         async with self._node_edge_write_guard(node_id):
             node = await self.get(Node, node_id)
+            if node and typed:
+                adjacency_entries.record(node, [entry])
             if node and edge_id not in node.edge_ids:
                 node.edge_ids.append(edge_id)
+                degree_counters.note(node, entry, 1)
                 await self.save(node, _holding_node_edge_lock=True)
         return node is not None
 
-    async def atomic_remove_edge_id(self, node_id: str, edge_id: str) -> bool:
+    async def atomic_remove_edge_id(
+        self, node_id: str, edge_id: str, *, entry: Optional[Dict[str, str]] = None
+    ) -> bool:
         """Atomically remove *edge_id* from a node's ``edges`` list using $pull.
 
         Falls back to read-modify-write when the database does not support
         atomic updates or when the document is not found.
 
+        Args:
+            node_id: Node document ID
+            edge_id: Edge ID to remove
+            entry: Typed adjacency entry for the edge, used to decrement the
+                node's degree counters (they are marked stale without it)
+
         Returns True on success, False on failure.
         """
+        from . import adjacency_entries, degree_counters
+        from .adjacency import layout_for, update_edge_ids
+        from .entities.walker_components.prefetch_pipeline import active_prefetch
+
+        pipeline = active_prefetch.get()
+        if pipeline is not None:
+            pipeline.invalidate(node_id)
+
+        layout = layout_for(node_id)
+        if layout is not None:
+            entries = {edge_id: entry} if entry is not None else None
+            return await update_edge_ids(
+                self, node_id, layout, remove=[edge_id], entries=entries
+            )
+
         db = self.database
         if self._is_mongodb(db) or self._is_postgres(db):
+            query: Dict[str, Any] = {"_id": node_id}
+            update: Dict[str, Any] = {"$pull": {"edges": edge_id}}
+            if adjacency_entries.enabled(node_id):
+                update["$pull"][adjacency_entries.ENTRIES_FIELD] = {"id": edge_id}
+            if degree_counters.enabled(node_id):
+                if entry is None:
+                    update["$set"] = degree_counters.stale_update()
+                else:
+                    query["edges"] = {"$all": [edge_id]}
+                    update["$inc"] = degree_counters.increments([(entry, -1)])
             try:
-                result = await db.find_one_and_update(
-                    "node",
-                    {"_id": node_id},
-                    {"$pull": {"edges": edge_id}},
-                )
+                result = await db.find_one_and_update("node", query, update)
                 if result is not None:
                     cached = await self._get_from_cache(node_id)
-                    if cached and hasattr(cached, "edge_ids"):
-                        with suppress(ValueError):
-                            cached.edge_ids.remove(edge_id)
+                    if (
+                        cached
+                        and hasattr(cached, "edge_ids")
+                        and edge_id in cached.edge_ids
+                    ):
+                        cached.edge_ids.remove(edge_id)
+                        degree_counters.note(cached, entry, -1)
                     return True
             except Exception:
                 logger.warning(
@@ -1302,6 +1575,7 @@ class GraphContext:
             node = await self.get(Node, node_id)
             if node and edge_id in node.edge_ids:
                 node.edge_ids.remove(edge_id)
+                degree_counters.note(node, entry, -1)
                 await self.save(
                     node, merge_node_edges=False, _holding_node_edge_lock=True
                 )
@@ -1701,6 +1975,54 @@ class GraphContext:
         # Mark as ensured
         _ensured_indexes.add(collection_key)
 
+    async def find_edges_for_pair(
+        self, node_a: str, node_b: str, edge_class=None
+    ) -> List:
+        """Edges of ``edge_class`` between two nodes, in either orientation.
+
+        This is the duplicate check behind ``Node.connect``. Edges created by
+        ``connect`` carry :meth:`Edge.deterministic_id`, so both orientations
+        are fetched with one ``find_many`` by primary key. When neither id
+        exists, one query on the ``(source, target, entity)`` index catches
+        edges created under random ids (``Edge.create``, older data).
+        ``JVSPATIAL_EDGE_LEGACY_LOOKUP=false`` skips that query; set it only
+        once every stored edge id has been rewritten to
+        :meth:`Edge.deterministic_id`.
+
+        Returns:
+            Edges with ``source == node_a`` first, then the reverse ones.
+        """
+        from .entities import Edge
+
+        edge_cls = edge_class or Edge
+        forward_id = edge_cls.deterministic_id(node_a, node_b)
+        reverse_id = edge_cls.deterministic_id(node_b, node_a)
+        docs = list(
+            (await self.database.find_many("edge", [forward_id, reverse_id])).values()
+        )
+        if not docs and self._legacy_edge_lookup_enabled():
+            pair = [node_a, node_b]
+            docs = await self.database.find(
+                "edge",
+                {
+                    "source": {"$in": pair},
+                    "target": {"$in": pair},
+                    "entity": edge_cls._entity_name(),
+                },
+            )
+        edges = []
+        for data in sorted(docs, key=lambda d: d.get("source") != node_a):
+            # ``$in`` on both endpoints also matches self-loops on either node.
+            if {data.get("source"), data.get("target")} != {node_a, node_b}:
+                continue
+            try:
+                edge = await self._deserialize_entity(edge_cls, data)
+            except Exception:
+                continue
+            if edge is not None:
+                edges.append(edge)
+        return edges
+
     async def find_edges_between(
         self, source_id: str, target_id: Optional[str] = None, edge_class=None, **kwargs
     ) -> List:
@@ -1756,6 +2078,39 @@ class GraphContext:
 
         return edges
 
+    async def _prepare_node_adjacency(
+        self, node_class: Type[Any], data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return ``data`` with a bucketed node's full edge list inlined.
+
+        Oversized legacy inline lists of a bucket-layout class are spilled and
+        re-saved when ``auto_persist_migrations`` is on.
+        """
+        from . import adjacency
+
+        if adjacency.is_bucketed(data):
+            return {**data, "edges": await adjacency.load_edge_ids(self, data)}
+        layout = adjacency.layout_for(node_class)
+        if (
+            layout is None
+            or not self.auto_persist_migrations
+            or not adjacency.needs_spill(data, node_class)
+        ):
+            return data
+        record = dict(data)
+        try:
+            async with self._node_edge_write_guard(str(data["id"])):
+                await adjacency.spill(self.database, record, layout)
+                await self.database.save(self._get_collection_name("n"), record)
+            adjacency.remember(self, str(data["id"]), data.get("edges") or [])
+        except Exception as exc:  # pragma: no cover
+            logger.warning(
+                "auto_persist_migrations: failed to spill edges of %s: %s",
+                data.get("id"),
+                exc,
+            )
+        return data
+
     async def _deserialize_entity(
         self, entity_class: Type[T], data: Dict[str, Any]
     ) -> Optional[T]:
@@ -1839,6 +2194,11 @@ class GraphContext:
 
             # entity_type_code already computed above
 
+            if entity_type_code == "n":
+                from . import adjacency_entries, degree_counters
+
+                data = await self._prepare_node_adjacency(target_class, data)
+
             if self._fast_deserialize_enabled():
                 if entity_type_code == "n":
                     edge_ids = data.get("edges", [])
@@ -1848,6 +2208,8 @@ class GraphContext:
                     entity = target_class.model_construct(
                         id=data["id"], edge_ids=edge_ids, **context_data
                     )
+                    adjacency_entries.load(entity, data)
+                    degree_counters.load(entity, data)
                 elif entity_type_code == "e":
                     context_data.pop("source", None)
                     context_data.pop("target", None)
@@ -1881,6 +2243,8 @@ class GraphContext:
                 context_data.pop("type_code", None)
 
                 entity = target_class(id=data["id"], edge_ids=edge_ids, **context_data)
+                adjacency_entries.load(entity, data)
+                degree_counters.load(entity, data)
 
             elif entity_type_code == "e":
                 # Handle Edge-specific logic with source/target at top level
@@ -2045,6 +2409,43 @@ class GraphContext:
             else:
                 uncached_ids.append(entity_id)
 
+        # Ids another task of this request is already reading are awaited
+        # rather than read again; the rest are registered as in flight.
+        loading = getattr(_request_identity_map.get(), "loading", None)
+        pending: List["asyncio.Future[Any]"] = []
+        claimed: Dict[str, "asyncio.Future[Any]"] = {}
+        if loading is not None:
+            loop = asyncio.get_running_loop()
+            to_read = []
+            for entity_id in uncached_ids:
+                if entity_id in loading:
+                    pending.append(loading[entity_id])
+                elif entity_id not in claimed:
+                    claimed[entity_id] = loading[entity_id] = loop.create_future()
+                    to_read.append(entity_id)
+            uncached_ids = to_read
+
+        try:
+            await self._read_batch(entity_class, uncached_ids, cached_entities)
+        finally:
+            if claimed:
+                loaded = {entity.id: entity for entity in cached_entities}
+                for entity_id, future in claimed.items():
+                    loading.pop(entity_id, None)  # type: ignore[union-attr]
+                    future.set_result(loaded.get(entity_id))
+
+        if pending:
+            for result in await asyncio.gather(*(asyncio.shield(f) for f in pending)):
+                # The other read may have been for a different class.
+                if isinstance(result, entity_class):
+                    cached_entities.append(result)
+
+        return cached_entities
+
+    async def _read_batch(
+        self, entity_class: Type[T], uncached_ids: List[str], out: List[Any]
+    ) -> None:
+        """Read ``uncached_ids`` in chunks, caching and appending to ``out``."""
         chunk_size = 500
 
         # Fetch uncached entities from database
@@ -2066,7 +2467,7 @@ class GraphContext:
                             entity = await self._deserialize_entity(entity_class, data)
                             if entity:
                                 await self._add_to_cache(entity.id, entity)
-                                cached_entities.append(entity)
+                                out.append(entity)
                         except Exception:
                             continue
                 else:
@@ -2077,48 +2478,55 @@ class GraphContext:
                             entity = await self._deserialize_entity(entity_class, data)
                             if entity:
                                 await self._add_to_cache(entity.id, entity)
-                                cached_entities.append(entity)
+                                out.append(entity)
                         except Exception:
                             continue
 
-        return cached_entities
-
     async def delete_batch(self, entities: List[Any]) -> None:
-        """Delete multiple entities in a single transaction.
+        """Delete multiple entities with one ``delete_many`` per collection.
+
+        Entities are grouped by collection and removed through
+        :meth:`Database.delete_many` (a single ``DELETE … WHERE id IN``
+        on SQL backends, ``BatchWriteItem`` on DynamoDB). This is a raw
+        record delete: node edge lists are not rewritten, so use
+        :meth:`delete` for graph-aware removal.
 
         Args:
-            entities: List of entity instances to delete
+            entities: List of entity instances (or record dicts) to delete
         """
         if not entities:
             return
 
-        # Group entities by type for efficient batch operations
-        entities_by_type: Dict[str, List[Any]] = {}
+        # Group entity ids by collection for one bulk delete per type
+        ids_by_collection: Dict[str, List[str]] = {}
         for entity in entities:
-            collection = self._get_collection_name(entity.type_code)
-            if collection not in entities_by_type:
-                entities_by_type[collection] = []
-            entities_by_type[collection].append(entity)
+            entity_id = (
+                entity.get("id")
+                if isinstance(entity, dict)
+                else getattr(entity, "id", None)
+            )
+            if not entity_id:
+                logger.error("Failed to delete entity unknown: missing id")
+                continue
+            collection = self._get_collection_name(
+                entity.get("type_code", "o")
+                if isinstance(entity, dict)
+                else entity.type_code
+            )
+            ids_by_collection.setdefault(collection, []).append(entity_id)
 
-        # Process each type group
-        for collection, type_entities in entities_by_type.items():
-            db = self.database
-            for entity in type_entities:
-                try:
-                    entity_id = entity.id if hasattr(entity, "id") else entity["id"]
-                    await db.delete(collection, entity_id)
-                    await self._cache.delete(entity_id)
-                except Exception as e:
-                    entity_id = (
-                        getattr(entity, "id", None) or entity.get("id", "unknown")
-                        if hasattr(entity, "get")
-                        else "unknown"
-                    )
-                    logger.error(
-                        f"Failed to delete entity {entity_id}: {e}",
-                        exc_info=True,
-                    )
-                    continue
+        db = self.database
+        for collection, ids in ids_by_collection.items():
+            try:
+                await db.delete_many(collection, ids)
+            except Exception as e:
+                logger.error(
+                    f"Failed to delete {len(ids)} entities from '{collection}': {e}",
+                    exc_info=True,
+                )
+                continue
+            for entity_id in ids:
+                await self._evict_from_cache(entity_id)
 
     # Async iterators for large datasets
     async def async_node_iterator(
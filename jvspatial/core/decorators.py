@@ -9,7 +9,10 @@ if TYPE_CHECKING:
 
 
 def _set_hook_attributes(
-    func: Callable[..., Any], targets: Optional[Any] = None
+    func: Callable[..., Any],
+    targets: Optional[Any] = None,
+    parallel_safe: bool = False,
+    executor: Optional[str] = None,
 ) -> None:
     """Set hook attributes on a function.
 
@@ -18,15 +21,30 @@ def _set_hook_attributes(
     """
     func._visit_targets = targets  # type: ignore[attr-defined]
     func._is_visit_hook = True  # type: ignore[attr-defined]
+    func._parallel_safe = parallel_safe  # type: ignore[attr-defined]
+    func._visit_executor = executor  # type: ignore[attr-defined]
 
 
-def on_visit(*target_types: Union[Type[Union["Node", "Edge", "Walker"]], str]):
+def on_visit(
+    *target_types: Union[Type[Union["Node", "Edge", "Walker"]], str],
+    parallel_safe: bool = False,
+    executor: Optional[str] = None,
+):
     """Register a visit hook for one or more target types.
 
     Args:
         *target_types: One or more target types (Node, Edge, Walker subclasses, or string names)
                       If empty, defaults to any valid type based on context
                       Strings will be resolved to actual classes at runtime
+        parallel_safe: The hook may run concurrently with hooks on other
+                      nodes of the same frontier batch (walkers created with
+                      ``concurrency > 1``). A visit runs concurrently only
+                      when every hook it triggers is parallel-safe.
+        executor: ``"thread"`` or ``"process"`` to run a CPU-heavy hook in a
+                      managed pool off the event loop. Such a hook is a plain
+                      function ``hook(record) -> Optional[dict]`` of the visited
+                      entity's flat export; returned field updates are set on
+                      the entity. Offloaded hooks are parallel-safe.
 
     Examples:
         @on_visit(NodeA, NodeB)           # Triggers for NodeA OR NodeB
@@ -35,6 +53,8 @@ def on_visit(*target_types: Union[Type[Union["Node", "Edge", "Walker"]], str]):
         @on_visit                         # Triggers for any valid type (no parentheses)
         @on_visit(Highway, Railroad)      # Triggers for Highway OR Railroad edges
         @on_visit("WebhookEvent")         # Triggers for WebhookEvent (string resolved at runtime)
+        @on_visit(City, parallel_safe=True)  # May overlap other visits' hooks
+        @on_visit(Doc, executor="process")    # def score(record) -> {"score": ...}
     """
     # Handle case where @on_visit is used without parentheses
     if (
@@ -48,6 +68,9 @@ def on_visit(*target_types: Union[Type[Union["Node", "Edge", "Walker"]], str]):
         _set_hook_attributes(func)
         return func
 
+    if executor is not None and executor not in ("thread", "process"):
+        raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         # Validate target types - allow strings for forward references
         for target_type in target_types:
@@ -55,7 +78,12 @@ def on_visit(*target_types: Union[Type[Union["Node", "Edge", "Walker"]], str]):
                 raise ValueError(
                     f"Target type must be a class or string, got {target_type}"
                 )
-        _set_hook_attributes(func, target_types if target_types else None)
+        _set_hook_attributes(
+            func,
+            target_types if target_types else None,
+            parallel_safe or executor is not None,
+            executor,
+        )
         return func
 
     return decorator
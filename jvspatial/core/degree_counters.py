@@ -0,0 +1,272 @@
+"""Per-node degree counters maintained on write.
+
+``count_neighbors`` otherwise counts edge documents (a ``$regex`` scan on
+most backends) or hydrates every neighbor. Node classes that opt in with
+``__degree_counters__ = True`` keep a small counter document beside their
+``edges`` list, broken down by direction, edge entity and peer entity::
+
+    {"id": ..., "edges": [...],
+     "degree": {"total": 3,
+                "out": {"Road": {"City": 2}},
+                "in": {"Edge": {"Farm": 1}},
+                "loop": {}}}
+
+``dir`` follows :mod:`jvspatial.core.adjacency_entries`: ``out`` when the
+node is the edge's source, ``in`` when it is the target and ``loop`` for
+self-loops. ``total`` is the number of edge ids the breakdown accounts for.
+
+Writers move ``total`` and the breakdown together with every edge id they
+add or remove -- ``$inc`` guarded by an ``edges`` membership condition on
+MongoDB and Postgres, the guarded read-modify-write elsewhere -- so the
+counters are trusted only while ``total`` equals the node's edge count. A
+write that cannot say which bucket an edge belongs to marks the document
+``stale`` instead. Readers that find counters stale or out of step rebuild
+them from the edge documents in one ``find_many`` (or from typed adjacency
+entries, when the class keeps them); the next save persists the result.
+``jvspatial repair-degrees`` recomputes them in bulk.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from jvspatial.core import adjacency_entries
+from jvspatial.core.adjacency import edge_count, read_buckets
+from jvspatial.core.graph_payload import entity_type_from_node_id
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+
+DEGREE_FIELD = "degree"
+
+_DIRECTIONS = {
+    "out": ("out", "loop"),
+    "in": ("in", "loop"),
+    "both": ("out", "in", "loop"),
+}
+
+Counters = Dict[str, Any]
+
+
+def enabled(node: Any) -> bool:
+    """Whether a node id, instance or class keeps degree counters."""
+    if isinstance(node, str):
+        from .entities.node import Node
+        from .utils import find_subclass_by_name
+
+        cls = find_subclass_by_name(Node, entity_type_from_node_id(node))
+    elif isinstance(node, type):
+        cls = node
+    else:
+        cls = type(node)
+    return bool(getattr(cls, "__degree_counters__", False))
+
+
+def empty() -> Counters:
+    """Counters of a node without edges."""
+    return {"total": 0, "out": {}, "in": {}, "loop": {}}
+
+
+def _key(entry: Dict[str, str]) -> Tuple[str, str, str]:
+    return entry["dir"], entry["entity"], entity_type_from_node_id(entry["peer"])
+
+
+def bump(counters: Counters, entry: Dict[str, str], sign: int) -> None:
+    """Count one edge (``sign=1``) or uncount it (``sign=-1``) in place."""
+    direction, edge_entity, peer_entity = _key(entry)
+    peers = counters.setdefault(direction, {}).setdefault(edge_entity, {})
+    peers[peer_entity] = peers.get(peer_entity, 0) + sign
+    counters["total"] = counters.get("total", 0) + sign
+
+
+def increments(changes: Iterable[Tuple[Dict[str, str], int]]) -> Dict[str, int]:
+    """``$inc`` document for ``(entry, sign)`` pairs."""
+    inc: Dict[str, int] = {}
+    for entry, sign in changes:
+        direction, edge_entity, peer_entity = _key(entry)
+        for path in (
+            f"{DEGREE_FIELD}.total",
+            f"{DEGREE_FIELD}.{direction}.{edge_entity}.{peer_entity}",
+        ):
+            inc[path] = inc.get(path, 0) + sign
+    return inc
+
+
+def stale_update() -> Dict[str, Any]:
+    """``$set`` document marking persisted counters stale."""
+    return {f"{DEGREE_FIELD}.stale": True}
+
+
+def valid(counters: Any, count: int) -> bool:
+    """Whether ``counters`` can be trusted for a node with ``count`` edge ids."""
+    return (
+        isinstance(counters, dict)
+        and not counters.get("stale")
+        and counters.get("total") == count
+    )
+
+
+def tally(entries: Iterable[Dict[str, str]], total: int) -> Counters:
+    """Counters for ``entries``, accounting for ``total`` edge ids.
+
+    Ids whose edge document no longer exists have no entry; they are part of
+    ``total`` but of no bucket.
+    """
+    counters = empty()
+    for entry in entries:
+        bump(counters, entry, 1)
+    counters["total"] = total
+    return counters
+
+
+def counters_of(node: Any) -> Optional[Counters]:
+    """A node instance's counters if they are in step with ``edge_ids``."""
+    if not enabled(node):
+        return None
+    counters = getattr(node, "_degree", None)
+    if counters is None and not node.edge_ids:
+        counters = empty()
+        node._degree = counters
+    return counters if valid(counters, len(node.edge_ids)) else None
+
+
+def note(node: Any, entry: Optional[Dict[str, str]], sign: int) -> None:
+    """Mirror one edge id added to / removed from ``node.edge_ids`` in memory.
+
+    Call right after the list changed. Without an ``entry`` the counters
+    are dropped and rebuilt on next use.
+    """
+    if not enabled(node):
+        return
+    counters = getattr(node, "_degree", None)
+    if counters is None:
+        if sign > 0 and entry is not None and node.edge_ids == [entry["id"]]:
+            node._degree = tally([entry], 1)
+        return
+    if entry is None:
+        node._degree = None
+    else:
+        bump(counters, entry, sign)
+
+
+def load(node: Any, data: Dict[str, Any]) -> None:
+    """Populate ``node``'s counters from its stored document."""
+    if enabled(node):
+        stored = data.get(DEGREE_FIELD)
+        node._degree = stored if isinstance(stored, dict) else None
+
+
+def export(node: Any) -> Optional[Counters]:
+    """Persisted form: the counters, a ``stale`` marker, or None when off."""
+    if not enabled(node):
+        return None
+    counters = counters_of(node)
+    return copy.deepcopy(counters) if counters is not None else {"stale": True}
+
+
+def stored(record: Dict[str, Any]) -> Optional[Counters]:
+    """Counters of a raw node document if they are in step with its edges."""
+    counters = record.get(DEGREE_FIELD)
+    return counters if valid(counters, edge_count(record)) else None
+
+
+def apply_record(
+    record: Dict[str, Any], entry: Optional[Dict[str, str]], sign: int
+) -> None:
+    """Mirror one edge id added to / removed from a raw node document."""
+    counters = record.get(DEGREE_FIELD)
+    if not isinstance(counters, dict):
+        record[DEGREE_FIELD] = {"stale": True}
+    elif entry is None:
+        counters["stale"] = True
+    else:
+        bump(counters, entry, sign)
+
+
+def count(
+    counters: Counters,
+    direction: str = "out",
+    edges: Optional[Set[str]] = None,
+    nodes: Optional[Set[str]] = None,
+) -> int:
+    """Edges in ``direction`` whose edge and peer entities pass the filters."""
+    total = 0
+    for bucket in _DIRECTIONS.get(direction, _DIRECTIONS["out"]):
+        for edge_entity, peers in (counters.get(bucket) or {}).items():
+            if edges is not None and edge_entity not in edges:
+                continue
+            for peer_entity, n in peers.items():
+                if nodes is None or peer_entity in nodes:
+                    total += n
+    return total
+
+
+def directed(record: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """``(out, in)`` degree of a raw node document, or None without counters."""
+    counters = stored(record)
+    if counters is None:
+        return None
+    return count(counters, "out"), count(counters, "in")
+
+
+async def rebuild(context: "GraphContext", node: Any) -> Counters:
+    """Recompute ``node``'s counters from its edges and keep them in memory."""
+    entries = await adjacency_entries.resolve(context, node)
+    if entries is None:
+        edge_ids = list(node.edge_ids)
+        docs = (
+            await context.database.find_many(
+                context._get_collection_name("e"), edge_ids
+            )
+            if edge_ids
+            else {}
+        )
+        entries = [
+            adjacency_entries.entry_for(docs[e], node.id) for e in edge_ids if e in docs
+        ]
+    counters = tally(entries, len(node.edge_ids))
+    node._degree = counters
+    return counters
+
+
+async def recompute(db: Any, record: Dict[str, Any]) -> Counters:
+    """Counters for a stored node document, read from its edge documents."""
+    edge_ids = [str(e) for e in record.get("edges") or []]
+    edge_ids += await read_buckets(db, record)
+    docs = await db.find_many("edge", edge_ids) if edge_ids else {}
+    node_id = str(record.get("id"))
+    return tally(
+        (adjacency_entries.entry_for(docs[e], node_id) for e in edge_ids if e in docs),
+        len(edge_ids),
+    )
+
+
+__all__ = [
+    "DEGREE_FIELD",
+    "apply_record",
+    "bump",
+    "count",
+    "counters_of",
+    "directed",
+    "empty",
+    "enabled",
+    "export",
+    "increments",
+    "load",
+    "note",
+    "rebuild",
+    "recompute",
+    "stale_update",
+    "stored",
+    "tally",
+    "valid",
+]
@@ -0,0 +1,407 @@
+"""Distributed walker execution over database work claims.
+
+A :class:`DistributedWalk` runs one walker class over a graph from any
+number of worker processes or machines sharing a database. The frontier
+lives in the database as one record per node and run
+(``frontier.<run_id>.<node_id>`` in ``walker_frontier``):
+
+* :meth:`DistributedWalk.seed` queues the start nodes.
+* :meth:`DistributedWalk.work` loops: lease up to ``batch_size`` pending
+  records with :func:`~jvspatial.db.work_claim.claim_record`, run the
+  walker's visit hooks on those nodes, queue the nodes and edges the hooks
+  ``visit()``, store the reports, and mark the records done with
+  :func:`~jvspatial.db.work_claim.complete_claim`.
+* A worker that dies leaves its leases to expire after ``stale_seconds``;
+  the records are then claimable again (stale-claim recovery).
+
+The frontier records double as the global visited set: a node is queued
+once per run, whichever worker discovers it first, and
+:meth:`DistributedWalk.visited` reports whether it has been processed.
+Edges are queued the same way, in records marked ``kind: "edge"``.
+
+Delivery is at least once. A node whose worker died after running its
+hooks is visited again, and so is one that two workers queued in the
+same instant (new records are written in one ``bulk_save``, which
+overwrites). Leases are atomic on MongoDB and SQLite (across
+processes sharing the file); on backends with the default
+read-then-write ``find_one_and_update`` (JsonDB, for one) two workers can
+also lease the same record under contention. Hooks should be idempotent.
+
+Each batch runs on a fresh walker built from ``walker_kwargs``, so walker
+attributes do not carry across batches or workers; share results through
+``report()`` (merged by :meth:`DistributedWalk.results`, and so must be
+JSON-serializable) or the database. ``pause()`` / ``disengage()`` in a
+hook stop the whole run until :meth:`DistributedWalk.resume`.
+
+:func:`run_local_workers` starts N local worker processes for tests and
+single-machine crawls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import random
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from jvspatial.db.work_claim import (
+    claim_record,
+    claimable_query,
+    complete_claim,
+    release_claim,
+)
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+    from jvspatial.core.entities import Walker
+
+FRONTIER_COLLECTION = "walker_frontier"
+RESULTS_COLLECTION = "walker_results"
+
+_RESULT_ENTITY = "DistributedWalkResult"
+_RUN_ENTITY = "DistributedWalkRun"
+
+
+class DistributedWalk:
+    """One distributed run of ``walker_cls``, addressed by ``run_id``.
+
+    Every worker builds its own instance with the same ``walker_cls`` and
+    ``run_id`` against the shared database.
+    """
+
+    def __init__(
+        self,
+        walker_cls: Type["Walker"],
+        run_id: Optional[str] = None,
+        *,
+        context: Optional["GraphContext"] = None,
+        walker_kwargs: Optional[Dict[str, Any]] = None,
+        batch_size: int = 16,
+        stale_seconds: float = 60.0,
+        poll_interval: float = 0.2,
+        frontier_collection: str = FRONTIER_COLLECTION,
+        results_collection: str = RESULTS_COLLECTION,
+    ) -> None:
+        """Initialize the run handle.
+
+        Args:
+            walker_cls: Walker class whose visit hooks run on each node
+            run_id: Run identifier; a new one is generated when omitted
+            context: Graph context (defaults to the current default context)
+            walker_kwargs: Keyword arguments for each batch's walker
+            batch_size: Frontier records leased per batch
+            stale_seconds: Lease length; a batch must finish within it
+            poll_interval: Seconds to wait while other workers hold all
+                pending records
+            frontier_collection: Collection holding the frontier records
+            results_collection: Collection holding reports and run state
+        """
+        self.walker_cls = walker_cls
+        self.run_id = run_id or secrets.token_hex(8)
+        self._context = context
+        self._walker_kwargs = dict(walker_kwargs or {})
+        self._batch_size = max(1, int(batch_size))
+        self._stale_seconds = float(stale_seconds)
+        self._poll_interval = float(poll_interval)
+        self._frontier = frontier_collection
+        self._results = results_collection
+
+    @property
+    def context(self) -> "GraphContext":
+        """The run's graph context, or the current default context."""
+        if self._context is not None:
+            return self._context
+        from jvspatial.core.context import get_default_context
+
+        return get_default_context()
+
+    @property
+    def _db(self) -> Any:
+        return self.context.database
+
+    def _record_id(self, node_id: str) -> str:
+        return f"frontier.{self.run_id}.{node_id}"
+
+    async def seed(self, nodes: Iterable[Any]) -> int:
+        """Queue start nodes or edges (or node ids); returns how many were new."""
+        return await self._enqueue(nodes)
+
+    async def _enqueue(self, items: Iterable[Any]) -> int:
+        """Create a pending record for each item not yet queued in this run.
+
+        Items are nodes, edges or node ids. One ``find_many`` skips the
+        queued ones and one ``bulk_save`` writes the rest.
+        """
+        from jvspatial.core.entities import Edge
+
+        kinds: Dict[str, str] = {}
+        for item in items:
+            kind = "edge" if isinstance(item, Edge) else "node"
+            kinds.setdefault(getattr(item, "id", item), kind)
+        if not kinds:
+            return 0
+        db = self._db
+        existing = await db.find_many(
+            self._frontier, [self._record_id(n) for n in kinds]
+        )
+        records = [
+            {
+                "id": self._record_id(entity_id),
+                "run_id": self.run_id,
+                "node_id": entity_id,
+                "kind": kind,
+                "state": "pending",
+            }
+            for entity_id, kind in kinds.items()
+            if self._record_id(entity_id) not in existing
+        ]
+        if not records:
+            return 0
+        return await db.bulk_save(self._frontier, records)
+
+    async def _claim_batch(self) -> List[Tuple[str, str, str, str]]:
+        """Lease up to ``batch_size`` pending records.
+
+        Returns ``(record_id, entity_id, kind, token)`` per leased record.
+        """
+        candidates = await self._db.find(
+            self._frontier,
+            {"run_id": self.run_id, "state": "pending", **claimable_query()},
+            limit=4 * self._batch_size,
+        )
+        # Workers polling together would all race for the first records.
+        random.shuffle(candidates)
+        claimed: List[Tuple[str, str, str, str]] = []
+        for candidate in candidates:
+            if len(claimed) >= self._batch_size:
+                break
+            record_id = str(candidate.get("id") or candidate.get("_id"))
+            doc, token = await claim_record(
+                self._db, self._frontier, record_id, stale_seconds=self._stale_seconds
+            )
+            if doc is not None and token is not None:
+                kind = doc.get("kind") or "node"
+                claimed.append((record_id, doc["node_id"], kind, token))
+        return claimed
+
+    async def work(
+        self, *, worker_id: Optional[str] = None, max_batches: Optional[int] = None
+    ) -> int:
+        """Process batches until the frontier is empty or the run stops.
+
+        While other workers hold every pending record this waits
+        ``poll_interval`` and retries, so their discoveries (or expired
+        leases) are picked up.
+
+        Args:
+            worker_id: Label stored on done records and results
+            max_batches: Stop after this many batches
+
+        Returns:
+            Number of nodes this worker visited
+        """
+        worker_id = worker_id or secrets.token_hex(4)
+        visited = batches = 0
+        while max_batches is None or batches < max_batches:
+            if await self.stopped():
+                break
+            claimed = await self._claim_batch()
+            if not claimed:
+                if not await self._db.count(
+                    self._frontier, {"run_id": self.run_id, "state": "pending"}
+                ):
+                    break
+                await asyncio.sleep(self._poll_interval)
+                continue
+            visited += await self._process(claimed, worker_id)
+            batches += 1
+        return visited
+
+    async def _process(
+        self, claimed: List[Tuple[str, str, str, str]], worker_id: str
+    ) -> int:
+        from jvspatial.core.entities import Edge, Node
+
+        context = self.context
+        entities: Dict[str, Any] = {}
+        for kind, entity_class in (("node", Node), ("edge", Edge)):
+            ids = [c[1] for c in claimed if c[2] == kind]
+            if ids:
+                for entity in await context.get_batch(entity_class, ids):
+                    entities[entity.id] = entity
+        walker = self.walker_cls(**self._walker_kwargs)
+        await walker._protection.start_if_needed()
+
+        done: List[Tuple[str, str, str, str]] = []
+        for record in claimed:
+            if walker.paused:
+                break
+            entity = entities.get(record[1])
+            if entity is not None:
+                await walker._begin_step(entity)
+                await walker._execute_visit_hooks(entity)
+            done.append(record)
+
+        # Discoveries and reports are stored before the records are marked
+        # done, so a crash in between re-runs the batch instead of losing it.
+        await self._enqueue(await walker.get_queue())
+        reports = await walker.get_report()
+        if reports:
+            await self._db.save(
+                self._results,
+                {
+                    "id": f"result.{self.run_id}.{secrets.token_hex(8)}",
+                    "entity": _RESULT_ENTITY,
+                    "run_id": self.run_id,
+                    "worker": worker_id,
+                    "node_ids": [record[1] for record in done],
+                    "reports": reports,
+                    "at": time.time(),
+                },
+            )
+        for record_id, _entity_id, _kind, token in done:
+            await complete_claim(
+                self._db,
+                self._frontier,
+                record_id,
+                token,
+                {"$set": {"state": "done", "worker": worker_id}},
+            )
+        for record_id, _entity_id, _kind, token in claimed[len(done) :]:
+            await release_claim(self._db, self._frontier, record_id, token)
+        if walker.paused:
+            await self.stop()
+        return len(done)
+
+    async def results(self) -> List[Any]:
+        """Every report of the run, grouped by batch."""
+        merged: List[Any] = []
+        async for record in self._db.find_iter(
+            self._results, {"run_id": self.run_id, "entity": _RESULT_ENTITY}
+        ):
+            merged.extend(record.get("reports") or [])
+        return merged
+
+    async def visited(self, node: Any) -> bool:
+        """Whether ``node`` (or node id) has been processed in this run."""
+        record = await self._db.get(
+            self._frontier, self._record_id(getattr(node, "id", node))
+        )
+        return bool(record) and record.get("state") == "done"
+
+    async def status(self) -> Dict[str, int]:
+        """Counts of ``pending`` and ``done`` frontier records."""
+        db = self._db
+        return {
+            state: await db.count(
+                self._frontier, {"run_id": self.run_id, "state": state}
+            )
+            for state in ("pending", "done")
+        }
+
+    async def _set_stopped(self, stopped: bool) -> None:
+        await self._db.save(
+            self._results,
+            {
+                "id": f"run.{self.run_id}",
+                "entity": _RUN_ENTITY,
+                "run_id": self.run_id,
+                "stopped": stopped,
+            },
+        )
+
+    async def stop(self) -> None:
+        """Stop every worker of the run after its current batch."""
+        await self._set_stopped(True)
+
+    async def resume(self) -> None:
+        """Let workers claim batches again after :meth:`stop`."""
+        await self._set_stopped(False)
+
+    async def stopped(self) -> bool:
+        """Whether :meth:`stop` (or a paused hook) has stopped the run."""
+        record = await self._db.get(self._results, f"run.{self.run_id}")
+        return bool(record and record.get("stopped"))
+
+    async def clear(self) -> None:
+        """Delete the run's frontier, results and state."""
+        await self._db.delete_many(self._frontier, {"run_id": self.run_id})
+        await self._db.delete_many(self._results, {"run_id": self.run_id})
+
+
+async def _worker_main(
+    walker_cls: Type["Walker"],
+    run_id: str,
+    db_type: str,
+    db_options: Dict[str, Any],
+    worker_id: str,
+    walk_options: Dict[str, Any],
+) -> int:
+    from jvspatial.core.context import GraphContext, set_default_context
+    from jvspatial.db.factory import create_database
+
+    db = create_database(db_type, **db_options)
+    context = GraphContext(database=db)
+    set_default_context(context)
+    try:
+        walk = DistributedWalk(walker_cls, run_id, context=context, **walk_options)
+        return await walk.work(worker_id=worker_id)
+    finally:
+        close = getattr(db, "close", None)
+        if close is not None:
+            await close()
+
+
+def _worker_process(*args: Any) -> int:
+    return asyncio.run(_worker_main(*args))
+
+
+async def run_local_workers(
+    walker_cls: Type["Walker"],
+    run_id: str,
+    *,
+    db_type: str,
+    db_options: Optional[Dict[str, Any]] = None,
+    processes: int = 2,
+    **walk_options: Any,
+) -> List[int]:
+    """Run ``processes`` local worker processes on one run until it drains.
+
+    Each process opens its own database with
+    ``create_database(db_type, **db_options)``, which must reach the same
+    data (a SQLite file, a JsonDB directory or a server). Processes are
+    spawned, so ``walker_cls`` must be importable by module path.
+    ``walk_options`` go to each worker's :class:`DistributedWalk`.
+
+    Returns:
+        Nodes visited per process
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = [
+            loop.run_in_executor(
+                pool,
+                _worker_process,
+                walker_cls,
+                run_id,
+                db_type,
+                dict(db_options or {}),
+                f"worker-{index}",
+                walk_options,
+            )
+            for index in range(processes)
+        ]
+        return list(await asyncio.gather(*futures))
+
+
+__all__ = [
+    "DistributedWalk",
+    "FRONTIER_COLLECTION",
+    "RESULTS_COLLECTION",
+    "run_local_workers",
+]
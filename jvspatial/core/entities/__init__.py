@@ -21,7 +21,7 @@ from .root import Root
 from .walker import Walker
 from .walker_components.event_system import WalkerEventSystem
 from .walker_components.protection import TraversalProtection
-from .walker_components.walker_queue import WalkerQueue
+from .walker_components.walker_queue import PriorityWalkerQueue, WalkerQueue
 from .walker_components.walker_trail import WalkerTrail
 
 
@@ -55,6 +55,7 @@ __all__ = [
     # Additional components
     "NodeQuery",
     "TraversalProtection",
+    "PriorityWalkerQueue",
     "WalkerQueue",
     "WalkerTrail",
     "WalkerEventSystem",
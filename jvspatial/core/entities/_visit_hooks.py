@@ -6,14 +6,19 @@ validation logic is identical for the two — this module hosts the shared
 implementation so the two ``__init_subclass__`` hooks don't duplicate
 ~50 lines apiece.
 
+It also caches the per-(walker class, target class) dispatch tables that
+``Walker._execute_visit_hooks`` runs on every visit: see
+:func:`dispatch_table`.
+
 Internal module (underscore-prefixed): callers outside ``jvspatial.core.entities``
 should not import from here.
 """
 
 from __future__ import annotations
 
+import asyncio
 import inspect
-from typing import Any, Dict, List, Type
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Type
 
 from jvspatial.exceptions import ValidationError
 
@@ -79,4 +84,95 @@ def register_visit_hooks(cls: Type[Any], *, label: str) -> Dict[Any, List[Any]]:
     return hooks
 
 
-__all__ = ["register_visit_hooks"]
+class DispatchTable(NamedTuple):
+    """Hooks one walker class runs on one target class, in call order.
+
+    Each entry is ``(function, is_async)``. ``walker_hooks`` are called as
+    ``function(walker, target)`` and ``target_hooks`` as
+    ``function(target, walker)``. A function appears at most once across
+    both tuples. ``parallel_safe`` is True when every hook was declared
+    with ``@on_visit(parallel_safe=True)``.
+    """
+
+    walker_hooks: Tuple[Tuple[Callable[..., Any], bool], ...]
+    target_hooks: Tuple[Tuple[Callable[..., Any], bool], ...]
+    parallel_safe: bool = False
+
+
+_dispatch_tables: Dict[Tuple[type, type], DispatchTable] = {}
+
+
+def _collect(registry: Dict[Any, List[Any]], cls: type) -> List[Any]:
+    """Hooks in ``registry`` keyed by ``cls``, its bases, its name, or ``None``."""
+    hooks = list(registry.get(cls, ()))
+    for base in cls.mro()[1:]:
+        hooks.extend(registry.get(base, ()))
+    hooks.extend(registry.get(cls.__name__, ()))
+    hooks.extend(registry.get(None, ()))
+    return hooks
+
+
+def _build(walker_type: type, target_type: type) -> DispatchTable:
+    from .walker_components.hook_offload import hook_executor, offloaded_hook
+
+    seen: set = set()
+
+    def _resolve(
+        hooks: List[Any], on_walker: bool
+    ) -> Tuple[Tuple[Callable[..., Any], bool], ...]:
+        resolved = []
+        for hook in hooks:
+            if hook in seen:
+                continue
+            seen.add(hook)
+            kind = hook_executor(hook)
+            if kind is not None:
+                # ``executor=`` hooks run in a pool behind an async adapter.
+                resolved.append((offloaded_hook(hook, kind, on_walker=on_walker), True))
+            else:
+                resolved.append((hook, asyncio.iscoroutinefunction(hook)))
+        return tuple(resolved)
+
+    walker_hooks = _resolve(
+        _collect(getattr(walker_type, "_visit_hooks", {}), target_type), True
+    )
+    target_hooks = _resolve(
+        _collect(getattr(target_type, "_visit_hooks", {}), walker_type), False
+    )
+    parallel_safe = all(
+        getattr(hook, "_parallel_safe", False)
+        for hook, _ in walker_hooks + target_hooks
+    )
+    return DispatchTable(walker_hooks, target_hooks, parallel_safe)
+
+
+def dispatch_table(walker_type: type, target_type: type) -> DispatchTable:
+    """Cached :class:`DispatchTable` for ``walker_type`` visiting ``target_type``.
+
+    Walker hooks match the target class, any of its bases, its class name
+    (forward reference) or ``None`` (any target); target hooks match the
+    walker class the same way. The table is built on first use and reused
+    until :func:`invalidate_dispatch_tables`.
+    """
+    key = (walker_type, target_type)
+    table = _dispatch_tables.get(key)
+    if table is None:
+        table = _dispatch_tables[key] = _build(walker_type, target_type)
+    return table
+
+
+def invalidate_dispatch_tables() -> None:
+    """Drop every cached dispatch table.
+
+    Called whenever a Node, Edge or Walker subclass is defined. Code that
+    edits a class's ``_visit_hooks`` mapping at runtime must call it too.
+    """
+    _dispatch_tables.clear()
+
+
+__all__ = [
+    "DispatchTable",
+    "dispatch_table",
+    "invalidate_dispatch_tables",
+    "register_visit_hooks",
+]
@@ -1,5 +1,6 @@
 """Edge class for jvspatial graph relationships."""
 
+import hashlib
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -69,9 +70,10 @@ class Edge(Object):
         ``_visit_hooks.register_visit_hooks``.
         """
         super().__init_subclass__(**kwargs)
-        from ._visit_hooks import register_visit_hooks
+        from ._visit_hooks import invalidate_dispatch_tables, register_visit_hooks
 
         cls._visit_hooks = register_visit_hooks(cls, label="Edge")
+        invalidate_dispatch_tables()
         cls._is_visit_hook = {}
 
     def __init__(
@@ -185,13 +187,28 @@ class Edge(Object):
             "bidirectional": self.bidirectional,
         }
 
+    @classmethod
+    def deterministic_id(cls: Type["Edge"], source: str, target: str) -> str:
+        """Stable id for the ``cls`` edge from ``source`` to ``target``.
+
+        ``Node.connect`` and ``GraphContext.connect_many`` create edges under
+        this id, so their duplicate check is a primary-key ``get`` on every
+        backend. Same ``type.Entity.hex`` shape as :func:`generate_id`.
+        """
+        digest = hashlib.blake2b(
+            f"{source}\x1f{target}".encode("utf-8"), digest_size=12
+        ).hexdigest()
+        return f"e.{cls._entity_name()}.{digest}"
+
     @classmethod
     def get_indexes(cls: Type["Edge"]) -> List[Dict[str, Any]]:
         """Default indexes for every edge collection.
 
-        ``idx_source_target_entity_unique`` enforces edge uniqueness and serves
-        outgoing traversal via leftmost-prefix on ``source``. The remaining
-        indexes cover traversal shapes the unique index cannot:
+        ``idx_source_target_entity_unique`` enforces edge uniqueness, answers
+        the duplicate lookup ``Node.connect`` falls back to for edges without a
+        :meth:`deterministic_id`, and serves outgoing traversal via
+        leftmost-prefix on ``source``. The remaining indexes cover traversal
+        shapes the unique index cannot:
 
         - ``idx_target_entity`` — incoming traversal (``direction="in"``).
         - ``idx_entity_source`` / ``idx_entity_target`` — typed-edge sweeps
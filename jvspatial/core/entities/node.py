@@ -11,19 +11,24 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Type,
     Union,
 )
 
+from .. import adjacency_entries, degree_counters
+from ..adjacency import EdgeBuckets
 from ..annotations import attribute
 from .edge import Edge
 from .object import Object
 
 # Import Walker at runtime for __init_subclass__ validation
 from .walker import Walker
+from .walker_components.prefetch_pipeline import active_prefetch
 
 if TYPE_CHECKING:
     from ..context import GraphContext
+    from ..graph_paths import GraphPath
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +46,14 @@ class Node(Object):
     _visitor_ref: Optional[weakref.ReferenceType] = attribute(
         private=True, default=None
     )
+    # ``{edge id: entry}`` for classes with ``__adjacency_entries__``; see
+    # :mod:`jvspatial.core.adjacency_entries`.
+    _adjacency: Optional[Dict[str, Dict[str, str]]] = attribute(
+        private=True, default=None
+    )
+    # Degree counters for classes with ``__degree_counters__``; see
+    # :mod:`jvspatial.core.degree_counters`.
+    _degree: Optional[Dict[str, Any]] = attribute(private=True, default=None)
     edge_ids: List[str] = attribute(
         transient=True, default_factory=list, description="List of connected edge IDs"
     )
@@ -48,6 +61,21 @@ class Node(Object):
         Dict[Union[Optional[Type["Walker"]], str], List[Callable]]
     ] = {}
 
+    # Opt-in bucketed adjacency for supernodes: edge ids beyond the layout's
+    # threshold live in separate bucket records instead of this document.
+    # See :mod:`jvspatial.core.adjacency`.
+    __edge_buckets__: ClassVar[Optional[EdgeBuckets]] = None
+
+    # Opt-in typed adjacency entries (edge id, peer id, direction, edge
+    # entity) persisted beside ``edges``, so traversal can skip edge
+    # documents. See :mod:`jvspatial.core.adjacency_entries`.
+    __adjacency_entries__: ClassVar[bool] = False
+
+    # Opt-in degree counters (per direction, edge entity and peer entity)
+    # maintained on write, so ``count_neighbors`` loads nothing. See
+    # :mod:`jvspatial.core.degree_counters`.
+    __degree_counters__: ClassVar[bool] = False
+
     @classmethod
     def _get_top_level_fields(cls: Type["Node"]) -> set:
         """Get top-level fields for Node persistence format."""
@@ -88,9 +116,10 @@ class Node(Object):
         itself is shared with ``Edge`` via ``_visit_hooks.register_visit_hooks``.
         """
         super().__init_subclass__(**kwargs)
-        from ._visit_hooks import register_visit_hooks
+        from ._visit_hooks import invalidate_dispatch_tables, register_visit_hooks
 
         cls._visit_hooks = register_visit_hooks(cls, label="Node")
+        invalidate_dispatch_tables()
 
     @property
     def visitor(self: "Node") -> Optional["Walker"]:
@@ -152,64 +181,48 @@ class Node(Object):
         if edge is None:
             edge = Edge
 
-        # Check if an edge already exists between these nodes
-        # This prevents duplicate edges from being created on repeated calls
-        # Check both directions (self->other and other->self) to catch all existing edges
-        existing_edges_forward = await context.find_edges_between(
-            source_id=self.id,
-            target_id=other.id,
-            edge_class=edge,
-        )
-        existing_edges_reverse = await context.find_edges_between(
-            source_id=other.id,
-            target_id=self.id,
-            edge_class=edge,
+        # Check if an edge already exists between these nodes (either
+        # orientation). Edges created here carry a deterministic id, so this
+        # is normally a primary-key lookup rather than a query.
+        await context.ensure_indexes(edge)
+        all_existing_edges = await context.find_edges_for_pair(
+            self.id, other.id, edge_class=edge
         )
 
-        # Combine both directions
-        all_existing_edges = existing_edges_forward + existing_edges_reverse
-
-        # Filter existing edges by direction if specified
-        # For bidirectional edges, we accept any edge between these nodes
-        # For unidirectional edges, we need to match the direction
-        matching_edge = None
-        for existing_edge in all_existing_edges:
-            # Check if direction matches
-            # If direction is "both", accept any edge between these nodes
-            # If direction is "out", accept edges where source=self.id and target=other.id
-            # If direction is "in", accept edges where source=other.id and target=self.id
-            if direction == "both":
-                # For bidirectional, accept any edge between these nodes
-                matching_edge = existing_edge
-                break
-            elif direction == "out":
-                # For outgoing, check source and target match
-                if existing_edge.source == self.id and existing_edge.target == other.id:
-                    matching_edge = existing_edge
-                    break
-            elif (
-                direction == "in"
-                and existing_edge.source == other.id
-                and existing_edge.target == self.id
-            ):
-                # For incoming, check source and target are reversed
-                matching_edge = existing_edge
-                break
+        # Filter existing edges by direction: "both" accepts an edge either way
+        # round, "out"/"in" need the matching orientation. An edge with this
+        # exact (source, target, entity) is returned regardless, since the
+        # unique index admits only one.
+        from ..graph_bulk import edge_matches_direction
+
+        matching_edge = next(
+            (
+                e
+                for e in all_existing_edges
+                if edge_matches_direction(
+                    e.source, e.target, self.id, other.id, direction
+                )
+            ),
+            None,
+        ) or next(
+            (
+                e
+                for e in all_existing_edges
+                if e.source == self.id and e.target == other.id
+            ),
+            None,
+        )
 
         # If an existing edge is found, return it instead of creating a duplicate
         if matching_edge:
             # Ensure edge IDs are in both nodes' edge_ids lists (in case they're missing)
-            if matching_edge.id not in self.edge_ids:
-                await context.atomic_add_edge_id(self.id, matching_edge.id)
-                if matching_edge.id not in self.edge_ids:
-                    self.edge_ids.append(matching_edge.id)
-            if matching_edge.id not in other.edge_ids:
-                await context.atomic_add_edge_id(other.id, matching_edge.id)
-                if matching_edge.id not in other.edge_ids:
-                    other.edge_ids.append(matching_edge.id)
+            for node in (self, other):
+                if matching_edge.id not in node.edge_ids:
+                    await node._attach_edge(context, matching_edge)
             return matching_edge
 
         # No existing edge found, create a new one
+        kwargs.setdefault("id", edge.deterministic_id(self.id, other.id))
         try:
             connection = await edge.create(
                 source=self.id, target=other.id, direction=direction, **kwargs
@@ -227,16 +240,20 @@ class Node(Object):
             raise
 
         # Atomically update both nodes' edge_ids
-        await context.atomic_add_edge_id(self.id, connection.id)
-        if connection.id not in self.edge_ids:
-            self.edge_ids.append(connection.id)
-
-        await context.atomic_add_edge_id(other.id, connection.id)
-        if connection.id not in other.edge_ids:
-            other.edge_ids.append(connection.id)
+        await self._attach_edge(context, connection)
+        await other._attach_edge(context, connection)
 
         return connection
 
+    async def _attach_edge(self, context: "GraphContext", edge: "Edge") -> None:
+        """Add ``edge`` to this node's persisted and in-memory edge list."""
+        entry = adjacency_entries.entry_for(edge, self.id)
+        await context.atomic_add_edge_id(self.id, edge.id, entry=entry)
+        if edge.id not in self.edge_ids:
+            self.edge_ids.append(edge.id)
+            degree_counters.note(self, entry, 1)
+        adjacency_entries.record(self, [entry])
+
     async def edges(self: "Node", direction: str = "") -> List["Edge"]:
         """Get edges connected to this node.
 
@@ -346,6 +363,14 @@ class Node(Object):
                 state="NY"  # Simple property filter via kwargs
             )
         """
+        # Outgoing neighbors may already be loaded by the running walker's
+        # prefetch pipeline (``Walker(prefetch_pipeline=True)``).
+        pipeline = active_prefetch.get()
+        if pipeline is not None and direction == "out" and edge is None and not kwargs:
+            prefetched = await pipeline.take(self.id)
+            if prefetched is not None:
+                return self._filter_connected(prefetched, node, limit, {})
+
         context = await self.get_context()
 
         # Build optimized database query using aggregation pipeline
@@ -409,8 +434,10 @@ class Node(Object):
         """Return all nodes reachable within ``depth`` hops from this node.
 
         Uses the backend ``traverse`` implementation when available (single
-        round trip on Postgres); otherwise falls back to a Python BFS using
-        :meth:`nodes` per hop.
+        round trip on Postgres); otherwise expands hop by hop with
+        :meth:`~jvspatial.core.context.GraphContext.expand_frontier`, one
+        edge query and one node batch fetch per hop. ``limit`` caps the
+        nodes reached from each node per hop on that path.
         """
         from ..context import get_default_context
         from .edge import Edge
@@ -451,30 +478,80 @@ class Node(Object):
                     return []
                 return await context.get_batch(Node, node_ids)
 
-        # Python BFS fallback (all backends).
-        seen: set = {self.id}
-        frontier: List["Node"] = [self]
-        collected: List["Node"] = []
-        for _ in range(depth):
-            next_frontier: List["Node"] = []
-            for current in frontier:
-                neighbors = await current.nodes(
-                    direction=direction,
-                    node=node,
-                    edge=edge,
-                    limit=limit,
-                    **kwargs,
-                )
-                for nb in neighbors:
-                    if nb.id in seen:
-                        continue
-                    seen.add(nb.id)
-                    collected.append(nb)
-                    next_frontier.append(nb)
-            frontier = next_frontier
-            if not frontier:
-                break
-        return collected
+        # Frontier-batched BFS (all backends).
+        rows = await context.expand_frontier(
+            [self],
+            depth,
+            direction=direction,
+            node=node,
+            edge=edge,
+            per_node_limit=limit,
+            **kwargs,
+        )
+        return [row["node"] for row in rows]
+
+    async def shortest_path(
+        self,
+        to: Union[str, "Node"],
+        weight: Optional[str] = None,
+        *,
+        direction: str = "out",
+        edge: Optional[
+            Union[
+                str,
+                Type["Edge"],
+                List[Union[str, Type["Edge"], Dict[str, Dict[str, Any]]]],
+            ]
+        ] = None,
+        node: Optional[Union[str, type, List[Union[str, type]]]] = None,
+        max_depth: Optional[int] = None,
+        heuristic: Optional[Callable[["Node", "Node"], float]] = None,
+    ) -> Optional["GraphPath"]:
+        """Return the cheapest path from this node to ``to``, or None.
+
+        ``weight`` is a dotted edge field (``"context.distance"``); without
+        it every edge costs 1. The result carries ``nodes``, ``edges`` and
+        ``cost``. See
+        :meth:`~jvspatial.core.context.GraphContext.shortest_path`.
+        """
+        from ..context import get_default_context
+
+        return await get_default_context().shortest_path(
+            self,
+            to,
+            weight=weight,
+            direction=direction,
+            edge=edge,
+            node=node,
+            max_depth=max_depth,
+            heuristic=heuristic,
+        )
+
+    async def reachable(
+        self,
+        depth: int = 1,
+        *,
+        direction: str = "out",
+        edge: Optional[
+            Union[
+                str,
+                Type["Edge"],
+                List[Union[str, Type["Edge"], Dict[str, Dict[str, Any]]]],
+            ]
+        ] = None,
+        node: Optional[Union[str, type, List[Union[str, type]]]] = None,
+    ) -> Dict[str, int]:
+        """Return ``{node id: hops}`` for nodes within ``depth`` hops.
+
+        Ids only, without loading nodes: one recursive query on SQLite and
+        Postgres, one edge query per hop elsewhere. See
+        :meth:`~jvspatial.core.context.GraphContext.reachable`.
+        """
+        from ..context import get_default_context
+
+        return await get_default_context().reachable(
+            self, depth, direction=direction, edge=edge, node=node
+        )
 
     async def count_neighbors(
         self,
@@ -502,9 +579,27 @@ class Node(Object):
         peer node id (pattern ``^n.<ClassName>.``). Persisted edges do not store
         separate ``target_entity`` / ``source_entity`` fields.
 
+        With degree counters (``__degree_counters__``), no property
+        ``kwargs`` and ``node`` / ``edge`` filters of entity names/classes
+        only, the answer comes from the node's counters without a query:
+        the number of matching edges, so a peer joined by two edges counts
+        twice, as on the regex path.
+
+        With typed adjacency entries (``__adjacency_entries__``) and no
+        property ``kwargs``, a ``node`` filter of entity names/classes is
+        matched against the peer id prefix and nothing is loaded: the result
+        is the number of distinct matching peers.
+
         Returns:
             Number of matching connected nodes.
         """
+        counted = await self._count_from_counters(direction, node, edge, kwargs)
+        if counted is not None:
+            return counted
+        entry_count = await self._count_from_entries(direction, node, edge, kwargs)
+        if entry_count is not None:
+            return entry_count
+
         # Fast-path: single entity type filter, no edge filter or property kwargs.
         if (
             not kwargs
@@ -558,6 +653,52 @@ class Node(Object):
             )
         )
 
+    async def _count_from_counters(
+        self,
+        direction: str,
+        node: Any,
+        edge: Any,
+        kwargs: Dict[str, Any],
+    ) -> Optional[int]:
+        """``count_neighbors`` from degree counters, or None if unavailable."""
+        if kwargs or not degree_counters.enabled(self):
+            return None
+        filters: List[Optional[Set[str]]] = []
+        for refs in (node, edge):
+            if refs is None:
+                filters.append(None)
+                continue
+            refs = refs if isinstance(refs, list) else [refs]
+            if not all(isinstance(r, (str, type)) for r in refs):
+                return None
+            filters.append({adjacency_entries.entity_name(r) for r in refs})
+        counters = degree_counters.counters_of(self)
+        if counters is None:
+            counters = await degree_counters.rebuild(await self.get_context(), self)
+        return degree_counters.count(
+            counters, direction, edges=filters[1], nodes=filters[0]
+        )
+
+    async def _count_from_entries(
+        self,
+        direction: str,
+        node: Any,
+        edge: Any,
+        kwargs: Dict[str, Any],
+    ) -> Optional[int]:
+        """``count_neighbors`` from adjacency entries, or None if unavailable."""
+        if kwargs or not adjacency_entries.enabled(self):
+            return None
+        refs = node if isinstance(node, list) else [node] if node is not None else []
+        if not all(isinstance(r, (str, type)) for r in refs):
+            return None
+        prefixes = tuple(f"n.{adjacency_entries.entity_name(r)}." for r in refs)
+        context = await self.get_context()
+        ids = await adjacency_entries.neighbor_ids(context, self, direction, edge)
+        if ids is None:
+            return None
+        return sum(1 for i in ids if not prefixes or i.startswith(prefixes))
+
     async def node(
         self,
         direction: str = "out",
@@ -643,6 +784,21 @@ class Node(Object):
         """
         from .node import Node as NodeClass
 
+        # Typed adjacency entries name the neighbors without any edge query.
+        entry_ids = await adjacency_entries.neighbor_ids(
+            context, self, direction, edge_filter
+        )
+        if entry_ids is not None:
+            if node_filter is None and not kwargs and limit is not None:
+                entry_ids = entry_ids[:limit]
+            loaded = {n.id: n for n in await context.get_batch(NodeClass, entry_ids)}
+            return self._filter_connected(
+                [loaded[i] for i in entry_ids if i in loaded],
+                node_filter,
+                limit,
+                kwargs,
+            )
+
         if (
             not kwargs
             and direction in ("out", "in")
@@ -819,6 +975,16 @@ class Node(Object):
         else:
             connected_nodes = []
 
+        return self._filter_connected(connected_nodes, node_filter, limit, kwargs)
+
+    def _filter_connected(
+        self,
+        connected_nodes: List["Node"],
+        node_filter: Any,
+        limit: Optional[int],
+        kwargs: Dict[str, Any],
+    ) -> List["Node"]:
+        """Apply ``nodes()`` node-type, property and limit filters."""
         # Apply node type filtering
         if node_filter is not None:
             filtered_nodes = []
@@ -1135,13 +1301,14 @@ class Node(Object):
 
             for found_edge in edges:
                 # Atomically remove edge_id from both nodes, then delete the edge
-                await context.atomic_remove_edge_id(self.id, found_edge.id)
-                if found_edge.id in self.edge_ids:
-                    self.edge_ids.remove(found_edge.id)
-
-                await context.atomic_remove_edge_id(other.id, found_edge.id)
-                if found_edge.id in other.edge_ids:
-                    other.edge_ids.remove(found_edge.id)
+                for node in (self, other):
+                    entry = adjacency_entries.entry_for(found_edge, node.id)
+                    await context.atomic_remove_edge_id(
+                        node.id, found_edge.id, entry=entry
+                    )
+                    if found_edge.id in node.edge_ids:
+                        node.edge_ids.remove(found_edge.id)
+                        degree_counters.note(node, entry, -1)
 
                 # Delete the edge document (context.delete already handles
                 # edge_ids cleanup, but we already did it atomically above,
@@ -1191,302 +1358,42 @@ class Node(Object):
         """Delete this node and cascade deletion of all related edges and dependent nodes.
 
         This method performs a clean cascade deletion for Node entities:
-        1. Finds all incoming edges to this node (edges where this node is the target)
-        2. If cascade is enabled, recursively finds all dependent nodes:
+        1. Collects every edge touching this node and, if cascade is enabled,
+           every node reachable FROM it via outgoing edges, one batched edge
+           query per BFS level
+        2. If cascade is enabled, picks the dependent nodes in memory:
            - A node is dependent if it's reachable FROM this node via outgoing edges
-           - A node is considered dependent if ALL its edges connect to nodes in the deletion set
-           - This ensures only nodes solely reachable through this node are deleted
+           - A reachable node with a connection (either direction) to a node
+             outside the reachable set is preserved, together with every
+             reachable node connected to it
            - Ancestors and nodes with other connections are preserved
-        3. Deletes all incoming edges to this node
-        4. Deletes all dependent nodes recursively (each dependent node will also
-           cascade delete its own dependent nodes)
+        3. Deletes the edges touching this node and its dependents, removing
+           their ids from surviving nodes, with batched writes
+        4. Deletes the dependent nodes with a batched delete
         5. Finally deletes this node itself
 
+        See :mod:`jvspatial.core.graph_delete` for the batching details.
+
         Note: Node entities are the only entities that can be connected by edges on the graph.
         Object entities are fundamental entities not connected by edges and use Object.delete()
         which simply removes the entity.
 
         Args:
             cascade: Whether to cascade deletion to dependent nodes (default: True)
-                    If False, only deletes incoming edges and the node itself
+                    If False, only deletes this node's edges and the node itself
 
         Examples:
             # Full cascade deletion (default)
-            # Deletes the node, its incoming edges, and all nodes solely reachable from it
+            # Deletes the node, its edges, and all nodes solely reachable from it
             await node.delete()
 
-            # Delete node and incoming edges only, don't cascade to dependent nodes
+            # Delete node and its edges only, don't cascade to dependent nodes
             await node.delete(cascade=False)
         """
-        context = await self.get_context()
-
-        # Get only incoming edges to this node (edges where this node is the target)
-        # We only delete incoming edges, not outgoing edges
-        incoming_edges = []
-
-        # Query database for edges where target is this node's ID
-        from .edge import Edge as EdgeClass
-
-        edge_query = {"target": self.id}
-        edge_results = await context.database.find("edge", edge_query)
-        for edge_data in edge_results:
-            try:
-                edge_obj = await context._deserialize_entity(EdgeClass, edge_data)
-                if edge_obj:
-                    incoming_edges.append(edge_obj)
-            except Exception:
-                continue
-
-        # Also check edges from edge_ids where this node is the target
-        for edge_id in self.edge_ids:
-            try:
-                edge = await Edge.get(edge_id)
-                # Only include edges where this node is the target (incoming)
-                if edge and edge.target == self.id and edge not in incoming_edges:
-                    incoming_edges.append(edge)
-            except Exception:
-                continue
+        from ..graph_delete import cascade_delete
 
-        # Remove duplicates
-        seen_edge_ids = set()
-        unique_incoming_edges = []
-        for edge in incoming_edges:
-            if edge.id not in seen_edge_ids:
-                seen_edge_ids.add(edge.id)
-                unique_incoming_edges.append(edge)
-        incoming_edges = unique_incoming_edges
-
-        # Get outgoing edges to find nodes reachable FROM this node
-        outgoing_edges = await context.find_edges_between(source_id=self.id)
-
-        # Build complete set of all nodes reachable FROM this node (via outgoing edges, recursively)
-        # This includes nodes reachable through multiple hops
-        reachable_node_ids = set()
-        nodes_to_explore = {self.id}
-        explored = set()
-
-        while nodes_to_explore:
-            current_id = nodes_to_explore.pop()
-            if current_id in explored:
-                continue
-            explored.add(current_id)
-
-            # Get all outgoing edges from current node
-            current_outgoing = await context.find_edges_between(source_id=current_id)
-            for edge in current_outgoing:
-                if edge.source == current_id:
-                    target_id = edge.target
-                    if target_id not in explored:
-                        reachable_node_ids.add(target_id)
-                        nodes_to_explore.add(target_id)
-
-        # If cascade is enabled, recursively find all dependent nodes to delete
-        # Strategy: Only delete nodes that are:
-        # 1. Reachable FROM this node (via outgoing edges)
-        # 2. ONLY connected to nodes in the deletion set (no connections to nodes outside)
-        # This ensures ancestors and nodes with other connections are preserved
-        nodes_to_delete = set()
-        if cascade:
-            # Start with nodes directly reachable from this node (via outgoing edges)
-            # Only consider nodes reachable FROM this node, not nodes that can reach TO this node
-            nodes_to_delete.add(self.id)
-
-            changed = True
-            max_iterations = 100  # Safety limit to prevent infinite loops
-            iteration = 0
-
-            while changed and iteration < max_iterations:
-                changed = False
-                iteration += 1
-
-                # Get all nodes reachable FROM nodes in the deletion set (via outgoing edges only)
-                nodes_to_check = set()
-                for node_id in nodes_to_delete:
-                    try:
-                        node = await Node.get(node_id)
-                        if not node:
-                            continue
-                        # Only follow outgoing edges (where this node is the source)
-                        for edge_id in node.edge_ids:  # type: ignore[attr-defined]
-                            try:
-                                edge = await Edge.get(edge_id)
-                                if edge and edge.source == node_id:
-                                    # Only add nodes reachable via outgoing edges
-                                    nodes_to_check.add(edge.target)
-                            except Exception:
-                                continue
-                    except Exception:
-                        continue
-
-                # For each candidate node, check if it should be deleted
-                for candidate_id in nodes_to_check:
-                    if candidate_id in nodes_to_delete:
-                        continue  # Already marked for deletion
-
-                    try:
-                        candidate_node = await Node.get(candidate_id)
-                        if not candidate_node:
-                            continue
-
-                        # Get all edges of the candidate node
-                        candidate_edges = []
-                        for edge_id in candidate_node.edge_ids:  # type: ignore[attr-defined]
-                            try:
-                                edge = await Edge.get(edge_id)
-                                if edge:
-                                    candidate_edges.append(edge)
-                            except Exception:
-                                continue
-
-                        # If the node has no edges, it's orphaned and should be deleted
-                        if not candidate_edges:
-                            nodes_to_delete.add(candidate_id)
-                            changed = True
-                            continue
-
-                        # Check if ALL edges connect to nodes in the deletion set
-                        # OR to nodes that are themselves only reachable from the deletion set
-                        # We use a recursive check: if all neighbors are in deletion set or will be deleted, delete this node
-                        async def is_node_only_connected_to_deletion_set(
-                            node_id: str,
-                            deletion_set: set,
-                            visited: set,
-                            root_node_id: str,
-                        ) -> bool:
-                            """Check if a node is only connected to nodes in deletion set or nodes that will be deleted.
-
-                            Args:
-                                node_id: Node to check
-                                deletion_set: Set of node IDs marked for deletion
-                                visited: Set of visited nodes (to prevent cycles)
-                                root_node_id: The original node being deleted (to check reachability)
-                            """
-                            if node_id in deletion_set:
-                                return True
-                            if node_id in visited:
-                                # For cycles, check if we can reach the root node
-                                # If we're in a cycle and all nodes in the cycle are candidates, allow deletion
-                                return True
-
-                            visited.add(node_id)
-
-                            try:
-                                node = await Node.get(node_id)
-                                if not node:
-                                    return True
-
-                                node_edges = []
-                                for edge_id in node.edge_ids:  # type: ignore[attr-defined]
-                                    try:
-                                        edge = await Edge.get(edge_id)
-                                        if edge:
-                                            node_edges.append(edge)
-                                    except Exception:
-                                        continue
-
-                                # If no edges, it's orphaned and should be deleted
-                                if not node_edges:
-                                    return True
-
-                                # Check all neighbors
-                                for edge in node_edges:
-                                    other_id = None
-                                    if edge.source == node_id:
-                                        other_id = edge.target
-                                    elif edge.target == node_id:
-                                        other_id = edge.source
-
-                                    if other_id:
-                                        # If neighbor is in deletion set, it's fine
-                                        if other_id in deletion_set:
-                                            continue
-
-                                        # Check if the neighbor is reachable FROM the root node
-                                        # If not, then this node has an external connection and shouldn't be deleted
-                                        if other_id not in reachable_node_ids:
-                                            # This node has a connection to a node not reachable from root
-                                            # This means it has an external connection, so don't delete it
-                                            return False
-
-                                        # If neighbor is reachable from root, recursively check if it should be deleted
-                                        # If the neighbor won't be deleted (has external connections), this node shouldn't be deleted either
-                                        neighbor_will_be_deleted = await is_node_only_connected_to_deletion_set(
-                                            other_id,
-                                            deletion_set,
-                                            visited.copy(),
-                                            root_node_id,
-                                        )
-                                        if not neighbor_will_be_deleted:
-                                            # Neighbor has external connections, so this node shouldn't be deleted
-                                            return False
-
-                                return True
-                            except Exception:
-                                return False
-
-                        # Check if candidate is only connected to deletion set
-                        if await is_node_only_connected_to_deletion_set(
-                            candidate_id, nodes_to_delete, set(), self.id
-                        ):
-                            nodes_to_delete.add(candidate_id)
-                            changed = True
-                    except Exception:
-                        # Continue even if check fails
-                        continue
-
-            # Remove self from nodes_to_delete (we'll delete it separately at the end)
-            nodes_to_delete.discard(self.id)
-
-        # Delete incoming edges to this node
-        for edge in incoming_edges:
-            try:
-                if edge.source != self.id:
-                    await context.atomic_remove_edge_id(edge.source, edge.id)
-
-                if edge.id in self.edge_ids:
-                    self.edge_ids.remove(edge.id)
-
-                # Direct DB delete (edge_ids already handled atomically above)
-                await context.database.delete("edge", edge.id)
-                await context._cache.delete(edge.id)
-            except Exception:
-                continue
-
-        # Clean up outgoing edges from this node
-        for edge in outgoing_edges:
-            try:
-                if edge.target != self.id:
-                    await context.atomic_remove_edge_id(edge.target, edge.id)
-
-                if edge.id in self.edge_ids:
-                    self.edge_ids.remove(edge.id)
-
-                await context.database.delete("edge", edge.id)
-                await context._cache.delete(edge.id)
-            except Exception:
-                continue
-
-        # If cascade is enabled, delete all dependent nodes
-        if cascade and nodes_to_delete:
-            # Get all nodes to delete
-            dependent_nodes = []
-            for node_id in nodes_to_delete:
-                try:
-                    node = await Node.get(node_id)
-                    if node:
-                        dependent_nodes.append(node)
-                except Exception:
-                    continue
-
-            # Delete dependent nodes recursively
-            # Each node will delete its own incoming edges and any further dependent nodes
-            for dependent_node in dependent_nodes:
-                try:
-                    # Recursively delete with cascade=True to handle nested dependencies
-                    await dependent_node.delete(cascade=True)
-                except Exception:
-                    # Continue even if dependent node deletion fails
-                    continue
+        context = await self.get_context()
+        await cascade_delete(context, self.id, cascade=cascade)
 
         # Clear edge_ids before final deletion to avoid recursion in context.delete()
         # All edges have already been deleted from the database
@@ -1573,5 +1480,11 @@ class Node(Object):
         # Include edges only when explicitly requested (e.g., for database persistence)
         if include_edges:
             result["edges"] = self.edge_ids
+            entries = adjacency_entries.export(self)
+            if entries is not None:
+                result[adjacency_entries.ENTRIES_FIELD] = entries
+            counters = degree_counters.export(self)
+            if counters is not None:
+                result[degree_counters.DEGREE_FIELD] = counters
 
         return result
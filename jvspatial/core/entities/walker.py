@@ -1,16 +1,21 @@
 """Walker class for jvspatial graph traversal."""
 
 import asyncio
+import contextlib
 import inspect
 from collections import deque
+from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     Union,
 )
@@ -24,10 +29,24 @@ if TYPE_CHECKING:
 from ..annotations import AttributeMixin, attribute
 from ..events import event_bus
 from ..utils import generate_id
+from ._visit_hooks import dispatch_table, invalidate_dispatch_tables
 from .walker_components.event_system import WalkerEventSystem
+from .walker_components.hook_offload import HookOffload
+from .walker_components.prefetch_pipeline import PrefetchPipeline, active_prefetch
 from .walker_components.protection import TraversalProtection
-from .walker_components.walker_queue import WalkerQueue
-from .walker_components.walker_trail import WalkerTrail
+from .walker_components.visit_tracking import (
+    VISIT_TRACKING_MODES,
+    IdInterner,
+    make_visit_counter,
+)
+from .walker_components.walker_queue import PriorityWalkerQueue, WalkerQueue
+from .walker_components.walker_trail import CompactWalkerTrail, WalkerTrail
+
+# ``(walker, node, reports)`` of the visit running in the current task when a
+# walker with ``concurrency > 1`` runs parallel-safe hooks concurrently.
+_visit_scope: ContextVar[Optional[Tuple[Any, Any, List[Any]]]] = ContextVar(
+    "jvspatial_walker_visit_scope", default=None
+)
 
 
 class WalkerVisitingContext:
@@ -101,6 +120,8 @@ class Walker(AttributeMixin, BaseModel):
         trail_metadata: Additional metadata for each trail step (read-only)
         trail_enabled: Whether trail tracking is enabled (configurable)
         max_trail_length: Maximum trail length (0 = unlimited, configurable)
+        visit_tracking: "dict" (default), "compact" or "bloom" visit counts
+            and trail storage (see walker_components.visit_tracking)
 
         # Infinite Walk Protection (all transient - runtime only)
         max_steps: Maximum number of steps before auto-halt (default: 10000)
@@ -216,19 +237,8 @@ class Walker(AttributeMixin, BaseModel):
         # Extract node ID if node is an object
         node_id = node.id if hasattr(node, "id") else node
 
-        # Get trail and extract node IDs
-        trail = self.get_trail()
-        node_ids = []
-        for step in trail:
-            if isinstance(step, dict):
-                node_ids.append(step.get("node", ""))
-            else:
-                node_ids.append(str(step))
-
-        # Check if node ID appears more than once
-        # (meaning it was visited before this current visit)
-        count = node_ids.count(node_id)
-        return count > 1  # More than once means visited before
+        # More than once means visited before this current visit
+        return self._trail_tracker.visit_count(node_id) > 1
 
     def get_recent_trail(self, count: int) -> List[str]:
         """Get the most recent trail entries (pure computation)."""
@@ -243,13 +253,11 @@ class Walker(AttributeMixin, BaseModel):
 
     def has_visited(self, node_id: str) -> bool:
         """Check if a node has been visited (pure computation)."""
-        trail = self._trail_tracker._trail
-        return any(step.get("node") == node_id for step in trail)
+        return self._trail_tracker.visit_count(node_id) > 0
 
     async def get_visit_count(self, node_id: str) -> int:
         """Get the number of times a node has been visited (pure computation)."""
-        trail = self._trail_tracker.get_trail()
-        return sum(1 for step in trail if step.get("node") == node_id)
+        return self._trail_tracker.visit_count(node_id)
 
     async def detect_cycles(self) -> List[List[str]]:
         """Detect cycles in the trail (requires computation)."""
@@ -273,7 +281,7 @@ class Walker(AttributeMixin, BaseModel):
         has_cycles = len(trail) > len(unique_nodes) if unique_nodes else False
         cycles_detected = 1 if has_cycles else 0
 
-        return {
+        summary = {
             "total_steps": len(trail),
             "length": len(trail),  # Alias for compatibility
             "unique_nodes": len(unique_nodes),
@@ -284,6 +292,9 @@ class Walker(AttributeMixin, BaseModel):
             "most_visited": None,
             "recent_nodes": [],
         }
+        if self._prefetch_pipeline is not None:
+            summary["prefetch"] = self._prefetch_pipeline.stats()
+        return summary
 
     def clear_trail(self) -> None:
         """Clear the trail (pure computation)."""
@@ -404,10 +415,43 @@ class Walker(AttributeMixin, BaseModel):
             "max_trail_length",
             int(env("JVSPATIAL_WALKER_MAX_TRAIL_LENGTH", default="0")),
         )
-        frontier_batch_size = kwargs.pop("frontier_batch_size", 1)
+        # Parallel-safe visit hooks of up to ``concurrency`` nodes of one
+        # frontier batch run concurrently; the batch defaults to that size.
+        concurrency = max(1, int(kwargs.pop("concurrency", 1)))
+        frontier_batch_size = kwargs.pop("frontier_batch_size", None)
+        # In-flight cap per pool for ``@on_visit(executor=...)`` hooks;
+        # defaults to twice the pool size.
+        offload_max_pending = kwargs.pop("offload_max_pending", None)
+        # ``queue="priority"`` selects the heap-backed best-first queue;
+        # ``queue_key(node)`` gives the priority of nodes queued without one.
+        queue_mode = kwargs.pop("queue", "fifo")
+        queue_key = kwargs.pop("queue_key", None)
+        if queue_mode not in ("fifo", "priority"):
+            raise ValueError(f"queue must be 'fifo' or 'priority', got {queue_mode!r}")
+        if frontier_batch_size is None:
+            frontier_batch_size = concurrency
+        # ``visit_tracking="compact"`` / ``"bloom"`` swap the dict visit
+        # counts and dict-per-step trail for compact structures.
+        visit_tracking = kwargs.pop(
+            "visit_tracking", env("JVSPATIAL_WALKER_VISIT_TRACKING", default="dict")
+        )
+        bloom_capacity = int(kwargs.pop("bloom_capacity", 1_000_000))
+        bloom_fp_rate = float(kwargs.pop("bloom_fp_rate", 0.01))
+        if visit_tracking not in VISIT_TRACKING_MODES:
+            raise ValueError(
+                f"visit_tracking must be one of {', '.join(VISIT_TRACKING_MODES)}, "
+                f"got {visit_tracking!r}"
+            )
         prefetch_neighbors = kwargs.pop("prefetch_neighbors", False)
         prefetch_depth = kwargs.pop("prefetch_depth", 1)
         speculative_prefetch = kwargs.pop("speculative_prefetch", False)
+        # ``prefetch_pipeline=True`` loads the outgoing neighbors of up to
+        # ``prefetch_batches`` upcoming frontier batches in the background;
+        # see walker_components/prefetch_pipeline.py.
+        prefetch_pipeline = kwargs.pop("prefetch_pipeline", False)
+        prefetch_batches = int(kwargs.pop("prefetch_batches", 4))
+        prefetch_max_in_flight = int(kwargs.pop("prefetch_max_in_flight", 2))
+        prefetch_max_nodes = int(kwargs.pop("prefetch_max_nodes", 10_000))
         # Optional pluggable trail store. When provided, steps mirror to
         # the store so a fresh process can call ``Walker.resume()`` and
         # pick up where this one left off. ROADMAP §2.5.
@@ -421,13 +465,28 @@ class Walker(AttributeMixin, BaseModel):
         self._max_queue_size = max_queue_size
         self._paused = paused
         self._frontier_batch_size = max(1, int(frontier_batch_size))
+        self._concurrency = concurrency
+        self._disengaged = False
+        self._hook_offload = HookOffload(max_pending=offload_max_pending)
         self._prefetch_neighbors = bool(prefetch_neighbors)
         self._prefetch_depth = max(1, int(prefetch_depth))
         self._speculative_prefetch = bool(speculative_prefetch)
         self._speculative_prefetch_task: Optional[asyncio.Task[None]] = None
+        self._prefetch_pipeline: Optional[PrefetchPipeline] = (
+            PrefetchPipeline(
+                batch_size=self._frontier_batch_size,
+                max_batches=prefetch_batches,
+                max_in_flight=prefetch_max_in_flight,
+                max_nodes=prefetch_max_nodes,
+            )
+            if prefetch_pipeline
+            else None
+        )
 
         # Initialize reporting system
         self._report = []
+        # Set by ``stream()``: reports go to the consumer instead of _report.
+        self._report_sink: Optional[asyncio.Queue[Any]] = None
 
         # Initialize event system
         self._event_handlers = {}
@@ -435,17 +494,40 @@ class Walker(AttributeMixin, BaseModel):
 
         # Initialize composition components
         self._queue: deque[Any] = deque()  # Create new deque for queue manager
-        self.queue = WalkerQueue(backing_deque=self._queue, max_size=max_queue_size)
+        if queue_mode == "priority":
+            self.queue: WalkerQueue = PriorityWalkerQueue(
+                max_size=max_queue_size, key=queue_key
+            )
+        else:
+            self.queue = WalkerQueue(backing_deque=self._queue, max_size=max_queue_size)
         # Replace default unbounded trail with a (possibly bounded) one so
         # ``max_trail_length`` from kwargs/env is honored (SPEC §6.4). When
         # ``trail_store`` is provided, mirror every recorded step to the
         # store keyed by the walker's id so a fresh process can resume.
         self._trail_store = trail_store
-        self._trail_tracker = WalkerTrail(
-            max_length=max_trail_length,
-            store=trail_store,
-            walker_id=self.id if trail_store is not None else None,
-        )
+        interner = IdInterner() if visit_tracking == "compact" else None
+
+        def _counter():
+            return make_visit_counter(
+                visit_tracking,
+                interner=interner,
+                capacity=bloom_capacity,
+                fp_rate=bloom_fp_rate,
+            )
+
+        if visit_tracking == "dict":
+            self._trail_tracker = WalkerTrail(
+                max_length=max_trail_length,
+                store=trail_store,
+                walker_id=self.id if trail_store is not None else None,
+            )
+        else:
+            self._trail_tracker = CompactWalkerTrail(
+                max_length=max_trail_length,
+                counter=_counter(),
+                store=trail_store,
+                walker_id=self.id if trail_store is not None else None,
+            )
         self._protection = TraversalProtection(
             max_steps=max_steps,
             max_visits_per_node=max_visits_per_node,
@@ -455,6 +537,7 @@ class Walker(AttributeMixin, BaseModel):
                 default=True,
                 parse=parse_bool_basic,
             ),
+            visit_counter=_counter(),
         )
         self._walker_events = WalkerEventSystem()
 
@@ -499,6 +582,7 @@ class Walker(AttributeMixin, BaseModel):
                             raise TypeError(
                                 f"Walker @on_visit must target Node/Edge types or string names, got {target.__name__ if hasattr(target, '__name__') else target}"
                             )
+        invalidate_dispatch_tables()
 
     def _register_event_handlers(self):
         """Register all @on_emit methods for event handling."""
@@ -516,7 +600,37 @@ class Walker(AttributeMixin, BaseModel):
         Args:
             data: Any data to add to the report
         """
-        self._report.append(data)
+        scope = _visit_scope.get()
+        if scope is not None and scope[0] is self:
+            # Concurrent visit: buffered, merged in frontier order.
+            scope[2].append(data)
+        else:
+            await self._publish_reports([data])
+
+    async def _publish_reports(self, items: List[Any]) -> None:
+        """Append ``items`` to the report, or hand them to ``stream()``.
+
+        While streaming, a full buffer blocks here, which holds up the
+        hook that reported and with it the traversal.
+        """
+        sink = self._report_sink
+        if sink is None:
+            self._report.extend(items)
+            return
+        for item in items:
+            await sink.put(item)
+
+    def hook_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Latency of offloaded (``executor=``) visit hooks, by hook name.
+
+        Each entry has ``calls``, ``errors``, ``mean_wait_ms`` (backpressure
+        and pool queueing), ``mean_run_ms`` (inside the hook), ``p50_ms``,
+        ``p99_ms`` and ``max_ms``.
+        """
+        return {
+            name: latency.as_dict()
+            for name, latency in self._hook_offload.metrics.items()
+        }
 
     async def get_report(self) -> List[Any]:
         """Get the current report list.
@@ -526,6 +640,65 @@ class Walker(AttributeMixin, BaseModel):
         """
         return self._report
 
+    async def stream(
+        self,
+        start_node: Optional[Union["Node", "Edge"]] = None,
+        *,
+        buffer: int = 16,
+    ) -> AsyncIterator[Any]:
+        """Traverse and yield report items as they are produced.
+
+        Runs ``spawn(start_node)`` in a background task, or ``run()`` when
+        no start node is given and the queue already holds nodes. Items are
+        handed over through a queue of ``buffer`` items: when the consumer
+        falls behind, ``report()`` blocks and the traversal waits.
+        Streamed items are not kept in ``get_report()``.
+
+        Leaving the ``async for`` early cancels the traversal. Exceptions
+        raised by the traversal are re-raised after the items reported
+        before them.
+
+        Args:
+            start_node: Node to start from (defaults to root, as ``spawn``)
+            buffer: Reported items held for the consumer before the
+                traversal blocks
+
+        Yields:
+            Each reported item, in report order
+        """
+        sink: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, int(buffer)))
+        self._report_sink = sink
+
+        async def _traverse() -> None:
+            if start_node is None and self.queue:
+                await self.run()
+            else:
+                await self.spawn(start_node)
+
+        task = asyncio.create_task(_traverse())
+        try:
+            while True:
+                if not sink.empty():
+                    yield sink.get_nowait()
+                    continue
+                if task.done():
+                    break
+                getter = asyncio.ensure_future(sink.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            task.result()
+        finally:
+            # Reports made while the traversal unwinds go to _report, so a
+            # cancelled traversal never blocks on a consumer that left.
+            self._report_sink = None
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
     async def emit(
         self,
         event: str,
@@ -542,6 +715,9 @@ class Walker(AttributeMixin, BaseModel):
     @property
     def current_node(self: "Walker") -> Optional[Union["Node", "Edge"]]:
         """Get the current node or edge being visited."""
+        scope = _visit_scope.get()
+        if scope is not None and scope[0] is self:
+            return scope[1]
         return self._current_node
 
     @current_node.setter
@@ -610,16 +786,22 @@ class Walker(AttributeMixin, BaseModel):
         """
         return self
 
-    async def visit(self: "Walker", nodes: Union["Node", List["Node"]]) -> list:
+    async def visit(
+        self: "Walker",
+        nodes: Union["Node", List["Node"]],
+        priority: Optional[float] = None,
+    ) -> list:
         """Add nodes to the traversal queue for later processing.
 
         Args:
             nodes: Node or list of nodes to visit
+            priority: Priority for ``queue="priority"`` walkers (lowest
+                pops first); defaults to ``queue_key(node)``
 
         Returns:
             List of nodes added to the queue
         """
-        return await self.append(nodes)
+        return await self.append(nodes, priority=priority)
 
     async def dequeue(
         self: "Walker", nodes: Union["Node", List["Node"]]
@@ -651,18 +833,30 @@ class Walker(AttributeMixin, BaseModel):
         return nodes_list
 
     async def append(
-        self: "Walker", nodes: Union["Node", List["Node"]]
+        self: "Walker",
+        nodes: Union["Node", List["Node"]],
+        priority: Optional[float] = None,
     ) -> List["Node"]:
         """Add node(s) to the end of the queue.
 
         Args:
             nodes: Node or list of nodes to add to the end of the queue
+            priority: Priority for ``queue="priority"`` walkers (lowest
+                pops first); defaults to ``queue_key(node)``
 
         Returns:
             List of nodes added to the queue
+
+        Raises:
+            ValueError: If ``priority`` is given to a FIFO walker
         """
         nodes_list = nodes if isinstance(nodes, list) else [nodes]
-        await self.queue.append(nodes_list)
+        if priority is None:
+            await self.queue.append(nodes_list)
+        elif isinstance(self.queue, PriorityWalkerQueue):
+            await self.queue.append(nodes_list, priority=priority)
+        else:
+            raise ValueError("priority= requires a Walker(queue='priority')")
         return nodes_list
 
     async def add_next(
@@ -766,7 +960,11 @@ class Walker(AttributeMixin, BaseModel):
         if not node_batch:
             return
 
-        if self._prefetch_depth > 1:
+        from ..context import get_default_context
+
+        context = get_default_context()
+        traverse = getattr(context.database, "traverse", None)
+        if self._prefetch_depth > 1 and callable(traverse):
             for node in node_batch:
                 neighbors = await node.neighborhood(
                     self._prefetch_depth, direction="out"
@@ -776,12 +974,14 @@ class Walker(AttributeMixin, BaseModel):
                         await self.queue.append([neighbor])
             return
 
-        node_ids = [n.id for n in node_batch]
-        bulk = await Node.nodes_bulk(node_ids, direction="out")
-        for neighbors in bulk.values():
-            for neighbor in neighbors:
-                if not self.has_visited(neighbor.id):
-                    await self.queue.append([neighbor])
+        # One edge query and one node batch fetch per hop for the whole
+        # batch; nodes with typed adjacency entries skip the edge query.
+        rows = await context.expand_frontier(
+            node_batch, self._prefetch_depth, direction="out"
+        )
+        for row in rows:
+            if not self.has_visited(row["node_id"]):
+                await self.queue.append([row["node"]])
 
     async def _start_speculative_prefetch(self) -> None:
         """Warm the entity cache for the next queued node ids while hooks run."""
@@ -791,7 +991,7 @@ class Walker(AttributeMixin, BaseModel):
         from .node import Node
 
         pending_ids: List[str] = []
-        for item in self.queue.to_list():
+        for item in self.queue.peek(4 * self._frontier_batch_size):
             if isinstance(item, Node) and item.id not in pending_ids:
                 pending_ids.append(item.id)
             if len(pending_ids) >= self._frontier_batch_size:
@@ -816,6 +1016,102 @@ class Walker(AttributeMixin, BaseModel):
             with suppress(Exception):
                 await task
 
+    async def _begin_step(self, current: Union["Node", "Edge"]) -> None:
+        """Make ``current`` the current node and count the step.
+
+        Raises ``ProtectionViolation`` when a step or visit limit is hit.
+        """
+        self.current_node = current
+
+        if hasattr(current, "id"):
+            self._protection.record_visit(current.id)
+
+        # Awaited so a buffering trail store applies backpressure instead
+        # of spawning a write task per step.
+        await self._trail_tracker.arecord_step(
+            current.id if hasattr(current, "id") else str(current)
+        )
+
+        await self._protection.increment_step()
+
+    async def _visit_in_scope(
+        self,
+        current: Union["Node", "Edge"],
+        reports: List[Any],
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Run one visit's hooks with its own current node and report buffer."""
+        _visit_scope.set((self, current, reports))
+        try:
+            await self._execute_visit_hooks(current)
+        finally:
+            slots.release()
+
+    async def _run_batch_concurrently(self, batch: List[Any]) -> None:
+        """Visit ``batch`` with up to ``concurrency`` visits in flight.
+
+        Steps are counted in frontier order before each visit starts, so
+        protection limits stop the batch at the same node as a sequential
+        run. A visit whose hooks are not all ``parallel_safe`` waits for the
+        visits before it and runs alone. Each concurrent visit buffers its
+        reports; buffers are appended to the report in frontier order.
+        Once the walker pauses, no further visits start: the rest of the
+        batch goes back to the head of the queue, or is dropped after
+        ``disengage()``.
+        """
+        from .edge import Edge
+        from .node import Node
+
+        slots = asyncio.Semaphore(self._concurrency)
+        running: List[Tuple[asyncio.Task[None], List[Any]]] = []
+
+        async def _settle() -> None:
+            results = await asyncio.gather(
+                *(task for task, _ in running), return_exceptions=True
+            )
+            for _, reports in running:
+                await self._publish_reports(reports)
+            running.clear()
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        if self._speculative_prefetch:
+            await self._start_speculative_prefetch()
+        try:
+            for index, current in enumerate(batch):
+                if not isinstance(current, (Node, Edge)):
+                    continue
+                parallel = dispatch_table(type(self), type(current)).parallel_safe
+                if parallel:
+                    await slots.acquire()
+                else:
+                    await _settle()
+                if self._paused:
+                    if parallel:
+                        slots.release()
+                    if not self._disengaged:
+                        await self.queue.prepend(batch[index:])
+                    return
+                try:
+                    await self._begin_step(current)
+                except BaseException:
+                    if parallel:
+                        slots.release()
+                    raise
+                if not parallel:
+                    await self._execute_visit_hooks(current)
+                    continue
+                reports: List[Any] = []
+                task = asyncio.create_task(
+                    self._visit_in_scope(current, reports, slots)
+                )
+                running.append((task, reports))
+        finally:
+            await _settle()
+            if self._speculative_prefetch:
+                await self._finish_speculative_prefetch()
+
     async def run(self: "Walker") -> List[Any]:
         """Run the walker traversal.
 
@@ -838,71 +1134,89 @@ class Walker(AttributeMixin, BaseModel):
         from .node import Node
         from .walker_components.protection import ProtectionViolation
 
-        # Process queue until empty or paused
-        while self.queue and not self._paused:
-            try:
-                # Check protection limits
-                if not await self._protection.check_limits():
-                    break
+        pipeline = self._prefetch_pipeline
+        pipeline_token = None
+        if pipeline is not None:
+            pipeline_token = active_prefetch.set(pipeline)
+            pipeline.start(self)
 
-                batch = self._drain_frontier_batch()
-                if not batch:
-                    continue
-
-                if self._prefetch_neighbors:
-                    await self._prefetch_neighbors_for_batch(batch)
+        try:
+            # Process queue until empty or paused
+            while self.queue and not self._paused:
+                try:
+                    # Check protection limits
+                    if not await self._protection.check_limits():
+                        break
 
-                for current in batch:
-                    if not isinstance(current, (Node, Edge)):
+                    batch = self._drain_frontier_batch()
+                    if not batch:
                         continue
-                    self.current_node = current
 
-                    if hasattr(current, "id"):
-                        self._protection.record_visit(current.id)
+                    if pipeline is not None:
+                        pipeline.batch_started()
 
-                    self._trail_tracker.record_step(
-                        current.id if hasattr(current, "id") else str(current)
-                    )
+                    if self._prefetch_neighbors:
+                        await self._prefetch_neighbors_for_batch(batch)
 
-                    await self._protection.increment_step()
-
-                    if self._speculative_prefetch:
-                        await self._start_speculative_prefetch()
-
-                    await self._execute_visit_hooks(current)
+                    if self._concurrency > 1:
+                        await self._run_batch_concurrently(batch)
+                        if pipeline is not None:
+                            pipeline.batch_done(batch)
+                        continue
 
-                    if self._speculative_prefetch:
-                        await self._finish_speculative_prefetch()
-
-            except ProtectionViolation as pv:
-                # SPEC §6.3 / §17: surface protection violations as the
-                # documented exception types instead of swallowing them
-                # into the walker report (audit §2.1).
-                walker_class = type(self).__name__
-                ptype = pv.protection_type
-                if ptype == "max_visits_per_node":
-                    raise InfiniteLoopError(
+                    for current in batch:
+                        if not isinstance(current, (Node, Edge)):
+                            continue
+                        await self._begin_step(current)
+
+                        if self._speculative_prefetch:
+                            await self._start_speculative_prefetch()
+
+                        await self._execute_visit_hooks(current)
+
+                        if self._speculative_prefetch:
+                            await self._finish_speculative_prefetch()
+
+                    if pipeline is not None:
+                        pipeline.batch_done(batch)
+
+                except ProtectionViolation as pv:
+                    # SPEC §6.3 / §17: surface protection violations as the
+                    # documented exception types instead of swallowing them
+                    # into the walker report (audit §2.1).
+                    walker_class = type(self).__name__
+                    ptype = pv.protection_type
+                    if ptype == "max_visits_per_node":
+                        raise InfiniteLoopError(
+                            walker_class=walker_class,
+                            node_id=pv.details.get("node_id", ""),
+                            visit_count=pv.details.get("visit_count", 0),
+                        ) from pv
+                    if ptype == "timeout":
+                        raise WalkerTimeoutError(
+                            walker_class=walker_class,
+                            timeout_seconds=pv.details.get(
+                                "max_execution_time", self._max_execution_time
+                            ),
+                        ) from pv
+                    # ``max_steps`` and any future protection types.
+                    raise WalkerExecutionError(
                         walker_class=walker_class,
-                        node_id=pv.details.get("node_id", ""),
-                        visit_count=pv.details.get("visit_count", 0),
+                        reason=f"protection_triggered: {ptype}",
+                        details=pv.details,
                     ) from pv
-                if ptype == "timeout":
-                    raise WalkerTimeoutError(
-                        walker_class=walker_class,
-                        timeout_seconds=pv.details.get(
-                            "max_execution_time", self._max_execution_time
-                        ),
-                    ) from pv
-                # ``max_steps`` and any future protection types.
-                raise WalkerExecutionError(
-                    walker_class=walker_class,
-                    reason=f"protection_triggered: {ptype}",
-                    details=pv.details,
-                ) from pv
-            except Exception as e:
-                # Handle other (non-protection) errors gracefully.
-                await self.report(f"Error during traversal: {e}")
-                break
+                except Exception as e:
+                    # Handle other (non-protection) errors gracefully.
+                    await self.report(f"Error during traversal: {e}")
+                    break
+
+        finally:
+            if pipeline is not None:
+                await pipeline.stop()
+                active_prefetch.reset(pipeline_token)
+            # Buffered trail steps are written when the run returns,
+            # pauses or fails, so ``restore()`` sees the whole trail.
+            await self._trail_tracker.flush()
 
         return await self.get_report()
 
@@ -916,36 +1230,14 @@ class Walker(AttributeMixin, BaseModel):
         Args:
             target: Node or Edge being visited
         """
-        target_type = type(target)
-        target_name = target_type.__name__
-        walker_type = type(self)
-        walker_name = walker_type.__name__
-
-        # =====================================================================
-        # Step 1: Execute walker hooks (hooks registered on the walker)
-        # =====================================================================
-        walker_hooks = list(self._visit_hooks.get(target_type, []))
-
-        # Include hooks registered for base classes (support subclass matching)
-        for base in target_type.mro()[1:]:  # skip the exact class (already added)
-            if base in self._visit_hooks:
-                walker_hooks.extend(self._visit_hooks.get(base, []))
-
-        # Get hooks for string name (forward references)
-        walker_hooks.extend(self._visit_hooks.get(target_name, []))
-
-        # Get general hooks (None key)
-        walker_hooks.extend(self._visit_hooks.get(None, []))
-
-        # Execute walker hooks (ensure stable order and no duplicates)
-        seen = set()
-        walker_hook_skipped = False
-        for hook in walker_hooks:
-            if hook in seen:
-                continue
-            seen.add(hook)
+        # Hook lookup (MRO walk, name and None keys, dedup, async check) is
+        # resolved once per (walker class, target class); see _visit_hooks.
+        table = dispatch_table(type(self), type(target))
+
+        # Step 1: walker hooks, called as hook(walker, target).
+        for hook, is_async in table.walker_hooks:
             try:
-                if asyncio.iscoroutinefunction(hook):
+                if is_async:
                     await hook(self, target)
                 else:
                     hook(self, target)
@@ -955,79 +1247,39 @@ class Walker(AttributeMixin, BaseModel):
                 from . import TraversalSkipped
 
                 if isinstance(e, TraversalSkipped):
-                    walker_hook_skipped = True
+                    # A walker hook skipping the node also skips node hooks.
                     return
-                else:
-                    # Report error as structured data
-                    await self.report(
-                        {
-                            "hook_error": str(e),
-                            "hook_name": hook.__name__,
-                            "node_id": getattr(target, "id", str(target)),
-                        }
-                    )
-
-        # If walker hook skipped the node, don't execute node hooks
-        if walker_hook_skipped:
-            return
-
-        # =====================================================================
-        # Step 2: Execute node/edge hooks (hooks registered on the target)
-        # =====================================================================
-        # Visit hooks are stored on the class, not the instance
-        target_class = type(target)
-        if not hasattr(target_class, "_visit_hooks"):
-            return
-
-        target_hooks = []
-        target_visit_hooks = getattr(target_class, "_visit_hooks", {})
-
-        # Get hooks for this specific walker type
-        if walker_type in target_visit_hooks:
-            target_hooks.extend(target_visit_hooks[walker_type])
-
-        # Include hooks registered for base walker classes (support subclass matching)
-        for base in walker_type.mro()[1:]:  # skip the exact class (already added)
-            if base in target_visit_hooks:
-                target_hooks.extend(target_visit_hooks[base])
-
-        # Get hooks for walker string name (forward references)
-        if walker_name in target_visit_hooks:
-            target_hooks.extend(target_visit_hooks[walker_name])
-
-        # Get general hooks (None key - for any walker)
-        if None in target_visit_hooks:
-            target_hooks.extend(target_visit_hooks[None])
+                # Report error as structured data
+                await self.report(
+                    {
+                        "hook_error": str(e),
+                        "hook_name": hook.__name__,
+                        "node_id": getattr(target, "id", str(target)),
+                    }
+                )
 
-        # Execute target hooks (ensure stable order and no duplicates)
-        for hook in target_hooks:
-            if hook in seen:
-                continue
-            seen.add(hook)
+        # Step 2: node/edge hooks. They are plain functions stored on the
+        # target class, so hook(target, walker) is the bound-method call
+        # ``target.hook(walker)`` without binding on every visit.
+        for hook, is_async in table.target_hooks:
             try:
-                # Node/edge hooks are called with the node/edge as 'self' and walker as parameter
-                # The hook signature is: async def execute(self, visitor: Walker) -> None
-                # where 'self' is the node/edge and 'visitor' is the walker
-                # Bind the unbound method to the target instance, then call with walker
-                bound_hook = hook.__get__(target, target_class)
-                if asyncio.iscoroutinefunction(bound_hook):
-                    await bound_hook(self)
+                if is_async:
+                    await hook(target, self)
                 else:
-                    bound_hook(self)
+                    hook(target, self)
             except Exception as e:
                 from . import TraversalSkipped
 
                 if isinstance(e, TraversalSkipped):
                     return
-                else:
-                    # Report error as structured data
-                    await self.report(
-                        {
-                            "hook_error": str(e),
-                            "hook_name": hook.__name__,
-                            "node_id": getattr(target, "id", str(target)),
-                        }
-                    )
+                # Report error as structured data
+                await self.report(
+                    {
+                        "hook_error": str(e),
+                        "hook_name": hook.__name__,
+                        "node_id": getattr(target, "id", str(target)),
+                    }
+                )
 
     async def _execute_exit_hooks(self) -> None:
         """Execute all @on_exit decorated methods."""
@@ -1063,13 +1315,70 @@ class Walker(AttributeMixin, BaseModel):
 
         # Add the start node to the queue and begin traversal
         # Only add if not already in queue to avoid duplicates
-        if start_node not in self.queue._backing:
+        if start_node not in self.queue:
             await self.queue.append([start_node])
         await self.run()
         # Execute exit hooks
         await self._execute_exit_hooks()
         return self
 
+    @staticmethod
+    async def spawn_many(
+        walkers: Iterable[
+            Union["Walker", Tuple["Walker", Optional[Union["Node", "Edge"]]]]
+        ],
+        *,
+        concurrency: int = 8,
+    ) -> List[List[Any]]:
+        """Spawn many walkers concurrently over one shared read cache.
+
+        Up to ``concurrency`` walkers run at once inside a request-scoped
+        identity map (see ``begin_request_identity_map``): an entity one
+        walker loaded is reused by the others, and walkers asking for the
+        same id at the same time share one database read. If an identity
+        map is already active (e.g. inside a request), it is used as is.
+
+        Args:
+            walkers: Walkers, or ``(walker, start_node)`` pairs; a bare
+                walker starts at root like ``spawn()``
+            concurrency: Maximum number of walkers running at once
+
+        Returns:
+            Each walker's report, in input order
+
+        Raises:
+            Whatever a walker's ``spawn()`` raises; the other walkers
+            still running are cancelled first.
+        """
+        from ..context import (
+            _request_identity_map,
+            begin_request_identity_map,
+            end_request_identity_map,
+        )
+
+        jobs = [item if isinstance(item, tuple) else (item, None) for item in walkers]
+        slots = asyncio.Semaphore(max(1, int(concurrency)))
+
+        async def _spawn(walker: "Walker", start: Any) -> List[Any]:
+            async with slots:
+                await walker.spawn(start)
+            return await walker.get_report()
+
+        token = None
+        if _request_identity_map.get() is None:
+            token = begin_request_identity_map()
+        tasks = [asyncio.ensure_future(_spawn(w, start)) for w, start in jobs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if token is not None:
+                end_request_identity_map(token)
+
     async def skip(self) -> None:
         """Skip the current node and continue traversal.
 
@@ -1105,6 +1414,7 @@ class Walker(AttributeMixin, BaseModel):
             The walker instance for chaining
         """
         self._paused = False
+        self._disengaged = False
         # Continue processing the queue
         await self.run()
         return self
@@ -1118,6 +1428,7 @@ class Walker(AttributeMixin, BaseModel):
             The walker instance for chaining
         """
         self._paused = True
+        self._disengaged = True
         # Clear visitor from current node
         if self.current_node and hasattr(self.current_node, "set_visitor"):
             self.current_node.set_visitor(None)
@@ -1151,6 +1462,8 @@ class Walker(AttributeMixin, BaseModel):
         # Exclude transient fields from context (id, entity, and type_code are transient)
         exclude_set = {
             "_report",
+            "_report_sink",
+            "_prefetch_pipeline",
             "_event_handlers",
             "_current_node",
             "_paused",
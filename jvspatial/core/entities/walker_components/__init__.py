@@ -1,11 +1,19 @@
 """Walker subcomponents for jvspatial."""
 
 from .event_system import WalkerEventSystem
+from .prefetch_pipeline import PrefetchPipeline
 from .protection import TraversalProtection
-from .walker_queue import WalkerQueue
-from .walker_trail import WalkerTrail
+from .visit_tracking import CountingBloomFilter, IdInterner, VisitCounter
+from .walker_queue import PriorityWalkerQueue, WalkerQueue
+from .walker_trail import CompactWalkerTrail, WalkerTrail
 
 __all__ = [
+    "CompactWalkerTrail",
+    "CountingBloomFilter",
+    "IdInterner",
+    "PrefetchPipeline",
+    "PriorityWalkerQueue",
+    "VisitCounter",
     "WalkerEventSystem",
     "TraversalProtection",
     "WalkerQueue",
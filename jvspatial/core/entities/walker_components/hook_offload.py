@@ -0,0 +1,275 @@
+"""Thread- and process-pool offload for CPU-heavy visit hooks.
+
+A hook declared with ``@on_visit(..., executor="thread")`` or
+``executor="process"`` does not receive the walker or the live entity.
+It is a plain function of one argument: the visited entity's flat export
+(``{"id", "entity", **fields}``), a picklable dict. It runs in a managed
+pool, off the event loop, and returns a mapping of field updates (or
+``None``). The walker applies the updates to the entity back on the loop;
+saving stays up to the walker.
+
+Pools are shared by every walker in the process and created on first use.
+Size them with ``JVSPATIAL_HOOK_THREAD_WORKERS`` /
+``JVSPATIAL_HOOK_PROCESS_WORKERS`` or :func:`configure_hook_pools`.
+Process-pool hooks must be importable by the workers: define them on a
+module-level class.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Mapping, Optional
+
+EXECUTOR_KINDS = ("thread", "process")
+
+# Latency samples kept per hook for the percentiles.
+_SAMPLES = 1024
+
+
+def _timed_call(hook: Callable[[Dict[str, Any]], Any], record: Dict[str, Any]):
+    """Run ``hook`` in a worker and return ``(result, seconds)``."""
+    started = time.perf_counter()
+    result = hook(record)
+    return result, time.perf_counter() - started
+
+
+class HookPools:
+    """Lazily created thread and process pools for offloaded hooks."""
+
+    def __init__(
+        self,
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize the pools.
+
+        Args:
+            thread_workers: Thread pool size. Defaults to
+                ``JVSPATIAL_HOOK_THREAD_WORKERS`` or ``min(32, cpus + 4)``.
+            process_workers: Process pool size. Defaults to
+                ``JVSPATIAL_HOOK_PROCESS_WORKERS`` or the CPU count.
+        """
+        from jvspatial.env import env
+
+        cpus = os.cpu_count() or 1
+        self._workers = {
+            "thread": int(
+                thread_workers
+                or env("JVSPATIAL_HOOK_THREAD_WORKERS", default=str(min(32, cpus + 4)))
+            ),
+            "process": int(
+                process_workers
+                or env("JVSPATIAL_HOOK_PROCESS_WORKERS", default=str(cpus))
+            ),
+        }
+        self._executors: Dict[str, Executor] = {}
+        self._lock = threading.Lock()
+
+    def workers(self, kind: str) -> int:
+        """Configured size of the ``kind`` pool."""
+        return self._workers[kind]
+
+    def executor(self, kind: str) -> Executor:
+        """The ``kind`` pool, created on first use."""
+        pool = self._executors.get(kind)
+        if pool is None:
+            with self._lock:
+                pool = self._executors.get(kind)
+                if pool is None:
+                    if kind == "process":
+                        pool = ProcessPoolExecutor(max_workers=self._workers[kind])
+                    else:
+                        pool = ThreadPoolExecutor(
+                            max_workers=self._workers[kind],
+                            thread_name_prefix="jvspatial-hook",
+                        )
+                    self._executors[kind] = pool
+        return pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down every pool created so far."""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for pool in executors.values():
+            pool.shutdown(wait=wait)
+
+
+_pools: Optional[HookPools] = None
+
+
+def get_hook_pools() -> HookPools:
+    """The process-wide :class:`HookPools`."""
+    global _pools
+    if _pools is None:
+        _pools = HookPools()
+    return _pools
+
+
+def configure_hook_pools(
+    thread_workers: Optional[int] = None, process_workers: Optional[int] = None
+) -> HookPools:
+    """Replace the process-wide pools, shutting down the current ones."""
+    global _pools
+    if _pools is not None:
+        _pools.shutdown()
+    _pools = HookPools(thread_workers, process_workers)
+    return _pools
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    if _pools is not None:
+        _pools.shutdown(wait=False)
+
+
+class HookLatency:
+    """Latency of one offloaded hook.
+
+    ``wait`` is time spent waiting for a backpressure slot and a free
+    worker (plus pickling for process pools); ``run`` is time inside the
+    hook.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.wait_total = 0.0
+        self.run_total = 0.0
+        self.max_total = 0.0
+        self._samples: Deque[float] = deque(maxlen=_SAMPLES)
+
+    def record(self, wait: float, run: float) -> None:
+        """Add one call that queued for wait and ran for run seconds."""
+        self.calls += 1
+        self.wait_total += wait
+        self.run_total += run
+        self.max_total = max(self.max_total, wait + run)
+        self._samples.append(wait + run)
+
+    def _percentile(self, fraction: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counts and millisecond timings (``p50``/``p99`` over recent calls)."""
+        calls = max(1, self.calls)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_wait_ms": self.wait_total / calls * 1000,
+            "mean_run_ms": self.run_total / calls * 1000,
+            "p50_ms": self._percentile(0.5) * 1000,
+            "p99_ms": self._percentile(0.99) * 1000,
+            "max_ms": self.max_total * 1000,
+        }
+
+
+class HookOffload:
+    """Per-walker offload state: backpressure slots and latency metrics.
+
+    At most ``max_pending`` offloaded calls per pool kind are in flight for
+    one walker. A visit waits for a slot before submitting, so with
+    ``concurrency > 1`` a saturated pool stops the walker from starting
+    more visits instead of queueing unbounded work on the pool.
+    """
+
+    def __init__(
+        self, pools: Optional[HookPools] = None, max_pending: Optional[int] = None
+    ) -> None:
+        self._pools = pools
+        self._max_pending = max_pending
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self.metrics: Dict[str, HookLatency] = {}
+
+    @property
+    def pools(self) -> HookPools:
+        """The pools this walker offloads to (the process-wide ones by default)."""
+        return self._pools or get_hook_pools()
+
+    def _slot(self, kind: str) -> asyncio.Semaphore:
+        slots = self._slots.get(kind)
+        if slots is None:
+            limit = self._max_pending or 2 * self.pools.workers(kind)
+            slots = self._slots[kind] = asyncio.Semaphore(max(1, limit))
+        return slots
+
+    async def call(
+        self, hook: Callable[..., Any], kind: str, record: Dict[str, Any]
+    ) -> Any:
+        """Run ``hook(record)`` in the ``kind`` pool and return its result."""
+        latency = self.metrics.setdefault(hook.__qualname__, HookLatency())
+        started = time.perf_counter()
+        try:
+            async with self._slot(kind):
+                loop = asyncio.get_running_loop()
+                result, run = await loop.run_in_executor(
+                    self.pools.executor(kind), _timed_call, hook, record
+                )
+        except BaseException:
+            latency.errors += 1
+            raise
+        latency.record(time.perf_counter() - started - run, run)
+        return result
+
+
+def _apply(target: Any, updates: Optional[Mapping[str, Any]]) -> None:
+    if updates is None:
+        return
+    if not isinstance(updates, Mapping):
+        raise TypeError(
+            "offloaded visit hooks must return a mapping of field updates or "
+            f"None, got {type(updates).__name__}"
+        )
+    for name, value in updates.items():
+        setattr(target, name, value)
+
+
+async def _offload(
+    hook: Callable[..., Any], kind: str, walker: Any, target: Any
+) -> None:
+    record = await target.export(flat=True)
+    _apply(target, await walker._hook_offload.call(hook, kind, record))
+
+
+def offloaded_hook(hook: Callable[..., Any], kind: str, *, on_walker: bool):
+    """Async adapter the dispatch table calls in place of ``hook``.
+
+    Walker hooks are called as ``(walker, target)`` and target hooks as
+    ``(target, walker)``; both end up as ``hook(record)`` in the pool.
+    """
+
+    async def _walker_adapter(walker: Any, target: Any) -> None:
+        await _offload(hook, kind, walker, target)
+
+    async def _target_adapter(target: Any, walker: Any) -> None:
+        await _offload(hook, kind, walker, target)
+
+    adapter = _walker_adapter if on_walker else _target_adapter
+    functools.update_wrapper(adapter, hook)
+    return adapter
+
+
+def hook_executor(hook: Callable[..., Any]) -> Optional[str]:
+    """The ``executor=`` a hook was declared with, or None."""
+    return getattr(hook, "_visit_executor", None)
+
+
+__all__ = [
+    "EXECUTOR_KINDS",
+    "HookLatency",
+    "HookOffload",
+    "HookPools",
+    "configure_hook_pools",
+    "get_hook_pools",
+    "hook_executor",
+    "offloaded_hook",
+]
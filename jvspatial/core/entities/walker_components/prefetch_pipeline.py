@@ -0,0 +1,235 @@
+"""Background adjacency prefetch for upcoming frontier batches.
+
+``Walker(prefetch_pipeline=True)`` runs a :class:`PrefetchPipeline` during
+``run()``. While hooks work on the current batch, the pipeline loads the
+outgoing neighbors of the nodes in the next ``depth`` frontier batches
+with one :meth:`GraphContext.nodes_bulk` call per batch. A hook's
+``here.nodes()`` (outgoing, without an edge filter or property filters)
+is then answered from memory: a hit. A lookup whose fetch is still in
+flight waits for it; that wait is stall time.
+
+``depth`` adapts between 1 and ``max_batches``: it is the number of
+batches whose hook time covers one fetch (both tracked as moving
+averages), so slow storage is fetched further ahead and slow hooks need
+only the next batch. Fetches are bounded by ``max_in_flight`` concurrent
+queries and by ``max_nodes`` prefetched neighbors held at once.
+
+Entries are dropped when their batch finishes; those no hook asked for
+count as wasted. Edges added or removed through
+:meth:`GraphContext.atomic_add_edge_id` / ``atomic_remove_edge_id`` (what
+``connect()`` and ``disconnect()`` use) invalidate the entries of both
+ends. Edges written by other processes during the walk are not seen for
+nodes already prefetched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from ..node import Node
+
+logger = logging.getLogger(__name__)
+
+# Pipeline of the walker whose ``run()`` is active in this context; read by
+# ``Node.nodes()`` and by the edge-id writers in ``GraphContext``.
+active_prefetch: ContextVar[Optional["PrefetchPipeline"]] = ContextVar(
+    "active_prefetch", default=None
+)
+
+# Moving-average weight of the newest hook-time and fetch-latency sample.
+_EWMA_ALPHA = 0.3
+
+
+class PrefetchPipeline:
+    """Keeps the next frontier batches' outgoing adjacency loading."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        max_batches: int = 4,
+        max_in_flight: int = 2,
+        max_nodes: int = 10_000,
+    ) -> None:
+        self.batch_size = max(1, int(batch_size))
+        self.max_batches = max(1, int(max_batches))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.max_nodes = max(1, int(max_nodes))
+        self.depth = min(2, self.max_batches)
+
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        self.fetches = 0
+        self.stall_seconds = 0.0
+
+        self._walker: Any = None
+        self._context: Any = None
+        self._ready: Dict[str, List["Node"]] = {}
+        self._held = 0
+        self._taken: Set[str] = set()
+        self._in_flight: Dict[str, "asyncio.Task[None]"] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stale: Set[str] = set()
+        self._hook_seconds: Optional[float] = None
+        self._fetch_seconds: Optional[float] = None
+        self._batch_started = 0.0
+        self._batch_stall = 0.0
+
+    def start(self, walker: Any) -> None:
+        """Bind to ``walker``'s queue and start loading ahead."""
+        from jvspatial.core.context import get_default_context
+
+        self._walker = walker
+        self._context = get_default_context()
+        self.schedule()
+
+    async def stop(self) -> None:
+        """Cancel outstanding fetches; unused entries count as wasted."""
+        self.wasted += len(self._in_flight)
+        self.wasted += sum(1 for node_id in self._ready if node_id not in self._taken)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(BaseException):
+                await task
+        self._in_flight.clear()
+        self._tasks.clear()
+        self._ready.clear()
+        self._taken.clear()
+        self._stale.clear()
+        self._held = 0
+        self._walker = None
+
+    def schedule(self) -> None:
+        """Start fetches for the next ``depth`` batches, within the bounds."""
+        walker = self._walker
+        if walker is None:
+            return
+        from ..node import Node
+
+        wanted: List[str] = []
+        for item in walker.queue.peek(self.depth * self.batch_size):
+            if not isinstance(item, Node):
+                continue
+            node_id = item.id
+            if (
+                node_id not in self._ready
+                and node_id not in self._in_flight
+                and node_id not in wanted
+            ):
+                wanted.append(node_id)
+        for start in range(0, len(wanted), self.batch_size):
+            if len(self._tasks) >= self.max_in_flight or self._held >= self.max_nodes:
+                break
+            ids = wanted[start : start + self.batch_size]
+            task = asyncio.ensure_future(self._fetch(ids))
+            self.fetches += 1
+            self._tasks.add(task)
+            for node_id in ids:
+                self._in_flight[node_id] = task
+
+    async def _fetch(self, ids: List[str]) -> None:
+        started = time.perf_counter()
+        try:
+            neighbors = await self._context.nodes_bulk(ids, direction="out")
+        except Exception as exc:
+            # The hooks fall back to their own queries for these ids.
+            logger.debug(f"Adjacency prefetch failed: {exc}")
+            neighbors = None
+        finally:
+            for node_id in ids:
+                self._in_flight.pop(node_id, None)
+            self._tasks.discard(asyncio.current_task())  # type: ignore[arg-type]
+        if neighbors is None:
+            self._stale.difference_update(ids)
+            return
+        self._fetch_seconds = _ewma(self._fetch_seconds, time.perf_counter() - started)
+        for node_id in ids:
+            if node_id in self._stale:
+                self._stale.discard(node_id)
+                continue
+            nodes = neighbors.get(node_id, [])
+            self._ready[node_id] = nodes
+            self._held += len(nodes)
+        self.schedule()
+
+    async def take(self, node_id: str) -> Optional[List["Node"]]:
+        """Prefetched outgoing neighbors of ``node_id``, or None on a miss."""
+        task = self._in_flight.get(node_id)
+        if task is not None:
+            waited = time.perf_counter()
+            with contextlib.suppress(Exception):
+                await asyncio.shield(task)
+            stalled = time.perf_counter() - waited
+            self.stall_seconds += stalled
+            self._batch_stall += stalled
+        nodes = self._ready.get(node_id)
+        if nodes is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._taken.add(node_id)
+        return list(nodes)
+
+    def invalidate(self, node_id: str) -> None:
+        """Forget ``node_id``'s adjacency after one of its edges changed."""
+        nodes = self._ready.pop(node_id, None)
+        if nodes is not None:
+            self._held -= len(nodes)
+        self._taken.discard(node_id)
+        if node_id in self._in_flight:
+            self._stale.add(node_id)
+
+    def batch_started(self) -> None:
+        """Start timing a batch's hooks and top up the upcoming fetches."""
+        self._batch_started = time.perf_counter()
+        self._batch_stall = 0.0
+        self.schedule()
+
+    def batch_done(self, batch: List[Any]) -> None:
+        """Release ``batch``'s entries and adapt the depth to its hook time."""
+        for item in batch:
+            node_id = getattr(item, "id", None)
+            nodes = self._ready.pop(node_id, None) if node_id else None
+            if nodes is None:
+                continue
+            self._held -= len(nodes)
+            if node_id in self._taken:
+                self._taken.discard(node_id)
+            else:
+                self.wasted += 1
+        busy = time.perf_counter() - self._batch_started - self._batch_stall
+        self._hook_seconds = _ewma(self._hook_seconds, max(busy, 0.0))
+        if self._hook_seconds is not None and self._fetch_seconds is not None:
+            ahead = math.ceil(self._fetch_seconds / max(self._hook_seconds, 1e-6))
+            self.depth = max(1, min(self.max_batches, ahead))
+        self.schedule()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters reported in the walker's trail summary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+            "fetches": self.fetches,
+            "stall_ms": round(self.stall_seconds * 1000, 3),
+            "depth": self.depth,
+        }
+
+
+def _ewma(current: Optional[float], sample: float) -> float:
+    if current is None:
+        return sample
+    return current + _EWMA_ALPHA * (sample - current)
+
+
+__all__ = ["PrefetchPipeline", "active_prefetch"]
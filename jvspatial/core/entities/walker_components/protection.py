@@ -7,7 +7,9 @@ loops, excessive resource usage, and other potentially harmful behaviors.
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+from .visit_tracking import CountingBloomFilter, VisitCounter
 
 
 class ProtectionViolation(Exception):
@@ -34,6 +36,7 @@ class TraversalProtection:
         max_visits_per_node: int = 100,
         max_execution_time: float = 300.0,
         enabled: bool = True,
+        visit_counter: Optional[Union[VisitCounter, CountingBloomFilter]] = None,
     ):
         """Initialize traversal protection.
 
@@ -42,6 +45,8 @@ class TraversalProtection:
             max_visits_per_node: Maximum visits to any single node
             max_execution_time: Maximum execution time in seconds
             enabled: When False, limits are not enforced (JVSPATIAL_WALKER_PROTECTION_ENABLED)
+            visit_counter: Compact counter to keep visit counts in instead
+                of a dict (see :mod:`.visit_tracking`)
         """
         self._enabled = enabled
         self._max_steps = max_steps
@@ -49,6 +54,7 @@ class TraversalProtection:
         self._max_execution_time = max_execution_time
         self._steps = 0
         self._visit_counts: dict[str, int] = {}
+        self._visit_counter = visit_counter
         self._start_time: Optional[float] = None
         # Track visit violations for O(1) check_limits() - set when any node
         # reaches max_visits_per_node (before raising exception)
@@ -90,8 +96,11 @@ class TraversalProtection:
         if not self._enabled:
             return
 
-        count = self._visit_counts.get(node_id, 0) + 1
-        self._visit_counts[node_id] = count
+        if self._visit_counter is not None:
+            count = self._visit_counter.add(node_id)
+        else:
+            count = self._visit_counts.get(node_id, 0) + 1
+            self._visit_counts[node_id] = count
         if count >= self._max_visits_per_node:
             # Set violation flag for O(1) check_limits() before raising
             self._visit_violation_detected = True
@@ -130,6 +139,8 @@ class TraversalProtection:
         """
         self._steps = 0
         self._visit_counts.clear()
+        if self._visit_counter is not None:
+            self._visit_counter.clear()
         self._visit_violation_detected = False
         self._start_time = time.time()
         self._started = True
@@ -152,7 +163,9 @@ class TraversalProtection:
 
     @property
     def visit_counts(self) -> dict[str, int]:
-        """Get visit counts per node."""
+        """Get visit counts per node (empty with a Bloom filter counter)."""
+        if self._visit_counter is not None:
+            return dict(self._visit_counter.items())
         return dict(self._visit_counts)
 
     @property
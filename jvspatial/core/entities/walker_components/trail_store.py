@@ -12,7 +12,8 @@ This module adds a ``TrailStore`` protocol with two adapters:
   identically to the legacy in-memory trail.
 * :class:`DBTrailStore` — persists steps to any registered
   :class:`jvspatial.db.database.Database`. Use this when walker state
-  must outlive the current process.
+  must outlive the current process. Steps are buffered and written with
+  ``bulk_save``; ``Walker.run()`` flushes on exit and pause.
 
 ``Walker.resume(walker_id, store=...)`` rehydrates a walker from a
 persisted trail so a fresh process can pick up where the prior one
@@ -23,6 +24,8 @@ Closes ROADMAP §2.5.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections import deque
 from typing import Any, Deque, Dict, List, Optional, Protocol
 
@@ -48,6 +51,13 @@ class TrailStore(Protocol):
         """Drop the entire trail for ``walker_id``."""
         ...
 
+    async def flush(self, walker_id: str) -> None:
+        """Persist any buffered steps for ``walker_id``.
+
+        Optional: ``WalkerTrail.flush`` skips stores without it.
+        """
+        ...
+
 
 class InMemoryTrailStore:
     """In-process trail store backed by a ``deque`` per walker.
@@ -89,6 +99,9 @@ class InMemoryTrailStore:
         """Drop all recorded steps for ``walker_id``."""
         self._trails.pop(walker_id, None)
 
+    async def flush(self, walker_id: str) -> None:
+        """No-op: steps are stored on ``append``."""
+
 
 class DBTrailStore:
     """Trail store that persists steps to a jvspatial :class:`Database`.
@@ -105,35 +118,59 @@ class DBTrailStore:
     * Multiple processes share the walker (rare; needs coordination).
     * Audit / debugging requires post-hoc inspection of the path.
 
-    The append path issues one ``save`` per step. For chatty walkers
-    consider:
-
-    * Batching: collect steps locally then ``flush()`` to the store.
-      (Future enhancement — for v1 we always write through.)
-    * A faster backend (Postgres or DynamoDB beats JsonDB by orders of
-      magnitude for high-frequency append).
+    ``append`` only buffers. A walker's buffer is written with one
+    ``bulk_save`` once it holds ``batch_size`` steps or its oldest step is
+    ``flush_interval`` seconds old (checked on append), and on
+    :meth:`flush`, which ``Walker.run()`` calls when it returns or
+    pauses. Threshold writes run in background tasks, at most
+    ``max_in_flight`` per store; an append that needs another one first
+    waits for the oldest, so a slow backend slows the walker instead of
+    piling up tasks. :meth:`load` and :meth:`clear` flush first, so
+    in-process readers always see every appended step. Steps still
+    buffered or in flight when the process dies are lost;
+    ``batch_size=1`` starts a write for every step.
 
     Args:
         db: Any registered :class:`Database` instance (Mongo / Postgres /
             SQLite / DynamoDB / JsonDB).
         collection: Collection / table name. Default ``"walker_trail"``.
+        batch_size: Buffered steps per walker that trigger a write.
+        flush_interval: Seconds a buffered step may wait before the next
+            append triggers a write.
+        max_in_flight: Concurrent background writes per store.
     """
 
-    def __init__(self, db: Any, *, collection: str = "walker_trail") -> None:
+    def __init__(
+        self,
+        db: Any,
+        *,
+        collection: str = "walker_trail",
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_in_flight: int = 2,
+    ) -> None:
         self._db = db
         self._collection = collection
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval = float(flush_interval)
+        self._max_in_flight = max(1, int(max_in_flight))
         # Per-walker monotonic counters. Reset whenever ``clear()`` runs.
         # Note: ``DBTrailStore`` is intentionally not safe for two
         # processes appending to the same walker — that case requires a
         # backend-side sequence which is out of scope for v1.
         self._seq: Dict[str, int] = {}
+        # Per-walker unsaved records and the monotonic time the oldest
+        # was buffered.
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._buffered_at: Dict[str, float] = {}
+        self._in_flight: Deque["asyncio.Task[None]"] = deque()
 
     @staticmethod
     def _record_id(walker_id: str, seq: int) -> str:
         return f"trail.{walker_id}.{seq:09d}"
 
     async def append(self, walker_id: str, step: Dict[str, Any]) -> None:
-        """Persist ``step`` for ``walker_id`` as one row in the backing store."""
+        """Buffer ``step`` for ``walker_id``; write the buffer when due."""
         seq = self._seq.get(walker_id, 0)
         rec_id = self._record_id(walker_id, seq)
         record = {
@@ -145,25 +182,63 @@ class DBTrailStore:
             # JSONB / nested-doc backends can keep it together.
             "data": step,
         }
-        await self._db.save(self._collection, record)
         self._seq[walker_id] = seq + 1
+        buffer = self._buffers.setdefault(walker_id, [])
+        if not buffer:
+            self._buffered_at[walker_id] = time.monotonic()
+        buffer.append(record)
+        if (
+            len(buffer) >= self._batch_size
+            or time.monotonic() - self._buffered_at[walker_id] >= self._flush_interval
+        ):
+            await self._write_behind(walker_id)
+
+    def _take(self, walker_id: str) -> List[Dict[str, Any]]:
+        self._buffered_at.pop(walker_id, None)
+        return self._buffers.pop(walker_id, [])
+
+    async def _write_behind(self, walker_id: str) -> None:
+        """Start a background ``bulk_save`` of the buffer, bounded in flight."""
+        while self._in_flight and self._in_flight[0].done():
+            self._in_flight.popleft().result()
+        if len(self._in_flight) >= self._max_in_flight:
+            await self._in_flight.popleft()
+        records = self._take(walker_id)
+        if records:
+            self._in_flight.append(
+                asyncio.ensure_future(self._db.bulk_save(self._collection, records))
+            )
+
+    async def flush(self, walker_id: str) -> None:
+        """Write ``walker_id``'s buffer and wait for every pending write.
+
+        Re-raises the first error of a background write.
+        """
+        records = self._take(walker_id)
+        pending, self._in_flight = list(self._in_flight), deque()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        if records:
+            await self._db.bulk_save(self._collection, records)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def load(self, walker_id: str, *, since: int = 0) -> List[Dict[str, Any]]:
         """Return persisted steps for ``walker_id`` (optionally from ``since``)."""
-        # Single round trip via the standard ``find`` API. The query is
-        # backend-portable; PG / Mongo can push the sort + filter down,
-        # JsonDB / DynamoDB filter in-memory.
-        rows = await self._db.find(
+        await self.flush(walker_id)
+        # Record ids sort in step order, so ``find_iter``'s default id
+        # keyset paging returns steps in order in bounded batches.
+        rows = self._db.find_iter(
             self._collection,
             {"walker_id": str(walker_id), "seq": {"$gte": int(since)}},
-            sort=[("seq", 1)],
+            batch_size=max(100, self._batch_size),
         )
         # Recover the original step dicts. Refresh the in-process
         # counter so a follow-up ``append`` continues from the right
         # sequence number.
         steps: List[Dict[str, Any]] = []
         last_seq = -1
-        for row in rows:
+        async for row in rows:
             steps.append(row.get("data") or {})
             seq = row.get("seq")
             if isinstance(seq, int) and seq > last_seq:
@@ -174,14 +249,8 @@ class DBTrailStore:
 
     async def clear(self, walker_id: str) -> None:
         """Delete every persisted step for ``walker_id``."""
-        # No bulk-delete in the base Database ABC — fetch and delete one
-        # by one. Fine for the cleanup case; if this gets called in a hot
-        # loop the backend's native bulk delete should be wired in later.
-        rows = await self._db.find(self._collection, {"walker_id": str(walker_id)})
-        for row in rows:
-            rid = row.get("id")
-            if rid:
-                await self._db.delete(self._collection, str(rid))
+        await self.flush(walker_id)
+        await self._db.delete_many(self._collection, {"walker_id": str(walker_id)})
         self._seq.pop(walker_id, None)
 
 
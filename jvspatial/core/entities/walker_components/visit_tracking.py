@@ -0,0 +1,248 @@
+"""Compact visit counters for very long traversals.
+
+The default walker keeps per-node visit counts in a ``dict`` of id strings
+and answers ``has_visited`` by scanning the trail. For crawls of millions
+of steps ``Walker(visit_tracking=...)`` selects one of these instead:
+
+* :class:`VisitCounter` (``"compact"``) — exact. Each id is interned once
+  to an integer slot and counts live in an ``array('H')`` (two bytes per
+  node, saturating at 65535).
+* :class:`CountingBloomFilter` (``"bloom"``) — probabilistic. Stores no
+  ids at all: ``k`` one-byte counters per node in a fixed array sized
+  from the expected node count and false-positive rate. Counts can be
+  over-estimated, never under-estimated, so a node that was never visited
+  reports as visited with probability about ``fp_rate``.
+
+Both expose the same small interface (``add``, ``discard``, ``count``,
+``in``, ``len``, ``items``, ``clear``, ``nbytes``) so
+:class:`~.protection.TraversalProtection` and
+:class:`~.walker_trail.CompactWalkerTrail` work with either.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+VISIT_TRACKING_MODES = ("dict", "compact", "bloom")
+
+_U16_MAX = 0xFFFF
+_U8_MAX = 0xFF
+
+
+class IdInterner:
+    """Two-way mapping between id strings and dense integer slots."""
+
+    def __init__(self) -> None:
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+
+    def slot(self, node_id: str) -> int:
+        """Slot of ``node_id``, assigning the next free one if new."""
+        slot = self._slots.get(node_id)
+        if slot is None:
+            slot = self._slots[sys.intern(node_id)] = len(self._ids)
+            self._ids.append(node_id)
+        return slot
+
+    def find(self, node_id: str) -> Optional[int]:
+        """Slot of ``node_id``, or None if it was never interned."""
+        return self._slots.get(node_id)
+
+    def id_of(self, slot: int) -> str:
+        """Node id interned at ``slot``."""
+        return self._ids[slot]
+
+    def __len__(self) -> int:
+        """Number of interned ids."""
+        return len(self._ids)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the mapping (ids are shared)."""
+        return sys.getsizeof(self._slots) + sys.getsizeof(self._ids)
+
+
+class VisitCounter:
+    """Exact per-node counts in an ``array('H')`` indexed by interned slot.
+
+    Counters saturate at 65535. Several counters may share one
+    :class:`IdInterner` so each id is stored once.
+    """
+
+    def __init__(self, interner: Optional[IdInterner] = None) -> None:
+        self._interner = interner if interner is not None else IdInterner()
+        self._counts = array("H")
+        self._distinct = 0
+
+    def add(self, node_id: str) -> int:
+        """Count one visit to ``node_id`` and return its new count."""
+        slot = self._interner.slot(node_id)
+        counts = self._counts
+        if slot >= len(counts):
+            counts.extend(bytes(2 * (slot + 1 - len(counts))))
+        count = counts[slot]
+        if count == 0:
+            self._distinct += 1
+        if count < _U16_MAX:
+            count += 1
+            counts[slot] = count
+        return count
+
+    def discard(self, node_id: str) -> None:
+        """Undo one visit to ``node_id`` (no-op when its count is 0)."""
+        slot = self._interner.find(node_id)
+        if slot is None or slot >= len(self._counts):
+            return
+        count = self._counts[slot]
+        if count:
+            self._counts[slot] = count - 1
+            if count == 1:
+                self._distinct -= 1
+
+    def count(self, node_id: str) -> int:
+        """Visits counted for ``node_id`` (0 if never seen)."""
+        slot = self._interner.find(node_id)
+        if slot is None or slot >= len(self._counts):
+            return 0
+        return self._counts[slot]
+
+    def __contains__(self, node_id: object) -> bool:
+        """Whether ``node_id`` has been visited at least once."""
+        return isinstance(node_id, str) and self.count(node_id) > 0
+
+    def __len__(self) -> int:
+        """Number of distinct nodes with a non-zero count."""
+        return self._distinct
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """``(node_id, count)`` for every node with a non-zero count."""
+        id_of = self._interner.id_of
+        for slot, count in enumerate(self._counts):
+            if count:
+                yield id_of(slot), count
+
+    def clear(self) -> None:
+        """Zero every count; interned slots are kept for reuse."""
+        self._counts = array("H")
+        self._distinct = 0
+
+    def nbytes(self) -> int:
+        """Approximate memory of the counts (the interner is counted apart)."""
+        return sys.getsizeof(self._counts)
+
+
+class CountingBloomFilter:
+    """Counting Bloom filter sized for ``capacity`` nodes at ``fp_rate``.
+
+    Uses ``m = -n ln p / (ln 2)^2`` one-byte counters and
+    ``k = (m / n) ln 2`` positions per id derived from ``hash(id)`` by
+    double hashing, so it is only meaningful within one process. ``count``
+    returns the smallest of the ``k`` counters: an upper bound on the true
+    count. Saturated counters (255) are never decremented. Ids are not
+    stored, so :meth:`items` yields nothing.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, fp_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.capacity = int(capacity)
+        self.fp_rate = float(fp_rate)
+        self._m = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self._k = max(1, round(self._m / capacity * math.log(2)))
+        self._counters = array("B", bytes(self._m))
+        self._distinct = 0
+
+    def _positions(self, node_id: str) -> List[int]:
+        h = hash(node_id) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        m = self._m
+        return [(h1 + i * h2) % m for i in range(self._k)]
+
+    def add(self, node_id: str) -> int:
+        """Count one visit to ``node_id`` and return its estimated count."""
+        counters = self._counters
+        estimate = _U8_MAX
+        for pos in self._positions(node_id):
+            value = counters[pos]
+            if value < _U8_MAX:
+                value += 1
+                counters[pos] = value
+            estimate = min(estimate, value)
+        if estimate == 1:
+            self._distinct += 1
+        return estimate
+
+    def discard(self, node_id: str) -> None:
+        """Undo one visit to ``node_id`` if it looks visited."""
+        positions = self._positions(node_id)
+        counters = self._counters
+        if any(counters[pos] == 0 for pos in positions):
+            return
+        estimate = _U8_MAX
+        for pos in positions:
+            value = counters[pos]
+            if value < _U8_MAX:
+                value -= 1
+                counters[pos] = value
+            estimate = min(estimate, value)
+        if estimate == 0:
+            self._distinct -= 1
+
+    def count(self, node_id: str) -> int:
+        """Estimated visits to ``node_id``; never below the true count."""
+        counters = self._counters
+        return min(counters[pos] for pos in self._positions(node_id))
+
+    def __contains__(self, node_id: object) -> bool:
+        """Whether ``node_id`` looks visited (false positives at ``fp_rate``)."""
+        return isinstance(node_id, str) and self.count(node_id) > 0
+
+    def __len__(self) -> int:
+        """Estimated number of distinct nodes."""
+        return max(0, self._distinct)
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """Nothing: the filter does not store ids."""
+        return iter(())
+
+    def clear(self) -> None:
+        """Zero every counter."""
+        self._counters = array("B", bytes(self._m))
+        self._distinct = 0
+
+    def nbytes(self) -> int:
+        """Approximate memory of the counters."""
+        return sys.getsizeof(self._counters)
+
+
+def make_visit_counter(
+    mode: str,
+    *,
+    interner: Optional[IdInterner] = None,
+    capacity: int = 1_000_000,
+    fp_rate: float = 0.01,
+):
+    """Counter for ``Walker(visit_tracking=mode)``; None for ``"dict"``."""
+    if mode == "compact":
+        return VisitCounter(interner)
+    if mode == "bloom":
+        return CountingBloomFilter(capacity, fp_rate)
+    if mode == "dict":
+        return None
+    raise ValueError(
+        f"visit_tracking must be one of {', '.join(VISIT_TRACKING_MODES)}, "
+        f"got {mode!r}"
+    )
+
+
+__all__ = [
+    "CountingBloomFilter",
+    "IdInterner",
+    "VISIT_TRACKING_MODES",
+    "VisitCounter",
+    "make_visit_counter",
+]
@@ -1,14 +1,18 @@
 """Queue management for walker traversal operations.
 
 This module provides queue management functionality for walker traversals,
-including size limits and backing deque operations.
+including size limits and backing deque operations. ``WalkerQueue`` is the
+default FIFO deque; ``PriorityWalkerQueue`` is the heap-backed best-first
+mode selected with ``Walker(queue="priority")``.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 from collections import deque
-from typing import Deque, Iterable, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +183,10 @@ class WalkerQueue:
         """
         return list(self._backing)
 
+    def peek(self, limit: int) -> List[object]:
+        """Return up to ``limit`` nodes from the head without removing them."""
+        return list(itertools.islice(self._backing, max(0, limit)))
+
     async def insert_after(
         self, target_node: object, nodes: Iterable[object]
     ) -> List[object]:
@@ -259,3 +267,174 @@ class WalkerQueue:
             self._warn_drop("insert_before", dropped)
 
         return inserted
+
+
+def _queue_key(node: object) -> Any:
+    """Identity of a queued node: its id when it has one."""
+    node_id = getattr(node, "id", None)
+    return node_id if node_id is not None else id(node)
+
+
+class PriorityWalkerQueue(WalkerQueue):
+    """Heap-backed best-first queue: the lowest priority pops first.
+
+    Priorities come from ``visit(node, priority=...)`` or, when omitted,
+    from ``key(node)`` (``0`` without a key); ties pop in insertion order.
+    Push and pop are O(log n). A node is queued at most once: pushing a
+    queued node again keeps the lower of the two priorities (decrease-key).
+    The old heap entry is invalidated lazily and skipped when popped, and
+    the heap is compacted when invalid entries outnumber live ones.
+
+    ``prepend``/``add_next`` place nodes ahead of every prioritized node,
+    in the order given. Positional inserts (``insert_after`` /
+    ``insert_before``) have no meaning in a heap and raise
+    ``NotImplementedError``. ``max_size`` counts live nodes and drops new
+    arrivals once reached, like the FIFO queue.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        key: Optional[Callable[[Any], float]] = None,
+    ) -> None:
+        """Initialize the priority queue.
+
+        Args:
+            max_size: Maximum number of queued nodes (``<= 0`` = unlimited)
+            key: Default priority of a node pushed without ``priority``
+        """
+        super().__init__(max_size=max_size)
+        self._key = key
+        # Heap entries are ``[priority, seq, node, live]``.
+        self._heap: List[List[Any]] = []
+        self._entries: Dict[Any, List[Any]] = {}
+        self._seq = itertools.count()
+        self._front_seq = itertools.count(-1, -1)
+
+    def _has_capacity(self) -> bool:
+        return self._max_size <= 0 or len(self._entries) < self._max_size
+
+    def _priority(self, node: object, priority: Optional[float]) -> float:
+        if priority is not None:
+            return priority
+        return self._key(node) if self._key is not None else 0
+
+    def _push(self, node: object, priority: float, seq: int) -> bool:
+        """Queue ``node``; False when it was dropped for capacity."""
+        key = _queue_key(node)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if priority >= entry[0]:
+                return True
+            entry[3] = False
+        elif not self._has_capacity():
+            return False
+        entry = [priority, seq, node, True]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [e for e in self._heap if e[3]]
+            heapq.heapify(self._heap)
+        return True
+
+    async def append(
+        self, nodes: Iterable[object], priority: Optional[float] = None
+    ) -> None:
+        """Queue nodes at ``priority`` (or their ``key``)."""
+        dropped = 0
+        for n in nodes:
+            if not self._push(n, self._priority(n, priority), next(self._seq)):
+                dropped += 1
+        if dropped:
+            self._warn_drop("append", dropped)
+
+    async def visit(
+        self, nodes: Iterable[object], priority: Optional[float] = None
+    ) -> None:
+        """Queue nodes at ``priority`` (or their ``key``)."""
+        await self.append(nodes, priority)
+
+    async def prepend(self, nodes: Iterable[object]) -> None:
+        """Queue nodes ahead of every prioritized node, in the order given."""
+        dropped = 0
+        for n in reversed(list(nodes)):
+            if not self._push(n, float("-inf"), next(self._front_seq)):
+                dropped += 1
+        if dropped:
+            self._warn_drop("prepend", dropped)
+
+    async def add_next(self, nodes: Iterable[object]) -> None:
+        """Queue nodes ahead of every prioritized node, in the order given."""
+        await self.prepend(nodes)
+
+    async def dequeue(self, nodes: object) -> List[object]:
+        """Remove the given node(s); returns the ones that were queued."""
+        removed: List[object] = []
+        for node in nodes if isinstance(nodes, list) else [nodes]:
+            entry = self._entries.pop(_queue_key(node), None)
+            if entry is not None:
+                entry[3] = False
+                removed.append(entry[2])
+        return removed
+
+    async def clear(self) -> None:
+        """Clear all nodes from the queue."""
+        self._heap.clear()
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the queue."""
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        """Check if queue is not empty."""
+        return bool(self._entries)
+
+    def __contains__(self, node: object) -> bool:
+        """Check if node is in the queue (matched by id when it has one)."""
+        return _queue_key(node) in self._entries
+
+    def popleft(self) -> object:
+        """Remove and return the node with the lowest priority.
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[3]:
+                del self._entries[_queue_key(entry[2])]
+                return entry[2]
+        raise IndexError("pop from an empty priority queue")
+
+    def priority_of(self, node: object) -> Optional[float]:
+        """Current priority of a queued node, or None."""
+        entry = self._entries.get(_queue_key(node))
+        return entry[0] if entry is not None else None
+
+    def peek(self, limit: int) -> List[object]:
+        """Return up to ``limit`` nodes in pop order without removing them."""
+        live = (e for e in self._heap if e[3])
+        return [e[2] for e in heapq.nsmallest(max(0, limit), live)]
+
+    def to_list(self) -> List[object]:
+        """All queued nodes in pop order."""
+        return [e[2] for e in sorted(self._entries.values())]
+
+    async def insert_after(
+        self, target_node: object, nodes: Iterable[object]
+    ) -> List[object]:
+        """Not supported: priority queues have no positions."""
+        raise NotImplementedError(
+            "insert_after is positional; priority queues order by priority "
+            "(use visit(node, priority=...))"
+        )
+
+    async def insert_before(
+        self, target_node: object, nodes: Iterable[object]
+    ) -> List[object]:
+        """Not supported: priority queues have no positions."""
+        raise NotImplementedError(
+            "insert_before is positional; priority queues order by priority "
+            "(use visit(node, priority=...))"
+        )
@@ -5,13 +5,17 @@ during graph traversals, including metadata about each step. Steps are
 held in an in-memory ``deque`` for fast read-back, and may optionally
 mirror to a pluggable :class:`TrailStore` so the history survives
 process boundaries (Lambda cold starts, deferred-invoke resumes).
+:class:`CompactWalkerTrail` stores the same steps column-wise for
+traversals too long for a dict per step.
 """
 
 from __future__ import annotations
 
 import asyncio
 from collections import deque
-from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Optional, Union
+
+from .visit_tracking import CountingBloomFilter, VisitCounter
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .trail_store import TrailStore
@@ -84,7 +88,7 @@ class WalkerTrail:
             **metadata: Additional metadata about the step
         """
         step = {"node": node_id, "edge": edge_id, **metadata}
-        self._trail.append(step)
+        self._append_step(step)
         if self._store is not None and self._walker_id is not None:
             try:
                 loop = asyncio.get_running_loop()
@@ -106,7 +110,7 @@ class WalkerTrail:
         behaves identically to :meth:`record_step`.
         """
         step = {"node": node_id, "edge": edge_id, **metadata}
-        self._trail.append(step)
+        self._append_step(step)
         if self._store is not None and self._walker_id is not None:
             await self._store.append(self._walker_id, step)
 
@@ -122,11 +126,20 @@ class WalkerTrail:
         steps = await self._store.load(self._walker_id)
         # Don't go through ``record_step`` — that would re-write each
         # step to the store and double-count.
-        self._trail.clear()
+        self.clear_trail()
         for step in steps:
-            self._trail.append(step)
+            self._append_step(step)
         return len(steps)
 
+    async def flush(self) -> None:
+        """Persist steps the store is still buffering (no-op without one)."""
+        flush = getattr(self._store, "flush", None)
+        if flush is not None and self._walker_id is not None:
+            await flush(self._walker_id)
+
+    def _append_step(self, step: Dict[str, Any]) -> None:
+        self._trail.append(step)
+
     def get_trail(self) -> List[Dict[str, Any]]:
         """Get the complete trail.
 
@@ -151,6 +164,10 @@ class WalkerTrail:
         """Clear all steps from the trail."""
         self._trail.clear()
 
+    def visit_count(self, node_id: Any) -> int:
+        """Number of retained steps that visited ``node_id``."""
+        return sum(1 for step in self._trail if step.get("node") == node_id)
+
     async def detect_cycles(self) -> List[tuple]:
         """Detect cycles in the trail.
 
@@ -170,3 +187,126 @@ class WalkerTrail:
                     node_positions[node_id] = i
 
         return cycles
+
+
+class CompactWalkerTrail(WalkerTrail):
+    """Columnar ring-buffer trail for very long traversals.
+
+    Steps are kept as parallel ``node`` / ``edge`` columns instead of one
+    dict per step; extra step metadata (which the walker itself never
+    records) goes to a side dict keyed by step number. With
+    ``max_length`` the columns form a ring that overwrites the oldest
+    step. ``counter`` counts how often each node appears in the retained
+    steps, so :meth:`visit_count` is O(1); with a
+    :class:`~.visit_tracking.CountingBloomFilter` it may over-count.
+    Reads rebuild step dicts on demand.
+    """
+
+    def __init__(
+        self,
+        max_length: int = 0,
+        *,
+        counter: Optional[Union[VisitCounter, CountingBloomFilter]] = None,
+        store: Optional["TrailStore"] = None,
+        walker_id: Optional[str] = None,
+    ) -> None:
+        """Initialize the compact trail.
+
+        Args:
+            max_length: Ring size; ``0`` (default) means unlimited
+            counter: Visit counter for the retained steps (a fresh
+                :class:`~.visit_tracking.VisitCounter` by default)
+            store: Optional :class:`TrailStore` to mirror steps to
+            walker_id: Persistence key, required with ``store``
+        """
+        super().__init__(max_length, store=store, walker_id=walker_id)
+        # The dict-per-step deque is unused; zero length keeps it empty.
+        self._trail = deque(maxlen=0)
+        self._counter = counter if counter is not None else VisitCounter()
+        self._nodes: List[Any] = []
+        self._edges: List[Any] = []
+        self._meta: Dict[int, Dict[str, Any]] = {}
+        # Step numbers of the oldest retained step and of the next one.
+        self._first = 0
+        self._next = 0
+
+    def _index(self, seq: int) -> int:
+        return seq % self._max_length if self._max_length else seq
+
+    def _append_step(self, step: Dict[str, Any]) -> None:
+        node_id = step.get("node")
+        seq = self._next
+        index = self._index(seq)
+        if index < len(self._nodes):
+            # Ring is full: the slot holds the oldest step.
+            old = self._nodes[index]
+            if isinstance(old, str):
+                self._counter.discard(old)
+            self._meta.pop(self._first, None)
+            self._first += 1
+            self._nodes[index] = node_id
+            self._edges[index] = step.get("edge")
+        else:
+            self._nodes.append(node_id)
+            self._edges.append(step.get("edge"))
+        if len(step) > 2 or "edge" not in step:
+            meta = {k: v for k, v in step.items() if k not in ("node", "edge")}
+            if meta:
+                self._meta[seq] = meta
+        if isinstance(node_id, str):
+            self._counter.add(node_id)
+        self._next = seq + 1
+
+    def _steps(self) -> Iterator[Dict[str, Any]]:
+        for seq in range(self._first, self._next):
+            index = self._index(seq)
+            yield {
+                "node": self._nodes[index],
+                "edge": self._edges[index],
+                **self._meta.get(seq, {}),
+            }
+
+    def node_ids(self) -> List[Any]:
+        """Node ids of the retained steps, oldest first."""
+        return [self._nodes[self._index(seq)] for seq in range(self._first, self._next)]
+
+    def get_trail(self) -> List[Dict[str, Any]]:
+        """Retained steps as ``node``/``edge`` dicts, oldest first."""
+        return list(self._steps())
+
+    async def get_recent(self, count: int = 5) -> List[str]:
+        """Node ids of the last ``count`` retained steps."""
+        if count <= 0:
+            return []
+        start = max(self._first, self._next - count)
+        return [self._nodes[self._index(seq)] for seq in range(start, self._next)]
+
+    def get_length(self) -> int:
+        """Number of retained steps."""
+        return self._next - self._first
+
+    def clear_trail(self) -> None:
+        """Drop every step and reset the visit counts."""
+        self._nodes = []
+        self._edges = []
+        self._meta.clear()
+        self._counter.clear()
+        self._first = self._next = 0
+
+    def visit_count(self, node_id: Any) -> int:
+        """Times ``node_id`` appears among the retained steps."""
+        if isinstance(node_id, str):
+            return self._counter.count(node_id)
+        return self.node_ids().count(node_id)
+
+    async def detect_cycles(self) -> List[tuple]:
+        """``(first, repeat)`` step positions of each revisited node."""
+        cycles = []
+        node_positions: Dict[Any, int] = {}
+        for i, node_id in enumerate(self.node_ids()):
+            if node_id is not None:
+                if node_id in node_positions:
+                    cycles.append((node_positions[node_id], i))
+                else:
+                    node_positions[node_id] = i
+        return cycles
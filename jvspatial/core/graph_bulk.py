@@ -0,0 +1,613 @@
+"""Bulk graph construction: :func:`connect_many` and :func:`create_and_connect_many`.
+
+``Node.connect`` costs two duplicate-check queries, an edge write and two
+edge-list read-modify-writes per edge, all sequential. The functions here do
+the same work in batches:
+
+1. One duplicate lookup per chunk of connections, run concurrently: a
+   ``find_many`` of the :meth:`~jvspatial.core.entities.Edge.deterministic_id`
+   of each pair, plus a ``(source, target, entity)`` query for pairs that
+   miss (see :meth:`~jvspatial.core.context.GraphContext.find_edges_for_pair`).
+2. All new edges written with ``bulk_save`` under deterministic ids.
+3. Each touched node's ``edges`` list updated once with every new id --
+   ``$addToSet``/``$each`` on MongoDB and Postgres, chunked ``find_many`` +
+   ``bulk_save`` under the per-node edge write guard elsewhere. Nodes that
+   keep typed adjacency entries or degree counters get theirs in the same
+   write.
+
+Duplicate detection follows ``Node.connect`` exactly (see
+:func:`edge_matches_direction`), so a batch is as idempotent as the
+equivalent sequence of ``connect`` calls, including repeats inside the
+batch itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from jvspatial.core import adjacency_entries, degree_counters
+from jvspatial.core.adjacency import layout_for, remember, spill, update_edge_ids
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+    from jvspatial.core.entities import Edge, Node
+
+logger = logging.getLogger(__name__)
+
+# Connections per duplicate lookup / records per bulk write, and how many of
+# those batches may be in flight at once.
+BULK_CHUNK_SIZE = 500
+BULK_CONCURRENCY = 4
+
+NodeRef = Union["Node", str]
+Connection = Union[
+    Tuple[NodeRef, NodeRef],
+    Tuple[NodeRef, NodeRef, Optional[Type["Edge"]]],
+    Tuple[NodeRef, NodeRef, Optional[Type["Edge"]], Optional[Dict[str, Any]]],
+]
+
+
+def edge_matches_direction(
+    source: str, target: str, src_id: str, dst_id: str, direction: str
+) -> bool:
+    """Whether an existing edge satisfies ``connect(src, dst, direction=...)``.
+
+    ``"both"`` accepts an edge either way round; ``"out"`` needs
+    ``source == src``; ``"in"`` needs ``source == dst``.
+    """
+    if direction == "both":
+        return {source, target} == {src_id, dst_id}
+    if direction == "out":
+        return source == src_id and target == dst_id
+    if direction == "in":
+        return source == dst_id and target == src_id
+    return False
+
+
+def _is_duplicate_error(exc: Exception) -> bool:
+    return "duplicate" in str(exc).lower() or "E11000" in str(exc)
+
+
+def _chunks(items: Sequence[Any], size: int = BULK_CHUNK_SIZE) -> List[Sequence[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class _Planned:
+    """One normalized connection request."""
+
+    __slots__ = ("src", "dst", "edge_class", "entity", "props", "direction")
+
+    def __init__(
+        self,
+        src: str,
+        dst: str,
+        edge_class: Type["Edge"],
+        props: Dict[str, Any],
+        direction: str,
+    ) -> None:
+        self.src = src
+        self.dst = dst
+        self.edge_class = edge_class
+        self.entity = edge_class._entity_name()
+        self.props = props
+        self.direction = direction
+
+
+def _normalize(
+    connections: Iterable[Connection],
+    direction: str,
+    instances: Dict[str, "Node"],
+) -> List[_Planned]:
+    from .entities import Edge, Node
+
+    planned: List[_Planned] = []
+    for item in connections:
+        if not 2 <= len(item) <= 4:
+            raise ValueError(
+                "connections must be (source, target[, edge_class[, props]]) tuples"
+            )
+        src, dst = item[0], item[1]
+        edge_class = (item[2] if len(item) > 2 else None) or Edge
+        props = dict((item[3] if len(item) > 3 else None) or {})
+        item_direction = props.pop("direction", direction)
+        ids = []
+        for ref in (src, dst):
+            if isinstance(ref, Node):
+                instances.setdefault(ref.id, ref)
+                ids.append(ref.id)
+            else:
+                ids.append(str(ref))
+        planned.append(_Planned(ids[0], ids[1], edge_class, props, item_direction))
+    return planned
+
+
+async def _existing_edges(
+    context: "GraphContext", planned: Sequence[_Planned]
+) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+    """Index existing edges between planned endpoints by (entity, source, target).
+
+    Each chunk first fetches both orientations' deterministic ids with one
+    ``find_many``. Connections that miss fall back to one
+    ``(source, target, entity)`` query unless
+    ``JVSPATIAL_EDGE_LEGACY_LOOKUP`` is off (see
+    :meth:`GraphContext.find_edges_for_pair`).
+    """
+    db = context.database
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    legacy = context._legacy_edge_lookup_enabled()
+
+    def _pair_ids(p: _Planned) -> Tuple[str, str]:
+        return (
+            p.edge_class.deterministic_id(p.src, p.dst),
+            p.edge_class.deterministic_id(p.dst, p.src),
+        )
+
+    async def _lookup(chunk: Sequence[_Planned]) -> List[Dict[str, Any]]:
+        ids = [i for p in chunk for i in _pair_ids(p)]
+        async with semaphore:
+            docs = list((await db.find_many("edge", ids)).values())
+        hits = {d.get("id") for d in docs}
+        misses = [p for p in chunk if not hits.intersection(_pair_ids(p))]
+        if not misses or not legacy:
+            return docs
+        endpoints = sorted({p.src for p in misses} | {p.dst for p in misses})
+        entities = sorted({p.entity for p in misses})
+        async with semaphore:
+            return docs + await db.find(
+                "edge",
+                {
+                    "source": {"$in": endpoints},
+                    "target": {"$in": endpoints},
+                    "entity": {"$in": entities},
+                },
+            )
+
+    found: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for batch in await asyncio.gather(*(_lookup(c) for c in _chunks(planned))):
+        for doc in batch:
+            key = (doc.get("entity", ""), doc.get("source", ""), doc.get("target", ""))
+            found.setdefault(key, doc)
+    return found
+
+
+def _match(
+    index: Dict[Tuple[str, str, str], Any], p: _Planned
+) -> Optional[Tuple[str, str, str]]:
+    """Key of the indexed edge ``Node.connect`` would return for ``p``.
+
+    The first edge satisfying the direction wins (forward before reverse);
+    failing that, an edge with this exact (source, target, entity), since
+    the unique index admits only one.
+    """
+    for source, target in ((p.src, p.dst), (p.dst, p.src)):
+        key = (p.entity, source, target)
+        if key in index and edge_matches_direction(
+            source, target, p.src, p.dst, p.direction
+        ):
+            return key
+    forward = (p.entity, p.src, p.dst)
+    return forward if forward in index else None
+
+
+async def _edge_record(edge: "Edge") -> Dict[str, Any]:
+    from jvspatial.utils.normalization import (
+        is_text_normalization_enabled,
+        normalize_data,
+    )
+
+    record = await edge.export()
+    record.setdefault("entity", edge.entity)
+    if is_text_normalization_enabled():
+        record = normalize_data(record)
+    return record
+
+
+async def _write_edges(
+    context: "GraphContext", edges: List["Edge"]
+) -> Dict[str, Dict[str, Any]]:
+    """``bulk_save`` new edges; returns ``{new_id: existing_doc}`` for lost races.
+
+    A chunk rejected by the unique ``(source, target, entity)`` index (a
+    concurrent writer got there first) is retried record by record, and each
+    duplicate is resolved to the edge that won -- the same recovery
+    ``Node.connect`` performs.
+    """
+    db = context.database
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    replaced: Dict[str, Dict[str, Any]] = {}
+
+    async def _write(chunk: Sequence["Edge"]) -> None:
+        records = [await _edge_record(e) for e in chunk]
+        async with semaphore:
+            try:
+                await db.bulk_save("edge", records)
+                return
+            except Exception as exc:
+                if not _is_duplicate_error(exc):
+                    raise
+            for record in records:
+                try:
+                    await db.save("edge", record)
+                except Exception as exc:
+                    if not _is_duplicate_error(exc):
+                        raise
+                    winner = await db.find_one(
+                        "edge",
+                        {
+                            "source": record["source"],
+                            "target": record["target"],
+                            "entity": record["entity"],
+                        },
+                    )
+                    if winner is None:
+                        raise
+                    replaced[record["id"]] = winner
+
+    await asyncio.gather(*(_write(c) for c in _chunks(edges)))
+    return replaced
+
+
+async def _add_edge_ids_many(
+    context: "GraphContext",
+    additions: Dict[str, List[str]],
+    entries: Optional[Dict[str, List[Dict[str, str]]]] = None,
+) -> None:
+    """Union ``additions[node_id]`` into each node's ``edges`` list, once per node.
+
+    ``entries[node_id]`` are the matching typed adjacency entries, stored
+    for nodes whose class keeps them.
+    """
+    await _update_edge_ids_many(context, additions, remove=False, entries=entries)
+
+
+async def _remove_edge_ids_many(
+    context: "GraphContext",
+    removals: Dict[str, List[str]],
+    entries: Optional[Dict[str, List[Dict[str, str]]]] = None,
+) -> None:
+    """Drop ``removals[node_id]`` from each node's ``edges`` list, once per node.
+
+    ``entries[node_id]`` are the typed adjacency entries of the removed
+    edges, used to decrement degree counters.
+    """
+    await _update_edge_ids_many(context, removals, remove=True, entries=entries)
+
+
+async def _update_edge_ids_many(
+    context: "GraphContext",
+    changes: Dict[str, List[str]],
+    *,
+    remove: bool,
+    entries: Optional[Dict[str, List[Dict[str, str]]]] = None,
+) -> None:
+    if not changes:
+        return
+    field = adjacency_entries.ENTRIES_FIELD
+    typed = {n for n in changes if adjacency_entries.enabled(n)}
+    counted = {n for n in changes if degree_counters.enabled(n)}
+    entries = {
+        n: e for n, e in (entries or {}).items() if (n in typed or n in counted) and e
+    }
+    by_id = {n: {e["id"]: e for e in lst} for n, lst in entries.items()}
+    sign = -1 if remove else 1
+    layouts = {n: layout_for(n) for n in changes}
+    bucketed = {n: layout for n, layout in layouts.items() if layout is not None}
+    if bucketed:
+        # Bucket-layout nodes keep their own per-node write path.
+        key = "remove" if remove else "add"
+        await asyncio.gather(
+            *(
+                update_edge_ids(
+                    context, n, layout, **{key: changes[n]}, entries=by_id.get(n)
+                )
+                for n, layout in bucketed.items()
+            )
+        )
+        changes = {n: ids for n, ids in changes.items() if n not in bucketed}
+        if not changes:
+            return
+    db = context.database
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    pending = dict(changes)
+
+    if context._is_mongodb(db) or context._is_postgres(db):
+
+        async def _atomic(node_id: str, edge_ids: List[str]) -> None:
+            query: Dict[str, Any] = {"_id": node_id}
+            update: Dict[str, Any]
+            if remove:
+                update = {"$pull": {"edges": {"$in": edge_ids}}}
+                if node_id in typed:
+                    update["$pull"][field] = {"id": {"$in": edge_ids}}
+            else:
+                update = {"$addToSet": {"edges": {"$each": edge_ids}}}
+                if node_id in typed and node_id in entries:
+                    update["$addToSet"][field] = {"$each": entries[node_id]}
+            if node_id in counted:
+                known = by_id.get(node_id, {})
+                if all(e in known for e in edge_ids):
+                    # Count only if every id changes; a miss takes the merge.
+                    if remove:
+                        query["edges"] = {"$all": edge_ids}
+                    else:
+                        query["$and"] = [
+                            {"edges": {"$not": {"$all": [e]}}} for e in edge_ids
+                        ]
+                    update["$inc"] = degree_counters.increments(
+                        (known[e], sign) for e in edge_ids
+                    )
+                else:
+                    update["$set"] = degree_counters.stale_update()
+            async with semaphore:
+                try:
+                    result = await db.find_one_and_update("node", query, update)
+                except Exception:
+                    logger.warning(
+                        "bulk edge-list update failed for node %s, falling back",
+                        node_id,
+                        exc_info=True,
+                    )
+                    return
+            if result is not None:
+                pending.pop(node_id, None)
+
+        await asyncio.gather(*(_atomic(n, ids) for n, ids in changes.items()))
+
+    async def _merge(node_ids: Sequence[str]) -> None:
+        async with AsyncExitStack() as stack:
+            # Sorted acquisition: other writers only ever hold one guard.
+            for node_id in node_ids:
+                await stack.enter_async_context(context._node_edge_write_guard(node_id))
+            async with semaphore:
+                docs = await db.find_many("node", list(node_ids))
+            changed = []
+            for node_id in node_ids:
+                doc = docs.get(node_id)
+                if doc is None:
+                    continue
+                edges = list(doc.get("edges") or [])
+                known = by_id.get(node_id, {})
+                if remove:
+                    drop = set(pending[node_id])
+                    kept = [e for e in edges if e not in drop]
+                    if len(kept) != len(edges):
+                        doc["edges"] = kept
+                        if node_id in typed:
+                            doc[field] = adjacency_entries.merge(kept, doc.get(field))
+                        if node_id in counted:
+                            for e in edges:
+                                if e in drop:
+                                    degree_counters.apply_record(doc, known.get(e), -1)
+                        changed.append(doc)
+                    continue
+                missing = [e for e in pending[node_id] if e not in edges]
+                if missing:
+                    doc["edges"] = edges + missing
+                    if node_id in counted:
+                        for e in missing:
+                            degree_counters.apply_record(doc, known.get(e), 1)
+                if node_id in typed and node_id in entries:
+                    doc[field] = adjacency_entries.merge(
+                        edges + missing, doc.get(field), entries[node_id]
+                    )
+                if missing or (node_id in typed and node_id in entries):
+                    changed.append(doc)
+            if changed:
+                async with semaphore:
+                    await db.bulk_save("node", changed)
+
+    if pending:
+        await asyncio.gather(*(_merge(c) for c in _chunks(sorted(pending))))
+
+    for node_id, edge_ids in changes.items():
+        cached = await context._get_from_cache(node_id)
+        if cached is None or not hasattr(cached, "edge_ids"):
+            continue
+        known = by_id.get(node_id, {})
+        if remove:
+            drop = set(edge_ids)
+            gone = [e for e in cached.edge_ids if e in drop]
+            cached.edge_ids[:] = [e for e in cached.edge_ids if e not in drop]
+        else:
+            gone = [e for e in dict.fromkeys(edge_ids) if e not in cached.edge_ids]
+            cached.edge_ids.extend(gone)
+            if node_id in typed:
+                adjacency_entries.record(cached, entries.get(node_id, ()))
+        for e in gone:
+            degree_counters.note(cached, known.get(e), sign)
+
+
+async def _connect(
+    context: "GraphContext",
+    connections: Iterable[Connection],
+    direction: str,
+    new_nodes: Dict[str, "Node"],
+) -> Tuple[
+    List["Edge"],
+    Dict[str, List[str]],
+    Dict[str, List[Dict[str, str]]],
+    Dict[str, "Node"],
+]:
+    """Plan, dedupe and write edges.
+
+    Returns the edges, the edge ids to add per node, their typed adjacency
+    entries (for nodes that keep entries or degree counters), and every node instance seen (so
+    callers can mirror the additions in memory).
+    """
+    instances: Dict[str, "Node"] = dict(new_nodes)
+    planned = _normalize(connections, direction, instances)
+    if not planned:
+        return [], {}, {}, instances
+
+    # Pairs touching a node that is only now being created cannot have
+    # existing edges, so they skip the duplicate lookup.
+    lookups = [p for p in planned if p.src not in new_nodes and p.dst not in new_nodes]
+    for edge_class in {p.edge_class for p in planned}:
+        await context.ensure_indexes(edge_class)
+    index: Dict[Tuple[str, str, str], Any] = await _existing_edges(context, lookups)
+
+    created: List["Edge"] = []
+    resolved: List[Union["Edge", Dict[str, Any]]] = []
+    for p in planned:
+        key = _match(index, p)
+        if key is not None:
+            resolved.append(index[key])
+            continue
+        props = {"id": p.edge_class.deterministic_id(p.src, p.dst), **p.props}
+        edge = p.edge_class(source=p.src, target=p.dst, direction=p.direction, **props)
+        index[(p.entity, p.src, p.dst)] = edge
+        created.append(edge)
+        resolved.append(edge)
+
+    replaced = await _write_edges(context, created)
+
+    edges: List["Edge"] = []
+    additions: Dict[str, List[str]] = {}
+    entries: Dict[str, List[Dict[str, str]]] = {}
+    hydrated: Dict[str, "Edge"] = {}
+    for p, hit in zip(planned, resolved):
+        if isinstance(hit, dict) or hit.id in replaced:
+            doc = hit if isinstance(hit, dict) else replaced[hit.id]
+            edge = hydrated.get(doc["id"])
+            if edge is None:
+                edge = await context._deserialize_entity(p.edge_class, doc)
+                hydrated[doc["id"]] = edge
+        else:
+            edge = hit
+        edges.append(edge)
+        for node_id in (p.src, p.dst):
+            node = instances.get(node_id)
+            if node is not None and edge.id in node.edge_ids:
+                continue
+            ids = additions.setdefault(node_id, [])
+            if edge.id not in ids:
+                ids.append(edge.id)
+                if adjacency_entries.enabled(node_id) or degree_counters.enabled(
+                    node_id
+                ):
+                    entry = adjacency_entries.entry_for(edge, node_id)
+                    entries.setdefault(node_id, []).append(entry)
+    return edges, additions, entries, instances
+
+
+def _sync_instances(
+    instances: Iterable["Node"],
+    additions: Dict[str, List[str]],
+    entries: Dict[str, List[Dict[str, str]]],
+) -> None:
+    for node in instances:
+        known = {e["id"]: e for e in entries.get(node.id, ())}
+        for edge_id in additions.get(node.id, ()):
+            if edge_id not in node.edge_ids:
+                node.edge_ids.append(edge_id)
+                degree_counters.note(node, known.get(edge_id), 1)
+        adjacency_entries.record(node, entries.get(node.id, ()))
+
+
+async def connect_many(
+    context: "GraphContext",
+    connections: Iterable[Connection],
+    *,
+    direction: str = "out",
+) -> List["Edge"]:
+    """Connect many node pairs with batched reads and writes.
+
+    Args:
+        context: Graph context to write through.
+        connections: ``(source, target, edge_class, props)`` tuples. Endpoints
+            are :class:`~jvspatial.core.entities.Node` instances or ids;
+            ``edge_class`` (default :class:`~jvspatial.core.entities.Edge`)
+            and ``props`` are optional. ``props["direction"]`` overrides
+            ``direction`` for that connection.
+        direction: Default direction, as for ``Node.connect``.
+
+    Returns:
+        One edge per connection, in input order -- the existing edge when
+        ``Node.connect`` would have returned one, otherwise the new edge.
+        Node instances passed in have their ``edge_ids`` updated in place.
+    """
+    edges, additions, entries, instances = await _connect(
+        context, connections, direction, {}
+    )
+    await _add_edge_ids_many(context, additions, entries)
+    _sync_instances(instances.values(), additions, entries)
+    return edges
+
+
+async def create_and_connect_many(
+    context: "GraphContext",
+    nodes: Sequence["Node"],
+    connections: Iterable[Connection],
+    *,
+    direction: str = "out",
+) -> Tuple[List["Node"], List["Edge"]]:
+    """Persist new nodes and connect them in one batched import.
+
+    New nodes are written with ``bulk_save`` *after* their edges, carrying
+    their complete ``edges`` lists, so they are never rewritten. Existing
+    nodes referenced by ``connections`` get the :func:`connect_many`
+    edge-list update.
+
+    Returns:
+        ``(nodes, edges)`` with ``edges`` in ``connections`` order.
+    """
+    from jvspatial.utils.normalization import (
+        is_text_normalization_enabled,
+        normalize_data,
+    )
+
+    new_nodes = {n.id: n for n in nodes}
+    edges, additions, entries, instances = await _connect(
+        context, connections, direction, new_nodes
+    )
+    _sync_instances(instances.values(), additions, entries)
+
+    records = []
+    for node in nodes:
+        record = await node.export(include_edges=True)
+        record.setdefault("entity", node.entity)
+        if is_text_normalization_enabled():
+            record = normalize_data(record)
+        layout = layout_for(node)
+        if layout is not None and await spill(context.database, record, layout):
+            remember(context, node.id, node.edge_ids)
+        records.append(record)
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def _save(chunk: Sequence[Dict[str, Any]]) -> None:
+        async with semaphore:
+            await context.database.bulk_save("node", list(chunk))
+
+    await asyncio.gather(*(_save(c) for c in _chunks(records)))
+    for node in nodes:
+        await context._add_to_cache(node.id, node)
+
+    await _add_edge_ids_many(
+        context,
+        {k: v for k, v in additions.items() if k not in new_nodes},
+        entries,
+    )
+    return list(nodes), edges
+
+
+__all__ = [
+    "BULK_CHUNK_SIZE",
+    "BULK_CONCURRENCY",
+    "connect_many",
+    "create_and_connect_many",
+    "edge_matches_direction",
+]
@@ -0,0 +1,178 @@
+"""Set-based cascade deletion behind :meth:`~jvspatial.core.entities.Node.delete`.
+
+The dependent set is computed once, in memory, from raw edge documents:
+
+1. Level-synchronous BFS over outgoing edges from the root: one
+   ``find({"source": {"$in": level}})`` per chunk of each level, run
+   concurrently. This yields ``R``, every node reachable from the root.
+2. One ``find({"target": {"$in": ...}})`` over the root and ``R`` picks up
+   the remaining incident edges, so every edge touching the candidates is
+   known without loading a single node.
+3. A node of ``R`` is *anchored* when it has a neighbour (either direction)
+   outside ``R`` and the root. Anchoring spreads through the connected
+   components of ``R`` (the root excluded), and every node in an unanchored
+   component is a dependent.
+
+Deletion is then batched: edge ids are pulled from surviving endpoints once
+per node, edges and dependents go out with ``delete_many``, and the entity
+cache is evicted for everything removed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+from jvspatial.core.adjacency import delete_buckets
+from jvspatial.core.adjacency_entries import entry_for
+from jvspatial.core.graph_bulk import (
+    BULK_CONCURRENCY,
+    _chunks,
+    _remove_edge_ids_many,
+)
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+
+logger = logging.getLogger(__name__)
+
+
+def _edge_id(doc: Dict[str, Any]) -> str:
+    return str(doc.get("id") or doc.get("_id") or "")
+
+
+async def _edges_where(
+    context: "GraphContext",
+    field: str,
+    node_ids: Iterable[str],
+    semaphore: asyncio.Semaphore,
+) -> List[Dict[str, Any]]:
+    """Edge documents whose ``field`` is any of ``node_ids``, chunked."""
+    db = context.database
+    collection = context._get_collection_name("e")
+
+    async def _one(chunk: Sequence[str]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await db.find(collection, {field: {"$in": list(chunk)}})
+
+    ids = sorted(set(node_ids))
+    out: List[Dict[str, Any]] = []
+    for part in await asyncio.gather(*(_one(c) for c in _chunks(ids))):
+        out.extend(part)
+    return out
+
+
+async def _collect(
+    context: "GraphContext", root_id: str, cascade: bool
+) -> Tuple[Set[str], Dict[str, Dict[str, Any]]]:
+    """Nodes reachable from ``root_id`` (root included) and all their edges."""
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    seen = {root_id}
+    edges: Dict[str, Dict[str, Any]] = {}
+    frontier = [root_id]
+    while frontier:
+        level: List[str] = []
+        for doc in await _edges_where(context, "source", frontier, semaphore):
+            edges[_edge_id(doc)] = doc
+            target = doc.get("target")
+            if cascade and target and target not in seen:
+                seen.add(target)
+                level.append(target)
+        frontier = level
+    for doc in await _edges_where(context, "target", seen, semaphore):
+        edges[_edge_id(doc)] = doc
+    edges.pop("", None)
+    return seen, edges
+
+
+def dependent_nodes(
+    root_id: str, reachable: Set[str], edges: Iterable[Dict[str, Any]]
+) -> Set[str]:
+    """Nodes of ``reachable`` that only hang off ``root_id``.
+
+    ``reachable`` includes the root; ``edges`` must include every edge
+    incident to it. See the module docstring for the rule.
+    """
+    candidates = reachable - {root_id}
+    anchored: Set[str] = set()
+    links: Dict[str, Set[str]] = {n: set() for n in candidates}
+    for doc in edges:
+        source, target = doc.get("source"), doc.get("target")
+        if not source or not target:
+            continue
+        if source in candidates and target in candidates:
+            links[source].add(target)
+            links[target].add(source)
+        elif source in candidates and target not in reachable:
+            anchored.add(source)
+        elif target in candidates and source not in reachable:
+            anchored.add(target)
+
+    dependents: Set[str] = set()
+    visited: Set[str] = set()
+    for start in candidates:
+        if start in visited:
+            continue
+        component = {start}
+        stack = [start]
+        while stack:
+            for other in links[stack.pop()]:
+                if other not in component:
+                    component.add(other)
+                    stack.append(other)
+        visited |= component
+        if not component & anchored:
+            dependents |= component
+    return dependents
+
+
+async def cascade_delete(
+    context: "GraphContext", root_id: str, *, cascade: bool = True
+) -> Dict[str, int]:
+    """Delete every edge touching ``root_id`` and, with ``cascade``, its dependents.
+
+    The root node document itself is left for the caller to remove.
+
+    Returns:
+        ``{"nodes": dependents deleted, "edges": edges deleted}``.
+    """
+    reachable, edges = await _collect(context, root_id, cascade)
+    doomed = {root_id}
+    if cascade:
+        doomed |= dependent_nodes(root_id, reachable, edges.values())
+
+    doomed_edges: List[str] = []
+    removals: Dict[str, List[str]] = {}
+    entries: Dict[str, List[Dict[str, str]]] = {}
+    for edge_id, doc in edges.items():
+        ends = {doc.get("source"), doc.get("target")}
+        if not ends & doomed:
+            continue
+        doomed_edges.append(edge_id)
+        for node_id in ends - doomed:
+            if node_id:
+                removals.setdefault(node_id, []).append(edge_id)
+                entries.setdefault(node_id, []).append(entry_for(doc, node_id))
+
+    await _remove_edge_ids_many(context, removals, entries)
+
+    db = context.database
+    dependents = sorted(doomed - {root_id})
+    for collection, ids in (
+        (context._get_collection_name("e"), sorted(doomed_edges)),
+        (context._get_collection_name("n"), dependents),
+    ):
+        for chunk in _chunks(ids):
+            await db.delete_many(collection, list(chunk))
+    await delete_buckets(context, dependents)
+    await asyncio.gather(
+        *(context._remove_from_cache(i) for i in doomed_edges + dependents)
+    )
+    logger.debug(
+        "cascade delete of %s removed %d nodes and %d edges",
+        root_id,
+        len(dependents),
+        len(doomed_edges),
+    )
+    return {"nodes": len(dependents), "edges": len(doomed_edges)}
@@ -1,10 +1,27 @@
-"""Bounded graph expansion for progressive visualization (no full-graph scan)."""
+"""Bounded graph expansion for progressive visualization (no full-graph scan).
+
+Both entry points fetch in batches rather than per record. :func:`subgraph_bfs`
+expands one BFS level at a time: the level's nodes are loaded with one
+``find_many`` and all of their incident edges with another (chunked and run
+concurrently). Edge documents seen at an earlier level are reused, so an edge
+is never fetched twice. Every payload's ``meta`` block reports the resulting
+round-trip counts.
+"""
 
 from __future__ import annotations
 
-from collections import deque
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from jvspatial.core.adjacency import (
+    BUCKET_COLLECTION,
+    bucket_ids,
+    edge_count,
+    is_bucketed,
+    layout_for,
+    partition_directions,
+)
+from jvspatial.core.degree_counters import directed
 from jvspatial.core.graph_payload import (
     DetailLevel,
     edge_record_to_payload,
@@ -18,6 +35,51 @@ from jvspatial.core.graph_payload import (
 if TYPE_CHECKING:
     from jvspatial.core.context import GraphContext
 
+# ``find_many`` batch size and how many batches may be in flight at once.
+FETCH_CHUNK_SIZE = 500
+FETCH_CONCURRENCY = 4
+
+
+class _BatchFetcher:
+    """Chunked, concurrent ``find_many`` that counts database round trips."""
+
+    def __init__(self, db: Any) -> None:
+        self._db = db
+        self._semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        self.round_trips: Dict[str, int] = {}
+
+    async def get(self, collection: str, record_id: str) -> Optional[Dict[str, Any]]:
+        self._count(collection)
+        return await self._db.get(collection, record_id)
+
+    async def many(
+        self, collection: str, ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        unique = list(dict.fromkeys(ids))
+        if not unique:
+            return {}
+        chunks = [
+            unique[i : i + FETCH_CHUNK_SIZE]
+            for i in range(0, len(unique), FETCH_CHUNK_SIZE)
+        ]
+
+        async def _one(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            async with self._semaphore:
+                self._count(collection)
+                return await self._db.find_many(collection, chunk)
+
+        out: Dict[str, Dict[str, Any]] = {}
+        for part in await asyncio.gather(*(_one(c) for c in chunks)):
+            out.update(part)
+        return out
+
+    def _count(self, collection: str) -> None:
+        self.round_trips[collection] = self.round_trips.get(collection, 0) + 1
+
+    def meta(self) -> Dict[str, int]:
+        """Round trips per collection plus ``total``."""
+        return {**self.round_trips, "total": sum(self.round_trips.values())}
+
 
 def _coerce_edge_id_list(value: Any) -> List[str]:
     if value is None:
@@ -27,6 +89,39 @@ def _coerce_edge_id_list(value: Any) -> List[str]:
     return []
 
 
+async def _bucketed_page(
+    fetch: _BatchFetcher,
+    center_raw: Dict[str, Any],
+    node_id: str,
+    direction: str,
+    cursor: int,
+    limit: int,
+) -> Tuple[List[str], bool]:
+    """Page of a bucketed node's edge ids, reading buckets only up to the page.
+
+    The order is the sorted inline head, then buckets by partition and
+    sequence. With a direction-partitioned layout, buckets that cannot hold
+    ``direction`` edges are skipped.
+    """
+    layout = layout_for(node_id)
+    directions = (
+        partition_directions(direction) if layout and layout.by_direction else None
+    )
+    bucket_size = layout.bucket_size if layout else 1000
+    ids = bucket_ids(center_raw, directions)
+    stream = sorted(_coerce_edge_id_list(center_raw.get("edges")))
+    want = cursor + limit
+    read = 0
+    while len(stream) <= want and read < len(ids):
+        n = max(1, -(-(want + 1 - len(stream)) // bucket_size))
+        batch = ids[read : read + n]
+        read += len(batch)
+        docs = await fetch.many(BUCKET_COLLECTION, batch)
+        for bid in batch:
+            stream.extend(_coerce_edge_id_list((docs.get(bid) or {}).get("edges")))
+    return stream[cursor:want], len(stream) > want or read < len(ids)
+
+
 def _edge_matches_direction(
     edge_doc: Dict[str, Any], node_id: str, direction: str
 ) -> bool:
@@ -87,8 +182,9 @@ async def expand_node(
 ) -> Dict[str, Any]:
     """Load the center node and a page of incident edges plus neighbor summaries.
 
-    Uses the node's persisted ``edges`` list and batch ``get`` calls — O(limit),
-    not O(|E|).
+    Uses the node's persisted ``edges`` list: one ``get`` for the center, then
+    one ``find_many`` for the page of edges and one for the neighbors —
+    O(limit) data in three round trips, not O(|E|).
 
     Args:
         context: Active graph context
@@ -99,12 +195,12 @@ async def expand_node(
         detail_level: ``summary`` (no context) or ``full`` (trimmed context on all nodes/edges)
 
     Returns:
-        Dict with ``center_id``, ``nodes``, ``edges``, ``pagination``
+        Dict with ``center_id``, ``nodes``, ``edges``, ``pagination``, ``meta``
     """
     limit = max(0, min(int(limit), 500))
     cursor = max(0, int(cursor))
-    db = context.database
-    center_raw = await db.get("node", node_id)
+    fetch = _BatchFetcher(context.database)
+    center_raw = await fetch.get("node", node_id)
     if not center_raw:
         return {
             "center_id": node_id,
@@ -117,16 +213,25 @@ async def expand_node(
                 "total_edge_count": 0,
                 "returned_edges": 0,
             },
+            "meta": {"round_trips": fetch.meta()},
             "found": False,
         }
 
-    all_edge_ids = sorted(_coerce_edge_id_list(center_raw.get("edges")))
-    total = len(all_edge_ids)
-    page_ids = all_edge_ids[cursor : cursor + limit]
-
+    if is_bucketed(center_raw):
+        page_ids, has_more = await _bucketed_page(
+            fetch, center_raw, node_id, direction, cursor, limit
+        )
+        total = edge_count(center_raw)
+    else:
+        all_edge_ids = sorted(_coerce_edge_id_list(center_raw.get("edges")))
+        total = len(all_edge_ids)
+        page_ids = all_edge_ids[cursor : cursor + limit]
+        has_more = cursor + len(page_ids) < total
+
+    page_docs = await fetch.many("edge", page_ids)
     edge_docs: List[Dict[str, Any]] = []
     for eid in page_ids:
-        doc = await db.get("edge", eid)
+        doc = page_docs.get(eid)
         if doc and _edge_matches_direction(doc, node_id, direction):
             edge_docs.append(doc)
 
@@ -137,28 +242,24 @@ async def expand_node(
             neighbor_ids.append(other)
 
     neighbor_ids_unique = sorted(set(neighbor_ids))
-    neighbor_records: Dict[str, Dict[str, Any]] = {}
-    for nid in neighbor_ids_unique:
-        nraw = await db.get("node", nid)
-        if nraw:
-            neighbor_records[nid] = nraw
+    neighbor_records = await fetch.many("node", neighbor_ids_unique)
 
     nodes_out: List[Dict[str, Any]] = [
         node_record_to_payload(
             center_raw,
             detail_level=detail_level,
             degree=total,
+            directed=directed(center_raw),
         )
     ]
     for nid in neighbor_ids_unique:
         if nid in neighbor_records:
-            nedges = neighbor_records[nid].get("edges") or []
-            deg = len(nedges) if isinstance(nedges, list) else 0
             nodes_out.append(
                 node_record_to_payload(
                     neighbor_records[nid],
                     detail_level=detail_level,
-                    degree=deg,
+                    degree=edge_count(neighbor_records[nid]),
+                    directed=directed(neighbor_records[nid]),
                 )
             )
         else:
@@ -182,8 +283,7 @@ async def expand_node(
         )
         for doc in edge_docs
     ]
-    next_cursor = cursor + len(page_ids) if cursor + len(page_ids) < total else None
-    has_more = next_cursor is not None
+    next_cursor = cursor + len(page_ids) if has_more else None
 
     return {
         "center_id": node_id,
@@ -196,6 +296,7 @@ async def expand_node(
             "total_edge_count": total,
             "returned_edges": len(edges_out),
         },
+        "meta": {"round_trips": fetch.meta()},
         "found": True,
     }
 
@@ -212,7 +313,15 @@ async def subgraph_bfs(
     """Breadth-first load of a bounded subgraph from ``root_id``.
 
     Stops when ``max_depth`` or ``max_nodes`` would be exceeded. Each node
-    follows at most ``max_edges_per_node`` incident edges (sorted by edge id).
+    follows at most ``max_edges_per_node`` incident edges, ranked so the
+    ``Root``/``App``/``Agents`` spine survives the cap, then by edge id.
+
+    Expansion is level-synchronous: the nodes admitted at one depth are
+    loaded with a single chunked ``find_many``, then every incident edge not
+    already loaded is fetched the same way, so the cost is a few round trips
+    per level instead of one per vertex and edge. Nodes are admitted in the
+    same order a one-at-a-time BFS would visit them, so the result is the
+    same.
 
     Args:
         context: Active graph context
@@ -223,62 +332,93 @@ async def subgraph_bfs(
         detail_level: ``summary`` or ``full``
 
     Returns:
-        Dict with ``root_id``, ``nodes``, ``edges``, ``meta``
+        Dict with ``root_id``, ``nodes``, ``edges``, ``meta`` (``meta`` carries
+        ``levels`` and per-collection ``round_trips``)
     """
     max_depth = max(0, min(int(max_depth), 50))
     max_nodes = max(1, min(int(max_nodes), 10_000))
     max_edges_per_node = max(1, min(int(max_edges_per_node), 2000))
 
-    db = context.database
+    fetch = _BatchFetcher(context.database)
     seen: Set[str] = set()
+    edge_docs: Dict[str, Dict[str, Any]] = {}
     edges_by_id: Dict[str, Dict[str, Any]] = {}
     nodes_by_id: Dict[str, Dict[str, Any]] = {}
     truncated = False
-
-    q: deque[tuple[str, int]] = deque([(root_id, 0)])
-
-    while q:
-        if len(seen) >= max_nodes:
-            truncated = True
+    levels = 0
+
+    frontier: List[str] = [root_id]
+    depth = 0
+    while frontier:
+        # Admit this level's unseen nodes, in BFS order, up to max_nodes.
+        level: List[str] = []
+        for vid in frontier:
+            if vid in seen:
+                continue
+            if len(seen) >= max_nodes:
+                truncated = True
+                break
+            seen.add(vid)
+            level.append(vid)
+        if not level:
+            break
+        levels += 1
+        nodes_by_id.update(await fetch.many("node", level))
+        if depth >= max_depth:
             break
-        vid, d = q.popleft()
-        if vid in seen:
-            continue
-        seen.add(vid)
-
-        raw = await db.get("node", vid)
-        if raw:
-            nodes_by_id[vid] = raw
-
-        if d >= max_depth:
-            continue
 
-        all_eids = _coerce_edge_id_list((raw or {}).get("edges"))
-        eid_docs: List[Tuple[str, Optional[Dict[str, Any]]]] = [
-            (eid, await db.get("edge", eid)) for eid in all_eids
+        eids_by_node = {
+            vid: _coerce_edge_id_list((nodes_by_id.get(vid) or {}).get("edges"))
+            for vid in level
+        }
+        spilled = [vid for vid in level if is_bucketed(nodes_by_id.get(vid))]
+        if spilled:
+            buckets = await fetch.many(
+                BUCKET_COLLECTION,
+                [bid for vid in spilled for bid in bucket_ids(nodes_by_id[vid])],
+            )
+            for vid in spilled:
+                for bid in bucket_ids(nodes_by_id[vid]):
+                    eids_by_node[vid].extend(
+                        _coerce_edge_id_list((buckets.get(bid) or {}).get("edges"))
+                    )
+        wanted = [
+            eid
+            for eids in eids_by_node.values()
+            for eid in eids
+            if eid not in edge_docs
         ]
-        eid_docs.sort(key=lambda t: _bfs_spine_edge_sort_key(t[0], t[1], vid))
-        selected = eid_docs[:max_edges_per_node]
-        if len(eid_docs) > len(selected):
-            truncated = True
-
-        for eid, edoc in selected:
-            if not edoc:
-                continue
-            edges_by_id[eid] = edoc
-            other = _other_endpoint(edoc, vid)
-            if not other:
-                continue
-            if other not in seen:
-                q.append((other, d + 1))
-
+        edge_docs.update(await fetch.many("edge", wanted))
+
+        next_frontier: List[str] = []
+        for vid in level:
+            eid_docs: List[Tuple[str, Optional[Dict[str, Any]]]] = [
+                (eid, edge_docs.get(eid)) for eid in eids_by_node[vid]
+            ]
+            eid_docs.sort(key=lambda t: _bfs_spine_edge_sort_key(t[0], t[1], vid))
+            selected = eid_docs[:max_edges_per_node]
+            if len(eid_docs) > len(selected):
+                truncated = True
+            for eid, edoc in selected:
+                if not edoc:
+                    continue
+                edges_by_id[eid] = edoc
+                other = _other_endpoint(edoc, vid)
+                if other and other not in seen:
+                    next_frontier.append(other)
+        frontier = next_frontier
+        depth += 1
     node_payloads: List[Dict[str, Any]] = []
     for nid in sorted(seen):
         rec = nodes_by_id.get(nid)
         if rec:
-            ecount = len(_coerce_edge_id_list(rec.get("edges")))
             node_payloads.append(
-                node_record_to_payload(rec, detail_level=detail_level, degree=ecount)
+                node_record_to_payload(
+                    rec,
+                    detail_level=detail_level,
+                    degree=edge_count(rec),
+                    directed=directed(rec),
+                )
             )
         else:
             ent = entity_type_from_node_id(nid)
@@ -309,5 +449,7 @@ async def subgraph_bfs(
             "truncated": truncated,
             "node_count": len(seen),
             "edge_count": len(edges_by_id),
+            "levels": levels,
+            "round_trips": fetch.meta(),
         },
     }
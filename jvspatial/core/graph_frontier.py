@@ -0,0 +1,273 @@
+"""Frontier-batched multi-hop expansion.
+
+Implements :meth:`~jvspatial.core.context.GraphContext.expand_frontier`.
+Without a backend ``traverse``, a BFS that calls ``nodes()`` per frontier
+node costs a round trip per node per hop. Here every hop is handled for the
+whole frontier at once:
+
+1. Frontier nodes that keep typed adjacency entries name their peers from
+   memory (see :mod:`jvspatial.core.adjacency_entries`).
+2. One edge ``find`` covers the rest: ``source``/``target`` ``$in`` the
+   frontier, with edge entity and property criteria pushed into the query
+   (very wide frontiers are chunked and run concurrently).
+3. Peer ids are pruned by node entity straight from the id, loaded with one
+   ``get_batch`` (entity cache, then ``find_many``) and checked against node
+   property criteria in memory.
+
+Rows carry the same annotations as the backend ``traverse`` rows, plus the
+loaded node.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from jvspatial.core import adjacency_entries
+from jvspatial.core.graph_bulk import BULK_CONCURRENCY, _chunks
+from jvspatial.core.graph_payload import entity_type_from_node_id
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+    from jvspatial.core.entities import Node
+
+# ``(edge id, peer id)`` pairs per frontier node, in discovery order.
+Links = Dict[str, List[Tuple[str, str]]]
+
+
+def _edge_filter_query(spec: adjacency_entries.EdgeSpec) -> Optional[Dict[str, Any]]:
+    """Edge document query for a parsed edge filter, or None for any edge."""
+    entities, any_type = spec
+    if any_type:
+        return None
+    if not any(entities.values()):
+        return {"entity": {"$in": sorted(entities)}}
+    return {
+        "$or": [
+            {"entity": name, **criteria} if criteria else {"entity": name}
+            for name, checks in entities.items()
+            for criteria in (checks or [None])
+        ]
+    }
+
+
+def _edge_query(
+    chunk: List[str], direction: str, spec: adjacency_entries.EdgeSpec
+) -> Dict[str, Any]:
+    """Edge query for one frontier chunk with the edge filter pushed down."""
+    if direction == "out":
+        query: Dict[str, Any] = {"source": {"$in": chunk}}
+    elif direction == "in":
+        query = {"target": {"$in": chunk}}
+    else:
+        query = {"$or": [{"source": {"$in": chunk}}, {"target": {"$in": chunk}}]}
+    pushed = _edge_filter_query(spec)
+    if pushed is None:
+        return query
+    if "entity" in pushed:
+        return {**query, **pushed}
+    return {"$and": [query, pushed]}
+
+
+async def _edge_docs(
+    context: "GraphContext",
+    frontier: List[str],
+    direction: str,
+    spec: adjacency_entries.EdgeSpec,
+) -> List[Dict[str, Any]]:
+    """Edge documents touching ``frontier`` nodes in ``direction``."""
+    db = context.database
+    collection = context._get_collection_name("e")
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def _one(chunk: List[str]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await db.find(collection, _edge_query(chunk, direction, spec))
+
+    pages = await asyncio.gather(*(_one(list(c)) for c in _chunks(frontier)))
+    return [doc for docs in pages for doc in docs]
+
+
+def _ends(
+    doc: Dict[str, Any], direction: str, members: Set[str]
+) -> List[Tuple[str, str]]:
+    """``(frontier node, peer)`` pairs an edge document links in ``direction``."""
+    source, target = doc.get("source"), doc.get("target")
+    pairs = []
+    if direction in ("out", "both") and source in members and target:
+        pairs.append((source, target))
+    if direction in ("in", "both") and target in members and source:
+        pairs.append((target, source))
+    return pairs
+
+
+async def _edge_links(
+    context: "GraphContext",
+    frontier: List[str],
+    direction: str,
+    spec: adjacency_entries.EdgeSpec,
+) -> Links:
+    """Links of ``frontier`` nodes read from the edge collection."""
+    members = set(frontier)
+    links: Links = {}
+    for doc in await _edge_docs(context, frontier, direction, spec):
+        edge_id = str(doc.get("id") or doc.get("_id") or "")
+        for node_id, peer in _ends(doc, direction, members):
+            links.setdefault(node_id, []).append((edge_id, peer))
+    return links
+
+
+def _entity_filter(node_filter: Any) -> Optional[Any]:
+    """Predicate on a node id's entity segment, or None when any will do.
+
+    Permissive for entities it cannot resolve: the in-memory node filter
+    has the final say.
+    """
+    if node_filter is None:
+        return None
+    items = node_filter if isinstance(node_filter, list) else [node_filter]
+    names: Set[str] = set()
+    classes: List[type] = []
+    for item in items:
+        if isinstance(item, dict):
+            names.update(item)
+        elif isinstance(item, type):
+            classes.append(item)
+        else:
+            names.add(str(item))
+
+    from .entities.node import Node
+    from .utils import find_subclass_by_name
+
+    def _allowed(node_id: str) -> bool:
+        entity = entity_type_from_node_id(node_id)
+        if entity in names:
+            return True
+        if not classes:
+            return False
+        cls = find_subclass_by_name(Node, entity)
+        return cls is None or issubclass(cls, tuple(classes))
+
+    return _allowed
+
+
+async def expand_frontier(
+    context: "GraphContext",
+    start: Iterable[Union[str, "Node"]],
+    depth: int = 1,
+    *,
+    direction: str = "out",
+    node: Any = None,
+    edge: Any = None,
+    limit: Optional[int] = None,
+    per_node_limit: Optional[int] = None,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Breadth-first expansion of many start nodes, one batched pass per hop.
+
+    Args:
+        context: Graph context to read through.
+        start: Start node ids or instances (instances spare a lookup when
+            they keep adjacency entries).
+        depth: Number of hops.
+        direction: ``out``, ``in`` or ``both``, as for ``Node.nodes``.
+        node: ``nodes(node=...)`` filter, applied at every hop; nodes that
+            fail it are neither returned nor expanded.
+        edge: ``nodes(edge=...)`` filter, applied at every hop.
+        limit: Cap on the number of rows returned.
+        per_node_limit: Cap on the new nodes reached from one node in a hop.
+        **kwargs: Node property filters, as for ``Node.nodes``.
+
+    Returns:
+        One row per reached node, in BFS order: ``{"node", "node_id",
+        "edge_id", "depth", "parent_id"}``. Start nodes are not included
+        and every node appears once, at its smallest depth.
+    """
+    from .entities.node import Node
+
+    if direction not in ("out", "in", "both"):
+        direction = "out"
+    instances: Dict[str, "Node"] = {}
+    frontier: List[str] = []
+    for item in start:
+        node_id = item if isinstance(item, str) else item.id
+        if not isinstance(item, str):
+            instances[node_id] = item
+        if node_id and node_id not in frontier:
+            frontier.append(node_id)
+    spec = adjacency_entries.parse_edge_filter(edge)
+    allowed = _entity_filter(node)
+    seen: Set[str] = set(frontier)
+    rows: List[Dict[str, Any]] = []
+
+    for level in range(1, max(0, depth) + 1):
+        if not frontier or (limit is not None and len(rows) >= limit):
+            break
+        # Frontier nodes with adjacency entries skip the edge query.
+        typed = [i for i in frontier if adjacency_entries.enabled(i)]
+        missing = [i for i in typed if i not in instances]
+        if missing:
+            for loaded in await context.get_batch(Node, missing):
+                instances[loaded.id] = loaded
+        links: Links = {}
+        for node_id in typed:
+            if node_id in instances:
+                found = await adjacency_entries.neighbor_links(
+                    context, instances[node_id], direction, edge
+                )
+                links[node_id] = found or []
+        rest = [i for i in frontier if i not in links]
+        if rest:
+            links.update(await _edge_links(context, rest, direction, spec))
+
+        candidates: List[str] = []
+        for parent in frontier:
+            for _, peer in links.get(parent, ()):
+                if peer not in seen and (allowed is None or allowed(peer)):
+                    candidates.append(peer)
+        candidates = list(dict.fromkeys(candidates))
+        loaded_nodes = await context.get_batch(Node, candidates) if candidates else []
+        if loaded_nodes and (node is not None or kwargs):
+            loaded_nodes = loaded_nodes[0]._filter_connected(
+                loaded_nodes, node, None, kwargs
+            )
+        reached = {n.id: n for n in loaded_nodes}
+        instances.update(reached)
+
+        next_frontier: List[str] = []
+        for parent in frontier:
+            taken = 0
+            for edge_id, peer in links.get(parent, ()):
+                if peer in seen or peer not in reached:
+                    continue
+                if per_node_limit is not None and taken >= per_node_limit:
+                    break
+                if limit is not None and len(rows) >= limit:
+                    break
+                seen.add(peer)
+                taken += 1
+                next_frontier.append(peer)
+                rows.append(
+                    {
+                        "node": reached[peer],
+                        "node_id": peer,
+                        "edge_id": edge_id,
+                        "depth": level,
+                        "parent_id": parent,
+                    }
+                )
+        frontier = next_frontier
+    return rows
+
+
+__all__ = ["expand_frontier"]
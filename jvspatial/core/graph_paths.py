@@ -0,0 +1,541 @@
+"""Weighted shortest paths and k-hop reachability.
+
+Implements :meth:`~jvspatial.core.context.GraphContext.shortest_path` and
+:meth:`~jvspatial.core.context.GraphContext.reachable`.
+Searches work on node and edge ids and expand neighbors in batches, one
+edge query per batch (see :mod:`jvspatial.core.graph_frontier`); only the
+nodes and edges of the answer are loaded. Which search runs:
+
+* Backends with a recursive CTE (``shortest_path`` / ``reachable`` on
+  SQLite and Postgres) answer in one query: reachability always, paths
+  when ``max_depth`` is at most :data:`PATH_CTE_MAX_DEPTH` (the CTE
+  enumerates simple paths, which grows exponentially with depth).
+* Unweighted paths: bidirectional BFS, one edge query per level and side.
+* Weighted, with ``max_depth``: hop-bounded Bellman-Ford, one edge query
+  per hop, exact for "cheapest path of at most ``max_depth`` edges".
+* Weighted, with a ``heuristic``: A*, prefetching the adjacency of the
+  :data:`EXPANSION_BATCH` best open nodes per query.
+* Weighted otherwise: bidirectional Dijkstra with the same prefetching.
+
+Edge weights are read from a dotted edge field (``"context.distance"``);
+missing or non-numeric values cost 1. The in-process searches raise
+``ValueError`` on a negative weight.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from jvspatial.core import adjacency_entries
+from jvspatial.core.graph_frontier import (
+    _edge_docs,
+    _edge_filter_query,
+    _edge_links,
+    _ends,
+    _entity_filter,
+)
+
+if TYPE_CHECKING:
+    from jvspatial.core.context import GraphContext
+    from jvspatial.core.entities import Edge, Node
+
+# Deepest bounded path search routed to a backend CTE.
+PATH_CTE_MAX_DEPTH = 6
+# Open nodes whose adjacency one Dijkstra/A* edge query fetches.
+EXPANSION_BATCH = 32
+
+_REVERSE = {"out": "in", "in": "out", "both": "both"}
+
+# ``{node id: [(edge id, peer id, weight)]}``
+Adjacency = Dict[str, List[Tuple[str, str, float]]]
+# ``{node id: (previous node id, edge id)}``
+Parents = Dict[str, Tuple[str, str]]
+
+
+@dataclass
+class GraphPath:
+    """A path between two nodes.
+
+    Attributes:
+        nodes: Nodes from start to end (both included).
+        edges: Edges between consecutive ``nodes``.
+        cost: Sum of edge weights (the hop count when unweighted).
+    """
+
+    nodes: List["Node"] = field(default_factory=list)
+    edges: List["Edge"] = field(default_factory=list)
+    cost: float = 0.0
+
+    @property
+    def hops(self) -> int:
+        """Number of edges on the path."""
+        return len(self.edges)
+
+    @property
+    def node_ids(self) -> List[str]:
+        """Ids of the path's nodes, source first."""
+        return [n.id for n in self.nodes]
+
+    @property
+    def edge_ids(self) -> List[str]:
+        """Ids of the path's edges, in path order."""
+        return [e.id for e in self.edges]
+
+
+def _weight_of(doc: Dict[str, Any], weight: Optional[str]) -> float:
+    if weight is None:
+        return 1.0
+    value: Any = doc
+    for part in weight.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return 1.0
+    if value < 0:
+        raise ValueError(f"negative edge weight {value!r} on {doc.get('id')}")
+    return float(value)
+
+
+class _Search:
+    """Shared state of one search: filters, adjacency cache, round trips."""
+
+    def __init__(
+        self,
+        context: "GraphContext",
+        direction: str,
+        edge: Any,
+        node: Any,
+        weight: Optional[str],
+        keep: Set[str],
+    ) -> None:
+        self.context = context
+        self.spec = adjacency_entries.parse_edge_filter(edge)
+        self.allowed = _entity_filter(node)
+        self.weight = weight
+        self.keep = keep
+        self.adjacency: Dict[str, Adjacency] = {
+            direction: {},
+            _REVERSE[direction]: {},
+        }
+
+    def _passes(self, node_id: str) -> bool:
+        return node_id in self.keep or self.allowed is None or self.allowed(node_id)
+
+    async def expand(self, direction: str, node_ids: List[str]) -> Adjacency:
+        """Adjacency of ``node_ids`` in ``direction``, fetching what is missing."""
+        cache = self.adjacency[direction]
+        missing = [n for n in dict.fromkeys(node_ids) if n not in cache]
+        if missing:
+            members = set(missing)
+            for node_id in missing:
+                cache[node_id] = []
+            for doc in await _edge_docs(self.context, missing, direction, self.spec):
+                edge_id = str(doc.get("id") or doc.get("_id") or "")
+                for node_id, peer in _ends(doc, direction, members):
+                    if self._passes(peer):
+                        cache[node_id].append(
+                            (edge_id, peer, _weight_of(doc, self.weight))
+                        )
+        return {n: cache[n] for n in node_ids}
+
+
+def _walk_back(parents: Parents, node_id: str) -> Tuple[List[str], List[str]]:
+    """Node and edge ids from the search root to ``node_id``."""
+    nodes, edges = [node_id], []
+    while node_id in parents:
+        node_id, edge_id = parents[node_id]
+        nodes.append(node_id)
+        edges.append(edge_id)
+    return nodes[::-1], edges[::-1]
+
+
+def _join(
+    forward: Parents, backward: Parents, meet: str
+) -> Tuple[List[str], List[str]]:
+    nodes, edges = _walk_back(forward, meet)
+    tail_nodes, tail_edges = _walk_back(backward, meet)
+    return nodes + tail_nodes[::-1][1:], edges + tail_edges[::-1]
+
+
+async def _bidirectional_bfs(
+    search: _Search,
+    source: str,
+    target: str,
+    direction: str,
+    max_depth: Optional[int],
+) -> Optional[Tuple[List[str], List[str], float]]:
+    sides: List[Tuple[str, Dict[str, int], Parents]] = [
+        (direction, {source: 0}, {}),
+        (_REVERSE[direction], {target: 0}, {}),
+    ]
+    frontiers = [[source], [target]]
+    levels = [0, 0]
+    while frontiers[0] and frontiers[1]:
+        if max_depth is not None and levels[0] + levels[1] >= max_depth:
+            return None
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        way, depth, parents = sides[side]
+        other_depth = sides[1 - side][1]
+        levels[side] += 1
+        adjacency = await search.expand(way, frontiers[side])
+        best: Optional[Tuple[int, str]] = None
+        reached: List[str] = []
+        for node_id in frontiers[side]:
+            for edge_id, peer, _ in adjacency[node_id]:
+                if peer in depth:
+                    continue
+                depth[peer] = levels[side]
+                parents[peer] = (node_id, edge_id)
+                reached.append(peer)
+                if peer in other_depth and (
+                    best is None or other_depth[peer] < best[0]
+                ):
+                    best = (other_depth[peer], peer)
+        if best is not None:
+            forward, backward = sides[0][2], sides[1][2]
+            nodes, edges = _join(forward, backward, best[1])
+            return nodes, edges, float(len(edges))
+        frontiers[side] = reached
+    return None
+
+
+async def _bounded_bellman_ford(
+    search: _Search,
+    source: str,
+    target: str,
+    direction: str,
+    max_depth: int,
+) -> Optional[Tuple[List[str], List[str], float]]:
+    # layers[k][v] = (cost, previous node, edge): v improved using k hops.
+    best: Dict[str, Tuple[float, int]] = {source: (0.0, 0)}
+    layers: List[Dict[str, Tuple[float, str, str]]] = [{}]
+    changed = {source: 0.0}
+    for hop in range(1, max_depth + 1):
+        if not changed:
+            break
+        adjacency = await search.expand(direction, list(changed))
+        bound = best[target][0] if target in best else math.inf
+        layer: Dict[str, Tuple[float, str, str]] = {}
+        for node_id, cost in changed.items():
+            for edge_id, peer, weight in adjacency[node_id]:
+                candidate = cost + weight
+                if candidate >= bound or peer == source:
+                    continue
+                if candidate < best.get(peer, (math.inf, 0))[0]:
+                    best[peer] = (candidate, hop)
+                    layer[peer] = (candidate, node_id, edge_id)
+        layers.append(layer)
+        changed = {peer: cost for peer, (cost, _, _) in layer.items() if peer != target}
+    if target not in best:
+        return None
+    cost, hop = best[target]
+    nodes, edges, node_id = [target], [], target
+    while hop > 0:
+        _, node_id, edge_id = layers[hop][node_id]
+        nodes.append(node_id)
+        edges.append(edge_id)
+        hop -= 1
+    return nodes[::-1], edges[::-1], cost
+
+
+def _batch(heap: List[Tuple[float, str]], done: Set[str], first: str) -> List[str]:
+    """``first`` plus the best open nodes, for one prefetching edge query."""
+    batch = [first]
+    for _, node_id in heapq.nsmallest(EXPANSION_BATCH * 2, heap):
+        if len(batch) >= EXPANSION_BATCH:
+            break
+        if node_id not in done and node_id not in batch:
+            batch.append(node_id)
+    return batch
+
+
+async def _bidirectional_dijkstra(
+    search: _Search, source: str, target: str, direction: str
+) -> Optional[Tuple[List[str], List[str], float]]:
+    ways = [direction, _REVERSE[direction]]
+    dist: List[Dict[str, float]] = [{source: 0.0}, {target: 0.0}]
+    parents: List[Parents] = [{}, {}]
+    heaps: List[List[Tuple[float, str]]] = [[(0.0, source)], [(0.0, target)]]
+    done: List[Set[str]] = [set(), set()]
+    best, meet = (0.0, source) if source == target else (math.inf, None)
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        cost, node_id = heapq.heappop(heaps[side])
+        if node_id in done[side] or cost > dist[side][node_id]:
+            continue
+        done[side].add(node_id)
+        cache = search.adjacency[ways[side]]
+        if node_id not in cache:
+            await search.expand(ways[side], _batch(heaps[side], done[side], node_id))
+        for edge_id, peer, weight in cache[node_id]:
+            candidate = cost + weight
+            if candidate < dist[side].get(peer, math.inf):
+                dist[side][peer] = candidate
+                parents[side][peer] = (node_id, edge_id)
+                heapq.heappush(heaps[side], (candidate, peer))
+            if peer in dist[1 - side]:
+                total = dist[side][peer] + dist[1 - side][peer]
+                if total < best:
+                    best, meet = total, peer
+    if meet is None:
+        return None
+    nodes, edges = _join(parents[0], parents[1], meet)
+    return nodes, edges, best
+
+
+async def _astar(
+    search: _Search,
+    source: str,
+    target: str,
+    direction: str,
+    heuristic: Callable[["Node", "Node"], float],
+) -> Optional[Tuple[List[str], List[str], float]]:
+    from .entities.node import Node
+
+    context = search.context
+    goal = await context.get(Node, target)
+    if goal is None:
+        return None
+    estimates: Dict[str, float] = {}
+
+    async def _estimate(node_ids: List[str]) -> None:
+        fresh = [n for n in dict.fromkeys(node_ids) if n not in estimates]
+        for node in await context.get_batch(Node, fresh) if fresh else []:
+            estimates[node.id] = float(heuristic(node, goal))
+        for node_id in fresh:
+            estimates.setdefault(node_id, math.inf)
+
+    await _estimate([source])
+    dist = {source: 0.0}
+    parents: Parents = {}
+    heap: List[Tuple[float, str]] = [(estimates[source], source)]
+    done: Set[str] = set()
+    cache = search.adjacency[direction]
+    while heap:
+        _, node_id = heapq.heappop(heap)
+        if node_id in done:
+            continue
+        if node_id == target:
+            nodes, edges = _walk_back(parents, target)
+            return nodes, edges, dist[target]
+        done.add(node_id)
+        if node_id not in cache:
+            adjacency = await search.expand(direction, _batch(heap, done, node_id))
+            await _estimate([p for links in adjacency.values() for _, p, _ in links])
+        for edge_id, peer, weight in cache[node_id]:
+            candidate = dist[node_id] + weight
+            if candidate < dist.get(peer, math.inf):
+                dist[peer] = candidate
+                parents[peer] = (node_id, edge_id)
+                heapq.heappush(heap, (candidate + estimates[peer], peer))
+    return None
+
+
+def _edge_collection(context: "GraphContext") -> str:
+    from .entities.edge import Edge
+
+    return context._get_collection_name(context._get_entity_type_code(Edge))
+
+
+def _pushable(context: "GraphContext", method: str, node: Any) -> Optional[Any]:
+    if node is not None:
+        return None
+    found = getattr(context.database, method, None)
+    return found if callable(found) else None
+
+
+async def shortest_path(
+    context: "GraphContext",
+    source: Union[str, "Node"],
+    target: Union[str, "Node"],
+    *,
+    weight: Optional[str] = None,
+    direction: str = "out",
+    edge: Any = None,
+    node: Any = None,
+    max_depth: Optional[int] = None,
+    heuristic: Optional[Callable[["Node", "Node"], float]] = None,
+) -> Optional[GraphPath]:
+    """Cheapest path from ``source`` to ``target``.
+
+    Args:
+        context: Graph context to read through.
+        source: Start node or id.
+        target: End node or id.
+        weight: Dotted edge field holding the cost, e.g.
+            ``"context.distance"``. None counts hops.
+        direction: ``out``, ``in`` or ``both``, as for ``Node.nodes``.
+        edge: ``nodes(edge=...)`` filter every path edge must pass.
+        node: Node entity filter (names or classes) for intermediate
+            nodes; property criteria are not supported here.
+        max_depth: Maximum number of edges on the path.
+        heuristic: ``heuristic(node, target) -> float`` lower bound on the
+            remaining cost, turning the weighted search into A*. It must
+            be admissible and consistent; ignored with ``max_depth``.
+
+    Returns:
+        A :class:`GraphPath`, or None when ``target`` is unreachable
+        (within ``max_depth``).
+    """
+    from .entities.edge import Edge
+    from .entities.node import Node
+
+    source_id = source if isinstance(source, str) else source.id
+    target_id = target if isinstance(target, str) else target.id
+    if direction not in _REVERSE:
+        raise ValueError(f"direction must be 'out', 'in', or 'both', got {direction!r}")
+    if max_depth is not None and max_depth < 0:
+        return None
+
+    found: Optional[Tuple[List[str], List[str], float]] = None
+    if source_id == target_id:
+        found = ([source_id], [], 0.0)
+    else:
+        backend = _pushable(context, "shortest_path", node)
+        if (
+            backend is not None
+            and max_depth is not None
+            and 1 <= max_depth <= PATH_CTE_MAX_DEPTH
+        ):
+            try:
+                row = await backend(
+                    _edge_collection(context),
+                    source_id,
+                    target_id,
+                    direction=direction,
+                    max_depth=max_depth,
+                    weight=weight,
+                    edge_filter=_edge_filter_query(
+                        adjacency_entries.parse_edge_filter(edge)
+                    ),
+                )
+            except (NotImplementedError, AttributeError):
+                pass
+            else:
+                if row is None:
+                    return None
+                found = (row["node_ids"], row["edge_ids"], row["cost"])
+        if found is None:
+            search = _Search(
+                context, direction, edge, node, weight, {source_id, target_id}
+            )
+            if weight is None:
+                found = await _bidirectional_bfs(
+                    search, source_id, target_id, direction, max_depth
+                )
+            elif max_depth is not None:
+                found = await _bounded_bellman_ford(
+                    search, source_id, target_id, direction, max_depth
+                )
+            elif heuristic is not None:
+                found = await _astar(search, source_id, target_id, direction, heuristic)
+            else:
+                found = await _bidirectional_dijkstra(
+                    search, source_id, target_id, direction
+                )
+    if found is None:
+        return None
+
+    node_ids, edge_ids, cost = found
+    nodes = {n.id: n for n in await context.get_batch(Node, node_ids)}
+    edges = (
+        {e.id: e for e in await context.get_batch(Edge, edge_ids)} if edge_ids else {}
+    )
+    if len(nodes) < len(set(node_ids)) or len(edges) < len(set(edge_ids)):
+        return None
+    return GraphPath(
+        nodes=[nodes[n] for n in node_ids],
+        edges=[edges[e] for e in edge_ids],
+        cost=cost,
+    )
+
+
+async def reachable(
+    context: "GraphContext",
+    start: Union[str, "Node"],
+    depth: int = 1,
+    *,
+    direction: str = "out",
+    edge: Any = None,
+    node: Any = None,
+) -> Dict[str, int]:
+    """Ids of the nodes within ``depth`` hops of ``start``, with their hop count.
+
+    One recursive CTE on backends that have one (and no ``node`` filter);
+    otherwise one edge query per hop. Nodes are not loaded.
+
+    Args:
+        context: Graph context to read through.
+        start: Start node or id (not included in the result).
+        depth: Maximum number of hops.
+        direction: ``out``, ``in`` or ``both``.
+        edge: ``nodes(edge=...)`` filter every traversed edge must pass.
+        node: Node entity filter (names or classes); nodes that fail it
+            are neither returned nor expanded.
+
+    Returns:
+        ``{node id: hops}`` in BFS order.
+    """
+    start_id = start if isinstance(start, str) else start.id
+    if direction not in _REVERSE:
+        raise ValueError(f"direction must be 'out', 'in', or 'both', got {direction!r}")
+    if depth < 1:
+        return {}
+    spec = adjacency_entries.parse_edge_filter(edge)
+
+    backend = _pushable(context, "reachable", node)
+    if backend is not None:
+        try:
+            rows = await backend(
+                _edge_collection(context),
+                start_id,
+                direction=direction,
+                max_depth=depth,
+                edge_filter=_edge_filter_query(spec),
+            )
+        except (NotImplementedError, AttributeError):
+            pass
+        else:
+            return {row["node_id"]: row["depth"] for row in rows}
+
+    allowed = _entity_filter(node)
+    hops: Dict[str, int] = {}
+    seen = {start_id}
+    frontier = [start_id]
+    for level in range(1, depth + 1):
+        if not frontier:
+            break
+        links = await _edge_links(context, frontier, direction, spec)
+        reached = []
+        for node_id in frontier:
+            for _, peer in links.get(node_id, ()):
+                if peer in seen or (allowed is not None and not allowed(peer)):
+                    continue
+                seen.add(peer)
+                hops[peer] = level
+                reached.append(peer)
+        frontier = reached
+    return hops
+
+
+__all__ = [
+    "EXPANSION_BATCH",
+    "GraphPath",
+    "PATH_CTE_MAX_DEPTH",
+    "reachable",
+    "shortest_path",
+]
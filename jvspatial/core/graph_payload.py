@@ -9,7 +9,7 @@ Node and edge ``label`` fields are the entity/class name only (from the stored
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 DetailLevel = Literal["summary", "full"]
 
@@ -89,15 +89,26 @@ def node_record_to_payload(
     *,
     detail_level: DetailLevel = "summary",
     degree: Optional[int] = None,
+    directed: Optional[Tuple[int, int]] = None,
     missing: bool = False,
 ) -> Dict[str, Any]:
-    """Build a JSON-serializable node dict for graph APIs (summary or full detail)."""
+    """Build a JSON-serializable node dict for graph APIs (summary or full detail).
+
+    ``directed`` is an ``(out, in)`` degree pair (from the node's degree
+    counters, see :mod:`jvspatial.core.degree_counters`), added as
+    ``out_degree`` / ``in_degree``.
+    """
     node_id = str(record.get("id", ""))
     entity = str(record.get("entity") or entity_type_from_node_id(node_id))
     edges = record.get("edges") or []
     if not isinstance(edges, list):
         edges = []
-    resolved_degree = degree if degree is not None else len(edges)
+    if degree is not None:
+        resolved_degree = degree
+    elif record.get("edge_buckets"):
+        resolved_degree = int(record.get("edge_count", len(edges)))
+    else:
+        resolved_degree = len(edges)
     ctx = record.get("context") if isinstance(record.get("context"), dict) else {}
     label = truncate_entity_label(entity)
     payload: Dict[str, Any] = {
@@ -106,6 +117,8 @@ def node_record_to_payload(
         "degree": resolved_degree,
         "label": label,
     }
+    if directed is not None:
+        payload["out_degree"], payload["in_degree"] = directed
     if missing:
         payload["missing"] = True
     if detail_level == "full":
@@ -36,9 +36,9 @@ import logging
 import threading
 import time
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from jvspatial.db.database import Database
+from jvspatial.db.database import ChangeEvent, Database, QueryPlan
 from jvspatial.runtime.serverless import is_serverless_mode
 
 logger = logging.getLogger(__name__)
@@ -68,6 +68,7 @@ class CachingDatabase(Database):
         inner: The wrapped database. Adopters can reach through to the
             backend if they need adapter-specific methods.
         supports_transactions: Mirrors the wrapped database's flag.
+        supports_changes: Mirrors the wrapped database's flag.
     """
 
     def __init__(
@@ -90,6 +91,7 @@ class CachingDatabase(Database):
         # Inherit the wrapped backend's transaction capability flag so
         # callers see the right answer.
         self.supports_transactions = getattr(inner, "supports_transactions", False)
+        self.supports_changes = getattr(inner, "supports_changes", False)
 
     # ----- helpers ----------------------------------------------------
 
@@ -133,6 +135,18 @@ class CachingDatabase(Database):
             if self._cache.pop(key, None) is not None:
                 self._stats["invalidations"] += 1
 
+    def _invalidate_collection(self, collection: str) -> None:
+        """Drop every cached entry for ``collection``.
+
+        Used by query-scoped bulk writes, where the affected ids are not
+        known without a second round trip.
+        """
+        with self._lock:
+            stale = [key for key in self._cache if key[0] == collection]
+            for key in stale:
+                del self._cache[key]
+            self._stats["invalidations"] += len(stale)
+
     # ----- introspection ---------------------------------------------
 
     def cache_stats(self) -> Dict[str, int]:
@@ -253,6 +267,37 @@ class CachingDatabase(Database):
                     self._cache_put(collection, str(rid), dict(r))
         return result
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Bulk delete on the backend, then invalidate.
+
+        An id list invalidates exactly those entries; a query drops the
+        whole collection from the cache.
+        """
+        result = await self.inner.delete_many(collection, query_or_ids)
+        if self._enabled():
+            if isinstance(query_or_ids, dict):
+                self._invalidate_collection(collection)
+            else:
+                for rid in query_or_ids:
+                    self._invalidate(collection, str(rid))
+        return result
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Bulk update on the backend, then drop the collection's entries."""
+        result = await self.inner.update_many(collection, query, update)
+        if result and self._enabled():
+            self._invalidate_collection(collection)
+        return result
+
     async def count(
         self,
         collection: str,
@@ -312,6 +357,54 @@ class CachingDatabase(Database):
         """Pass through deprecated-index cleanup to the wrapped backend."""
         await self.inner.drop_deprecated_indexes(deprecated)
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """Report the wrapped backend's pushdown decision."""
+        return self.inner.pushdown_status(collection, query, sort=sort)
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Explain against the wrapped backend (not cached, not instrumented)."""
+        return await self.inner.explain(collection, query, sort=sort, limit=limit)
+
+    async def change_cursor(self) -> bytes:
+        """Change cursor from the wrapped backend."""
+        return await self.inner.change_cursor()
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Pass the wrapped backend's change stream through, uncached."""
+        async for event in self.inner.changes(
+            collections,
+            since=since,
+            follow=follow,
+            poll_interval=poll_interval,
+            batch_size=batch_size,
+        ):
+            yield event
+
+    async def prune_changes(self, before: bytes) -> int:
+        """Prune the wrapped backend's change log."""
+        return await self.inner.prune_changes(before)
+
     # Pass through optional adapter methods (transactions, close, etc.)
     # via __getattr__ so callers reaching for adapter-specific surface
     # still work.
@@ -10,6 +10,11 @@ and emits, for each operation:
 2. One metrics emission to the configured :class:`MetricsRecorder`:
    a duration histogram and a counter, both labeled with the standard
    dimensions.
+3. For slow operations only, one entry in a bounded
+   :class:`~jvspatial.db._slow_query.SlowQueryLog`: normalized query
+   shape, sort, row count and whether the backend pushed the query
+   down (:meth:`Database.pushdown_status`). :meth:`suggest_indexes`
+   turns the ring into ``create_index`` recommendations.
 
 The wrapper is itself a :class:`Database`, so the outer call path
 doesn't need to know whether observation is enabled.
@@ -47,7 +52,13 @@ from typing import (
     Union,
 )
 
-from jvspatial.db.database import Database
+from jvspatial.db._slow_query import (
+    DEFAULT_SLOW_QUERY_LOG_SIZE,
+    IndexSuggestion,
+    SlowQueryLog,
+    suggest_indexes,
+)
+from jvspatial.db.database import ChangeEvent, Database, QueryPlan
 from jvspatial.observability import db_op_counter
 from jvspatial.observability.metrics import (
     MetricsRecorder,
@@ -85,7 +96,10 @@ class ObservableDatabase(Database):
         metrics: A :class:`MetricsRecorder`. Defaults to
             :class:`NullMetricsRecorder` (zero overhead).
         slow_query_ms: Threshold above which the per-op log line is
-            elevated from INFO to WARNING. Defaults to 100ms.
+            elevated from INFO to WARNING and the operation is recorded
+            in :attr:`slow_queries`. Defaults to 100ms.
+        slow_query_log_size: Capacity of the slow-query ring. ``0``
+            disables recording. Defaults to 256.
     """
 
     def __init__(
@@ -94,15 +108,25 @@ class ObservableDatabase(Database):
         *,
         metrics: Optional[MetricsRecorder] = None,
         slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        slow_query_log_size: int = DEFAULT_SLOW_QUERY_LOG_SIZE,
     ) -> None:
         if slow_query_ms < 0:
             raise ValueError("slow_query_ms must be >= 0")
+        if slow_query_log_size < 0:
+            raise ValueError("slow_query_log_size must be >= 0")
         self.inner = inner
         self.metrics: MetricsRecorder = metrics or NullMetricsRecorder()
         self.slow_query_ms = float(slow_query_ms)
         self._backend = _backend_label(inner)
+        self.slow_queries = SlowQueryLog(maxlen=slow_query_log_size)
         # Mirror capability flag.
         self.supports_transactions = getattr(inner, "supports_transactions", False)
+        self.supports_changes = getattr(inner, "supports_changes", False)
+
+    @property
+    def backend(self) -> str:
+        """Backend label used in log lines, metrics and slow-query entries."""
+        return self._backend
 
     # -------------------------- core helpers ---------------------------
 
@@ -113,11 +137,14 @@ class ObservableDatabase(Database):
         coro_factory: Callable[[], Awaitable[Any]],
         *,
         result_count_extractor: Optional[Callable[[Any], int]] = None,
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
     ) -> Any:
         """Run ``coro_factory()`` while emitting a log line and metric.
 
         ``coro_factory`` is a thunk so we measure the underlying call
-        only, not the time spent constructing the coroutine.
+        only, not the time spent constructing the coroutine. ``query``
+        and ``sort`` are only consulted when the call turns out slow.
         """
         start = time.monotonic()
         success = True
@@ -146,6 +173,8 @@ class ObservableDatabase(Database):
                 duration_s=duration_s,
                 success=success,
                 result_count=result_count,
+                query=query,
+                sort=sort,
             )
 
     def _emit(
@@ -157,6 +186,8 @@ class ObservableDatabase(Database):
         duration_s: float,
         success: bool,
         result_count: Optional[int],
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
     ) -> None:
         # Build the structured payload once; reuse for log + metrics.
         labels: Dict[str, Any] = {
@@ -176,6 +207,9 @@ class ObservableDatabase(Database):
         msg = "db.%s on '%s' took %.2fms" % (op, collection, duration_ms)
         if slow:
             logger.warning("SLOW %s", msg, extra=log_extra)
+            self._record_slow(
+                op, collection, duration_ms, result_count, query=query, sort=sort
+            )
         else:
             logger.info(msg, extra=log_extra)
 
@@ -204,6 +238,93 @@ class ObservableDatabase(Database):
         except Exception as exc:  # pragma: no cover - defensive
             logger.debug("Metrics emission failed (suppressed): %s", exc)
 
+    def _record_slow(
+        self,
+        op: str,
+        collection: str,
+        duration_ms: float,
+        result_count: Optional[int],
+        *,
+        query: Optional[Dict[str, Any]],
+        sort: Optional[List[Tuple[str, int]]],
+    ) -> None:
+        # Pushdown is only meaningful for query-shaped ops; id lookups and
+        # writes are recorded without it.
+        pushed_down: Optional[bool] = None
+        if query is not None:
+            try:
+                pushed_down = self.inner.pushdown_status(collection, query, sort=sort)
+            except Exception:  # pragma: no cover - defensive
+                pushed_down = None
+        self.slow_queries.record(
+            backend=self._backend,
+            op=op,
+            collection=collection,
+            duration_ms=duration_ms,
+            query=query,
+            sort=sort,
+            result_count=result_count,
+            pushed_down=pushed_down,
+        )
+
+    def suggest_indexes(
+        self, *, min_occurrences: int = 1, limit: Optional[int] = None
+    ) -> List[IndexSuggestion]:
+        """Index recommendations derived from the current slow-query ring."""
+        return suggest_indexes(
+            self.slow_queries.entries(),
+            min_occurrences=min_occurrences,
+            limit=limit,
+        )
+
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """Report the wrapped backend's pushdown decision."""
+        return self.inner.pushdown_status(collection, query, sort=sort)
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Explain against the wrapped backend (not cached, not instrumented)."""
+        return await self.inner.explain(collection, query, sort=sort, limit=limit)
+
+    async def change_cursor(self) -> bytes:
+        """Change cursor from the wrapped backend."""
+        return await self.inner.change_cursor()
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Pass the wrapped backend's change stream through, uninstrumented."""
+        async for event in self.inner.changes(
+            collections,
+            since=since,
+            follow=follow,
+            poll_interval=poll_interval,
+            batch_size=batch_size,
+        ):
+            yield event
+
+    async def prune_changes(self, before: bytes) -> int:
+        """Prune the wrapped backend's change log."""
+        return await self.inner.prune_changes(before)
+
     # ------------------------- Database protocol -----------------------
 
     async def save(self, collection: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -243,6 +364,8 @@ class ObservableDatabase(Database):
             collection,
             lambda: self.inner.find(collection, query, limit=limit, sort=sort),
             result_count_extractor=lambda r: len(r) if isinstance(r, list) else 0,
+            query=query,
+            sort=sort,
         )
 
     async def count(
@@ -256,6 +379,7 @@ class ObservableDatabase(Database):
             collection,
             lambda: self.inner.count(collection, query),
             result_count_extractor=lambda r: int(r) if r is not None else 0,
+            query=query or {},
         )
 
     async def find_one(
@@ -267,6 +391,7 @@ class ObservableDatabase(Database):
             collection,
             lambda: self.inner.find_one(collection, query),
             result_count_extractor=lambda r: 0 if r is None else 1,
+            query=query,
         )
 
     async def find_many(
@@ -289,6 +414,35 @@ class ObservableDatabase(Database):
             result_count_extractor=lambda r: int(r) if r is not None else 0,
         )
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Instrumented ``delete_many`` (emits structured log + metric)."""
+        return await self._instrument(
+            "delete_many",
+            collection,
+            lambda: self.inner.delete_many(collection, query_or_ids),
+            result_count_extractor=lambda r: int(r) if r is not None else 0,
+            query=query_or_ids if isinstance(query_or_ids, dict) else None,
+        )
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Instrumented ``update_many`` (emits structured log + metric)."""
+        return await self._instrument(
+            "update_many",
+            collection,
+            lambda: self.inner.update_many(collection, query, update),
+            result_count_extractor=lambda r: int(r) if r is not None else 0,
+            query=query,
+        )
+
     async def find_one_and_delete(
         self, collection: str, query: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -298,6 +452,7 @@ class ObservableDatabase(Database):
             collection,
             lambda: self.inner.find_one_and_delete(collection, query),
             result_count_extractor=lambda r: 0 if r is None else 1,
+            query=query,
         )
 
     async def find_one_and_update(
@@ -315,6 +470,7 @@ class ObservableDatabase(Database):
                 collection, query, update, upsert=upsert
             ),
             result_count_extractor=lambda r: 0 if r is None else 1,
+            query=query,
         )
 
     async def create_index(
@@ -391,6 +547,62 @@ class ObservableDatabase(Database):
             result_count_extractor=lambda r: len(r) if isinstance(r, list) else 0,
         )
 
+    async def reachable(
+        self,
+        edge_collection: str,
+        start_id: str,
+        *,
+        direction: str = "out",
+        max_depth: int = 1,
+        edge_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Instrumented k-hop reachability when the backend supports it."""
+        inner = getattr(self.inner, "reachable", None)
+        if not callable(inner):
+            raise AttributeError("reachable")
+        return await self._instrument(
+            "reachable",
+            edge_collection,
+            lambda: inner(
+                edge_collection,
+                start_id,
+                direction=direction,
+                max_depth=max_depth,
+                edge_filter=edge_filter,
+            ),
+            result_count_extractor=lambda r: len(r) if isinstance(r, list) else 0,
+        )
+
+    async def shortest_path(
+        self,
+        edge_collection: str,
+        source_id: str,
+        target_id: str,
+        *,
+        direction: str = "out",
+        max_depth: int,
+        weight: Optional[str] = None,
+        edge_filter: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Instrumented bounded path search when the backend supports it."""
+        inner = getattr(self.inner, "shortest_path", None)
+        if not callable(inner):
+            raise AttributeError("shortest_path")
+        return await self._instrument(
+            "shortest_path",
+            edge_collection,
+            lambda: inner(
+                edge_collection,
+                source_id,
+                target_id,
+                direction=direction,
+                max_depth=max_depth,
+                weight=weight,
+                edge_filter=edge_filter,
+            ),
+            result_count_extractor=lambda r: 1 if r else 0,
+        )
+
     async def find_iter(
         self,
         collection: str,
@@ -431,6 +643,8 @@ class ObservableDatabase(Database):
                 duration_s=duration_s,
                 success=success,
                 result_count=result_count,
+                query=query,
+                sort=sort,
             )
 
     def __getattr__(self, name: str) -> Any:
@@ -438,4 +652,22 @@ class ObservableDatabase(Database):
         return getattr(self.inner, name)
 
 
-__all__ = ["ObservableDatabase", "DEFAULT_SLOW_QUERY_MS"]
+def find_observable(db: Any) -> Optional[ObservableDatabase]:
+    """Return the :class:`ObservableDatabase` in ``db``'s wrapper chain, if any.
+
+    Follows ``.inner`` links (caching / observability wrappers) without
+    going through their ``__getattr__`` forwarding.
+    """
+    candidate: Any = db
+    for _ in range(8):
+        if isinstance(candidate, ObservableDatabase):
+            return candidate
+        candidate = (
+            vars(candidate).get("inner") if hasattr(candidate, "__dict__") else None
+        )
+        if candidate is None:
+            return None
+    return None
+
+
+__all__ = ["ObservableDatabase", "DEFAULT_SLOW_QUERY_MS", "find_observable"]
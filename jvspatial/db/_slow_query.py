@@ -0,0 +1,334 @@
+"""Slow-query ring buffer and index advisor.
+
+:class:`~jvspatial.db._observable.ObservableDatabase` records every
+operation that crosses its ``slow_query_ms`` threshold into a bounded
+:class:`SlowQueryLog`. Each entry carries the *shape* of the query
+(literals replaced by ``"?"``) rather than the query itself, so the log
+never retains user data and identical access patterns collapse onto one
+key.
+
+:func:`suggest_indexes` turns those entries into ``create_index``
+declarations. Field order follows the usual equality → sort → range
+rule: equality predicates narrow the index prefix, the sort keys can
+then be read in index order, and range predicates go last because they
+end the usable prefix.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+# Default number of slow operations retained per ObservableDatabase.
+DEFAULT_SLOW_QUERY_LOG_SIZE = 256
+
+# Placeholder that replaces every literal in a normalized query shape.
+SHAPE_PLACEHOLDER = "?"
+
+_LOGICAL_OPS = ("$and", "$or", "$nor")
+_EQUALITY_OPS = ("$eq", "$in", "$elemMatch", "$all", "$size")
+_PRIMARY_KEY_FIELDS = ("id", "_id")
+
+
+def normalize_query_shape(query: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return ``query`` with every literal replaced by ``"?"``.
+
+    Keys are sorted so ``{"a": 1, "b": 2}`` and ``{"b": 3, "a": 4}``
+    produce the same shape. Branches of ``$and``/``$or``/``$nor`` are
+    normalized recursively and de-duplicated; ``$elemMatch`` keeps its
+    inner structure.
+    """
+    if not query:
+        return {}
+    return _shape(query)
+
+
+def _shape(node: Dict[str, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for key in sorted(node):
+        value = node[key]
+        if key in _LOGICAL_OPS and isinstance(value, list):
+            branches = {
+                shape_key(_shape(b)): _shape(b) for b in value if isinstance(b, dict)
+            }
+            out[key] = [branches[k] for k in sorted(branches)]
+        elif isinstance(value, dict) and (key == "$elemMatch" or _is_operator(value)):
+            out[key] = _shape(value)
+        else:
+            out[key] = SHAPE_PLACEHOLDER
+    return out
+
+
+def _is_operator(value: Dict[str, Any]) -> bool:
+    return bool(value) and all(str(k).startswith("$") for k in value)
+
+
+def shape_key(shape: Dict[str, Any]) -> str:
+    """Canonical string form of a normalized shape (used as a grouping key)."""
+    return json.dumps(shape, sort_keys=True, separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    """One slow operation captured by :class:`SlowQueryLog`."""
+
+    timestamp: float
+    backend: str
+    op: str
+    collection: str
+    duration_ms: float
+    shape: Optional[Dict[str, Any]] = None
+    sort: Optional[List[Tuple[str, int]]] = None
+    result_count: Optional[int] = None
+    pushed_down: Optional[bool] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation (used by the CLI and admin endpoint)."""
+        return {
+            "timestamp": self.timestamp,
+            "backend": self.backend,
+            "op": self.op,
+            "collection": self.collection,
+            "duration_ms": round(self.duration_ms, 3),
+            "shape": self.shape,
+            "sort": [[f, d] for f, d in self.sort] if self.sort else None,
+            "result_count": self.result_count,
+            "pushed_down": self.pushed_down,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SlowQuery":
+        """Inverse of :meth:`to_dict`."""
+        sort = data.get("sort")
+        return cls(
+            timestamp=float(data.get("timestamp", 0.0)),
+            backend=str(data.get("backend", "")),
+            op=str(data.get("op", "")),
+            collection=str(data.get("collection", "")),
+            duration_ms=float(data.get("duration_ms", 0.0)),
+            shape=data.get("shape"),
+            sort=[(str(f), int(d)) for f, d in sort] if sort else None,
+            result_count=data.get("result_count"),
+            pushed_down=data.get("pushed_down"),
+        )
+
+
+class SlowQueryLog:
+    """Bounded, thread-safe ring of :class:`SlowQuery` entries.
+
+    Oldest entries are dropped once ``maxlen`` is reached; ``maxlen=0``
+    disables recording entirely.
+    """
+
+    def __init__(self, maxlen: int = DEFAULT_SLOW_QUERY_LOG_SIZE) -> None:
+        if maxlen < 0:
+            raise ValueError("maxlen must be >= 0")
+        self._entries: Deque[SlowQuery] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._dropped = 0
+
+    @property
+    def maxlen(self) -> int:
+        """Ring capacity."""
+        return self._entries.maxlen or 0
+
+    @property
+    def dropped(self) -> int:
+        """Entries evicted (or never kept) because the ring was full."""
+        return self._dropped
+
+    def record(
+        self,
+        *,
+        backend: str,
+        op: str,
+        collection: str,
+        duration_ms: float,
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        result_count: Optional[int] = None,
+        pushed_down: Optional[bool] = None,
+    ) -> None:
+        """Append one slow operation, normalizing ``query`` to its shape."""
+        entry = SlowQuery(
+            timestamp=time.time(),
+            backend=backend,
+            op=op,
+            collection=collection,
+            duration_ms=duration_ms,
+            shape=normalize_query_shape(query) if query is not None else None,
+            sort=list(sort) if sort else None,
+            result_count=result_count,
+            pushed_down=pushed_down,
+        )
+        with self._lock:
+            if len(self._entries) == self.maxlen:
+                self._dropped += 1
+            if self.maxlen:
+                self._entries.append(entry)
+
+    def entries(self) -> List[SlowQuery]:
+        """Snapshot of the ring, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the drop counter."""
+        with self._lock:
+            self._entries.clear()
+            self._dropped = 0
+
+    def __len__(self) -> int:
+        """Number of entries currently held."""
+        return len(self._entries)
+
+
+# ---- index advisor ----------------------------------------------------------
+
+
+@dataclass
+class IndexSuggestion:
+    """One ``create_index`` recommendation produced by :func:`suggest_indexes`."""
+
+    collection: str
+    fields: List[Tuple[str, int]]
+    occurrences: int = 0
+    scans: int = 0
+    total_duration_ms: float = 0.0
+    shapes: List[str] = field(default_factory=list)
+
+    @property
+    def declaration(self) -> str:
+        """Python ``create_index`` call that would create this index."""
+        if len(self.fields) == 1 and self.fields[0][1] == 1:
+            spec = repr(self.fields[0][0])
+        else:
+            spec = "[" + ", ".join(f"({f!r}, {d})" for f, d in self.fields) + "]"
+        return f"await db.create_index({self.collection!r}, {spec})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation."""
+        return {
+            "collection": self.collection,
+            "fields": [[f, d] for f, d in self.fields],
+            "declaration": self.declaration,
+            "occurrences": self.occurrences,
+            "scans": self.scans,
+            "total_duration_ms": round(self.total_duration_ms, 3),
+            "shapes": list(self.shapes),
+        }
+
+
+def _classify(shape: Dict[str, Any], equality: List[str], ranges: List[str]) -> None:
+    """Split a normalized shape's fields into equality and range predicates.
+
+    ``$or``/``$nor`` branches are skipped -- each branch would need its
+    own index, which a single compound declaration cannot express.
+    """
+    for key, value in shape.items():
+        if key == "$and" and isinstance(value, list):
+            for branch in value:
+                _classify(branch, equality, ranges)
+            continue
+        if key.startswith("$") or key in _PRIMARY_KEY_FIELDS:
+            continue
+        if isinstance(value, dict) and not all(op in _EQUALITY_OPS for op in value):
+            target = ranges
+        else:
+            target = equality
+        if key not in equality and key not in ranges:
+            target.append(key)
+
+
+def index_fields_for(
+    shape: Optional[Dict[str, Any]],
+    sort: Optional[List[Tuple[str, int]]] = None,
+) -> List[Tuple[str, int]]:
+    """Equality → sort → range field order for one query shape."""
+    equality: List[str] = []
+    ranges: List[str] = []
+    _classify(shape or {}, equality, ranges)
+    fields: List[Tuple[str, int]] = [(f, 1) for f in sorted(equality)]
+    seen = set(equality)
+    for f, d in sort or []:
+        if f not in seen and f not in _PRIMARY_KEY_FIELDS:
+            fields.append((f, 1 if d >= 0 else -1))
+            seen.add(f)
+    fields.extend((f, 1) for f in sorted(ranges) if f not in seen)
+    return fields
+
+
+def suggest_indexes(
+    entries: Iterable[SlowQuery],
+    *,
+    min_occurrences: int = 1,
+    limit: Optional[int] = None,
+) -> List[IndexSuggestion]:
+    """Aggregate slow entries into ranked ``create_index`` suggestions.
+
+    Entries with the same collection and derived field list merge into
+    one suggestion. A suggestion whose fields are a prefix of a longer
+    one on the same collection is folded into it, since the longer
+    index also serves the shorter query. Results are ranked by total
+    time spent, then by how often the shape fell back to a scan.
+    """
+    grouped: Dict[Tuple[str, Tuple[Tuple[str, int], ...]], IndexSuggestion] = {}
+    for entry in entries:
+        if entry.shape is None:
+            continue
+        fields = index_fields_for(entry.shape, entry.sort)
+        if not fields:
+            continue
+        key = (entry.collection, tuple(fields))
+        suggestion = grouped.get(key)
+        if suggestion is None:
+            suggestion = IndexSuggestion(collection=entry.collection, fields=fields)
+            grouped[key] = suggestion
+        suggestion.occurrences += 1
+        suggestion.total_duration_ms += entry.duration_ms
+        if entry.pushed_down is False:
+            suggestion.scans += 1
+        skey = shape_key(entry.shape)
+        if skey not in suggestion.shapes:
+            suggestion.shapes.append(skey)
+
+    # Fold prefixes into the longest covering index on the same collection.
+    keys = sorted(grouped, key=lambda k: len(k[1]), reverse=True)
+    for short in keys:
+        for long in keys:
+            if (
+                long != short
+                and long in grouped
+                and short in grouped
+                and long[0] == short[0]
+                and len(long[1]) > len(short[1])
+                and long[1][: len(short[1])] == short[1]
+            ):
+                target, folded = grouped[long], grouped.pop(short)
+                target.occurrences += folded.occurrences
+                target.scans += folded.scans
+                target.total_duration_ms += folded.total_duration_ms
+                target.shapes.extend(s for s in folded.shapes if s not in target.shapes)
+                break
+
+    ranked = sorted(
+        (s for s in grouped.values() if s.occurrences >= min_occurrences),
+        key=lambda s: (-s.total_duration_ms, -s.scans, s.collection, s.fields),
+    )
+    return ranked[:limit] if limit is not None else ranked
+
+
+__all__ = [
+    "DEFAULT_SLOW_QUERY_LOG_SIZE",
+    "IndexSuggestion",
+    "SlowQuery",
+    "SlowQueryLog",
+    "index_fields_for",
+    "normalize_query_shape",
+    "shape_key",
+    "suggest_indexes",
+]
@@ -4,13 +4,14 @@ This module provides a streamlined database interface that removes
 unnecessary complexity while maintaining core functionality.
 """
 
+import asyncio
 import base64
 import json
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 from jvspatial.db.query import QueryEngine
 
@@ -67,6 +68,148 @@ class BulkSaveResult:
         return self.saved == self.attempted and not self.failed_ids
 
 
+@dataclass(frozen=True)
+class QueryPlan:
+    """Structured outcome of :meth:`Database.explain`.
+
+    Describes how :meth:`Database.find` would execute a query without
+    fetching any records. ``pushed_filter`` / ``residual_filter`` split
+    the top-level clauses of the query by whether the backend can
+    evaluate them; adapters that translate all-or-nothing (SQLite,
+    Postgres) still run the *whole* query in Python when any clause is
+    residual, and report ``pushed_down=False`` in that case.
+
+    Fields that a backend cannot answer stay ``None``.
+    """
+
+    backend: str
+    collection: str
+    strategy: str
+    pushed_down: Optional[bool]
+    pushed_filter: Dict[str, Any] = field(default_factory=dict)
+    residual_filter: Dict[str, Any] = field(default_factory=dict)
+    sort_pushed_down: Optional[bool] = None
+    limit_pushed_down: Optional[bool] = None
+    index: Optional[str] = None
+    request: Any = None
+    estimated_rows: Optional[int] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation."""
+        return {
+            "backend": self.backend,
+            "collection": self.collection,
+            "strategy": self.strategy,
+            "pushed_down": self.pushed_down,
+            "pushed_filter": self.pushed_filter,
+            "residual_filter": self.residual_filter,
+            "sort_pushed_down": self.sort_pushed_down,
+            "limit_pushed_down": self.limit_pushed_down,
+            "index": self.index,
+            "request": self.request,
+            "estimated_rows": self.estimated_rows,
+            "details": self.details,
+        }
+
+
+def split_query_clauses(
+    query: Dict[str, Any], translatable: Callable[[Dict[str, Any]], Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split ``query`` into ``(pushed, residual)`` by top-level clause.
+
+    ``translatable`` is called with a one-clause query and returns truthy
+    when the backend can evaluate that clause natively. Used by
+    :meth:`Database.explain` implementations to point at the exact
+    operator that forced a fallback.
+    """
+    pushed: Dict[str, Any] = {}
+    residual: Dict[str, Any] = {}
+    for key, value in (query or {}).items():
+        (pushed if translatable({key: value}) else residual)[key] = value
+    return pushed, residual
+
+
+# ---- change data capture ----------------------------------------------------
+
+# Operations carried by :class:`ChangeEvent`. Inserts, replaces and updates
+# all surface as ``"save"`` -- ``INSERT OR REPLACE`` / upsert backends cannot
+# tell them apart, and consumers maintaining derived state treat them the
+# same way.
+CHANGE_OPS = ("save", "delete")
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One entry of the stream produced by :meth:`Database.changes`.
+
+    ``document`` is the record as written (``None`` for deletes).
+    ``cursor`` resumes the stream *after* this event when passed back as
+    ``changes(since=...)``; like :func:`encode_cursor` output it is opaque
+    and only meaningful to the adapter that produced it.
+    """
+
+    op: str
+    collection: str
+    id: str
+    document: Optional[Dict[str, Any]]
+    cursor: bytes
+    timestamp: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation (cursor as an ASCII string)."""
+        return {
+            "op": self.op,
+            "collection": self.collection,
+            "id": self.id,
+            "document": self.document,
+            "cursor": self.cursor.decode("ascii"),
+            "timestamp": self.timestamp,
+        }
+
+
+def decode_change_cursor(
+    cursor: Optional[bytes], backend: str, *keys: str
+) -> Optional[Dict[str, Any]]:
+    """Decode a :class:`ChangeEvent` cursor and check it carries ``keys``.
+
+    Raises:
+        ValueError: The cursor is malformed or was produced by a
+            different backend (its payload lacks ``keys``).
+    """
+    decoded = decode_cursor(cursor)
+    if decoded is None:
+        return None
+    if not isinstance(decoded, dict) or any(k not in decoded for k in keys):
+        raise ValueError(f"change cursor was not produced by {backend}")
+    return decoded
+
+
+async def poll_change_log(
+    fetch: Callable[[Any], Any],
+    position: Any,
+    *,
+    follow: bool,
+    poll_interval: float,
+) -> AsyncIterator[ChangeEvent]:
+    """Drive a polled change log for :meth:`Database.changes`.
+
+    ``fetch(position)`` returns ``(next_position, events)`` with events
+    oldest first. No events means the reader has caught up: the generator
+    returns when ``follow`` is false and otherwise sleeps
+    ``poll_interval`` seconds before asking again. ``next_position`` may
+    advance even without events (e.g. past entries filtered out).
+    """
+    while True:
+        position, events = await fetch(position)
+        for event in events:
+            yield event
+        if not events:
+            if not follow:
+                return
+            await asyncio.sleep(poll_interval)
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -197,10 +340,17 @@ class Database(ABC):
         with ACID semantics (e.g. MongoDB replica set). ``False`` for
         adapters where transactions are unavailable or only available in a
         weak buffered form. Default ``False``.
+
+    ``supports_changes``
+        ``True`` if :meth:`changes` streams this database's writes. MongoDB
+        always advertises it (change streams need a replica set at
+        runtime); SQLite, Postgres and JsonDB only when constructed with
+        ``capture_changes=True``. Default ``False``.
     """
 
     # Capability flags. Override in subclasses.
     supports_transactions: bool = False
+    supports_changes: bool = False
 
     @abstractmethod
     async def save(self, collection: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -563,7 +713,8 @@ class Database(ABC):
         ``find_one_and_update``).
 
         Supported update operators include ``$set``, ``$unset``, ``$inc``, ``$push``,
-        ``$addToSet``, and ``$setOnInsert`` when ``upsert=True``.
+        ``$addToSet`` (both accept ``{"$each": [...]}``), ``$pull`` (a value,
+        ``{"$in": [...]}`` or a query condition), and ``$setOnInsert`` when ``upsert=True``.
 
         Args:
             collection: Collection name
@@ -598,6 +749,94 @@ class Database(ABC):
         await self.save(collection, doc)
         return doc
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Delete every record matching a query, or every listed id.
+
+        Args:
+            collection: Collection name.
+            query_or_ids: Mongo-style query dict (same operator surface as
+                :meth:`find`) or a list of record ids. An empty list is a
+                no-op; an empty dict deletes the whole collection.
+
+        Returns:
+            Number of records deleted.
+
+        Performance:
+            * SQLite / PostgreSQL: a single ``DELETE … WHERE`` when the
+              query translates; otherwise matching ids are resolved in
+              Python and deleted with one ``id IN (…)`` statement.
+            * MongoDB: native ``delete_many``.
+            * DynamoDB: chunked ``BatchWriteItem`` ``DeleteRequest`` (25
+              keys/request) with unprocessed-item retry.
+            * JsonDB: one locked batch of per-file unlinks.
+
+            The default implementation resolves the match set with
+            :meth:`find` (or :meth:`find_many` for an id list, so missing
+            ids are not counted) and issues one ``delete()`` per record.
+        """
+        ids = await self._resolve_delete_ids(collection, query_or_ids)
+        if not isinstance(query_or_ids, dict) and ids:
+            existing = await self.find_many(collection, ids)
+            ids = [rec_id for rec_id in ids if rec_id in existing]
+        for rec_id in ids:
+            await self.delete(collection, rec_id)
+        return len(ids)
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Apply one update document to every record matching ``query``.
+
+        Supports the same operators as :meth:`find_one_and_update`
+        (``$set``, ``$unset``, ``$inc``, ``$push``, ``$addToSet``, ``$pull``);
+        ``$setOnInsert`` is ignored because ``update_many`` never upserts.
+
+        Args:
+            collection: Collection name.
+            query: Mongo-style query dict.
+            update: MongoDB-style update document.
+
+        Returns:
+            Number of records matched and rewritten.
+
+        Atomicity: MongoDB uses native ``update_many``; SQLite applies the
+        whole batch in one transaction under the adapter lock; the other
+        adapters (and this default) read the match set, apply the update
+        in memory and write it back with :meth:`bulk_save`, so a
+        concurrent writer between the read and the write can be lost.
+        """
+        docs = await self.find(collection, _normalize_id_query(query))
+        if not docs:
+            return 0
+        for doc in docs:
+            QueryEngine.apply_update(doc, update, apply_set_on_insert=False)
+        return await self.bulk_save(collection, docs)
+
+    async def _resolve_delete_ids(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> List[str]:
+        """Resolve the ``delete_many`` argument to a de-duplicated id list.
+
+        Lists are taken verbatim; queries are run through :meth:`find`.
+        Adapters without a native ``DELETE … WHERE`` share this so the id
+        list and query forms behave identically.
+        """
+        if isinstance(query_or_ids, dict):
+            docs = await self.find(collection, _normalize_id_query(query_or_ids))
+            raw_ids = [d.get("id", d.get("_id")) for d in docs]
+        else:
+            raw_ids = list(query_or_ids)
+        return [str(i) for i in dict.fromkeys(raw_ids) if i is not None]
+
     async def create_index(
         self,
         collection: str,
@@ -641,12 +880,123 @@ class Database(ABC):
         """
         return None
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """Report whether :meth:`find` would evaluate ``query`` in the store.
+
+        ``True`` means the filter (and ``sort``, when given) is executed by
+        the backend -- SQL ``WHERE`` / ``ORDER BY``, a native Mongo filter,
+        a DynamoDB GSI query. ``False`` means the adapter falls back to
+        loading the collection and matching in Python. ``None`` means the
+        adapter cannot tell.
+
+        Pure and synchronous: it inspects the query shape only and never
+        touches the store, so the observability wrapper can call it on
+        every slow operation.
+        """
+        return None
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Describe how :meth:`find` would execute ``query``.
+
+        Returns a :class:`QueryPlan` with the pushed-down and residual parts
+        of the filter, the native request (SQL, DynamoDB request, Mongo
+        filter), the index the backend would use, whether ``sort`` and
+        ``limit`` run server-side, and an estimated row count where the
+        backend reports one. No records are fetched.
+
+        The default only knows what :meth:`pushdown_status` reports;
+        built-in adapters override it.
+        """
+        pushed = self.pushdown_status(collection, query, sort=sort)
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="unknown",
+            pushed_down=pushed,
+            pushed_filter=dict(query or {}) if pushed else {},
+            residual_filter=dict(query or {}) if pushed is False else {},
+        )
+
+    async def change_cursor(self) -> bytes:
+        """Return a cursor positioned at the current end of the change stream.
+
+        Take one *before* an initial full scan, then pass it to
+        :meth:`changes` so writes that land during the scan are replayed
+        rather than lost. Replay is at-least-once relative to the scan;
+        consumers should apply events idempotently.
+
+        Raises:
+            NotImplementedError: The adapter does not capture changes
+                (see :attr:`supports_changes`).
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not capture changes")
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Stream writes as ordered :class:`ChangeEvent` records.
+
+        Args:
+            collections: Only report these collections (all when ``None``).
+            since: Resume strictly after this cursor -- any
+                :attr:`ChangeEvent.cursor` or :meth:`change_cursor` value.
+                ``None`` starts at the current end of the stream; empty
+                bytes replays everything still retained (not MongoDB,
+                whose stream cannot start before "now").
+            follow: Keep waiting for new writes (default). When ``False``
+                the iterator returns once it has caught up.
+            poll_interval: Seconds between polls once caught up, for
+                adapters that poll a change table.
+            batch_size: Events fetched per round trip.
+
+        Events are ordered per backend: by commit sequence on SQLite and
+        Postgres, log order on JsonDB, and change-stream order on MongoDB.
+
+        Raises:
+            NotImplementedError: The adapter does not capture changes
+                (see :attr:`supports_changes`).
+            ValueError: ``since`` came from a different backend.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not capture changes")
+        yield  # pragma: no cover - makes this an async generator
+
+    async def prune_changes(self, before: bytes) -> int:
+        """Drop captured changes up to and including the ``before`` cursor.
+
+        Change tables are append-only; call this once every consumer has
+        checkpointed past ``before``. Returns the number of entries
+        removed. The default (and MongoDB, whose oplog bounds itself) is
+        a no-op returning ``0``.
+        """
+        return 0
+
 
 __all__ = [
     "Database",
     "DatabaseError",
     "VersionConflictError",
     "BulkSaveResult",
+    "ChangeEvent",
+    "QueryPlan",
     "encode_cursor",
     "decode_cursor",
     "finalize_find_results",
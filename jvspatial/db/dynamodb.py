@@ -36,7 +36,12 @@ except ImportError:
     ClientError = Exception  # type: ignore[assignment, misc]
     Config = None  # type: ignore[assignment, misc]
 
-from jvspatial.db.database import Database, finalize_find_results
+from jvspatial.db.database import (
+    Database,
+    QueryPlan,
+    finalize_find_results,
+    split_query_clauses,
+)
 from jvspatial.db.query import QueryEngine
 from jvspatial.exceptions import DatabaseError
 from jvspatial.utils.retry import retry_async
@@ -830,6 +835,93 @@ class DynamoDB(Database):
         await self.batch_write(collection, [dict(r) for r in records])
         return len(records)
 
+    async def batch_delete(self, collection: str, ids: List[str]) -> int:
+        """Delete multiple records using batch_write_item ``DeleteRequest``.
+
+        Mirrors :meth:`batch_write`: 25 keys per request, batches in
+        parallel, unprocessed items retried with exponential backoff.
+
+        Args:
+            collection: Collection name
+            ids: Record IDs to delete
+
+        Returns:
+            Number of keys the service accepted (ids still unprocessed
+            after retries are logged and excluded from the count)
+
+        Raises:
+            DatabaseError: If a batch request fails
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return 0
+
+        table_name = await self._ensure_table_exists(collection)
+        client = await self._get_client()
+
+        # DynamoDB batch_write_item has a limit of 25 items per request
+        batch_size = 25
+        batches = [
+            unique_ids[i : i + batch_size]
+            for i in range(0, len(unique_ids), batch_size)
+        ]
+
+        async def process_batch(batch_ids: List[str]) -> int:
+            """Process a single batch of ids; return the accepted count."""
+            request_items = {
+                table_name: [
+                    {
+                        "DeleteRequest": {
+                            "Key": {"collection": {"S": collection}, "id": {"S": i}}
+                        }
+                    }
+                    for i in batch_ids
+                ]
+            }
+            try:
+                response = await self._run_with_throttle_retry(
+                    "batch_delete_item",
+                    partial(client.batch_write_item, RequestItems=request_items),
+                )
+                unprocessed = response.get("UnprocessedItems", {})
+                max_retries = 3
+                retry_count = 0
+                while unprocessed and retry_count < max_retries:
+                    retry_count += 1
+                    await asyncio.sleep(0.1 * (2 ** (retry_count - 1)))
+                    retry_response = await self._run_with_throttle_retry(
+                        "batch_delete_item_retry",
+                        partial(client.batch_write_item, RequestItems=unprocessed),
+                    )
+                    unprocessed = retry_response.get("UnprocessedItems", {})
+
+                remaining = len(unprocessed.get(table_name, [])) if unprocessed else 0
+                if remaining:
+                    logger.warning(
+                        f"Some deletes remain unprocessed after {max_retries} retries for collection '{collection}': {remaining}"
+                    )
+                return len(batch_ids) - remaining
+            except ClientError as e:
+                raise DatabaseError(f"DynamoDB batch_delete error: {e}") from e
+
+        counts = await asyncio.gather(*[process_batch(batch) for batch in batches])
+        return sum(counts)
+
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Delete matches via :meth:`batch_delete`.
+
+        DynamoDB has no conditional multi-item delete, so a query is
+        resolved to ids with :meth:`find` (GSI query where one matches,
+        scan otherwise) before the keys go out in ``BatchWriteItem``
+        requests.
+        """
+        ids = await self._resolve_delete_ids(collection, query_or_ids)
+        return await self.batch_delete(collection, ids)
+
     def _find_matching_gsi(
         self, collection: str, query: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -1296,6 +1388,119 @@ class DynamoDB(Database):
         except ClientError as e:
             raise DatabaseError(f"DynamoDB find error: {e}") from e
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """``True`` when :meth:`find` can use a GSI query instead of a scan.
+
+        Mirrors the branch in :meth:`find`: a GSI is used only for a
+        top-level equality on an indexed field without ``$or``/``$and``.
+        Sorting always happens in memory, so it does not affect the
+        answer.
+        """
+        if not query or query.get("$or") or query.get("$and"):
+            return False
+        return self._find_matching_gsi(collection, query) is not None
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Show the ``Query``/``Scan`` request :meth:`find` would send.
+
+        Only equality clauses on indexed fields reach DynamoDB (as the GSI
+        key condition or a ``FilterExpression``); everything else is
+        ``residual_filter`` and matched in Python. Sorting is always done
+        in memory, and ``Limit`` is only sent when no sort is requested.
+        ``estimated_rows`` is the approximate ``ItemCount`` DescribeTable
+        reports for the GSI or table (refreshed by AWS every ~6 hours).
+        """
+        table_name = await self._ensure_table_exists(collection)
+        fetch_limit = None if sort else limit
+        gsi_match = self._find_matching_gsi(collection, query)
+        use_gsi = bool(gsi_match) and not query.get("$or") and not query.get("$and")
+
+        request: Dict[str, Any]
+        if use_gsi:
+            assert gsi_match is not None
+            remaining = {k: v for k, v in query.items() if k != gsi_match["field_path"]}
+            filter_expr, names, values = self._build_filter_expression(
+                remaining, collection
+            )
+            request = {
+                "operation": "Query",
+                "TableName": table_name,
+                "IndexName": gsi_match["gsi_name"],
+                "KeyConditionExpression": "#key = :val",
+                "ExpressionAttributeNames": {"#key": gsi_match["attr_name"], **names},
+                "ExpressionAttributeValues": {":val": gsi_match["value"], **values},
+            }
+        else:
+            filter_expr, names, values = self._build_filter_expression(
+                query, collection
+            )
+            request = {
+                "operation": "Scan",
+                "TableName": table_name,
+                "FilterExpression": (
+                    f"#coll = :collection_val AND {filter_expr}"
+                    if filter_expr
+                    else "#coll = :collection_val"
+                ),
+                "ExpressionAttributeNames": {"#coll": "collection", **names},
+                "ExpressionAttributeValues": {":collection_val": collection, **values},
+            }
+        if use_gsi and filter_expr:
+            request["FilterExpression"] = filter_expr
+        if fetch_limit:
+            request["Limit"] = fetch_limit
+
+        indexed = self._indexed_fields.get(collection, {})
+        pushed, residual = split_query_clauses(
+            query,
+            lambda clause: not clause.get("$or")
+            and not clause.get("$and")
+            and all(
+                k in indexed and not isinstance(v, dict) for k, v in clause.items()
+            ),
+        )
+
+        estimated: Optional[int] = None
+        try:
+            client = await self._get_client()
+            described = (await client.describe_table(TableName=table_name))["Table"]
+            if use_gsi:
+                assert gsi_match is not None
+                for gsi in described.get("GlobalSecondaryIndexes", []):
+                    if gsi.get("IndexName") == gsi_match["gsi_name"]:
+                        estimated = gsi.get("ItemCount")
+            else:
+                estimated = described.get("ItemCount")
+        except Exception as exc:  # estimate is best-effort
+            logger.debug("DynamoDB explain: describe_table failed: %s", exc)
+
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="gsi_query" if use_gsi else "scan",
+            pushed_down=self.pushdown_status(collection, query, sort=sort),
+            pushed_filter=pushed,
+            residual_filter=residual,
+            sort_pushed_down=False if sort else None,
+            limit_pushed_down=None if limit is None else bool(fetch_limit),
+            index=gsi_match["gsi_name"] if use_gsi and gsi_match else None,
+            request=request,
+            estimated_rows=int(estimated) if estimated is not None else None,
+        )
+
     async def _wait_for_index_active(
         self, client: Any, table_name: str, index_name: str, max_wait: int = 300
     ) -> None:
@@ -10,6 +10,7 @@ from typing import Any, Callable, Dict, Optional
 
 from ._cache import CachingDatabase
 from ._observable import DEFAULT_SLOW_QUERY_MS, ObservableDatabase
+from ._slow_query import DEFAULT_SLOW_QUERY_LOG_SIZE
 from .database import Database
 from .jsondb import JsonDB
 from .manager import get_database_manager
@@ -147,7 +148,9 @@ def _instantiate_builtin_database(
     if db_type == "json":
         jsondb_path, _ = resolve_db_paths()
         base_path = kwargs.get("base_path") or kwargs.get("db_path") or jsondb_path
-        return JsonDB(str(base_path))
+        return JsonDB(
+            str(base_path), capture_changes=bool(kwargs.get("capture_changes", False))
+        )
 
     if db_type == "mongodb":
         from .mongodb import MongoDB
@@ -255,6 +258,7 @@ def create_database(
     cache_get_ttl: float = 60.0,
     observe: bool = False,
     slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+    slow_query_log_size: int = DEFAULT_SLOW_QUERY_LOG_SIZE,
     metrics: Optional[Any] = None,
     **kwargs: Any,
 ) -> Database:
@@ -284,6 +288,9 @@ def create_database(
         slow_query_ms: Threshold above which the per-op log line is
             elevated to WARNING. Only meaningful when
             ``observe=True``. Defaults to 100ms.
+        slow_query_log_size: Capacity of the observability wrapper's
+            slow-query ring (see ``ObservableDatabase.slow_queries``).
+            Only meaningful when ``observe=True``. Defaults to 256.
         metrics: Optional :class:`~jvspatial.observability.metrics.MetricsRecorder`
             implementation. Defaults to
             :class:`~jvspatial.observability.metrics.NullMetricsRecorder`
@@ -349,7 +356,12 @@ def create_database(
     # including cache hits/misses -- which is what SLO calculations
     # need.
     if observe:
-        db = ObservableDatabase(db, metrics=metrics, slow_query_ms=slow_query_ms)
+        db = ObservableDatabase(
+            db,
+            metrics=metrics,
+            slow_query_ms=slow_query_ms,
+            slow_query_log_size=slow_query_log_size,
+        )
 
     # Register with manager if requested
     if register:
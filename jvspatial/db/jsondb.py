@@ -21,18 +21,37 @@ callers.
 
 Reads are unlocked: a reader either observes the completed previous
 write (atomic rename guarantees this) or the completed new write.
+
+Change log
+----------
+With ``capture_changes=True`` every write also appends one JSON line to
+``<base_path>/_changes.jsonl`` while still holding the record's path
+lock, so the log order matches the order writes land per record.
+Change cursors are byte offsets into that file. The log is flushed but
+not fsynced; a crash can lose its tail even though the record files
+are durable.
 """
 
 import asyncio
 import json
 import logging
 import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from jvspatial.db._atomic import atomic_write_bytes, cleanup_orphan_tmp_files
 from jvspatial.db._path_locks import PathLockManager
-from jvspatial.db.database import Database, finalize_find_results
+from jvspatial.db.database import (
+    ChangeEvent,
+    Database,
+    QueryPlan,
+    _normalize_id_query,
+    decode_change_cursor,
+    encode_cursor,
+    finalize_find_results,
+    poll_change_log,
+)
 from jvspatial.db.query import QueryEngine
 from jvspatial.runtime.serverless import is_serverless_mode
 
@@ -70,13 +89,20 @@ class JsonDB(Database):
     # for adapter classes.
     supports_transactions: bool = False
 
-    def __init__(self, base_path: str = "jvdb") -> None:
+    # Append-only change log written when ``capture_changes`` is on.
+    CHANGE_LOG_NAME = "_changes.jsonl"
+
+    def __init__(self, base_path: str = "jvdb", capture_changes: bool = False) -> None:
         """Initialize JSON database.
 
         Args:
             base_path: Base directory for JSON files
+            capture_changes: Append every write to the change log read by
+                :meth:`changes`.
         """
         self.base_path = Path(base_path).resolve()
+        self.supports_changes = capture_changes
+        self._change_log_lock = threading.Lock()
         self._warned_non_tmp_serverless = False
         # Per-path locks: writes to different files run concurrently, writes
         # to the same file serialize. Locks are threading.Lock so they're
@@ -223,6 +249,75 @@ class JsonDB(Database):
         except Exception:
             return None
 
+    @property
+    def _change_log_path(self) -> Path:
+        return self.base_path / self.CHANGE_LOG_NAME
+
+    def _append_change(
+        self,
+        op: str,
+        collection: str,
+        record_id: Any,
+        document: Optional[Dict[str, Any]],
+    ) -> None:
+        """Append one change-log line (no-op unless capture is on).
+
+        Called with the record's path lock held; the log lock makes each
+        line a single uninterleaved append across threads.
+        """
+        if not self.supports_changes:
+            return
+        line = json.dumps(
+            {
+                "op": op,
+                "collection": collection,
+                "id": str(record_id),
+                "document": document,
+                "ts": time.time(),
+            },
+            default=str,
+            separators=(",", ":"),
+        )
+        path = self._change_log_path
+        with self._change_log_lock, open(path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+    def _read_changes(
+        self, offset: int, collections: Optional[List[str]], batch_size: int
+    ) -> Tuple[int, List[ChangeEvent]]:
+        """Read up to ``batch_size`` matching log entries after ``offset``.
+
+        Returns the offset just past the last line consumed, which moves
+        past lines outside ``collections`` too. A trailing line without
+        its newline is a write in progress and is left for the next poll.
+        """
+        events: List[ChangeEvent] = []
+        try:
+            with open(self._change_log_path, "rb") as fh:
+                fh.seek(offset)
+                while len(events) < batch_size:
+                    raw = fh.readline()
+                    if not raw.endswith(b"\n"):
+                        break
+                    offset += len(raw)
+                    entry = json.loads(raw)
+                    if collections and entry["collection"] not in collections:
+                        continue
+                    events.append(
+                        ChangeEvent(
+                            op=entry["op"],
+                            collection=entry["collection"],
+                            id=entry["id"],
+                            document=entry.get("document"),
+                            cursor=encode_cursor({"offset": offset}),
+                            timestamp=entry.get("ts"),
+                        )
+                    )
+        except FileNotFoundError:
+            # No change has been written yet.
+            return offset, events
+        return offset, events
+
     def _sync_write_record(self, collection: str, data: Dict[str, Any]) -> None:
         """Write one record atomically with per-path locking.
 
@@ -234,6 +329,7 @@ class JsonDB(Database):
         payload = _dumps(data)
         with self._path_locks.lock(str(record_path)):
             atomic_write_bytes(record_path, payload)
+            self._append_change("save", collection, data["id"], data)
 
     def _sync_delete_record(self, collection: str, record_id: str) -> None:
         """Delete one record under per-path lock (cross-thread safe)."""
@@ -241,6 +337,53 @@ class JsonDB(Database):
         with self._path_locks.lock(str(record_path)):
             if record_path.exists():
                 record_path.unlink()
+                self._append_change("delete", collection, record_id, None)
+
+    def _sync_delete_records(self, collection: str, record_ids: List[str]) -> int:
+        """Delete a batch of records in one worker-thread hop.
+
+        Each unlink still takes its own per-path lock, so the batch never
+        tears a concurrent single-record write. Returns how many files
+        were actually removed.
+        """
+        deleted = 0
+        for record_id in record_ids:
+            record_path = self._get_record_path(collection, record_id)
+            with self._path_locks.lock(str(record_path)):
+                if record_path.exists():
+                    record_path.unlink()
+                    self._append_change("delete", collection, record_id, None)
+                    deleted += 1
+        return deleted
+
+    def _sync_update_records(
+        self,
+        collection: str,
+        record_ids: List[str],
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Apply ``update`` to a batch of records in one worker-thread hop.
+
+        Each record is re-read and re-matched under its path lock before
+        the rewrite, so a concurrent writer that moved it out of the match
+        set between the scan and the update is respected.
+        """
+        updated = 0
+        for record_id in record_ids:
+            record_path = self._get_record_path(collection, record_id)
+            with self._path_locks.lock(str(record_path)):
+                try:
+                    record = _loads(record_path.read_bytes())
+                except (OSError, ValueError):
+                    continue
+                if query and not QueryEngine.match(record, query):
+                    continue
+                QueryEngine.apply_update(record, update, apply_set_on_insert=False)
+                atomic_write_bytes(record_path, _dumps(record))
+                self._append_change("save", collection, record_id, record)
+                updated += 1
+        return updated
 
     async def save(self, collection: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Save a record to the database.
@@ -260,6 +403,41 @@ class JsonDB(Database):
         """Delete a record by ID."""
         await asyncio.to_thread(self._sync_delete_record, collection, id)
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Delete matches as one locked batch on a single worker thread.
+
+        Queries are resolved to ids via :meth:`find`; the unlinks then run
+        in one ``asyncio.to_thread`` hop instead of one per record.
+        """
+        ids = await self._resolve_delete_ids(collection, query_or_ids)
+        if not ids:
+            return 0
+        return await asyncio.to_thread(self._sync_delete_records, collection, ids)
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Apply ``update`` to every match as one locked batch.
+
+        The scan is unlocked like :meth:`find`; each rewrite re-checks the
+        match under its path lock (see :meth:`_sync_update_records`).
+        """
+        q = _normalize_id_query(query)
+        docs = await self.find(collection, q)
+        ids = [str(d["id"]) for d in docs if d.get("id") is not None]
+        if not ids:
+            return 0
+        return await asyncio.to_thread(
+            self._sync_update_records, collection, ids, q, update
+        )
+
     async def count(
         self,
         collection: str,
@@ -419,6 +597,97 @@ class JsonDB(Database):
 
         return finalize_find_results(results, sort=sort, limit=limit)
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """Always ``False``: :meth:`find` reads every file in the collection."""
+        return False
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Describe the full-directory read :meth:`find` performs.
+
+        Nothing is pushed down: every record file is loaded, then matched,
+        sorted and limited in Python. ``estimated_rows`` is the number of
+        record files, i.e. how many documents :meth:`find` will parse.
+        """
+        collection_dir = self._get_collection_dir(collection)
+
+        def _count_files() -> int:
+            if not collection_dir.exists():
+                return 0
+            return len(self._list_collection_json_files(collection_dir))
+
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="full_scan",
+            pushed_down=False,
+            residual_filter=dict(query or {}),
+            sort_pushed_down=False if sort else None,
+            limit_pushed_down=False if limit is not None else None,
+            request={"path": str(collection_dir), "glob": "*.json"},
+            estimated_rows=await asyncio.to_thread(_count_files),
+        )
+
+    def _require_change_capture(self) -> None:
+        if not self.supports_changes:
+            raise NotImplementedError(
+                "JsonDB change capture is off; construct with capture_changes=True"
+            )
+
+    async def change_cursor(self) -> bytes:
+        """Cursor at the current end of the change log."""
+        self._require_change_capture()
+
+        def _size() -> int:
+            try:
+                return self._change_log_path.stat().st_size
+            except FileNotFoundError:
+                return 0
+
+        return encode_cursor({"offset": await asyncio.to_thread(_size)})
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Tail ``_changes.jsonl`` from a byte-offset cursor.
+
+        The log is never pruned in place (:meth:`prune_changes` is a
+        no-op); delete the file while no reader is attached to reset it.
+        """
+        self._require_change_capture()
+        if since is None:
+            since = await self.change_cursor()
+        decoded = decode_change_cursor(since, "JsonDB", "offset") or {"offset": 0}
+        scope = list(collections) if collections else None
+
+        async def _fetch(offset: int) -> Tuple[int, List[ChangeEvent]]:
+            return await asyncio.to_thread(
+                self._read_changes, offset, scope, batch_size
+            )
+
+        async for event in poll_change_log(
+            _fetch, int(decoded["offset"]), follow=follow, poll_interval=poll_interval
+        ):
+            yield event
+
     def _get_nested_value(self, data: Dict[str, Any], key: str) -> Any:
         """Get a nested value using dot notation."""
         keys = key.split(".")
@@ -14,11 +14,27 @@ Index creation
     ``drop_deprecated_indexes(deprecated)`` removes named indexes listed by collection
     (e.g. orphan names from earlier releases). Host applications may call it during
     startup along with ``GraphContext.ensure_indexes`` for their entity types.
+
+Change streams
+    ``changes()`` is a database-level change stream (replica set or sharded
+    cluster required). Cursors wrap the stream's resume token, so resuming
+    works as long as the token is still inside the oplog window.
 """
 
 import contextlib
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import (
@@ -28,12 +44,27 @@ from pymongo.errors import (
     ServerSelectionTimeoutError,
 )
 
-from jvspatial.db.database import Database
+from jvspatial.db.database import (
+    ChangeEvent,
+    Database,
+    QueryPlan,
+    decode_change_cursor,
+    encode_cursor,
+)
 from jvspatial.exceptions import DatabaseError
 from jvspatial.utils.retry import retry_async
 
 logger = logging.getLogger(__name__)
 
+# Change-stream operation types surfaced by ``MongoDB.changes`` and the
+# ``ChangeEvent.op`` each maps to.
+_CHANGE_STREAM_OPS = {
+    "insert": "save",
+    "update": "save",
+    "replace": "save",
+    "delete": "delete",
+}
+
 
 def _is_connection_error(exc: BaseException) -> bool:
     """Return True if the exception indicates a connection/network error worth retrying."""
@@ -69,6 +100,9 @@ class MongoDB(Database):
     # for a runtime probe that honors the deployment topology
     # (audit §5.9 / SPEC §4.2).
     supports_transactions: bool = True
+    # Change streams need a replica set or sharded cluster; on a
+    # standalone server ``changes()`` raises ``DatabaseError``.
+    supports_changes: bool = True
 
     def __init__(
         self,
@@ -319,6 +353,74 @@ class MongoDB(Database):
 
         return await self._run_with_reconnect("find", _find_op)
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """Always ``True``: filter, sort and limit are sent to the server."""
+        return True
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Run the server's ``explain`` on the cursor :meth:`find` would open.
+
+        ``index`` is the first ``IXSCAN`` in the winning plan (``None`` for a
+        ``COLLSCAN``); ``estimated_rows`` is ``executionStats.nReturned``
+        when the server includes execution stats.
+        """
+
+        async def _explain_op() -> Dict[str, Any]:
+            await self._ensure_connected()
+            if self._db is None:
+                raise DatabaseError("MongoDB database connection not established")
+            cursor = self._db[collection].find(query)
+            if sort:
+                cursor = cursor.sort(sort)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+            return await cursor.explain()
+
+        raw = await self._run_with_reconnect("explain", _explain_op)
+        winning = (raw.get("queryPlanner") or {}).get("winningPlan") or {}
+
+        def _stages(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+            out = [node]
+            for key in ("inputStage", "queryPlan"):
+                if isinstance(node.get(key), dict):
+                    out.extend(_stages(node[key]))
+            for child in node.get("inputStages", []) or []:
+                out.extend(_stages(child))
+            return out
+
+        stages = _stages(winning)
+        index = next(
+            (st.get("indexName") for st in stages if st.get("stage") == "IXSCAN"),
+            None,
+        )
+        returned = (raw.get("executionStats") or {}).get("nReturned")
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="index_scan" if index else "collection_scan",
+            pushed_down=True,
+            pushed_filter=dict(query or {}),
+            sort_pushed_down=True if sort else None,
+            limit_pushed_down=True if limit is not None else None,
+            index=index,
+            request={"filter": query, "sort": sort, "limit": limit},
+            estimated_rows=int(returned) if returned is not None else None,
+            details={"stages": [st.get("stage") for st in stages], "explain": raw},
+        )
+
     async def find_many(
         self, collection: str, ids: List[str]
     ) -> Dict[str, Dict[str, Any]]:
@@ -408,6 +510,55 @@ class MongoDB(Database):
         matched = int(getattr(result, "matched_count", 0) or 0)
         return upserted + matched
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Delete matches via native ``delete_many``.
+
+        An id list becomes ``{"_id": {"$in": ids}}``. Returns the
+        server-reported ``deleted_count``.
+        """
+        if isinstance(query_or_ids, dict):
+            query = query_or_ids
+        else:
+            ids = list(dict.fromkeys(str(i) for i in query_or_ids))
+            if not ids:
+                return 0
+            query = {"_id": {"$in": ids}}
+
+        async def _delete_many_op() -> int:
+            await self._ensure_connected()
+            if self._db is None:
+                raise DatabaseError("MongoDB database connection not established")
+            result = await self._db[collection].delete_many(query)
+            return int(getattr(result, "deleted_count", 0) or 0)
+
+        return await self._run_with_reconnect("delete_many", _delete_many_op)
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Apply ``update`` via native ``update_many``.
+
+        Returns the server-reported ``matched_count`` so the result lines
+        up with the other adapters, which count every rewritten match
+        whether or not its bytes changed.
+        """
+
+        async def _update_many_op() -> int:
+            await self._ensure_connected()
+            if self._db is None:
+                raise DatabaseError("MongoDB database connection not established")
+            result = await self._db[collection].update_many(query, update)
+            return int(getattr(result, "matched_count", 0) or 0)
+
+        return await self._run_with_reconnect("update_many", _update_many_op)
+
     async def find_one_and_delete(
         self, collection: str, query: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -704,6 +855,78 @@ class MongoDB(Database):
         except PyMongoError as e:
             raise DatabaseError(f"MongoDB index creation error: {e}") from e
 
+    def _change_pipeline(
+        self, collections: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        match: Dict[str, Any] = {"operationType": {"$in": list(_CHANGE_STREAM_OPS)}}
+        if collections:
+            match["ns.coll"] = {"$in": list(collections)}
+        return [{"$match": match}]
+
+    async def change_cursor(self) -> bytes:
+        """Resume token for "now", taken from a freshly opened change stream."""
+        await self._ensure_connected()
+        if self._db is None:
+            raise DatabaseError("MongoDB database connection not established")
+        try:
+            async with self._db.watch(self._change_pipeline(None)) as stream:
+                token = stream.resume_token
+        except PyMongoError as e:
+            raise DatabaseError(f"MongoDB change_cursor error: {e}") from e
+        if token is None:
+            raise DatabaseError("MongoDB change stream returned no resume token")
+        return encode_cursor({"token": token})
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Read a database-level change stream.
+
+        Updates are delivered with ``full_document="updateLookup"``, so
+        ``document`` is the record's state when the event is read, which
+        may already include later writes. ``poll_interval`` becomes the
+        server-side ``maxAwaitTimeMS``.
+        """
+        decoded = decode_change_cursor(since, "MongoDB", "token")
+        await self._ensure_connected()
+        if self._db is None:
+            raise DatabaseError("MongoDB database connection not established")
+        kwargs: Dict[str, Any] = {
+            "full_document": "updateLookup",
+            "batch_size": batch_size,
+            "max_await_time_ms": max(1, int(poll_interval * 1000)),
+        }
+        if decoded:
+            kwargs["resume_after"] = decoded["token"]
+        try:
+            async with self._db.watch(
+                self._change_pipeline(collections), **kwargs
+            ) as stream:
+                while True:
+                    change = await stream.try_next()
+                    if change is None:
+                        if not follow:
+                            return
+                        continue
+                    key = change.get("documentKey") or {}
+                    cluster_time = change.get("clusterTime")
+                    yield ChangeEvent(
+                        op=_CHANGE_STREAM_OPS[change["operationType"]],
+                        collection=change["ns"]["coll"],
+                        id=str(key.get("_id")),
+                        document=change.get("fullDocument"),
+                        cursor=encode_cursor({"token": change["_id"]}),
+                        timestamp=getattr(cluster_time, "time", None),
+                    )
+        except PyMongoError as e:
+            raise DatabaseError(f"MongoDB changes error: {e}") from e
+
     async def is_transactional(self) -> bool:
         """Return True only when the deployment supports MongoDB transactions.
 
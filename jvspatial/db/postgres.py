@@ -61,6 +61,16 @@ One table per collection::
 
 RLS policies and pgvector columns are added on-demand when a tenant scope
 or a vector-typed field is encountered.
+
+Change capture
+--------------
+With ``capture_changes=True`` each collection table gets an ``AFTER
+INSERT OR UPDATE OR DELETE`` trigger that appends to one shared
+``jv_changes`` table, tagging every row with its writer's ``txid``.
+:meth:`PostgresDB.changes` reads ``(txid, seq)`` order and only returns
+rows whose transaction is older than the oldest one still running, so a
+late-committing writer can never land behind a cursor. The triggers stay
+installed once created; drop them to stop capture.
 """
 
 from __future__ import annotations
@@ -83,12 +93,23 @@ from typing import (
     Union,
 )
 
-from ._postgres_translate import translate_query, translate_sort
+from ._postgres_translate import (
+    _path_literal,
+    _safe_field_path,
+    translate_query,
+    translate_sort,
+)
 from .database import (
     BulkSaveResult,
+    ChangeEvent,
     Database,
+    QueryPlan,
+    decode_change_cursor,
     decode_cursor,
+    encode_cursor,
     finalize_find_results,
+    poll_change_log,
+    split_query_clauses,
 )
 from .query import QueryEngine
 
@@ -160,6 +181,18 @@ def _safe_collection(name: str) -> str:
     return name
 
 
+def _rowcount(status: str) -> int:
+    """Parse the affected-row count out of an asyncpg command status tag.
+
+    ``conn.execute`` returns the server's status string (``"DELETE 3"``,
+    ``"UPDATE 0"``); the count is the last whitespace-separated token.
+    """
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
+
+
 def _pg_string_literal(value: str) -> str:
     """Quote a Python string as a PG string literal (single-quote escape)."""
     return "'" + value.replace("'", "''") + "'"
@@ -280,6 +313,7 @@ class PostgresDB(Database):
         pooler_mode: str = "session",
         command_timeout: float = 60.0,
         schema_name: str = "public",
+        capture_changes: bool = False,
     ) -> None:
         """Initialize the Postgres adapter.
 
@@ -299,6 +333,9 @@ class PostgresDB(Database):
             command_timeout: Per-statement timeout in seconds.
             schema_name: Postgres schema to host the collection tables in.
                 Defaults to ``public``. Must be an existing schema.
+            capture_changes: Install change-capture triggers on every
+                collection table this instance bootstraps, feeding
+                :meth:`changes`.
 
         Raises:
             ImportError: ``asyncpg`` is not installed.
@@ -334,6 +371,8 @@ class PostgresDB(Database):
         self.pooler_mode = pooler_mode
         self.command_timeout = command_timeout
         self.schema_name = schema_name
+        self.supports_changes = capture_changes
+        self._change_log_ready = False
 
         self._pool: Optional["Pool"] = None
         self._pool_lock = asyncio.Lock()
@@ -594,8 +633,60 @@ class PostgresDB(Database):
                     WHERE tenant_id IS NOT NULL;
                 """
             )
+            if self.supports_changes:
+                await self._ensure_change_log(conn)
+                # CREATE TRIGGER has no IF NOT EXISTS before PG 14; the
+                # DO block makes concurrent bootstraps idempotent. The
+                # collection is passed as an argument because
+                # TG_TABLE_NAME is the case-folded identifier.
+                await conn.execute(
+                    f"""
+                    DO $jv$ BEGIN
+                        CREATE TRIGGER {col}_jv_changes
+                            AFTER INSERT OR UPDATE OR DELETE ON {schema}.{col}
+                            FOR EACH ROW
+                            EXECUTE PROCEDURE {schema}.jv_capture_change({_pg_string_literal(collection)});
+                    EXCEPTION WHEN duplicate_object THEN NULL;
+                    END $jv$;
+                    """
+                )
         self._collections_bootstrapped.add(collection)
 
+    async def _ensure_change_log(self, conn: Any) -> None:
+        """Create ``jv_changes`` and its trigger function (once per instance)."""
+        if self._change_log_ready:
+            return
+        schema = _safe_collection(self.schema_name)
+        await conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {schema}.jv_changes (
+                seq        BIGSERIAL PRIMARY KEY,
+                txid       BIGINT NOT NULL DEFAULT txid_current(),
+                collection TEXT NOT NULL,
+                id         TEXT NOT NULL,
+                op         TEXT NOT NULL,
+                data       JSONB,
+                changed_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+            );
+            CREATE INDEX IF NOT EXISTS jv_changes_txid_seq_idx
+                ON {schema}.jv_changes (txid, seq);
+            CREATE OR REPLACE FUNCTION {schema}.jv_capture_change()
+            RETURNS trigger LANGUAGE plpgsql AS $jv$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    INSERT INTO {schema}.jv_changes (collection, id, op, data)
+                    VALUES (TG_ARGV[0], OLD.id, 'delete', NULL);
+                    RETURN OLD;
+                END IF;
+                INSERT INTO {schema}.jv_changes (collection, id, op, data)
+                VALUES (TG_ARGV[0], NEW.id, 'save', NEW.data);
+                RETURN NEW;
+            END
+            $jv$;
+            """
+        )
+        self._change_log_ready = True
+
     # ---- payload helpers ---------------------------------------------------
 
     @staticmethod
@@ -877,6 +968,119 @@ class PostgresDB(Database):
             records = finalize_find_results(records, sort=sort, limit=limit)
         return records
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """``True`` when :meth:`find` runs entirely as JSONB SQL.
+
+        Same decision :meth:`find` makes: the query (minus any ``$near``
+        vector clause) must translate, and a requested sort must either
+        translate or be superseded by the vector ``ORDER BY``.
+        """
+        filtered_query, vec_field, _, _, _ = (
+            self._pop_vector_clause(collection, query)
+            if query
+            else (query, None, None, None, None)
+        )
+        if filtered_query and translate_query(filtered_query) is None:
+            return False
+        return not sort or vec_field is not None or translate_sort(sort) is not None
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Plan :meth:`find` with ``EXPLAIN (FORMAT JSON)``.
+
+        Builds the exact SQL :meth:`find` would send (falling back to the
+        bare full-collection ``SELECT`` when the translator refuses) and
+        reports the planner's root ``Plan Rows`` as ``estimated_rows`` and
+        the first ``Index Name`` found in the plan tree as ``index``.
+        """
+        await self._bootstrap_collection(collection)
+        col = _safe_collection(collection)
+        schema = _safe_collection(self.schema_name)
+        filtered_query, vec_field, vec_literal, vec_limit, vec_ops = (
+            self._pop_vector_clause(collection, query)
+            if query
+            else (query, None, None, None, None)
+        )
+        translated = translate_query(filtered_query) if filtered_query else ("", [])
+        pushed, residual = split_query_clauses(
+            filtered_query, lambda clause: translate_query(clause) is not None
+        )
+
+        sort_sql: Optional[str] = None
+        limit_pushed = False
+        if translated is None:
+            sql = f"SELECT data FROM {schema}.{col}"
+            params: List[Any] = []
+        else:
+            where_sql, where_params = translated
+            params = list(where_params)
+            where_clause = f" WHERE {where_sql}" if where_sql else ""
+            sort_sql = translate_sort(sort) if vec_field is None else None
+            if vec_field is not None:
+                params.append(vec_literal)
+                order_clause = f" ORDER BY {vec_field} {vec_ops} ${len(params)}::vector"
+            elif sort_sql:
+                order_clause = f" ORDER BY {sort_sql}"
+            else:
+                order_clause = ""
+            sort_in_memory = bool(sort) and sort_sql is None and vec_field is None
+            effective_limit = limit
+            if vec_limit is not None and (limit is None or vec_limit < limit):
+                effective_limit = vec_limit
+            limit_clause = ""
+            if effective_limit is not None and not sort_in_memory:
+                params.append(int(effective_limit))
+                limit_clause = f" LIMIT ${len(params)}"
+                limit_pushed = True
+            sql = (
+                f"SELECT data FROM {schema}.{col}"
+                f"{where_clause}{order_clause}{limit_clause}"
+            )
+
+        async with self._acquire_conn() as conn:
+            raw = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {sql}", *params)
+        plan_doc = json.loads(raw) if isinstance(raw, str) else raw
+        root = plan_doc[0]["Plan"] if plan_doc else {}
+
+        def _first_index(node: Dict[str, Any]) -> Optional[str]:
+            if node.get("Index Name"):
+                return str(node["Index Name"])
+            for child in node.get("Plans", []) or []:
+                found = _first_index(child)
+                if found:
+                    return found
+            return None
+
+        rows = root.get("Plan Rows")
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="sql" if translated is not None else "full_scan",
+            pushed_down=self.pushdown_status(collection, query, sort=sort),
+            pushed_filter=pushed,
+            residual_filter=residual,
+            sort_pushed_down=(
+                None if not sort else (sort_sql is not None or vec_field is not None)
+            ),
+            limit_pushed_down=None if limit is None else limit_pushed,
+            index=_first_index(root),
+            request={"sql": sql, "params": params},
+            estimated_rows=int(rows) if rows is not None else None,
+            details={"plan": plan_doc},
+        )
+
     async def count(
         self, collection: str, query: Optional[Dict[str, Any]] = None
     ) -> int:
@@ -1285,6 +1489,97 @@ class PostgresDB(Database):
                 )
                 return doc
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Delete matching records with a single ``DELETE … WHERE``.
+
+        Id lists bind as one ``id = ANY($1::text[])`` array parameter, so
+        there is no placeholder-count ceiling to chunk around. Queries the
+        translator cannot express fall back to resolving ids in Python
+        and deleting those.
+        """
+        await self._bootstrap_collection(collection)
+        col = _safe_collection(collection)
+        schema = _safe_collection(self.schema_name)
+
+        from .database import _normalize_id_query
+
+        if isinstance(query_or_ids, dict):
+            q = _normalize_id_query(query_or_ids)
+            translated = translate_query(q) if q else ("", [])
+            if translated is not None:
+                where_sql, params = translated
+                clause = f" WHERE {where_sql}" if where_sql else ""
+                async with self._acquire_conn() as conn:
+                    status = await conn.execute(
+                        f"DELETE FROM {schema}.{col}{clause}", *params
+                    )
+                return _rowcount(status)
+
+        ids = await self._resolve_delete_ids(collection, query_or_ids)
+        if not ids:
+            return 0
+        async with self._acquire_conn() as conn:
+            status = await conn.execute(
+                f"DELETE FROM {schema}.{col} WHERE id = ANY($1::text[])", ids
+            )
+        return _rowcount(status)
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Apply ``update`` to every matching record in one transaction.
+
+        Matching rows are locked with ``SELECT ... FOR UPDATE``, rewritten
+        in Python via :meth:`QueryEngine.apply_update` and upserted back
+        with ``executemany`` before the transaction commits — concurrent
+        writers on the same rows serialize, as with
+        :meth:`find_one_and_update`. Untranslatable queries fall back to
+        the base-class read-modify-write path.
+        """
+        await self._bootstrap_collection(collection)
+        col = _safe_collection(collection)
+        schema = _safe_collection(self.schema_name)
+
+        from .database import _normalize_id_query
+
+        q = _normalize_id_query(query)
+        translated = translate_query(q) if q else ("", [])
+        if translated is None:
+            return await super().update_many(collection, query, update)
+
+        where_sql, params = translated
+        clause = f" WHERE {where_sql}" if where_sql else ""
+        async with self._acquire_conn() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    f"SELECT data FROM {schema}.{col}{clause} FOR UPDATE",
+                    *params,
+                )
+                if not rows:
+                    return 0
+                args = []
+                for row in rows:
+                    doc = self._record_from_row(row)
+                    QueryEngine.apply_update(doc, update, apply_set_on_insert=False)
+                    args.append(self._split_payload(doc))
+                await conn.executemany(
+                    f"""
+                    UPDATE {schema}.{col}
+                    SET entity = $2, tenant_id = $3, data = $4::jsonb,
+                        updated_at = NOW()
+                    WHERE id = $1
+                    """,
+                    args,
+                )
+        return len(rows)
+
     def _pop_vector_clause(
         self, collection: str, query: Dict[str, Any]
     ) -> Tuple[
@@ -1675,6 +1970,194 @@ class PostgresDB(Database):
             for row in rows
         ]
 
+    @staticmethod
+    def _graph_step(direction: str, current: str) -> Tuple[str, str]:
+        """``(join predicate, next node expression)`` for one hop from ``current``."""
+        if direction == "out":
+            return f"(e.data ->> 'source') = {current}", "e.data ->> 'target'"
+        if direction == "in":
+            return f"(e.data ->> 'target') = {current}", "e.data ->> 'source'"
+        if direction == "both":
+            return (
+                f"((e.data ->> 'source') = {current} "
+                f"OR (e.data ->> 'target') = {current})",
+                f"CASE WHEN (e.data ->> 'source') = {current} "
+                "THEN (e.data ->> 'target') ELSE (e.data ->> 'source') END",
+            )
+        raise ValueError(f"direction must be 'out', 'in', or 'both', got {direction!r}")
+
+    @staticmethod
+    def _graph_filter(
+        edge_filter: Optional[Dict[str, Any]], shift: int, caller: str
+    ) -> Tuple[str, List[Any]]:
+        if not edge_filter:
+            return "", []
+        translated = translate_query(edge_filter)
+        if translated is None:
+            raise NotImplementedError(
+                f"PostgresDB.{caller}: edge_filter contains operators that don't "
+                "push down to SQL; fall back to per-hop expansion"
+            )
+        sql, params = translated
+        return f" AND ({_shift_placeholders(sql, shift=shift)})", list(params)
+
+    async def reachable(
+        self,
+        edge_collection: str,
+        start_id: str,
+        *,
+        direction: str = "out",
+        max_depth: int = 1,
+        edge_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Nodes within ``max_depth`` hops of ``start_id``, in one recursive CTE.
+
+        Unlike :meth:`traverse`, the recursive arm carries only
+        ``(node_id, depth)`` and uses ``UNION``, so each node enters the
+        walk at most once per depth and dense graphs stay polynomial.
+
+        Args:
+            edge_collection: Collection holding the edge records.
+            start_id: Node id to start from (not included in the result).
+            direction: ``out``, ``in`` or ``both``.
+            max_depth: Maximum number of hops (``>= 1``).
+            edge_filter: Optional Mongo-style query every traversed edge
+                must match.
+
+        Returns:
+            ``[{"node_id": ..., "depth": N}]`` ordered by depth, with each
+            node at its smallest depth.
+
+        Raises:
+            ValueError: Unknown ``direction`` or ``max_depth`` < 1.
+            NotImplementedError: ``edge_filter`` cannot be pushed down.
+        """
+        predicate, step = self._graph_step(direction, "walk.node_id")
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be >= 1, got {max_depth}")
+        params: List[Any] = [str(start_id), int(max_depth)]
+        filter_sql, filter_params = self._graph_filter(
+            edge_filter, len(params), "reachable"
+        )
+        params.extend(filter_params)
+
+        await self._bootstrap_collection(edge_collection)
+        col = _safe_collection(edge_collection)
+        schema = _safe_collection(self.schema_name)
+        sql = f"""
+        WITH RECURSIVE walk(node_id, depth) AS (
+            SELECT $1::text, 0
+            UNION
+            SELECT {step}, walk.depth + 1
+            FROM walk
+            JOIN {schema}.{col} e ON {predicate}
+            WHERE walk.depth < $2{filter_sql}
+        )
+        SELECT node_id, MIN(depth) AS depth
+        FROM walk
+        WHERE node_id IS NOT NULL AND node_id <> $1
+        GROUP BY node_id
+        ORDER BY depth, node_id
+        """
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(sql, *params)
+        return [{"node_id": row["node_id"], "depth": int(row["depth"])} for row in rows]
+
+    async def shortest_path(
+        self,
+        edge_collection: str,
+        source_id: str,
+        target_id: str,
+        *,
+        direction: str = "out",
+        max_depth: int,
+        weight: Optional[str] = None,
+        edge_filter: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Cheapest simple path of at most ``max_depth`` hops, in one query.
+
+        A recursive CTE enumerates simple paths from ``source_id`` (no node
+        repeats) up to ``max_depth`` hops and keeps the cheapest that ends
+        at ``target_id``. The number of paths grows with the branching
+        factor to the power ``max_depth``, so keep ``max_depth`` small;
+        ``GraphContext.shortest_path`` only routes short bounded searches
+        here.
+
+        Args:
+            edge_collection: Collection holding the edge records.
+            source_id: Path start.
+            target_id: Path end.
+            direction: ``out``, ``in`` or ``both``.
+            max_depth: Maximum number of hops (``>= 1``).
+            weight: Dotted edge field holding the cost (e.g.
+                ``"context.distance"``); non-numeric or missing values
+                cost 1. None counts hops.
+            edge_filter: Optional Mongo-style query every traversed edge
+                must match.
+
+        Returns:
+            ``{"node_ids": [...], "edge_ids": [...], "cost": float}`` or
+            None when no path exists within ``max_depth``.
+
+        Raises:
+            ValueError: Unknown ``direction``, ``max_depth`` < 1 or an
+                unsafe ``weight`` path.
+            NotImplementedError: ``edge_filter`` cannot be pushed down.
+        """
+        predicate, step = self._graph_step(direction, "paths.node_id")
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be >= 1, got {max_depth}")
+        if weight is None:
+            cost = "1.0::float8"
+        elif _safe_field_path(weight):
+            path = _path_literal(weight)
+            cost = (
+                f"CASE WHEN jsonb_typeof(e.data #> '{path}') = 'number' "
+                f"THEN (e.data #>> '{path}')::float8 ELSE 1.0::float8 END"
+            )
+        else:
+            raise ValueError(f"unsafe weight field path: {weight!r}")
+        params: List[Any] = [str(source_id), str(target_id), int(max_depth)]
+        filter_sql, filter_params = self._graph_filter(
+            edge_filter, len(params), "shortest_path"
+        )
+        params.extend(filter_params)
+
+        await self._bootstrap_collection(edge_collection)
+        col = _safe_collection(edge_collection)
+        schema = _safe_collection(self.schema_name)
+        sql = f"""
+        WITH RECURSIVE paths(node_id, nodes, edges, cost, depth) AS (
+            SELECT $1::text, ARRAY[$1::text], ARRAY[]::text[], 0::float8, 0
+            UNION ALL
+            SELECT {step},
+                   paths.nodes || ({step}),
+                   paths.edges || e.id::text,
+                   paths.cost + {cost},
+                   paths.depth + 1
+            FROM paths
+            JOIN {schema}.{col} e ON {predicate}
+            WHERE paths.depth < $3 AND paths.node_id <> $2
+              AND NOT (({step}) = ANY(paths.nodes)){filter_sql}
+        )
+        SELECT nodes, edges, cost
+        FROM paths
+        WHERE node_id = $2
+        ORDER BY cost, depth
+        LIMIT 1
+        """
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(sql, *params)
+        if row is None:
+            return None
+        return {
+            "node_ids": list(row["nodes"]),
+            "edge_ids": list(row["edges"]),
+            "cost": float(row["cost"]),
+        }
+
     # ---- transactions ------------------------------------------------------
 
     async def begin_transaction(self) -> "PostgresTransaction":
@@ -1700,6 +2183,112 @@ class PostgresDB(Database):
         """Roll back ``transaction`` and release its connection back to the pool."""
         await transaction.rollback()
 
+    # ---- change data capture ------------------------------------------------
+
+    def _require_change_capture(self) -> None:
+        if not self.supports_changes:
+            raise NotImplementedError(
+                "PostgresDB change capture is off; construct with capture_changes=True"
+            )
+
+    async def change_cursor(self) -> bytes:
+        """Cursor just before the oldest transaction still in flight."""
+        self._require_change_capture()
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            await self._ensure_change_log(conn)
+            xmin = await conn.fetchval(
+                "SELECT txid_snapshot_xmin(txid_current_snapshot())"
+            )
+        return encode_cursor({"tx": int(xmin), "seq": 0})
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Poll ``jv_changes`` in ``(txid, seq)`` order.
+
+        Only transactions older than the current snapshot's ``xmin`` are
+        read, so every event behind a cursor is final. A long-running
+        transaction holds delivery back until it ends.
+        """
+        self._require_change_capture()
+        if since is None:
+            since = await self.change_cursor()
+        decoded = decode_change_cursor(since, "PostgresDB", "tx", "seq") or {
+            "tx": 0,
+            "seq": 0,
+        }
+        schema = _safe_collection(self.schema_name)
+        sql = (
+            "SELECT seq, txid, collection, id, op, data, "
+            "EXTRACT(EPOCH FROM changed_at) AS ts "
+            f"FROM {schema}.jv_changes "
+            "WHERE (txid, seq) > ($1, $2) "
+            "AND txid < txid_snapshot_xmin(txid_current_snapshot())"
+        )
+        params: List[Any] = []
+        if collections:
+            sql += " AND collection = ANY($4::text[])"
+            params.append(list(collections))
+        sql += " ORDER BY txid, seq LIMIT $3"
+
+        async def _fetch(
+            position: Tuple[int, int],
+        ) -> Tuple[Tuple[int, int], List[ChangeEvent]]:
+            pool = await self._ensure_pool()
+            async with pool.acquire() as conn:
+                await self._ensure_change_log(conn)
+                rows = await conn.fetch(
+                    sql, position[0], position[1], batch_size, *params
+                )
+            events = [
+                ChangeEvent(
+                    op=row["op"],
+                    collection=row["collection"],
+                    id=row["id"],
+                    document=(
+                        self._record_from_row(row) if row["data"] is not None else None
+                    ),
+                    cursor=encode_cursor({"tx": row["txid"], "seq": row["seq"]}),
+                    timestamp=float(row["ts"]) if row["ts"] is not None else None,
+                )
+                for row in rows
+            ]
+            if rows:
+                position = (int(rows[-1]["txid"]), int(rows[-1]["seq"]))
+            return position, events
+
+        async for event in poll_change_log(
+            _fetch,
+            (int(decoded["tx"]), int(decoded["seq"])),
+            follow=follow,
+            poll_interval=poll_interval,
+        ):
+            yield event
+
+    async def prune_changes(self, before: bytes) -> int:
+        """Delete ``jv_changes`` rows up to and including ``before``."""
+        self._require_change_capture()
+        decoded = decode_change_cursor(before, "PostgresDB", "tx", "seq")
+        if decoded is None:
+            return 0
+        schema = _safe_collection(self.schema_name)
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            await self._ensure_change_log(conn)
+            status = await conn.execute(
+                f"DELETE FROM {schema}.jv_changes WHERE (txid, seq) <= ($1, $2)",
+                int(decoded["tx"]),
+                int(decoded["seq"]),
+            )
+        return _rowcount(status)
+
     # ---- index management --------------------------------------------------
 
     async def drop_deprecated_indexes(self, deprecated: Dict[str, List[str]]) -> None:
@@ -568,7 +568,7 @@ class QueryEngine:
                     if not isinstance(arr, list):
                         arr = []
                     arr = list(arr)
-                    arr.append(item)
+                    arr.extend(QueryEngine._update_items(item))
                     QueryEngine.set_field_value(document, field, arr)
             elif op == "$addToSet":
                 for field, item in payload.items():
@@ -576,13 +576,47 @@ class QueryEngine:
                     if not isinstance(arr, list):
                         arr = []
                     arr = list(arr)
-                    if item not in arr:
-                        arr.append(item)
+                    for value in QueryEngine._update_items(item):
+                        if value not in arr:
+                            arr.append(value)
                     QueryEngine.set_field_value(document, field, arr)
+            elif op == "$pull":
+                for field, item in payload.items():
+                    arr = QueryEngine.get_field_value(document, field)
+                    if not isinstance(arr, list):
+                        continue
+                    if isinstance(item, dict) and set(item) == {"$in"}:
+                        drop = list(item["$in"])
+                        kept = [v for v in arr if v not in drop]
+                    elif isinstance(item, dict):
+                        kept = [
+                            v for v in arr if not QueryEngine._pull_matches(v, item)
+                        ]
+                    else:
+                        kept = [v for v in arr if v != item]
+                    QueryEngine.set_field_value(document, field, kept)
             else:
                 continue
         return document
 
+    @staticmethod
+    def _pull_matches(value: Any, condition: Dict[str, Any]) -> bool:
+        """Whether ``$pull`` with a query ``condition`` removes ``value``.
+
+        Operator conditions (``{"$gte": 5}``) test the element itself; field
+        conditions (``{"id": "e1"}``) test embedded documents.
+        """
+        if all(k.startswith("$") for k in condition):
+            return QueryEngine.match({"v": value}, {"v": condition})
+        return isinstance(value, dict) and QueryEngine.match(value, condition)
+
+    @staticmethod
+    def _update_items(item: Any) -> List[Any]:
+        """Values appended by ``$push``/``$addToSet`` (unwraps ``{"$each": [...]}``)."""
+        if isinstance(item, dict) and set(item) == {"$each"}:
+            return list(item["$each"])
+        return [item]
+
 
 class QueryOperator:
     """Enumeration of supported MongoDB-style query operators."""
@@ -0,0 +1,601 @@
+"""Hash-partitioned router that spreads one logical database over N adapters.
+
+:class:`ShardedDatabase` implements the :class:`~jvspatial.db.database.Database`
+interface on top of a list of child adapters ("shards"). Each record lives on
+exactly one shard, chosen by a stable hash of its routing key:
+
+* **Default routing** hashes the record ``id``. ``save`` / ``get`` /
+  ``delete`` touch a single shard; ``find_many`` / ``bulk_save`` group ids by
+  shard and issue one call per shard concurrently.
+* **Field routing** (``shard_key="tenant_id"``) hashes a record field
+  instead, so one tenant's records are co-located. ``save`` routes by the
+  field; ``get`` / ``delete`` only have the id, so they fan out. ``find`` /
+  ``count`` narrow to one shard when the query pins the field to a literal.
+
+Queries that cannot be narrowed (``find``, ``count``, ``update_many``,
+query-form ``delete_many``) fan out to every shard concurrently. ``find``
+results are merged with :func:`~jvspatial.db.database.finalize_find_results`:
+each shard returns its slice already sorted and capped at ``limit``, and the
+stable sort merges the concatenated runs before the global ``limit`` applies,
+so ordering follows the same SPEC §4.1 contract as a single adapter.
+
+The hash is ``blake2b`` over the UTF-8 key, not Python's ``hash()``, so the
+placement is identical across processes and interpreter restarts.
+
+Resharding
+----------
+:meth:`ShardedDatabase.reshard` moves to a new shard list by streaming every
+record of the given collections through :meth:`Database.find_iter`, writing
+misplaced records to their new home with :meth:`Database.bulk_save` and
+removing them from the old shard with :meth:`Database.delete_many`. Shards
+present in both lists keep the records that still hash to them. Writes
+issued while a reshard is running may land on the old topology and be
+missed; pause writers (or run the reshard from a maintenance job) first.
+
+Change streams
+--------------
+:meth:`ShardedDatabase.changes` polls every shard's own
+:meth:`~jvspatial.db.database.Database.changes` in turn. Events keep their
+per-shard order; there is no global order across shards. Each event's
+cursor packs one cursor per shard, so it resumes every shard at once and
+is only valid for the same shard list.
+
+Limitations: no cross-shard transactions (``supports_transactions`` is
+``False``), and no recursive ``traverse`` pushdown -- graph traversal falls
+back to the per-hop path in :class:`~jvspatial.core.context.GraphContext`.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import logging
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .database import (
+    ChangeEvent,
+    Database,
+    QueryPlan,
+    _normalize_id_query,
+    decode_change_cursor,
+    encode_cursor,
+    finalize_find_results,
+    resolve_sort_value,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _stable_hash(key: str) -> int:
+    """Return a process-independent 64-bit hash of ``key``."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class ShardedDatabase(Database):
+    """Route records across child databases by a stable hash.
+
+    Args:
+        shards: Child adapters. Order matters -- shard ``i`` owns the keys
+            whose hash is ``i`` modulo ``len(shards)``.
+        shard_key: ``None`` (default) to route by record ``id``, a dotted
+            field path (``"tenant_id"``, ``"context.tenant"``) to route by
+            that field, or a callable ``record -> str`` for custom keys.
+            Records missing the field fall back to their ``id``.
+
+    Example:
+        ```python
+        from jvspatial.db import SQLiteDB, ShardedDatabase
+
+        db = ShardedDatabase(
+            [SQLiteDB(db_path=f"data/shard{i}.db") for i in range(4)]
+        )
+        ```
+    """
+
+    supports_transactions: bool = False
+
+    def __init__(
+        self,
+        shards: Sequence[Database],
+        *,
+        shard_key: Union[None, str, Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        if not shards:
+            raise ValueError("ShardedDatabase requires at least one shard")
+        self.shards: List[Database] = list(shards)
+        self.shard_key = shard_key
+        self.supports_changes = all(
+            getattr(s, "supports_changes", False) for s in self.shards
+        )
+
+    # ----- routing ----------------------------------------------------
+
+    @property
+    def _routes_by_id(self) -> bool:
+        return self.shard_key is None
+
+    def _index_for(self, key: Any, shards: Optional[List[Database]] = None) -> int:
+        pool = self.shards if shards is None else shards
+        return _stable_hash(str(key)) % len(pool)
+
+    def _routing_key(self, record: Dict[str, Any]) -> Any:
+        """Return the value ``record`` is placed by."""
+        rec_id = record.get("id", record.get("_id"))
+        if self.shard_key is None:
+            return rec_id
+        if callable(self.shard_key):
+            key = self.shard_key(record)
+        else:
+            key = resolve_sort_value(record, self.shard_key)
+        return rec_id if key is None else key
+
+    def shard_for(
+        self, record: Dict[str, Any], shards: Optional[List[Database]] = None
+    ) -> Database:
+        """Return the shard that owns ``record``."""
+        pool = self.shards if shards is None else shards
+        return pool[self._index_for(self._routing_key(record), pool)]
+
+    def shard_for_id(self, record_id: str) -> Optional[Database]:
+        """Return the shard owning ``record_id``, or ``None`` under field routing."""
+        if not self._routes_by_id:
+            return None
+        return self.shards[self._index_for(record_id)]
+
+    def _shards_for_query(self, query: Dict[str, Any]) -> List[Database]:
+        """Narrow a query to one shard when it pins the routing key."""
+        if callable(self.shard_key):
+            return self.shards
+        field = "id" if self.shard_key is None else self.shard_key
+        q = _normalize_id_query(query) if field == "id" else query
+        value = q.get(field)
+        if value is None or isinstance(value, (dict, list)):
+            return self.shards
+        return [self.shards[self._index_for(value)]]
+
+    def _group_ids(self, ids: Sequence[Any]) -> Dict[int, List[str]]:
+        groups: Dict[int, List[str]] = {}
+        for rec_id in dict.fromkeys(str(i) for i in ids):
+            groups.setdefault(self._index_for(rec_id), []).append(rec_id)
+        return groups
+
+    # ----- Database protocol -----------------------------------------
+
+    async def save(self, collection: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Save ``data`` on the shard its routing key hashes to."""
+        return await self.shard_for(data).save(collection, data)
+
+    async def get(self, collection: str, id: str) -> Optional[Dict[str, Any]]:
+        """Fetch by id: one shard under id routing, first hit otherwise."""
+        shard = self.shard_for_id(id)
+        if shard is not None:
+            return await shard.get(collection, id)
+        results = await asyncio.gather(*(s.get(collection, id) for s in self.shards))
+        return next((r for r in results if r is not None), None)
+
+    async def delete(self, collection: str, id: str) -> None:
+        """Delete by id: one shard under id routing, every shard otherwise."""
+        shard = self.shard_for_id(id)
+        if shard is not None:
+            await shard.delete(collection, id)
+            return
+        await asyncio.gather(*(s.delete(collection, id) for s in self.shards))
+
+    async def find(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        limit: Optional[int] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fan out to the relevant shards and merge.
+
+        Every shard receives the same ``sort`` and ``limit``: the global
+        top ``limit`` is always inside the union of the per-shard top
+        ``limit`` slices, so pushing the cap down is safe and bounds the
+        merge to ``len(shards) * limit`` rows.
+        """
+        targets = self._shards_for_query(query)
+        if len(targets) == 1:
+            return await targets[0].find(collection, query, limit=limit, sort=sort)
+        parts = await asyncio.gather(
+            *(s.find(collection, query, limit=limit, sort=sort) for s in targets)
+        )
+        merged = [rec for part in parts for rec in part]
+        return finalize_find_results(merged, sort=sort, limit=limit)
+
+    async def count(
+        self, collection: str, query: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Sum per-shard counts (each shard uses its native count path)."""
+        q = query or {}
+        targets = self._shards_for_query(q)
+        counts = await asyncio.gather(*(s.count(collection, q) for s in targets))
+        return sum(counts)
+
+    async def find_many(
+        self, collection: str, ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """One ``find_many`` per owning shard, issued concurrently."""
+        if not ids:
+            return {}
+        if not self._routes_by_id:
+            targets: List[Tuple[Database, List[str]]] = [
+                (s, list(dict.fromkeys(ids))) for s in self.shards
+            ]
+        else:
+            targets = [
+                (self.shards[idx], group) for idx, group in self._group_ids(ids).items()
+            ]
+        parts = await asyncio.gather(
+            *(s.find_many(collection, group) for s, group in targets)
+        )
+        out: Dict[str, Dict[str, Any]] = {}
+        for part in parts:
+            out.update(part)
+        return out
+
+    async def bulk_save(self, collection: str, records: List[Dict[str, Any]]) -> int:
+        """Group records by owning shard; one ``bulk_save`` per shard."""
+        if not records:
+            return 0
+        for idx, r in enumerate(records):
+            if "id" not in r:
+                raise ValueError(f"bulk_save: record at index {idx} has no 'id' field")
+        groups: Dict[int, List[Dict[str, Any]]] = {}
+        for r in records:
+            groups.setdefault(self._index_for(self._routing_key(r)), []).append(r)
+        counts = await asyncio.gather(
+            *(
+                self.shards[idx].bulk_save(collection, group)
+                for idx, group in groups.items()
+            )
+        )
+        return sum(counts)
+
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Route id lists by shard; fan queries out to every relevant shard."""
+        if isinstance(query_or_ids, dict):
+            targets = self._shards_for_query(query_or_ids)
+            counts = await asyncio.gather(
+                *(s.delete_many(collection, query_or_ids) for s in targets)
+            )
+            return sum(counts)
+        if not self._routes_by_id:
+            ids = list(query_or_ids)
+            counts = await asyncio.gather(
+                *(s.delete_many(collection, ids) for s in self.shards)
+            )
+            return sum(counts)
+        counts = await asyncio.gather(
+            *(
+                self.shards[idx].delete_many(collection, group)
+                for idx, group in self._group_ids(query_or_ids).items()
+            )
+        )
+        return sum(counts)
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Fan ``update_many`` out; each shard applies its native path."""
+        targets = self._shards_for_query(query)
+        counts = await asyncio.gather(
+            *(s.update_many(collection, query, update) for s in targets)
+        )
+        return sum(counts)
+
+    async def find_one_and_delete(
+        self, collection: str, query: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Try each candidate shard in order; atomic within one shard only."""
+        for shard in self._shards_for_query(query):
+            doc = await shard.find_one_and_delete(collection, query)
+            if doc is not None:
+                return doc
+        return None
+
+    async def find_one_and_update(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Update the first match found, trying candidate shards in order.
+
+        An upsert that matches nothing lands on the shard owning the
+        query's ``id`` (or routing field). Atomic within one shard only.
+        """
+        targets = self._shards_for_query(query)
+        for shard in targets:
+            doc = await shard.find_one_and_update(
+                collection, query, update, upsert=False
+            )
+            if doc is not None:
+                return doc
+        if not upsert:
+            return None
+        seed = dict(_normalize_id_query(query))
+        owner = targets[0] if len(targets) == 1 else self.shard_for(seed)
+        return await owner.find_one_and_update(collection, query, update, upsert=True)
+
+    async def create_index(
+        self,
+        collection: str,
+        field_or_fields: Union[str, List[Tuple[str, int]]],
+        unique: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Create the index on every shard.
+
+        ``unique`` is enforced per shard only; a value is globally unique
+        only when the unique field is also the routing key.
+        """
+        await asyncio.gather(
+            *(
+                s.create_index(collection, field_or_fields, unique=unique, **kwargs)
+                for s in self.shards
+            )
+        )
+
+    async def drop_deprecated_indexes(self, deprecated: Dict[str, List[str]]) -> None:
+        """Drop deprecated indexes on every shard."""
+        await asyncio.gather(
+            *(s.drop_deprecated_indexes(deprecated) for s in self.shards)
+        )
+
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """``False`` if any targeted shard scans; ``True`` only if all push down."""
+        answers = [
+            s.pushdown_status(collection, query, sort=sort)
+            for s in self._shards_for_query(query)
+        ]
+        if any(a is False for a in answers):
+            return False
+        return True if answers and all(answers) else None
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Explain on every targeted shard and summarize.
+
+        Per-shard plans are under ``details["shards"]``. The summary is
+        pushed down only if every shard pushes down; ``estimated_rows`` is
+        the sum when every shard reports one. Sort and limit are always
+        re-applied here after the merge.
+        """
+        targets = self._shards_for_query(query)
+        plans = await asyncio.gather(
+            *(s.explain(collection, query, sort=sort, limit=limit) for s in targets)
+        )
+        pushed = [p.pushed_down for p in plans]
+        estimates = [p.estimated_rows for p in plans]
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="single_shard" if len(targets) == 1 else "fan_out",
+            pushed_down=(
+                False
+                if any(p is False for p in pushed)
+                else (True if pushed and all(pushed) else None)
+            ),
+            pushed_filter=plans[0].pushed_filter if plans else {},
+            residual_filter=plans[0].residual_filter if plans else {},
+            sort_pushed_down=plans[0].sort_pushed_down if len(plans) == 1 else None,
+            limit_pushed_down=plans[0].limit_pushed_down if len(plans) == 1 else None,
+            estimated_rows=(
+                sum(e for e in estimates if e is not None)
+                if estimates and all(e is not None for e in estimates)
+                else None
+            ),
+            details={
+                "shards": [
+                    {"shard": self.shards.index(s), **p.to_dict()}
+                    for s, p in zip(targets, plans)
+                ]
+            },
+        )
+
+    # ----- change streams ----------------------------------------------
+
+    @staticmethod
+    def _encode_change_cursor(positions: List[Optional[bytes]]) -> bytes:
+        return encode_cursor(
+            {"shards": [p.decode("ascii") if p else None for p in positions]}
+        )
+
+    def _decode_change_cursor(self, cursor: bytes) -> List[Optional[bytes]]:
+        decoded = decode_change_cursor(cursor, "ShardedDatabase", "shards")
+        shards = decoded["shards"] if decoded else []
+        if len(shards) != len(self.shards):
+            raise ValueError(
+                f"change cursor covers {len(shards)} shard(s); "
+                f"this database has {len(self.shards)}"
+            )
+        return [p.encode("ascii") if p else None for p in shards]
+
+    async def change_cursor(self) -> bytes:
+        """One cursor per shard, taken concurrently."""
+        positions = await asyncio.gather(*(s.change_cursor() for s in self.shards))
+        return self._encode_change_cursor(list(positions))
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Round-robin each shard's change stream until all are caught up.
+
+        Each pass drains every shard with ``follow=False``; when a whole
+        pass yields nothing the iterator returns (``follow=False``) or
+        sleeps ``poll_interval``.
+        """
+        positions = self._decode_change_cursor(
+            since if since is not None else await self.change_cursor()
+        )
+        while True:
+            delivered = False
+            for index, shard in enumerate(self.shards):
+                # ``changes()`` is an async generator on every backend;
+                # closing it promptly releases the shard's poll loop.
+                stream = cast(
+                    AsyncGenerator[ChangeEvent, None],
+                    shard.changes(
+                        collections,
+                        since=positions[index],
+                        follow=False,
+                        poll_interval=poll_interval,
+                        batch_size=batch_size,
+                    ),
+                )
+                try:
+                    async for event in stream:
+                        positions[index] = event.cursor
+                        delivered = True
+                        yield dataclasses.replace(
+                            event, cursor=self._encode_change_cursor(positions)
+                        )
+                finally:
+                    await stream.aclose()
+            if not delivered:
+                if not follow:
+                    return
+                await asyncio.sleep(poll_interval)
+
+    async def prune_changes(self, before: bytes) -> int:
+        """Prune each shard up to its own position in ``before``."""
+        positions = self._decode_change_cursor(before)
+        removed = await asyncio.gather(
+            *(s.prune_changes(p) for s, p in zip(self.shards, positions) if p)
+        )
+        return sum(removed)
+
+    async def close(self) -> None:
+        """Release every shard that has its own close method."""
+        for shard in self.shards:
+            close = getattr(shard, "close", None)
+            if callable(close):
+                await close()
+
+    # ----- resharding -------------------------------------------------
+
+    async def reshard(
+        self,
+        new_shards: Sequence[Database],
+        collections: Sequence[str],
+        *,
+        batch_size: int = 500,
+    ) -> Dict[str, int]:
+        """Rebalance ``collections`` onto ``new_shards`` and switch over.
+
+        Records are streamed from each current shard with ``find_iter``
+        (constant memory), buffered per destination, flushed with
+        ``bulk_save`` every ``batch_size`` records and then removed from
+        their source with ``delete_many``. A shard that appears in both
+        lists (same object) keeps the records that still hash to it.
+
+        Args:
+            new_shards: Target topology.
+            collections: Collections to move; the ``Database`` interface
+                cannot enumerate collections, so callers name them
+                (typically ``["node", "edge", "object", "walker"]``).
+            batch_size: Records per ``bulk_save`` / ``delete_many`` flush.
+
+        Returns:
+            ``{collection: records_moved}``.
+        """
+        if not new_shards:
+            raise ValueError("reshard requires at least one shard")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        target = list(new_shards)
+        moved: Dict[str, int] = {}
+
+        for collection in collections:
+            moved[collection] = 0
+            for source in self.shards:
+                pending: Dict[int, List[Dict[str, Any]]] = {}
+                buffered = 0
+                async for record in source.find_iter(
+                    collection, {}, batch_size=batch_size
+                ):
+                    dest = self.shard_for(record, target)
+                    if dest is source:
+                        continue
+                    pending.setdefault(id(dest), []).append(record)
+                    buffered += 1
+                    if buffered >= batch_size:
+                        moved[collection] += await self._flush_moves(
+                            collection, source, target, pending
+                        )
+                        pending, buffered = {}, 0
+                if buffered:
+                    moved[collection] += await self._flush_moves(
+                        collection, source, target, pending
+                    )
+            logger.info(
+                "ShardedDatabase.reshard: moved %d %s records onto %d shards",
+                moved[collection],
+                collection,
+                len(target),
+            )
+
+        self.shards = target
+        return moved
+
+    async def _flush_moves(
+        self,
+        collection: str,
+        source: Database,
+        target: List[Database],
+        pending: Dict[int, List[Dict[str, Any]]],
+    ) -> int:
+        """Write buffered records to their new shards, then drop the originals."""
+        by_identity = {id(s): s for s in target}
+        moved_ids: List[str] = []
+        for dest_key, records in pending.items():
+            await by_identity[dest_key].bulk_save(collection, records)
+            moved_ids.extend(str(r["id"]) for r in records)
+        # Delete only after every copy landed, so a failed write leaves the
+        # record readable on its old shard rather than lost.
+        await source.delete_many(collection, moved_ids)
+        return len(moved_ids)
+
+
+__all__ = ["ShardedDatabase"]
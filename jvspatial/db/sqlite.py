@@ -12,16 +12,38 @@ import asyncio
 import contextlib
 import json
 import logging
+import re
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ._sqlite_translate import (
+    _safe_field_path,
     translate_partial_filter_expression,
     translate_query,
     translate_sort,
 )
-from .database import Database, finalize_find_results
+from .database import (
+    ChangeEvent,
+    Database,
+    QueryPlan,
+    _normalize_id_query,
+    decode_change_cursor,
+    encode_cursor,
+    finalize_find_results,
+    poll_change_log,
+    split_query_clauses,
+)
 from .query import QueryEngine
 
 logger = logging.getLogger(__name__)
@@ -31,6 +53,45 @@ try:
 except ImportError:  # pragma: no cover - handled by raising in __init__
     aiosqlite = None  # type: ignore[assignment]
 
+# Change capture: triggers on ``records`` append to ``record_changes``, so
+# every write path (save, bulk, delete_many, update_many, raw SQL) is
+# captured in the same transaction as the write itself. ``INSERT OR
+# REPLACE`` fires only the INSERT trigger (``recursive_triggers`` is off),
+# so a replace surfaces as one ``save`` rather than a delete + save.
+_CHANGE_TRIGGERS = (
+    "record_changes_insert",
+    "record_changes_update",
+    "record_changes_delete",
+)
+_UNIX_NOW_SQL = "(julianday('now') - 2440587.5) * 86400.0"
+_CHANGE_CAPTURE_DDL = f"""
+CREATE TABLE IF NOT EXISTS record_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    op TEXT NOT NULL,
+    data TEXT,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_record_changes_collection
+    ON record_changes (collection, seq);
+CREATE TRIGGER IF NOT EXISTS record_changes_insert AFTER INSERT ON records
+BEGIN
+    INSERT INTO record_changes (collection, id, op, data, ts)
+    VALUES (NEW.collection, NEW.id, 'save', NEW.data, {_UNIX_NOW_SQL});
+END;
+CREATE TRIGGER IF NOT EXISTS record_changes_update AFTER UPDATE ON records
+BEGIN
+    INSERT INTO record_changes (collection, id, op, data, ts)
+    VALUES (NEW.collection, NEW.id, 'save', NEW.data, {_UNIX_NOW_SQL});
+END;
+CREATE TRIGGER IF NOT EXISTS record_changes_delete AFTER DELETE ON records
+BEGIN
+    INSERT INTO record_changes (collection, id, op, data, ts)
+    VALUES (OLD.collection, OLD.id, 'delete', NULL, {_UNIX_NOW_SQL});
+END;
+"""
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from aiosqlite import Connection
 
@@ -73,6 +134,7 @@ class SQLiteDB(Database):
         timeout: float = 5.0,
         journal_mode: str = "WAL",
         synchronous: str = "NORMAL",
+        capture_changes: bool = False,
     ) -> None:
         if aiosqlite is None:  # pragma: no cover - exercised when dependency missing
             raise ImportError(
@@ -110,6 +172,10 @@ class SQLiteDB(Database):
         self.timeout = timeout
         self.journal_mode = journal_mode
         self.synchronous = synchronous
+        # Trigger-fed change table backing :meth:`changes`. The triggers
+        # live in the database file, so opening it with capture off
+        # drops them rather than leaving an unread table to grow.
+        self.supports_changes = capture_changes
 
         self._connection: Optional["Connection"] = None
         self._lock = asyncio.Lock()
@@ -199,6 +265,7 @@ class SQLiteDB(Database):
                 ON records (collection)
                 """
             )
+            await self._sync_change_capture(self._connection)
             await self._connection.commit()
             # Drop legacy global unique indexes on session_id before any
             # writes — CREATE INDEX IF NOT EXISTS would leave them in place
@@ -208,6 +275,14 @@ class SQLiteDB(Database):
 
         return self._connection
 
+    async def _sync_change_capture(self, connection: "Connection") -> None:
+        """Install or drop the ``record_changes`` triggers to match config."""
+        if self.supports_changes:
+            await connection.executescript(_CHANGE_CAPTURE_DDL)
+            return
+        for name in _CHANGE_TRIGGERS:
+            await connection.execute(f"DROP TRIGGER IF EXISTS {name}")
+
     def _json_path(self, field_path: str) -> str:
         """Convert a field path (e.g., 'context.user_id') to SQLite JSON path expression.
 
@@ -596,6 +671,147 @@ class SQLiteDB(Database):
                 raise
         return len(records)
 
+    async def delete_many(
+        self,
+        collection: str,
+        query_or_ids: Union[Dict[str, Any], List[str]],
+    ) -> int:
+        """Delete matching records with a single ``DELETE … WHERE``.
+
+        * Id list: ``WHERE collection=? AND id IN (...)``, chunked by 500
+          like :meth:`find_many`, all chunks in one transaction.
+        * Translatable query: the translated WHERE clause is pushed into
+          the DELETE directly.
+        * Untranslatable query (e.g. ``$regex``): matching ids are
+          resolved in Python first, then deleted as an id list.
+        """
+        if isinstance(query_or_ids, dict):
+            query = _normalize_id_query(query_or_ids)
+            translated = translate_query(query) if query else ("", [])
+            if translated is not None:
+                where_extra, params = translated
+                sql = "DELETE FROM records WHERE collection = ?"
+                sql_params: List[Any] = [collection]
+                if where_extra:
+                    sql += f" AND ({where_extra})"
+                    sql_params.extend(params)
+                async with self._lock:
+                    connection = await self._get_connection()
+                    cursor = await connection.execute(sql, tuple(sql_params))
+                    deleted = cursor.rowcount
+                    await cursor.close()
+                    await connection.commit()
+                return max(deleted, 0)
+
+        ids = await self._resolve_delete_ids(collection, query_or_ids)
+        if not ids:
+            return 0
+        deleted = 0
+        chunk_size = 500
+        async with self._lock:
+            connection = await self._get_connection()
+            try:
+                await connection.execute("BEGIN")
+                for i in range(0, len(ids), chunk_size):
+                    chunk = ids[i : i + chunk_size]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = await connection.execute(
+                        f"DELETE FROM records "
+                        f"WHERE collection = ? AND id IN ({placeholders})",
+                        (collection, *chunk),
+                    )
+                    deleted += max(cursor.rowcount, 0)
+                    await cursor.close()
+                await connection.commit()
+            except Exception:
+                with contextlib.suppress(Exception):
+                    await connection.rollback()
+                raise
+        return deleted
+
+    async def update_many(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        """Apply ``update`` to every match in one transaction.
+
+        SQLite has no JSON update-operator equivalent for the full
+        ``$set``/``$inc``/``$push`` surface, so the match set is read,
+        rewritten in Python via :meth:`QueryEngine.apply_update` and
+        written back with ``executemany`` — all under the write lock so
+        no other writer on this adapter interleaves.
+        """
+        async with self._lock:
+            docs = await self.find(collection, _normalize_id_query(query))
+            if not docs:
+                return 0
+            params = []
+            for doc in docs:
+                QueryEngine.apply_update(doc, update, apply_set_on_insert=False)
+                params.append((collection, str(doc["id"]), json.dumps(doc)))
+            connection = await self._get_connection()
+            try:
+                await connection.execute("BEGIN")
+                await connection.executemany(
+                    "INSERT OR REPLACE INTO records "
+                    "(collection, id, data) VALUES (?, ?, ?)",
+                    params,
+                )
+                await connection.commit()
+            except Exception:
+                with contextlib.suppress(Exception):
+                    await connection.rollback()
+                raise
+        return len(docs)
+
+    async def find_one_and_update(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Atomic find-and-update (see :meth:`Database.find_one_and_update`).
+
+        The match is read and rewritten inside one ``BEGIN IMMEDIATE``
+        transaction under the write lock, so neither another task on this
+        adapter nor another process on the same file can interleave. This
+        is what makes :func:`~jvspatial.db.work_claim.claim_record` a real
+        lease on SQLite.
+        """
+        async with self._lock:
+            connection = await self._get_connection()
+            try:
+                await connection.execute("BEGIN IMMEDIATE")
+                docs = await self.find(collection, _normalize_id_query(query), limit=1)
+                if docs:
+                    doc = docs[0]
+                    QueryEngine.apply_update(doc, update, apply_set_on_insert=False)
+                elif upsert:
+                    doc = {}
+                    doc_id = query.get("_id", query.get("id"))
+                    if doc_id is not None:
+                        doc["_id"] = doc_id
+                        doc["id"] = str(doc_id)
+                    QueryEngine.apply_update(doc, update, apply_set_on_insert=True)
+                else:
+                    await connection.rollback()
+                    return None
+                doc["id"] = str(doc.setdefault("id", str(uuid.uuid4())))
+                await connection.execute(
+                    "INSERT OR REPLACE INTO records (collection, id, data) "
+                    "VALUES (?, ?, ?)",
+                    (collection, doc["id"], json.dumps(doc)),
+                )
+                await connection.commit()
+            except Exception:
+                with contextlib.suppress(Exception):
+                    await connection.rollback()
+                raise
+        return doc
+
     async def find(
         self,
         collection: str,
@@ -689,6 +905,84 @@ class SQLiteDB(Database):
                 results.append(record)
         return finalize_find_results(results, sort=sort, limit=limit)
 
+    def pushdown_status(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[bool]:
+        """``True`` when both the filter and ``sort`` translate to SQL."""
+        if query and translate_query(query) is None:
+            return False
+        return not sort or translate_sort(sort) is not None
+
+    async def explain(
+        self,
+        collection: str,
+        query: Dict[str, Any],
+        *,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> QueryPlan:
+        """Plan :meth:`find` and run ``EXPLAIN QUERY PLAN`` on its SQL.
+
+        Mirrors the branches in :meth:`find`: an untranslatable query loads
+        the whole collection and filters, sorts and limits in Python; a
+        translatable query with an untranslatable sort keeps the ``WHERE``
+        in SQL but withholds ``LIMIT``. SQLite exposes no row estimates,
+        so ``estimated_rows`` stays ``None``.
+        """
+        if not sort:
+            sort = None
+        translated = translate_query(query) if query else ("", [])
+        pushed, residual = split_query_clauses(
+            query, lambda clause: translate_query(clause) is not None
+        )
+        sql = "SELECT data FROM records WHERE collection = ?"
+        params: List[Any] = [collection]
+        order_by = None
+        if translated is not None:
+            where_extra, where_params = translated
+            if where_extra:
+                sql += f" AND ({where_extra})"
+                params.extend(where_params)
+            order_by = translate_sort(sort)
+            if order_by is not None:
+                sql += f" ORDER BY {order_by}"
+            if limit is not None and (order_by is not None or sort is None):
+                sql += " LIMIT ?"
+                params.append(int(limit))
+
+        connection = await self._get_connection()
+        cursor = await connection.execute(f"EXPLAIN QUERY PLAN {sql}", tuple(params))
+        rows = await cursor.fetchall()
+        await cursor.close()
+        steps = [str(row[3]) for row in rows]
+        index = None
+        for step in steps:
+            match = re.search(r"USING (?:COVERING )?INDEX (\S+)", step)
+            if match:
+                index = match.group(1)
+                break
+
+        filter_pushed = translated is not None
+        return QueryPlan(
+            backend=type(self).__name__,
+            collection=collection,
+            strategy="sql" if filter_pushed else "full_scan",
+            pushed_down=self.pushdown_status(collection, query, sort=sort),
+            pushed_filter=pushed,
+            residual_filter=residual,
+            sort_pushed_down=None if sort is None else order_by is not None,
+            limit_pushed_down=(
+                None if limit is None else filter_pushed and " LIMIT ?" in sql
+            ),
+            index=index,
+            request={"sql": sql, "params": params},
+            details={"query_plan": steps},
+        )
+
     async def count(
         self,
         collection: str,
@@ -729,6 +1023,278 @@ class SQLiteDB(Database):
         rows = await self.find(collection, q)
         return len(rows)
 
+    # ---- graph queries -----------------------------------------------------
+
+    async def _ensure_endpoint_indexes(self, edge_collection: str) -> None:
+        """Index ``source``/``target`` so recursive joins don't rescan edges."""
+        created = self._created_indexes.get(edge_collection, set())
+        for field in ("source", "target"):
+            if f"idx_{edge_collection}_{field}" not in created:
+                await self.create_index(edge_collection, field)
+
+    @staticmethod
+    def _graph_step(direction: str, current: str) -> Tuple[str, str]:
+        """``(join predicate, next node expression)`` for one hop from ``current``."""
+        source = "json_extract(data, '$.source')"
+        target = "json_extract(data, '$.target')"
+        if direction == "out":
+            return f"{source} = {current}", target
+        if direction == "in":
+            return f"{target} = {current}", source
+        if direction == "both":
+            return (
+                f"({source} = {current} OR {target} = {current})",
+                f"CASE WHEN {source} = {current} THEN {target} ELSE {source} END",
+            )
+        raise ValueError(f"direction must be 'out', 'in', or 'both', got {direction!r}")
+
+    @staticmethod
+    def _graph_filter(
+        edge_filter: Optional[Dict[str, Any]], caller: str
+    ) -> Tuple[str, List[Any]]:
+        if not edge_filter:
+            return "", []
+        translated = translate_query(edge_filter)
+        if translated is None:
+            raise NotImplementedError(
+                f"SQLiteDB.{caller}: edge_filter contains operators that don't "
+                "push down to SQL; fall back to per-hop expansion"
+            )
+        return f" AND ({translated[0]})", list(translated[1])
+
+    async def reachable(
+        self,
+        edge_collection: str,
+        start_id: str,
+        *,
+        direction: str = "out",
+        max_depth: int = 1,
+        edge_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Nodes within ``max_depth`` hops of ``start_id``, in one recursive CTE.
+
+        The recursive arm carries only ``(node_id, depth)`` and uses
+        ``UNION``, so each node enters the walk at most once per depth and
+        dense graphs stay polynomial.
+
+        Args:
+            edge_collection: Collection holding the edge records.
+            start_id: Node id to start from (not included in the result).
+            direction: ``out``, ``in`` or ``both``.
+            max_depth: Maximum number of hops (``>= 1``).
+            edge_filter: Optional Mongo-style query every traversed edge
+                must match.
+
+        Returns:
+            ``[{"node_id": ..., "depth": N}]`` ordered by depth, with each
+            node at its smallest depth.
+
+        Raises:
+            ValueError: Unknown ``direction`` or ``max_depth`` < 1.
+            NotImplementedError: ``edge_filter`` cannot be pushed down.
+        """
+        predicate, step = self._graph_step(direction, "walk.node_id")
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be >= 1, got {max_depth}")
+        filter_sql, filter_params = self._graph_filter(edge_filter, "reachable")
+        await self._ensure_endpoint_indexes(edge_collection)
+        sql = f"""
+        WITH RECURSIVE walk(node_id, depth) AS (
+            SELECT ?, 0
+            UNION
+            SELECT {step}, walk.depth + 1
+            FROM walk JOIN records ON records.collection = ? AND {predicate}
+            WHERE walk.depth < ?{filter_sql}
+        )
+        SELECT node_id, MIN(depth) AS depth FROM walk
+        WHERE node_id IS NOT NULL AND node_id != ?
+        GROUP BY node_id
+        ORDER BY depth, node_id
+        """
+        params = [start_id, edge_collection, int(max_depth), *filter_params, start_id]
+        connection = await self._get_connection()
+        cursor = await connection.execute(sql, tuple(params))
+        rows = await cursor.fetchall()
+        await cursor.close()
+        return [{"node_id": row[0], "depth": int(row[1])} for row in rows]
+
+    async def shortest_path(
+        self,
+        edge_collection: str,
+        source_id: str,
+        target_id: str,
+        *,
+        direction: str = "out",
+        max_depth: int,
+        weight: Optional[str] = None,
+        edge_filter: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Cheapest simple path of at most ``max_depth`` hops, in one query.
+
+        A recursive CTE enumerates simple paths from ``source_id`` (no node
+        repeats) up to ``max_depth`` hops and keeps the cheapest that ends
+        at ``target_id``. The number of paths grows with the branching
+        factor to the power ``max_depth``, so keep ``max_depth`` small;
+        ``GraphContext.shortest_path`` only routes short bounded searches
+        here.
+
+        Args:
+            edge_collection: Collection holding the edge records.
+            source_id: Path start.
+            target_id: Path end.
+            direction: ``out``, ``in`` or ``both``.
+            max_depth: Maximum number of hops (``>= 1``).
+            weight: Dotted edge field holding the cost (e.g.
+                ``"context.distance"``); non-numeric or missing values
+                cost 1. None counts hops.
+            edge_filter: Optional Mongo-style query every traversed edge
+                must match.
+
+        Returns:
+            ``{"node_ids": [...], "edge_ids": [...], "cost": float}`` or
+            None when no path exists within ``max_depth``.
+
+        Raises:
+            ValueError: Unknown ``direction``, ``max_depth`` < 1 or an
+                unsafe ``weight`` path.
+            NotImplementedError: ``edge_filter`` cannot be pushed down.
+        """
+        predicate, step = self._graph_step(direction, "paths.node_id")
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be >= 1, got {max_depth}")
+        if weight is None:
+            cost = "1.0"
+        elif _safe_field_path(weight):
+            cost = (
+                f"CASE WHEN json_type(data, '$.{weight}') IN ('integer', 'real') "
+                f"THEN json_extract(data, '$.{weight}') ELSE 1.0 END"
+            )
+        else:
+            raise ValueError(f"unsafe weight field path: {weight!r}")
+        filter_sql, filter_params = self._graph_filter(edge_filter, "shortest_path")
+        await self._ensure_endpoint_indexes(edge_collection)
+        # Paths are char(31)-delimited id lists; ids never contain it.
+        sql = f"""
+        WITH RECURSIVE paths(node_id, nodes, edges, cost, depth) AS (
+            SELECT ?, char(31) || ? || char(31), char(31), 0.0, 0
+            UNION ALL
+            SELECT {step},
+                   paths.nodes || {step} || char(31),
+                   paths.edges || records.id || char(31),
+                   paths.cost + {cost},
+                   paths.depth + 1
+            FROM paths JOIN records ON records.collection = ? AND {predicate}
+            WHERE paths.depth < ? AND paths.node_id != ?
+              AND instr(paths.nodes, char(31) || {step} || char(31)) = 0{filter_sql}
+        )
+        SELECT nodes, edges, cost FROM paths
+        WHERE node_id = ?
+        ORDER BY cost, depth
+        LIMIT 1
+        """
+        params = [
+            source_id,
+            source_id,
+            edge_collection,
+            int(max_depth),
+            target_id,
+            *filter_params,
+            target_id,
+        ]
+        connection = await self._get_connection()
+        cursor = await connection.execute(sql, tuple(params))
+        row = await cursor.fetchone()
+        await cursor.close()
+        if row is None:
+            return None
+        return {
+            "node_ids": [n for n in row[0].split("\x1f") if n],
+            "edge_ids": [e for e in row[1].split("\x1f") if e],
+            "cost": float(row[2]),
+        }
+
+    # ---- change data capture ----------------------------------------------
+
+    def _require_change_capture(self) -> None:
+        if not self.supports_changes:
+            raise NotImplementedError(
+                "SQLiteDB change capture is off; construct with capture_changes=True"
+            )
+
+    async def change_cursor(self) -> bytes:
+        """Cursor at the newest ``record_changes`` row."""
+        self._require_change_capture()
+        connection = await self._get_connection()
+        cursor = await connection.execute("SELECT MAX(seq) FROM record_changes")
+        row = await cursor.fetchone()
+        await cursor.close()
+        return encode_cursor({"seq": (row[0] if row else None) or 0})
+
+    async def changes(
+        self,
+        collections: Optional[List[str]] = None,
+        *,
+        since: Optional[bytes] = None,
+        follow: bool = True,
+        poll_interval: float = 0.5,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Tail the ``record_changes`` table in ``seq`` order.
+
+        Writers serialize on the database lock, so ``seq`` order is
+        commit order and a cursor never skips a late-committing write.
+        """
+        self._require_change_capture()
+        if since is None:
+            since = await self.change_cursor()
+        decoded = decode_change_cursor(since, "SQLiteDB", "seq") or {"seq": 0}
+
+        sql = (
+            "SELECT seq, collection, id, op, data, ts FROM record_changes WHERE seq > ?"
+        )
+        scope: List[Any] = []
+        if collections:
+            sql += f" AND collection IN ({', '.join('?' for _ in collections)})"
+            scope = list(collections)
+        sql += " ORDER BY seq LIMIT ?"
+
+        async def _fetch(after: int) -> Tuple[int, List[ChangeEvent]]:
+            connection = await self._get_connection()
+            cursor = await connection.execute(sql, (after, *scope, batch_size))
+            rows = list(await cursor.fetchall())
+            await cursor.close()
+            events = [
+                ChangeEvent(
+                    op=row["op"],
+                    collection=row["collection"],
+                    id=row["id"],
+                    document=json.loads(row["data"]) if row["data"] else None,
+                    cursor=encode_cursor({"seq": row["seq"]}),
+                    timestamp=row["ts"],
+                )
+                for row in rows
+            ]
+            return (rows[-1]["seq"] if rows else after), events
+
+        async for event in poll_change_log(
+            _fetch, int(decoded["seq"]), follow=follow, poll_interval=poll_interval
+        ):
+            yield event
+
+    async def prune_changes(self, before: bytes) -> int:
+        """Delete ``record_changes`` rows up to and including ``before``."""
+        self._require_change_capture()
+        decoded = decode_change_cursor(before, "SQLiteDB", "seq")
+        if decoded is None:
+            return 0
+        async with self._lock:
+            connection = await self._get_connection()
+            cursor = await connection.execute(
+                "DELETE FROM record_changes WHERE seq <= ?", (int(decoded["seq"]),)
+            )
+            await connection.commit()
+            return cursor.rowcount or 0
+
     # Context manager helpers for convenience
     async def __aenter__(self) -> "SQLiteDB":
         """Async context manager entry."""
@@ -30,6 +30,22 @@ def _stale_seconds() -> float:
     )
 
 
+def claimable_query(now: Optional[float] = None) -> Dict[str, Any]:
+    """Query clause matching records that :func:`claim_record` can lease.
+
+    A record is claimable when it was never claimed, was released, or its
+    lease expired. Combine with a caller filter to find candidates::
+
+        await db.find(col, {"state": "pending", **claimable_query()})
+    """
+    return {
+        "$or": [
+            {_CLAIM_FIELD: {"$exists": False}},
+            {_CLAIM_UNTIL_FIELD: {"$lt": time.time() if now is None else now}},
+        ]
+    }
+
+
 async def claim_record(
     db: Any,
     collection: str,
@@ -50,13 +66,7 @@ async def claim_record(
     now = time.time()
     stale = stale_seconds if stale_seconds is not None else _stale_seconds()
     token = secrets.token_hex(16)
-    query: Dict[str, Any] = {
-        "_id": record_id,
-        "$or": [
-            {_CLAIM_FIELD: {"$exists": False}},
-            {_CLAIM_UNTIL_FIELD: {"$lt": now}},
-        ],
-    }
+    query: Dict[str, Any] = {"_id": record_id, **claimable_query(now)}
     update = {"$set": {_CLAIM_FIELD: token, _CLAIM_UNTIL_FIELD: now + stale}}
     try:
         doc = await db.find_one_and_update(collection, query, update)
@@ -86,6 +96,33 @@ async def release_claim(
         logger.warning("Failed to release claim %s/%s: %s", collection, record_id, exc)
 
 
+async def complete_claim(
+    db: Any,
+    collection: str,
+    record_id: str,
+    token: str,
+    update: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """Apply ``update`` and release the lease in one write.
+
+    Only succeeds while the token still matches, i.e. the lease did not
+    expire and pass to another worker.
+
+    Returns:
+        ``True`` when the record was updated.
+    """
+    merged: Dict[str, Any] = {k: dict(v) for k, v in (update or {}).items()}
+    merged.setdefault("$unset", {}).update({_CLAIM_FIELD: "", _CLAIM_UNTIL_FIELD: ""})
+    try:
+        doc = await db.find_one_and_update(
+            collection, {"_id": record_id, _CLAIM_FIELD: token}, merged
+        )
+        return doc is not None
+    except Exception as exc:
+        logger.error("Failed to complete claim %s/%s: %s", collection, record_id, exc)
+        return False
+
+
 async def delete_claimed_record(
     db: Any,
     collection: str,
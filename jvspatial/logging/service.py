@@ -536,22 +536,8 @@ class BaseLoggingService:
             for key, value in kwargs.items():
                 query[f"context.log_data.{key}"] = value
 
-            # Find matching logs
-            log_context = GraphContext(database=log_db)
-            matching_logs = await log_context.database.find("object", query)
-
-            # Delete each log
-            deleted_count = 0
-            for log_data in matching_logs:
-                try:
-                    log_id = log_data.get("id")
-                    if log_id:
-                        await log_context.database.delete("object", log_id)
-                        deleted_count += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to delete error log {log_data.get('id')}: {e}"
-                    )
+            # Delete matching logs in one bulk operation
+            deleted_count = await log_db.delete_many("object", query)
 
             return {"deleted": deleted_count}
 
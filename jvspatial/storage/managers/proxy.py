@@ -362,7 +362,7 @@ class URLProxyManager:
 
             # Query for expired or inactive proxies
             ctx = await self.context
-            results = await ctx.database.find(
+            count = await ctx.database.delete_many(
                 "url_proxy",
                 {
                     "$or": [
@@ -372,15 +372,6 @@ class URLProxyManager:
                 },
             )
 
-            count = 0
-            for data in results:
-                try:
-                    # Delete the proxy document
-                    await ctx.database.delete("url_proxy", data["id"])
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Failed to delete proxy {data.get('id')}: {e}")
-
             if count > 0:
                 logger.info(f"Cleaned up {count} expired/inactive proxies")
 
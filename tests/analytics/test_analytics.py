@@ -0,0 +1,178 @@
+"""Graph analytics over CSR snapshots (``jvspatial.analytics``).
+
+Snapshots are loaded from SQLite and JsonDB; the algorithms are checked on
+a small graph with known answers and on hand-built CSR arrays.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jvspatial.analytics import (  # noqa: E402
+    CSRGraph,
+    bfs,
+    degree_centrality,
+    degree_histogram,
+    load_snapshot,
+    pagerank,
+    shortest_paths,
+    strongly_connected_components,
+    top_k,
+    weakly_connected_components,
+    write_back,
+)
+from jvspatial.core.context import GraphContext  # noqa: E402
+from jvspatial.core.entities import Edge, Node  # noqa: E402
+
+
+class Metro(Node):
+    name: str = ""
+    rank: float = 0.0
+
+
+class Kiosk(Node):
+    name: str = ""
+
+
+class Line(Edge):
+    km: float = 1.0
+
+
+class Tram(Edge):
+    pass
+
+
+async def _network(ctx: GraphContext):
+    """Cycle ``a -> b -> c -> a`` (plus ``a -> c``), ``c -> d``, ``e -> f``, ``g``.
+
+    Also ``d -> e`` by ``Tram`` and ``a -> kiosk``.
+    """
+    metros = {n: await Metro.create(name=n) for n in "abcdefg"}
+    for source, target, km in [
+        ("a", "b", 1),
+        ("b", "c", 2),
+        ("a", "c", 5),
+        ("c", "a", 1),
+        ("c", "d", 1),
+        ("e", "f", 1),
+    ]:
+        await metros[source].connect(metros[target], Line, km=km)
+    await metros["d"].connect(metros["e"], Tram)
+    await metros["a"].connect(await Kiosk.create(name="k"))
+    return metros
+
+
+async def _lines(ctx: GraphContext):
+    metros = await _network(ctx)
+    graph = await load_snapshot(nodes=[Metro], edges=["Line"], weight="km")
+    return graph, {n: graph.index_of(m.id) for n, m in metros.items()}
+
+
+class TestSnapshot:
+    async def test_load_filters_and_weights(self, ctx):
+        graph, at = await _lines(ctx)
+        assert (graph.num_nodes, graph.num_edges) == (7, 6)
+        assert graph.offsets.dtype == np.int32 and graph.indices.dtype == np.int32
+        assert sorted(graph.neighbors(at["a"]).tolist()) == sorted([at["b"], at["c"]])
+        assert graph.reverse().neighbors(at["a"]).tolist() == [at["c"]]
+        lo, hi = graph.offsets[at["a"]], graph.offsets[at["a"] + 1]
+        weights = dict(zip(graph.indices[lo:hi].tolist(), graph.weights[lo:hi]))
+        assert weights[at["c"]] == 5.0
+        assert graph.nbytes == 8 * 4 + 6 * 4 + 6 * 8
+
+    async def test_load_everything(self, ctx):
+        await _network(ctx)
+        graph = await load_snapshot(ctx, batch_size=2)
+        assert (graph.num_nodes, graph.num_edges) == (8, 8)
+        assert graph.weights is None
+
+    async def test_write_back(self, ctx):
+        graph, at = await _lines(ctx)
+        ranks = pagerank(graph)
+        assert await write_back(graph, "rank", ranks, batch_size=3) == 7
+        loaded = await Metro.get(graph.ids[at["a"]])
+        assert loaded.rank == pytest.approx(float(ranks[at["a"]]))
+        assert loaded.name == "a" and len(loaded.edge_ids) == 4
+        with pytest.raises(ValueError):
+            await write_back(graph, "rank", ranks[:3])
+
+
+class TestAlgorithms:
+    async def test_bfs(self, ctx):
+        graph, at = await _lines(ctx)
+        depth = bfs(graph, graph.ids[at["a"]])
+        assert [depth[at[n]] for n in "abcdefg"] == [0, 1, 1, 2, -1, -1, -1]
+        assert bfs(graph, [at["a"]], max_depth=1)[at["d"]] == -1
+        upstream = bfs(graph, at["d"], direction="in")
+        assert [upstream[at[n]] for n in "abcd"] == [2, 2, 1, 0]
+
+    async def test_shortest_paths(self, ctx):
+        graph, at = await _lines(ctx)
+        dist, pred = shortest_paths(graph, at["a"])
+        assert [dist[at[n]] for n in "abcd"] == [0, 1, 3, 4]
+        assert np.isinf(dist[at["e"]])
+        assert pred[at["c"]] == at["b"] and pred[at["a"]] == -1
+        hops, hop_pred = shortest_paths(graph, at["a"], weighted=False)
+        assert [hops[at[n]] for n in "abcd"] == [0, 1, 1, 2]
+        assert hop_pred[at["d"]] == at["c"]
+
+    async def test_components(self, ctx):
+        graph, at = await _lines(ctx)
+        weak = weakly_connected_components(graph)
+        assert len({weak[at[n]] for n in "abcd"}) == 1
+        assert weak[at["e"]] == weak[at["f"]] != weak[at["a"]]
+        assert len(np.unique(weak)) == 3
+        strong = strongly_connected_components(graph)
+        assert len({strong[at[n]] for n in "abc"}) == 1
+        assert len(np.unique(strong)) == 5
+        assert strong[at["a"]] == min(at[n] for n in "abc")
+
+    async def test_degrees_and_top_k(self, ctx):
+        graph, at = await _lines(ctx)
+        assert degree_histogram(graph).tolist() == [3, 2, 2]
+        assert degree_histogram(graph, "in").tolist() == [2, 4, 1]
+        best = top_k(graph, degree_centrality(graph), k=2)
+        assert [node_id for node_id, _ in best] == [
+            graph.ids[at["c"]],
+            graph.ids[at["a"]],
+        ]
+        assert best[0][1] == pytest.approx(4 / 6)
+
+
+def _csr(n, pairs, weights=None):
+    ids = [f"n.X.{i}" for i in range(n)]
+    src = np.asarray([s for s, _ in pairs], dtype=np.int32)
+    dst = np.asarray([t for _, t in pairs], dtype=np.int32)
+    w = None if weights is None else np.asarray(weights, dtype=np.float64)
+    return CSRGraph.from_edges(ids, src, dst, w)
+
+
+def test_pagerank_known_values():
+    cycle = _csr(3, [(0, 1), (1, 2), (2, 0)])
+    assert pagerank(cycle) == pytest.approx([1 / 3] * 3)
+    star = _csr(4, [(1, 0), (2, 0), (3, 0)])
+    ranks = pagerank(star, tol=1e-12)
+    assert ranks.sum() == pytest.approx(1.0)
+    assert ranks[0] > ranks[1] == pytest.approx(ranks[2])
+    skewed = _csr(3, [(0, 1), (0, 2), (1, 0), (2, 0)], weights=[9, 1, 1, 1])
+    weighted = pagerank(skewed, weighted=True)
+    assert weighted[1] > weighted[2]
+
+
+def test_components_on_long_chain():
+    n = 2000
+    chain = _csr(n, [(i + 1, i) for i in range(n - 1)])
+    assert set(weakly_connected_components(chain).tolist()) == {0}
+    ring = _csr(n, [(i, (i + 1) % n) for i in range(n)])
+    assert set(strongly_connected_components(ring).tolist()) == {0}
+
+
+def test_undirected_view_and_empty_graph():
+    graph = _csr(3, [(0, 1), (1, 1)])
+    both = graph.undirected()
+    assert sorted(both.neighbors(1).tolist()) == [0, 1]
+    assert bfs(graph, 2, direction="both").tolist() == [-1, -1, 0]
+    empty = _csr(0, [])
+    assert pagerank(empty).size == 0
+    assert weakly_connected_components(empty).size == 0
+    assert top_k(empty, np.zeros(0)) == []
@@ -1,15 +1,22 @@
 """Tests for WalkerExecutor component."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 
 from jvspatial.api.endpoints.router import EndpointRouter
 from jvspatial.api.endpoints.walker_executor import (
     DirectExecutionWalker,
     WalkerExecutor,
 )
+from jvspatial.core import on_visit
+from jvspatial.core.context import GraphContext, set_default_context
 from jvspatial.core.entities import Node, Walker
+from jvspatial.db.sqlite import SQLiteDB
 
 
 class MockDirectExecutionWalker(Walker):
@@ -196,3 +203,113 @@ class TestWalkerExecutor:
                 await executor.execute_walker(walker, walker_cls, None)
 
             executor.router.raise_error.assert_called_once()
+
+
+class Lighthouse(Node):
+    """Node for streaming tests."""
+
+    name: str = ""
+
+
+class KeeperWalker(Walker):
+    """Traversal walker that reports each node and follows its edges."""
+
+    label: str = ""
+
+    @on_visit(Lighthouse)
+    async def log(self, here):
+        if here.name == "bad":
+            await self.report({"error": "dark", "name": here.name})
+        else:
+            await self.report({"name": here.name})
+        await self.visit(await here.nodes())
+
+
+class TestWalkerStreaming:
+    """Traversal walkers registered with ``stream="ndjson"`` / ``"sse"``."""
+
+    @pytest.fixture
+    async def chain(self):
+        db = SQLiteDB(db_path=":memory:")
+        set_default_context(GraphContext(database=db))
+        try:
+            nodes = [await Lighthouse.create(name=n) for n in ("a", "bad", "c")]
+            for left, right in zip(nodes, nodes[1:]):
+                await left.connect(right)
+            yield nodes
+        finally:
+            await db.close()
+
+    @staticmethod
+    async def _body(response) -> str:
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    def test_endpoint_rejects_unknown_stream_format(self):
+        from jvspatial.api import endpoint
+
+        with pytest.raises(ValueError):
+            endpoint("/keeper", stream="xml")
+
+    async def test_ndjson_lines_per_report(self, chain):
+        executor = WalkerExecutor(EndpointRouter())
+        KeeperWalker._jvspatial_endpoint_config = {"stream": "ndjson"}
+        response = await executor.execute_walker(
+            KeeperWalker(), KeeperWalker, chain[0].id
+        )
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/x-ndjson"
+        lines = (await self._body(response)).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"name": "a"},
+            {"error": "dark", "name": "bad"},
+            {"name": "c"},
+        ]
+
+    async def test_sse_events_mark_errors_and_end(self, chain):
+        executor = WalkerExecutor(EndpointRouter())
+        KeeperWalker._jvspatial_endpoint_config = {"stream": "sse"}
+        response = await executor.execute_walker(
+            KeeperWalker(), KeeperWalker, chain[0].id
+        )
+        assert response.headers["x-accel-buffering"] == "no"
+        events = (await self._body(response)).strip().split("\n\n")
+        assert events == [
+            'data: {"name": "a"}',
+            'event: error\ndata: {"error": "dark", "name": "bad"}',
+            'data: {"name": "c"}',
+            "event: end\ndata: {}",
+        ]
+
+    async def test_first_item_before_traversal_ends(self, chain):
+        executor = WalkerExecutor(EndpointRouter())
+        KeeperWalker._jvspatial_endpoint_config = {"stream": "ndjson"}
+        walker = KeeperWalker()
+        response = await executor.execute_walker(walker, KeeperWalker, chain[0].id)
+        body = response.body_iterator
+        assert json.loads(await body.__anext__()) == {"name": "a"}
+        assert walker.get_trail_length() < len(chain)
+        await body.aclose()
+
+    async def test_missing_start_node_is_404_before_streaming(self, chain):
+        executor = WalkerExecutor(EndpointRouter())
+        KeeperWalker._jvspatial_endpoint_config = {"stream": "ndjson"}
+        with pytest.raises(HTTPException) as info:
+            await executor.execute_walker(
+                KeeperWalker(), KeeperWalker, "n.Lighthouse.missing"
+            )
+        assert info.value.status_code == 404
+
+    async def test_routed_endpoint_streams(self, chain):
+        router = EndpointRouter()
+        KeeperWalker._jvspatial_endpoint_config = {"stream": "ndjson"}
+        router.endpoint("/keeper", methods=["POST"])(KeeperWalker)
+        app = FastAPI()
+        app.include_router(router.router)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.post("/keeper", json={"start_node": chain[0].id})
+        assert response.status_code == 200, response.text
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert len(response.text.splitlines()) == 3
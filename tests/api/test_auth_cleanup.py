@@ -41,12 +41,12 @@ class TestTokenCleanupService:
             return_value=[{"id": "entry1", "expires_at": expired_time}]
         )
         cleanup_service.context._deserialize_entity = AsyncMock(return_value=mock_entry)
-        cleanup_service.context.delete = AsyncMock()
+        cleanup_service.context.delete_batch = AsyncMock()
 
         removed_count = await cleanup_service.cleanup_expired_blacklist_entries()
 
         assert removed_count == 1
-        cleanup_service.context.delete.assert_called_once_with(mock_entry)
+        cleanup_service.context.delete_batch.assert_called_once_with([mock_entry])
 
     @pytest.mark.asyncio
     async def test_cleanup_expired_blacklist_entries_none_expired(
@@ -78,12 +78,12 @@ class TestTokenCleanupService:
             return_value=[{"id": "token1", "expires_at": expired_time}]
         )
         cleanup_service.context._deserialize_entity = AsyncMock(return_value=mock_token)
-        cleanup_service.context.delete = AsyncMock()
+        cleanup_service.context.delete_batch = AsyncMock()
 
         removed_count = await cleanup_service.cleanup_expired_refresh_tokens()
 
         assert removed_count == 1
-        cleanup_service.context.delete.assert_called_once_with(mock_token)
+        cleanup_service.context.delete_batch.assert_called_once_with([mock_token])
 
     @pytest.mark.asyncio
     async def test_cleanup_expired_refresh_tokens_none_expired(self, cleanup_service):
@@ -8,6 +8,10 @@ from typing import Any, Protocol
 class _GraphDb(Protocol):
     async def save(self, collection: str, data: dict[str, Any]) -> dict[str, Any]: ...
 
+    async def bulk_save(
+        self, collection: str, records: list[dict[str, Any]]
+    ) -> int: ...
+
 
 async def seed_chain_graph(db: _GraphDb, *, length: int = 50) -> str:
     """Linear chain n.0 -> n.1 -> ... -> n.(length-1). Returns root id."""
@@ -36,3 +40,107 @@ async def seed_chain_graph(db: _GraphDb, *, length: int = 50) -> str:
             },
         )
     return "n.0"
+
+
+async def seed_tree_graph(db: _GraphDb, *, fanout: int = 10, depth: int = 2) -> str:
+    """Balanced tree with bidirectional edges (UI-style ``n.<Entity>.<id>`` ids).
+
+    ``fanout=10, depth=2`` gives 111 nodes and 110 edges. Written with
+    ``bulk_save`` so seeding stays cheap relative to the measured work.
+    Returns the root id.
+    """
+    nodes: dict[str, dict[str, Any]] = {}
+    edges: list[dict[str, Any]] = []
+
+    def _add(nid: str, level: int) -> None:
+        nodes[nid] = {
+            "id": nid,
+            "entity": f"L{level}",
+            "context": {"level": level},
+            "edges": [],
+        }
+
+    root = "n.Root.root"
+    _add(root, 0)
+    frontier = [root]
+    for level in range(1, depth + 1):
+        nxt: list[str] = []
+        for parent in frontier:
+            for k in range(fanout):
+                child = f"n.L{level}.{parent.rsplit('.', 1)[-1]}_{k}"
+                _add(child, level)
+                eid = f"e.Edge.{len(edges)}"
+                edges.append(
+                    {
+                        "id": eid,
+                        "entity": "Edge",
+                        "context": {},
+                        "source": parent,
+                        "target": child,
+                        "bidirectional": True,
+                    }
+                )
+                nodes[parent]["edges"].append(eid)
+                nodes[child]["edges"].append(eid)
+                nxt.append(child)
+        frontier = nxt
+    await db.bulk_save("node", list(nodes.values()))
+    await db.bulk_save("edge", edges)
+    return root
+
+
+async def seed_grid_graph(
+    db: _GraphDb,
+    *,
+    rows: int = 30,
+    cols: int = 30,
+    node_entity: str = "GridCell",
+    edge_entity: str = "GridLink",
+    seed: int = 11,
+) -> tuple[str, str]:
+    """``rows x cols`` grid with directed edges to all four neighbors.
+
+    Each edge stores a deterministic pseudo-random ``context.distance`` in
+    ``[1, 10)``, so weighted and hop-count shortest paths differ. Returns
+    the ids of the top-left and bottom-right cells.
+    """
+    import random
+
+    rand = random.Random(seed)
+
+    def _nid(r: int, c: int) -> str:
+        return f"n.{node_entity}.{r}_{c}"
+
+    nodes = {
+        _nid(r, c): {
+            "id": _nid(r, c),
+            "entity": node_entity,
+            "context": {"row": r, "col": c},
+            "edges": [],
+        }
+        for r in range(rows)
+        for c in range(cols)
+    }
+    edges: list[dict[str, Any]] = []
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                if not (0 <= r + dr < rows and 0 <= c + dc < cols):
+                    continue
+                source, target = _nid(r, c), _nid(r + dr, c + dc)
+                eid = f"e.{edge_entity}.{len(edges)}"
+                edges.append(
+                    {
+                        "id": eid,
+                        "entity": edge_entity,
+                        "context": {"distance": round(rand.uniform(1, 10), 2)},
+                        "source": source,
+                        "target": target,
+                        "bidirectional": False,
+                    }
+                )
+                nodes[source]["edges"].append(eid)
+                nodes[target]["edges"].append(eid)
+    await db.bulk_save("node", list(nodes.values()))
+    await db.bulk_save("edge", edges)
+    return _nid(0, 0), _nid(rows - 1, cols - 1)
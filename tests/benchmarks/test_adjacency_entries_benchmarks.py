@@ -0,0 +1,57 @@
+"""``nodes()`` / ``count_neighbors()`` on a 300-neighbor hub, with and without
+typed adjacency entries.
+
+Each round builds the hub with ``create_and_connect_many`` and then runs 20
+traversals. Without entries every traversal queries the edge collection;
+with ``__adjacency_entries__`` the neighbor ids come from the hub document
+(and neighbor nodes from the entity cache).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_FAN_OUT = 300
+_ROUNDS = 20
+
+
+class EdgeQueryHub(Node):
+    name: str = ""
+
+
+class EntryHub(Node):
+    __adjacency_entries__ = True
+    name: str = ""
+
+
+async def _traverse(hub_class: type) -> None:
+    db = SQLiteDB(db_path=":memory:")
+    ctx = GraphContext(database=db)
+    set_default_context(ctx)
+    try:
+        hub = hub_class(name="hub")
+        leaves = [hub_class(name=f"l{i}") for i in range(_FAN_OUT)]
+        await ctx.create_and_connect_many([hub, *leaves], [(hub, x) for x in leaves])
+        for _ in range(_ROUNDS):
+            assert len(await hub.nodes()) == _FAN_OUT
+            assert await hub.count_neighbors() == _FAN_OUT
+    finally:
+        await db.close()
+
+
+def test_bench_nodes_via_edge_queries(benchmark):
+    benchmark.pedantic(
+        run_async, args=(_traverse, EdgeQueryHub), rounds=3, iterations=1
+    )
+
+
+def test_bench_nodes_via_adjacency_entries(benchmark):
+    benchmark.pedantic(run_async, args=(_traverse, EntryHub), rounds=3, iterations=1)
@@ -0,0 +1,94 @@
+"""CSR analytics: snapshot loading and the kernels on a synthetic graph.
+
+``load_snapshot`` streams a 2,000-node / 6,000-edge SQLite graph through
+``find_iter``. The kernel benchmarks run on a random 100,000-node,
+1,000,000-edge CSR graph built in memory, where the arrays take about 4 MB.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jvspatial.analytics import (  # noqa: E402
+    CSRGraph,
+    bfs,
+    load_snapshot,
+    pagerank,
+    strongly_connected_components,
+    weakly_connected_components,
+)
+from jvspatial.core.context import GraphContext, set_default_context  # noqa: E402
+from jvspatial.core.entities import Node  # noqa: E402
+from jvspatial.db.sqlite import SQLiteDB  # noqa: E402
+
+from .conftest import run_async  # noqa: E402
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 100_000
+_EDGES = 1_000_000
+
+
+class AnalyticsCell(Node):
+    name: str = ""
+
+
+def _random_graph() -> CSRGraph:
+    rng = np.random.default_rng(7)
+    ids = [f"n.AnalyticsCell.{i}" for i in range(_NODES)]
+    sources = rng.integers(0, _NODES, _EDGES, dtype=np.int32)
+    targets = rng.integers(0, _NODES, _EDGES, dtype=np.int32)
+    return CSRGraph.from_edges(ids, sources, targets)
+
+
+@pytest.fixture(scope="module")
+def graph() -> CSRGraph:
+    built = _random_graph()
+    assert built.nbytes < 5 * 1024 * 1024
+    return built
+
+
+async def _load() -> None:
+    db = SQLiteDB(db_path=":memory:")
+    ctx = GraphContext(database=db)
+    set_default_context(ctx)
+    try:
+        cells = [AnalyticsCell(name=str(i)) for i in range(2000)]
+        rand = random.Random(3)
+        pairs = [
+            (cells[i], cells[rand.randrange(2000)]) for i in range(2000) for _ in "abc"
+        ]
+        await ctx.create_and_connect_many(cells, pairs)
+        snapshot = await load_snapshot(ctx)
+        assert snapshot.num_nodes == 2000
+    finally:
+        await db.close()
+
+
+def test_bench_load_snapshot(benchmark):
+    benchmark.pedantic(run_async, args=(_load,), rounds=3, iterations=1)
+
+
+def test_bench_pagerank(benchmark, graph):
+    ranks = benchmark.pedantic(pagerank, args=(graph,), rounds=3, iterations=1)
+    assert ranks.sum() == pytest.approx(1.0)
+
+
+def test_bench_bfs(benchmark, graph):
+    benchmark.pedantic(bfs, args=(graph, 0), rounds=3, iterations=1)
+
+
+def test_bench_weakly_connected_components(benchmark, graph):
+    benchmark.pedantic(
+        weakly_connected_components, args=(graph,), rounds=3, iterations=1
+    )
+
+
+def test_bench_strongly_connected_components(benchmark, graph):
+    benchmark.pedantic(
+        strongly_connected_components, args=(graph,), rounds=1, iterations=1
+    )
@@ -0,0 +1,51 @@
+"""Cascade ``Node.delete`` on a 3-level, 357-node tree.
+
+The tree is built with ``create_and_connect_many`` inside the measured
+region (each round needs a fresh graph); the delete itself costs one edge
+query per BFS level plus one ``delete_many`` per collection.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_FAN_OUT = (4, 8, 10)
+
+
+class TreeNode(Node):
+    name: str = ""
+
+
+async def _build_and_delete() -> None:
+    db = SQLiteDB(db_path=":memory:")
+    ctx = GraphContext(database=db)
+    set_default_context(ctx)
+    try:
+        root = TreeNode(name="root")
+        nodes, pairs, level = [root], [], [root]
+        for fan_out in _FAN_OUT:
+            nxt = []
+            for parent in level:
+                for i in range(fan_out):
+                    child = TreeNode(name=f"{parent.name}.{i}")
+                    pairs.append((parent, child))
+                    nxt.append(child)
+            nodes.extend(nxt)
+            level = nxt
+        await ctx.create_and_connect_many(nodes, pairs)
+        await root.delete()
+        assert await db.count("node") == 0
+    finally:
+        await db.close()
+
+
+def test_bench_cascade_delete_tree(benchmark):
+    benchmark.pedantic(run_async, args=(_build_and_delete,), rounds=3, iterations=1)
@@ -0,0 +1,55 @@
+"""``count_neighbors()`` on a 300-neighbor hub, with and without degree
+counters.
+
+Each round builds the hub with ``create_and_connect_many`` and then counts
+20 times with an entity filter. Without counters every count is a
+``$regex`` count over the edge collection; with ``__degree_counters__``
+it is a lookup in the hub's counters.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_FAN_OUT = 300
+_ROUNDS = 20
+
+
+class RegexHub(Node):
+    name: str = ""
+
+
+class CountedHub(Node):
+    __degree_counters__ = True
+    name: str = ""
+
+
+async def _count(hub_class: type) -> None:
+    db = SQLiteDB(db_path=":memory:")
+    ctx = GraphContext(database=db)
+    set_default_context(ctx)
+    try:
+        hub = hub_class(name="hub")
+        leaves = [hub_class(name=f"l{i}") for i in range(_FAN_OUT)]
+        await ctx.create_and_connect_many([hub, *leaves], [(hub, x) for x in leaves])
+        for _ in range(_ROUNDS):
+            assert await hub.count_neighbors(node=hub_class) == _FAN_OUT
+            assert await hub.count_neighbors(direction="in") == 0
+    finally:
+        await db.close()
+
+
+def test_bench_count_via_edge_queries(benchmark):
+    benchmark.pedantic(run_async, args=(_count, RegexHub), rounds=3, iterations=1)
+
+
+def test_bench_count_via_degree_counters(benchmark):
+    benchmark.pedantic(run_async, args=(_count, CountedHub), rounds=3, iterations=1)
@@ -0,0 +1,78 @@
+"""Three-hop expansion of a 4-ary tree (84 nodes), per-node BFS versus
+``expand_frontier``.
+
+Each round builds the tree with ``create_and_connect_many``, drops the
+entity cache and expands the root three hops. The per-node BFS calls
+``nodes()`` on every frontier node (one edge query and one node fetch per
+node); ``expand_frontier`` issues one edge query and one node batch fetch
+per hop.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_FAN_OUT = 4
+_DEPTH = 3
+
+
+class FrontierCell(Node):
+    name: str = ""
+
+
+async def _build(ctx: GraphContext) -> FrontierCell:
+    root = FrontierCell(name="root")
+    nodes, pairs, level = [root], [], [root]
+    for depth in range(_DEPTH):
+        children = []
+        for parent in level:
+            for i in range(_FAN_OUT):
+                child = FrontierCell(name=f"{parent.name}.{i}")
+                children.append(child)
+                pairs.append((parent, child))
+        nodes.extend(children)
+        level = children
+    await ctx.create_and_connect_many(nodes, pairs)
+    await ctx.clear_cache()
+    return root
+
+
+async def _expand(mode: str) -> None:
+    db = SQLiteDB(db_path=":memory:")
+    ctx = GraphContext(database=db)
+    set_default_context(ctx)
+    try:
+        root = await _build(ctx)
+        if mode == "frontier":
+            rows = await ctx.expand_frontier([root.id], _DEPTH)
+            reached = len(rows)
+        else:
+            seen, frontier = {root.id}, [await FrontierCell.get(root.id)]
+            for _ in range(_DEPTH):
+                nxt = []
+                for node in frontier:
+                    for peer in await node.nodes():
+                        if peer.id not in seen:
+                            seen.add(peer.id)
+                            nxt.append(peer)
+                frontier = nxt
+            reached = len(seen) - 1
+        assert reached == _FAN_OUT + _FAN_OUT**2 + _FAN_OUT**3
+    finally:
+        await db.close()
+
+
+def test_bench_per_node_bfs(benchmark):
+    benchmark.pedantic(run_async, args=(_expand, "per-node"), rounds=3, iterations=1)
+
+
+def test_bench_expand_frontier(benchmark):
+    benchmark.pedantic(run_async, args=(_expand, "frontier"), rounds=3, iterations=1)
@@ -0,0 +1,81 @@
+"""Graph-UI expansion benchmarks: ``subgraph_bfs`` and ``expand_node``.
+
+Both run level-synchronous ``find_many`` batches, so cost should track
+the number of BFS levels rather than the number of vertices and edges.
+The Postgres variants skip unless ``JVSPATIAL_POSTGRES_TEST_DSN`` points
+at a reachable server.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+
+import pytest
+
+from jvspatial.core.context import GraphContext
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+from .graph_fixtures import seed_tree_graph
+
+pytestmark = pytest.mark.benchmark
+
+_PG_DSN = os.getenv("JVSPATIAL_POSTGRES_TEST_DSN")
+
+
+def _backends():
+    yield "sqlite"
+    yield pytest.param(
+        "postgres",
+        marks=pytest.mark.skipif(
+            not _PG_DSN, reason="JVSPATIAL_POSTGRES_TEST_DSN not set"
+        ),
+    )
+
+
+async def _with_db(backend: str, work):
+    if backend == "sqlite":
+        db = SQLiteDB(db_path=":memory:")
+    else:
+        from jvspatial.db.postgres import PostgresDB
+
+        db = PostgresDB(dsn=_PG_DSN, schema_name=f"bench_{uuid.uuid4().hex[:12]}")
+    try:
+        return await work(GraphContext(database=db))
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize("backend", list(_backends()))
+def test_bench_subgraph_bfs_depth2(benchmark, backend):
+    """111-node, depth-2 subgraph (the default jvgraph-ui load)."""
+
+    async def _run():
+        async def work(ctx: GraphContext):
+            root = await seed_tree_graph(ctx.database, fanout=10, depth=2)
+            for _ in range(5):
+                sub = await ctx.subgraph_bfs(root, max_depth=2, max_nodes=200)
+            assert sub["meta"]["node_count"] == 111
+            assert sub["meta"]["round_trips"]["total"] == 5
+
+        await _with_db(backend, work)
+
+    benchmark(run_async, _run)
+
+
+@pytest.mark.parametrize("backend", list(_backends()))
+def test_bench_expand_node_hub(benchmark, backend):
+    """One page of 100 edges off a 100-child hub."""
+
+    async def _run():
+        async def work(ctx: GraphContext):
+            root = await seed_tree_graph(ctx.database, fanout=100, depth=1)
+            for _ in range(10):
+                out = await ctx.expand_node(root, limit=100)
+            assert len(out["edges"]) == 100
+            assert out["meta"]["round_trips"]["total"] == 3
+
+        await _with_db(backend, work)
+
+    benchmark(run_async, _run)
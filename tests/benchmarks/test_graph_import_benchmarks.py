@@ -0,0 +1,64 @@
+"""Bulk graph import: ``connect_many`` versus a ``Node.connect`` loop.
+
+Both benches build the same 200-node, 600-edge graph. The ``connect``
+loop pays two duplicate lookups, an edge write and two edge-list updates
+per edge; the batched path pays a handful of round trips per 500 edges.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 200
+_EDGES = 600
+
+
+class ImportCity(Node):
+    name: str = ""
+
+
+def _pairs() -> list[tuple[int, int]]:
+    rng = random.Random(7)
+    pairs: set[tuple[int, int]] = set()
+    while len(pairs) < _EDGES:
+        a, b = rng.randrange(_NODES), rng.randrange(_NODES)
+        if a != b:
+            pairs.add((a, b))
+    return sorted(pairs)
+
+
+async def _import(bulk: bool) -> None:
+    db = SQLiteDB(db_path=":memory:")
+    ctx = GraphContext(database=db)
+    set_default_context(ctx)
+    try:
+        nodes = [ImportCity(name=f"c{i}") for i in range(_NODES)]
+        pairs = [(nodes[a], nodes[b]) for a, b in _pairs()]
+        if bulk:
+            await ctx.create_and_connect_many(nodes, pairs)
+        else:
+            for node in nodes:
+                await node.save()
+            for a, b in pairs:
+                await a.connect(b)
+        assert await db.count("edge") == _EDGES
+    finally:
+        await db.close()
+
+
+def test_bench_connect_loop(benchmark):
+    benchmark.pedantic(run_async, args=(_import, False), rounds=3, iterations=1)
+
+
+def test_bench_create_and_connect_many(benchmark):
+    benchmark.pedantic(run_async, args=(_import, True), rounds=3, iterations=1)
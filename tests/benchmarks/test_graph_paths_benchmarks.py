@@ -0,0 +1,116 @@
+"""Shortest paths and k-hop reachability on a synthetic weighted grid.
+
+``seed_grid_graph`` builds a 30x30 grid (900 nodes, 3,480 directed edges,
+``context.distance`` in ``[1, 10)``). Corner-to-corner searches run in
+process over batched edge queries: bidirectional BFS when unweighted,
+bidirectional Dijkstra when weighted, A* with a Manhattan heuristic. The
+bounded search and ``reachable`` run as one recursive CTE. The Postgres
+variants skip unless ``JVSPATIAL_POSTGRES_TEST_DSN`` points at a
+reachable server.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+
+import pytest
+
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Edge, Node
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+from .graph_fixtures import seed_grid_graph
+
+pytestmark = pytest.mark.benchmark
+
+_PG_DSN = os.getenv("JVSPATIAL_POSTGRES_TEST_DSN")
+_SIZE = 30
+
+
+class GridCell(Node):
+    row: int = 0
+    col: int = 0
+
+
+class GridLink(Edge):
+    distance: float = 1.0
+
+
+def _backends():
+    yield "sqlite"
+    yield pytest.param(
+        "postgres",
+        marks=pytest.mark.skipif(
+            not _PG_DSN, reason="JVSPATIAL_POSTGRES_TEST_DSN not set"
+        ),
+    )
+
+
+def _manhattan(node: GridCell, goal: GridCell) -> float:
+    # Every edge costs at least 1, so grid distance never overestimates.
+    return float(abs(goal.row - node.row) + abs(goal.col - node.col))
+
+
+async def _with_grid(backend: str, work):
+    if backend == "sqlite":
+        db = SQLiteDB(db_path=":memory:")
+    else:
+        from jvspatial.db.postgres import PostgresDB
+
+        db = PostgresDB(dsn=_PG_DSN, schema_name=f"bench_{uuid.uuid4().hex[:12]}")
+    try:
+        ctx = GraphContext(database=db)
+        set_default_context(ctx)
+        corner, far = await seed_grid_graph(db, rows=_SIZE, cols=_SIZE)
+        return await work(ctx, corner, far)
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize("backend", list(_backends()))
+@pytest.mark.parametrize("mode", ["hops", "dijkstra", "astar"])
+def test_bench_shortest_path_corner_to_corner(benchmark, backend, mode):
+    async def _run():
+        async def work(ctx: GraphContext, corner: str, far: str):
+            path = await ctx.shortest_path(
+                corner,
+                far,
+                weight=None if mode == "hops" else "context.distance",
+                heuristic=_manhattan if mode == "astar" else None,
+            )
+            assert path.node_ids[0] == corner and path.node_ids[-1] == far
+            assert path.hops >= 2 * (_SIZE - 1)
+
+        await _with_grid(backend, work)
+
+    benchmark.pedantic(run_async, args=(_run,), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("backend", list(_backends()))
+def test_bench_bounded_shortest_path_cte(benchmark, backend):
+    """Cheapest path of at most 6 edges between cells 3 rows and cols apart."""
+
+    async def _run():
+        async def work(ctx: GraphContext, corner: str, far: str):
+            path = await ctx.shortest_path(
+                corner, "n.GridCell.3_3", weight="context.distance", max_depth=6
+            )
+            assert path.hops == 6
+
+        await _with_grid(backend, work)
+
+    benchmark.pedantic(run_async, args=(_run,), rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("backend", list(_backends()))
+def test_bench_reachable_depth_10(benchmark, backend):
+    async def _run():
+        async def work(ctx: GraphContext, corner: str, far: str):
+            hops = await ctx.reachable(corner, 10)
+            assert len(hops) == 65
+
+        await _with_grid(backend, work)
+
+    benchmark.pedantic(run_async, args=(_run,), rounds=3, iterations=1)
@@ -0,0 +1,99 @@
+"""CPU-heavy visit hooks inline, in the thread pool and in the process pool.
+
+A walker visits 32 in-memory nodes with ``concurrency=8``; each visit runs
+about 20 ms of pure-Python arithmetic. A ticker task on the same event
+loop records the worst gap between 1 ms sleeps, which is the stall every
+other request on that loop would see. Inline hooks block the loop for the
+whole hook. The thread pool roughly halves the stall (the GIL still
+interleaves); the process pool keeps it near the tick interval and also
+runs hooks in parallel when cores are available. The worst stall is in
+``extra_info``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.core.entities.walker_components.hook_offload import (
+    configure_hook_pools,
+)
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 32
+_WORK = 200_000
+
+
+class CrunchCell(Node):
+    total: int = 0
+
+
+def _crunch(record):
+    return {"total": sum(i * i for i in range(_WORK)) % 1000 + 1}
+
+
+class InlineCruncher(Walker):
+    @on_visit(CrunchCell, parallel_safe=True)
+    async def crunch(self, here):
+        here.total = _crunch({})["total"]
+
+
+class ThreadCruncher(Walker):
+    @on_visit(CrunchCell, executor="thread")
+    def crunch(record):
+        return _crunch(record)
+
+
+class ProcessCruncher(Walker):
+    @on_visit(CrunchCell, executor="process")
+    def crunch(record):
+        return _crunch(record)
+
+
+_WALKERS = {
+    "inline": InlineCruncher,
+    "thread": ThreadCruncher,
+    "process": ProcessCruncher,
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def pools():
+    pools = configure_hook_pools(thread_workers=4, process_workers=4)
+    yield pools
+    pools.shutdown()
+
+
+async def _walk(mode: str) -> float:
+    walker = _WALKERS[mode](concurrency=8)
+    cells = [CrunchCell() for _ in range(_NODES)]
+    await walker.queue.append(cells)
+    worst = 0.0
+    done = False
+
+    async def _ticker() -> None:
+        nonlocal worst
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - before)
+
+    ticker = asyncio.create_task(_ticker())
+    await walker.run()
+    done = True
+    await ticker
+    assert all(cell.total for cell in cells)
+    return worst
+
+
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+def test_bench_cpu_heavy_hooks(benchmark, mode):
+    worst = benchmark.pedantic(run_async, args=(_walk, mode), rounds=3, iterations=1)
+    benchmark.extra_info["worst_loop_stall_ms"] = round(worst * 1000, 1)
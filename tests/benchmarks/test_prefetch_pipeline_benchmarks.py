@@ -0,0 +1,83 @@
+"""Adjacency prefetch: per-hook queries vs speculative vs pipelined prefetch.
+
+Walks a three-level tree with fan-out 6 (259 nodes) on in-memory SQLite
+behind a 2 ms round trip per query, standing in for a networked store.
+Each hook waits 1 ms and then asks for its node's outgoing neighbors, so
+without prefetch every visit pays hook time plus a round trip; the
+pipeline loads upcoming frontier batches while hooks run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node, Walker
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_FANOUT = 6
+_NODES = 1 + _FANOUT + _FANOUT**2 + _FANOUT**3
+_ROUND_TRIP = 0.002
+
+_MODES = {
+    "off": {},
+    "speculative": {"speculative_prefetch": True},
+    "pipeline": {"prefetch_pipeline": True},
+}
+
+
+class RemoteSQLiteDB(SQLiteDB):
+    """SQLite with a fixed delay per read once ``remote`` is set."""
+
+    remote = False
+
+    async def find(self, *args, **kwargs):
+        if self.remote:
+            await asyncio.sleep(_ROUND_TRIP)
+        return await super().find(*args, **kwargs)
+
+
+class Mesh(Node):
+    pass
+
+
+class Lineman(Walker):
+    @on_visit(Mesh)
+    async def inspect(self, here):
+        await asyncio.sleep(0.001)
+        await self.visit(await here.nodes())
+
+
+async def _walk(mode: str) -> None:
+    db = RemoteSQLiteDB(db_path=":memory:")
+    context = GraphContext(database=db)
+    set_default_context(context)
+    try:
+        root = await context.create(Mesh)
+        level = [root]
+        for _ in range(3):
+            children = []
+            for parent in level:
+                for _ in range(_FANOUT):
+                    child = await context.create(Mesh)
+                    await parent.connect(child)
+                    children.append(child)
+            level = children
+        db.remote = True
+        walker = Lineman(frontier_batch_size=6, **_MODES[mode])
+        await walker.spawn(root)
+        assert walker.get_trail_length() == _NODES
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize("mode", list(_MODES))
+def test_bench_prefetch_pipeline(benchmark, mode):
+    benchmark.pedantic(run_async, args=(_walk, mode), rounds=3, iterations=1)
@@ -0,0 +1,64 @@
+"""Best-first traversal: heap-backed queue vs re-sorting a FIFO queue.
+
+A walker expands 2000 in-memory nodes, each queueing three children with
+pseudo-random costs, and must always visit the cheapest queued node next.
+``Walker(queue="priority")`` pushes and pops in O(log n); the baseline is
+what best-first code had to do before, re-sorting the whole queue through
+``get_queue`` / ``clear_queue`` / ``append`` after every expansion.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_VISITS = 2000
+_FANOUT = 3
+
+
+class Frontier(Node):
+    cost: float = 0.0
+
+
+class BestFirst(Walker):
+    visited: int = 0
+    resort: bool = False
+
+    @on_visit(Frontier)
+    async def expand(self, here):
+        self.visited += 1
+        if self.visited >= _VISITS:
+            await self.disengage()
+            return
+        rng = random.Random(self.visited)
+        children = [Frontier(cost=here.cost + rng.random()) for _ in range(_FANOUT)]
+        await self.visit(children)
+        if self.resort:
+            queued = await self.get_queue()
+            await self.clear_queue()
+            await self.append(sorted(queued, key=lambda n: n.cost))
+
+
+async def _walk(mode: str) -> None:
+    if mode == "priority":
+        walker = BestFirst(
+            queue="priority", queue_key=lambda n: n.cost, max_queue_size=0
+        )
+    else:
+        walker = BestFirst(resort=True, max_queue_size=0)
+    await walker.visit(Frontier())
+    await walker.run()
+    assert walker.visited == _VISITS
+
+
+@pytest.mark.parametrize("mode", ["resort", "priority"])
+def test_bench_best_first(benchmark, mode):
+    benchmark.pedantic(run_async, args=(_walk, mode), rounds=3, iterations=1)
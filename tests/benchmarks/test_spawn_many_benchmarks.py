@@ -0,0 +1,93 @@
+"""Many short walkers: sequential ``spawn()`` vs ``Walker.spawn_many``.
+
+Runs 32 walkers, each starting at one of the 8 children of a root with
+fan-out 8 and walking two levels down, so every subtree is walked by four
+walkers. SQLite sits behind a 2 ms round trip per read and the process
+cache is off, standing in for API workers that share no cache. Sequential
+spawning pays every read; ``spawn_many`` overlaps eight walkers and reads
+each node once per batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from jvspatial.cache.memory import MemoryCache
+from jvspatial.core import on_visit
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Node, Walker
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_FANOUT = 8
+_WALKERS = 32
+_ROUND_TRIP = 0.002
+
+
+class RemoteSQLiteDB(SQLiteDB):
+    """SQLite with a fixed delay per read once ``remote`` is set."""
+
+    remote = False
+
+    async def get(self, *args, **kwargs):
+        if self.remote:
+            await asyncio.sleep(_ROUND_TRIP)
+        return await super().get(*args, **kwargs)
+
+    async def find(self, *args, **kwargs):
+        if self.remote:
+            await asyncio.sleep(_ROUND_TRIP)
+        return await super().find(*args, **kwargs)
+
+    async def find_many(self, *args, **kwargs):
+        if self.remote:
+            await asyncio.sleep(_ROUND_TRIP)
+        return await super().find_many(*args, **kwargs)
+
+
+class Burrow(Node):
+    pass
+
+
+class Ferret(Walker):
+    @on_visit(Burrow)
+    async def sniff(self, here):
+        await self.report(here.id)
+        await self.visit(await here.nodes())
+
+
+async def _walk(mode: str) -> None:
+    db = RemoteSQLiteDB(db_path=":memory:")
+    context = GraphContext(database=db, cache_backend=MemoryCache(max_size=0))
+    set_default_context(context)
+    try:
+        root = await context.create(Burrow)
+        starts = []
+        for _ in range(_FANOUT):
+            child = await context.create(Burrow)
+            await root.connect(child)
+            starts.append(child)
+            for _ in range(_FANOUT):
+                await child.connect(await context.create(Burrow))
+        db.remote = True
+        jobs = [(Ferret(), starts[i % _FANOUT]) for i in range(_WALKERS)]
+        if mode == "sequential":
+            reports = []
+            for walker, start in jobs:
+                await walker.spawn(start)
+                reports.append(await walker.get_report())
+        else:
+            reports = await Walker.spawn_many(jobs, concurrency=8)
+        assert all(len(r) == 1 + _FANOUT for r in reports)
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize("mode", ["sequential", "spawn_many"])
+def test_bench_spawn_many(benchmark, mode):
+    benchmark.pedantic(run_async, args=(_walk, mode), rounds=3, iterations=1)
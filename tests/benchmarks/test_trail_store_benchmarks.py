@@ -0,0 +1,49 @@
+"""Walker trail persistence: write-through vs buffered ``DBTrailStore``.
+
+A walker visits 1000 in-memory nodes with a ``DBTrailStore`` on an
+in-memory SQLite database. ``batch_size=1`` writes every step as it is
+recorded (the old behavior); the default buffers 100 steps per
+``bulk_save``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.core.entities.walker_components.trail_store import DBTrailStore
+from jvspatial.db.sqlite import SQLiteDB
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 1000
+
+
+class Milepost(Node):
+    pass
+
+
+class Hiker(Walker):
+    @on_visit(Milepost)
+    async def pass_by(self, here):
+        pass
+
+
+async def _walk(batch_size: int) -> None:
+    db = SQLiteDB(db_path=":memory:")
+    try:
+        store = DBTrailStore(db, batch_size=batch_size)
+        walker = Hiker(trail_store=store, max_queue_size=0)
+        await walker.queue.append([Milepost() for _ in range(_NODES)])
+        await walker.run()
+        assert len(await store.load(walker.id)) == _NODES
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 100])
+def test_bench_trail_persistence(benchmark, batch_size):
+    benchmark.pedantic(run_async, args=(_walk, batch_size), rounds=3, iterations=1)
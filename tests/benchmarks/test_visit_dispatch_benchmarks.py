@@ -0,0 +1,71 @@
+"""Visit-hook dispatch: cached tables against a rebuild on every visit.
+
+A walker with four hooks (exact class, base class, class name, catch-all)
+visits 20,000 in-memory nodes that carry two hooks of their own, calling
+``_execute_visit_hooks`` directly so only dispatch and the trivial hook
+bodies are measured. The ``rebuild`` variant drops the cached tables
+before each visit, which is the lookup work every visit used to repeat.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.core.entities._visit_hooks import invalidate_dispatch_tables
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_VISITS = 20_000
+
+
+class DispatchBase(Node):
+    @on_visit
+    def seen(self, visitor):
+        visitor.count += 1
+
+
+class DispatchCell(DispatchBase):
+    @on_visit("DispatchWalker")
+    async def tagged(self, visitor):
+        visitor.count += 1
+
+
+class DispatchWalker(Walker):
+    count: int = 0
+
+    @on_visit(DispatchCell)
+    async def cell(self, here):
+        self.count += 1
+
+    @on_visit(DispatchBase)
+    def base(self, here):
+        self.count += 1
+
+    @on_visit("DispatchCell")
+    def by_name(self, here):
+        self.count += 1
+
+    @on_visit
+    async def anything(self, here):
+        self.count += 1
+
+
+async def _visit_all(rebuild: bool) -> None:
+    walker = DispatchWalker()
+    cells = [DispatchCell() for _ in range(100)]
+    for i in range(_VISITS):
+        if rebuild:
+            invalidate_dispatch_tables()
+        await walker._execute_visit_hooks(cells[i % 100])
+    assert walker.count == 6 * _VISITS
+
+
+@pytest.mark.parametrize("mode", ["cached", "rebuild"])
+def test_bench_execute_visit_hooks(benchmark, mode):
+    benchmark.pedantic(
+        run_async, args=(_visit_all, mode == "rebuild"), rounds=3, iterations=1
+    )
@@ -0,0 +1,71 @@
+"""Memory per visited node for each ``visit_tracking`` mode.
+
+A walker visits 20000 in-memory nodes once each. The nodes are built
+before measuring, so ``tracemalloc`` only sees what the walker keeps per
+step: visit counts, the trail and the visited lookup. Bytes per node are
+attached to each result as ``extra_info["bytes_per_node"]``; the timed
+part is the walk itself.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import List
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 20000
+
+
+class Landmark(Node):
+    pass
+
+
+class Tally(Walker):
+    @on_visit(Landmark)
+    async def tally(self, here):
+        pass
+
+
+def _walker(mode: str) -> Tally:
+    return Tally(
+        visit_tracking=mode,
+        bloom_capacity=_NODES,
+        max_steps=_NODES + 1,
+        max_queue_size=0,
+    )
+
+
+async def _walk(args) -> Tally:
+    mode, nodes = args
+    walker = _walker(mode)
+    await walker.queue.append(nodes)
+    await walker.run()
+    assert walker.get_trail_length() == _NODES
+    return walker
+
+
+def _bytes_per_node(mode: str, nodes: List[Landmark]) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        walker = run_async(_walk, (mode, nodes))
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert walker.has_visited(nodes[0].id)
+    return (after - before) / _NODES
+
+
+@pytest.mark.parametrize("mode", ["dict", "compact", "bloom"])
+def test_bench_visit_tracking_memory(benchmark, mode):
+    nodes = [Landmark() for _ in range(_NODES)]
+    benchmark.extra_info["bytes_per_node"] = round(_bytes_per_node(mode, nodes), 1)
+    benchmark.pedantic(run_async, args=(_walk, (mode, nodes)), rounds=3, iterations=1)
@@ -0,0 +1,46 @@
+"""Concurrent frontier execution for I/O-bound visit hooks.
+
+A walker visits 200 in-memory nodes whose parallel-safe hook awaits a
+5 ms sleep, standing in for an HTTP or LLM call. Sequentially that is at
+least a second of waiting; with ``concurrency=16`` the waits overlap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 200
+
+
+class FetchCell(Node):
+    pass
+
+
+class FetchWalker(Walker):
+    done: int = 0
+
+    @on_visit(FetchCell, parallel_safe=True)
+    async def fetch(self, here):
+        await asyncio.sleep(0.005)
+        self.done += 1
+
+
+async def _walk(concurrency: int) -> None:
+    walker = FetchWalker(concurrency=concurrency, max_queue_size=_NODES)
+    await walker.queue.append([FetchCell() for _ in range(_NODES)])
+    await walker.run()
+    assert walker.done == _NODES
+
+
+@pytest.mark.parametrize("concurrency", [1, 16])
+def test_bench_io_bound_hooks(benchmark, concurrency):
+    benchmark.pedantic(run_async, args=(_walk, concurrency), rounds=3, iterations=1)
@@ -0,0 +1,50 @@
+"""Time to the first report item: ``run()`` vs ``stream()``.
+
+A walker reports once per node over 500 in-memory nodes, each visit
+waiting 1 ms to stand in for I/O. ``run`` hands back the report list
+after the whole traversal; ``stream`` yields the first item after the
+first visit, and closing the stream cancels the rest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+
+from .conftest import run_async
+
+pytestmark = pytest.mark.benchmark
+
+_NODES = 500
+
+
+class Signal(Node):
+    pass
+
+
+class Listener(Walker):
+    @on_visit(Signal)
+    async def hear(self, here):
+        await asyncio.sleep(0.001)
+        await self.report(here.id)
+
+
+async def _first_item(mode: str) -> None:
+    walker = Listener()
+    await walker.queue.append([Signal() for _ in range(_NODES)])
+    if mode == "run":
+        first = (await walker.run())[0]
+    else:
+        items = walker.stream()
+        first = await items.__anext__()
+        await items.aclose()
+    assert first
+
+
+@pytest.mark.parametrize("mode", ["run", "stream"])
+def test_bench_time_to_first_report(benchmark, mode):
+    benchmark.pedantic(run_async, args=(_first_item, mode), rounds=3, iterations=1)
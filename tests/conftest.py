@@ -1,7 +1,15 @@
 # conftest.py - Test configuration for pytest
 
+import tempfile
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
 import pytest
 
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.db.database import Database
+from jvspatial.db.jsondb import JsonDB
+from jvspatial.db.sqlite import SQLiteDB
+
 
 @pytest.fixture(autouse=True)
 def _clear_jvspatial_load_env_cache():
@@ -35,3 +43,80 @@ def pytest_collection_modifyitems(config, items):
             if pattern in test_id:
                 item.add_marker(skip_obsolete)
                 break
+
+
+# ---- graph tests on SQLite and JsonDB ----------------------------------------
+
+
+@pytest.fixture
+def db_options() -> Dict[str, Any]:
+    """Extra constructor options for ``graph_db``; override in a module."""
+    return {}
+
+
+@pytest.fixture
+def graph_cache() -> Optional[Any]:
+    """Cache backend for ``ctx`` (None: from the environment); override in a module."""
+    return None
+
+
+@pytest.fixture(params=["sqlite", "jsondb"])
+async def graph_db(request, db_options) -> AsyncIterator[Database]:
+    """A fresh in-memory SQLite or temporary-directory JsonDB database."""
+    if request.param == "sqlite":
+        db = SQLiteDB(db_path=":memory:", **db_options)
+        try:
+            yield db
+        finally:
+            await db.close()
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            yield JsonDB(base_path=tmp, **db_options)
+
+
+@pytest.fixture
+async def ctx(graph_db, graph_cache) -> AsyncIterator[GraphContext]:
+    """Default graph context over ``graph_db`` (runs each test on both backends)."""
+    context = GraphContext(database=graph_db, cache_backend=graph_cache)
+    set_default_context(context)
+    yield context
+
+
+class CountingDatabase:
+    """Database proxy that counts calls per ``"<method>:<collection>"``."""
+
+    def __init__(self, inner: Any) -> None:
+        self.inner = inner
+        self.calls: Dict[str, int] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.inner, name)
+        if not callable(attr):
+            return attr
+
+        async def _wrapped(collection: str, *args: Any, **kwargs: Any) -> Any:
+            key = f"{name}:{collection}"
+            self.calls[key] = self.calls.get(key, 0) + 1
+            return await attr(collection, *args, **kwargs)
+
+        return _wrapped
+
+    def edge_calls(self) -> Dict[str, int]:
+        """The counts for the ``edge`` collection only."""
+        return {k: v for k, v in self.calls.items() if k.endswith(":edge")}
+
+
+@pytest.fixture
+def count_db_calls(ctx) -> Callable[[], CountingDatabase]:
+    """Put a :class:`CountingDatabase` in front of ``ctx``'s database and return it.
+
+    Counting starts when the returned callable is called, so setup writes
+    are not counted. Restore with ``ctx._database = counting.inner``.
+    """
+
+    def install() -> CountingDatabase:
+        counting = CountingDatabase(ctx.database)
+        ctx._database = counting
+        return counting
+
+    return install
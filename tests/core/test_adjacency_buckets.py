@@ -0,0 +1,232 @@
+"""Bucketed adjacency storage (``Node.__edge_buckets__``).
+
+Runs against SQLite and JsonDB: hub nodes keep a bounded inline head, spill
+the rest into ``edge_bucket`` records, and hydrate, save, disconnect,
+delete and page through ``expand_node`` transparently.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from jvspatial.core.adjacency import BUCKET_COLLECTION, EdgeBuckets
+from jvspatial.core.context import GraphContext
+from jvspatial.core.entities import Edge, Node
+
+
+class BucketHub(Node):
+    __edge_buckets__ = EdgeBuckets(threshold=4, bucket_size=3)
+    name: str = ""
+
+
+class SplitHub(Node):
+    __edge_buckets__ = EdgeBuckets(
+        threshold=0, bucket_size=2, by_direction=True, by_type=True
+    )
+    name: str = ""
+
+
+class Leaf(Node):
+    name: str = ""
+
+
+class Tagged(Edge):
+    pass
+
+
+async def _hub_with_leaves(n: int) -> tuple:
+    hub = await BucketHub.create(name="hub")
+    leaves = [await Leaf.create(name=f"l{i}") for i in range(n)]
+    edges = [await hub.connect(leaf) for leaf in leaves]
+    return hub, leaves, edges
+
+
+async def _buckets(ctx: GraphContext, node_id: str) -> List[Dict[str, Any]]:
+    return await ctx.database.find(BUCKET_COLLECTION, {"node": node_id})
+
+
+class TestLayout:
+    async def test_spills_beyond_threshold(self, ctx):
+        hub, _, edges = await _hub_with_leaves(10)
+        raw = await ctx.database.get("node", hub.id)
+        assert len(raw["edges"]) == 4
+        assert raw["edge_count"] == 10
+        assert raw["edge_buckets"] == {"any.any": 2}
+        sizes = sorted(len(b["edges"]) for b in await _buckets(ctx, hub.id))
+        assert sizes == [3, 3]
+
+        await ctx.clear_cache()
+        loaded = await BucketHub.get(hub.id)
+        assert sorted(loaded.edge_ids) == sorted(e.id for e in edges)
+        assert len(await loaded.nodes()) == 10
+
+    async def test_small_nodes_stay_inline(self, ctx):
+        hub, _, _ = await _hub_with_leaves(3)
+        raw = await ctx.database.get("node", hub.id)
+        assert "edge_buckets" not in raw and len(raw["edges"]) == 3
+        assert await _buckets(ctx, hub.id) == []
+
+    async def test_save_touches_only_changed_buckets(self, ctx, count_db_calls):
+        hub, _, _ = await _hub_with_leaves(10)
+        counting = count_db_calls()
+
+        hub.name = "renamed"
+        await hub.save()
+        assert counting.calls.get("bulk_save:edge_bucket") is None
+        assert counting.calls.get(f"find_many:{BUCKET_COLLECTION}") is None
+
+        extra = await Leaf.create(name="extra")
+        await hub.connect(extra)
+        assert counting.calls.get("bulk_save:edge_bucket") == 1
+        ctx._database = counting.inner
+
+        raw = await ctx.database.get("node", hub.id)
+        assert raw["context"]["name"] == "renamed"
+        assert raw["edge_count"] == 11 and len(raw["edges"]) == 4
+
+    async def test_disconnect_and_authoritative_save(self, ctx):
+        hub, leaves, edges = await _hub_with_leaves(10)
+        head = (await ctx.database.get("node", hub.id))["edges"]
+        bucketed = next(e for e in edges if e.id not in head)
+        other = next(leaf for leaf in leaves if leaf.id == bucketed.target)
+        assert await hub.disconnect(other)
+        raw = await ctx.database.get("node", hub.id)
+        assert raw["edge_count"] == 9
+        stored = [e for b in await _buckets(ctx, hub.id) for e in b["edges"]]
+        assert bucketed.id not in stored
+
+        hub.edge_ids = hub.edge_ids[:5]
+        await ctx.save(hub, merge_node_edges=False)
+        await ctx.clear_cache()
+        loaded = await BucketHub.get(hub.id)
+        assert sorted(loaded.edge_ids) == sorted(hub.edge_ids)
+        assert (await ctx.database.get("node", hub.id))["edge_count"] == 5
+
+    async def test_merge_save_keeps_concurrent_additions(self, ctx):
+        hub, _, _ = await _hub_with_leaves(6)
+        stale = await ctx.database.get("node", hub.id)
+        extra = await Leaf.create(name="late")
+        edge = await Edge.create(source=hub.id, target=extra.id)
+        await ctx.atomic_add_edge_id(hub.id, edge.id)
+        stale_node = BucketHub(id=hub.id, name="stale", edge_ids=stale["edges"])
+        await ctx.save(stale_node)
+        await ctx.clear_cache()
+        loaded = await BucketHub.get(hub.id)
+        assert edge.id in loaded.edge_ids and len(loaded.edge_ids) == 7
+
+    async def test_cascade_delete_drops_buckets(self, ctx):
+        hub, _, _ = await _hub_with_leaves(10)
+        await hub.delete()
+        assert await ctx.database.find("node", {}) == []
+        assert await ctx.database.find(BUCKET_COLLECTION, {}) == []
+
+    async def test_partitions_by_direction_and_type(self, ctx):
+        hub = await SplitHub.create(name="hub")
+        a, b, c = [await Leaf.create(name=n) for n in "abc"]
+        await hub.connect(a, Tagged)
+        await hub.connect(b, Tagged)
+        await hub.connect(c)
+        await c.connect(hub, Tagged)
+        raw = await ctx.database.get("node", hub.id)
+        assert raw["edges"] == []
+        assert raw["edge_buckets"] == {"in.Tagged": 1, "out.Edge": 1, "out.Tagged": 1}
+
+        page = await ctx.expand_node(hub.id, direction="in")
+        assert page["pagination"]["total_edge_count"] == 4
+        assert len(page["edges"]) == 1
+        assert page["meta"]["round_trips"][BUCKET_COLLECTION] == 1
+
+    async def test_expand_node_pages_through_buckets(self, ctx):
+        hub, _, edges = await _hub_with_leaves(10)
+        seen: List[str] = []
+        cursor = 0
+        while cursor is not None:
+            page = await ctx.expand_node(hub.id, limit=4, cursor=cursor)
+            seen.extend(e["id"] for e in page["edges"])
+            assert page["pagination"]["total_edge_count"] == 10
+            cursor = page["pagination"]["next_cursor"]
+        assert sorted(seen) == sorted(e.id for e in edges)
+
+        first = await ctx.expand_node(hub.id, limit=2)
+        assert BUCKET_COLLECTION not in first["meta"]["round_trips"]
+        hub_payload = next(n for n in first["nodes"] if n["id"] == hub.id)
+        assert hub_payload["degree"] == 10
+
+    async def test_subgraph_bfs_follows_bucketed_edges(self, ctx):
+        hub, _, _ = await _hub_with_leaves(10)
+        sub = await ctx.subgraph_bfs(hub.id, max_depth=1, max_nodes=50)
+        assert sub["meta"]["node_count"] == 11
+
+    async def test_bulk_import_spills_new_nodes(self, ctx):
+        hub = BucketHub(name="hub")
+        leaves = [Leaf(name=f"l{i}") for i in range(9)]
+        await ctx.create_and_connect_many([hub, *leaves], [(hub, x) for x in leaves])
+        raw = await ctx.database.get("node", hub.id)
+        assert raw["edge_count"] == 9 and len(raw["edges"]) == 4
+
+        more = [await Leaf.create(name=f"m{i}") for i in range(2)]
+        await ctx.connect_many([(hub, x) for x in more])
+        assert (await ctx.database.get("node", hub.id))["edge_count"] == 11
+        await ctx.clear_cache()
+        assert len((await BucketHub.get(hub.id)).edge_ids) == 11
+
+
+class TestMigration:
+    async def _legacy_hub(self, ctx: GraphContext) -> str:
+        leaves = [await Leaf.create(name=f"l{i}") for i in range(8)]
+        edges = [
+            await Edge.create(source="n.BucketHub.legacy", target=leaf.id)
+            for leaf in leaves
+        ]
+        await ctx.database.save(
+            "node",
+            {
+                "id": "n.BucketHub.legacy",
+                "entity": "BucketHub",
+                "context": {"name": "legacy"},
+                "edges": [e.id for e in edges],
+            },
+        )
+        return "n.BucketHub.legacy"
+
+    async def test_spills_on_next_save(self, ctx):
+        hub_id = await self._legacy_hub(ctx)
+        hub = await BucketHub.get(hub_id)
+        assert len(hub.edge_ids) == 8
+        await hub.save()
+        raw = await ctx.database.get("node", hub_id)
+        assert len(raw["edges"]) == 4 and raw["edge_count"] == 8
+
+    async def test_spills_on_read_with_auto_persist(self, ctx):
+        hub_id = await self._legacy_hub(ctx)
+        ctx.auto_persist_migrations = True
+        hub = await BucketHub.get(hub_id)
+        assert len(hub.edge_ids) == 8
+        raw = await ctx.database.get("node", hub_id)
+        assert len(raw["edges"]) == 4 and raw["edge_count"] == 8
+
+    async def test_migrate_cli_spills(self, ctx, monkeypatch):
+        hub_id = await self._legacy_hub(ctx)
+
+        class _StubManager:
+            def get_prime_database(self):
+                return ctx.database
+
+        monkeypatch.setattr(
+            "jvspatial.db.manager.get_database_manager", lambda: _StubManager()
+        )
+        from jvspatial.cli import _run_migrate, build_parser
+
+        args = build_parser().parse_args(
+            ["migrate", "--collection", "node", "--entity", "BucketHub", "--apply"]
+        )
+        assert await _run_migrate(args) == 0
+        raw = await ctx.database.get("node", hub_id)
+        assert len(raw["edges"]) == 4 and raw["edge_count"] == 8
+        await ctx.clear_cache()
+        assert len((await BucketHub.get(hub_id)).edge_ids) == 8
+
+
+def test_layout_validation():
+    with pytest.raises(ValueError):
+        EdgeBuckets(bucket_size=0)
@@ -0,0 +1,203 @@
+"""Typed adjacency entries (``Node.__adjacency_entries__``).
+
+Runs against SQLite and JsonDB: opted-in nodes persist one entry per edge,
+and ``nodes()``, ``count_neighbors()``, ``neighborhood()`` and walker
+prefetch resolve neighbors without querying the edge collection.
+"""
+
+from jvspatial.core import on_visit
+from jvspatial.core.context import GraphContext
+from jvspatial.core.entities import Edge, Node, Walker
+from jvspatial.db.query import QueryEngine
+
+
+class Village(Node):
+    __adjacency_entries__ = True
+    name: str = ""
+
+
+class Farm(Node):
+    __adjacency_entries__ = True
+    name: str = ""
+
+
+class Plain(Node):
+    name: str = ""
+
+
+class Road(Edge):
+    lanes: int = 1
+
+
+async def _star(ctx: GraphContext):
+    """``hub -> a, b (Road), f (Farm)``; ``c -> hub``."""
+    hub = await Village.create(name="hub")
+    a, b, c = [await Village.create(name=n) for n in "abc"]
+    f = await Farm.create(name="f")
+    await hub.connect(a, Road, lanes=2)
+    await hub.connect(b, Road, lanes=4)
+    await hub.connect(f)
+    await c.connect(hub)
+    return hub, a, b, c, f
+
+
+class TestEntries:
+    async def test_connect_persists_entries(self, ctx):
+        hub, a, _, c, _ = await _star(ctx)
+        raw = await ctx.database.get("node", hub.id)
+        by_peer = {e["peer"]: e for e in raw["adjacency"]}
+        assert by_peer[a.id]["dir"] == "out" and by_peer[a.id]["entity"] == "Road"
+        assert by_peer[c.id]["dir"] == "in" and by_peer[c.id]["entity"] == "Edge"
+        assert [e["id"] for e in raw["adjacency"]] == raw["edges"]
+        leaf = await ctx.database.get("node", a.id)
+        assert leaf["adjacency"][0]["peer"] == hub.id
+        assert leaf["adjacency"][0]["dir"] == "in"
+
+    async def test_plain_nodes_store_no_entries(self, ctx):
+        p, q = await Plain.create(name="p"), await Plain.create(name="q")
+        await p.connect(q)
+        assert "adjacency" not in await ctx.database.get("node", p.id)
+
+    async def test_nodes_skip_edge_documents(self, ctx, count_db_calls):
+        hub, a, b, c, f = await _star(ctx)
+        counting = count_db_calls()
+        out = await hub.nodes()
+        inbound = await hub.nodes(direction="in")
+        both = await hub.nodes(direction="both")
+        roads = await hub.nodes(edge=Road)
+        farms = await hub.nodes(node="Farm")
+        named = await hub.nodes(name="b")
+        first = await hub.nodes(limit=1)
+        assert counting.edge_calls() == {}
+        ctx._database = counting.inner
+
+        assert {n.id for n in out} == {a.id, b.id, f.id}
+        assert [n.id for n in inbound] == [c.id]
+        assert {n.id for n in both} == {a.id, b.id, c.id, f.id}
+        assert {n.id for n in roads} == {a.id, b.id}
+        assert [n.id for n in farms] == [f.id]
+        assert [n.id for n in named] == [b.id]
+        assert len(first) == 1 and first[0].id in {a.id, b.id, f.id}
+
+    async def test_edge_property_filter_fetches_edges_by_id(self, ctx, count_db_calls):
+        hub, _, b, _, _ = await _star(ctx)
+        counting = count_db_calls()
+        wide = await hub.nodes(edge=[{"Road": {"context.lanes": {"$gte": 3}}}])
+        assert set(counting.edge_calls()) == {"find_many:edge"}
+        ctx._database = counting.inner
+        assert [n.id for n in wide] == [b.id]
+
+    async def test_count_neighbors_loads_nothing(self, ctx, count_db_calls):
+        hub, *_ = await _star(ctx)
+        counting = count_db_calls()
+        assert await hub.count_neighbors() == 3
+        assert await hub.count_neighbors(direction="both") == 4
+        assert await hub.count_neighbors(node="Farm") == 1
+        assert await hub.count_neighbors(node=Village, edge=Road) == 2
+        assert counting.calls == {}
+        ctx._database = counting.inner
+
+    async def test_disconnect_and_delete_drop_entries(self, ctx):
+        hub, a, b, c, f = await _star(ctx)
+        assert await hub.disconnect(a)
+        await b.delete()
+        await ctx.clear_cache()
+        raw = await ctx.database.get("node", hub.id)
+        assert {e["peer"] for e in raw["adjacency"]} == {c.id, f.id}
+        assert len(raw["adjacency"]) == len(raw["edges"]) == 2
+        loaded = await Village.get(hub.id)
+        assert [n.name for n in await loaded.nodes()] == ["f"]
+
+    async def test_bulk_connect_writes_entries(self, ctx, count_db_calls):
+        hub = Village(name="hub")
+        towns = [Village(name=f"t{i}") for i in range(4)]
+        await ctx.create_and_connect_many([hub, *towns], [(hub, t) for t in towns])
+        extra = await Village.create(name="extra")
+        await ctx.connect_many([(extra, hub, Road)])
+        raw = await ctx.database.get("node", hub.id)
+        assert len(raw["adjacency"]) == len(raw["edges"]) == 5
+        await ctx.clear_cache()
+        loaded = await Village.get(hub.id)
+        counting = count_db_calls()
+        assert len(await loaded.nodes()) == 4
+        assert [n.id for n in await loaded.nodes(direction="in")] == [extra.id]
+        assert counting.edge_calls() == {}
+        ctx._database = counting.inner
+
+    async def test_walker_prefetch_uses_entries(self, ctx, count_db_calls):
+        hub, a, b, _, f = await _star(ctx)
+        await ctx.clear_cache()
+        root = await Village.get(hub.id)
+
+        class Prefetch(Walker):
+            def __init__(self):
+                super().__init__(prefetch_neighbors=True, frontier_batch_size=4)
+                self.seen: list = []
+
+            @on_visit()
+            async def visit_node(self, node):
+                self.seen.append(node.id)
+
+        counting = count_db_calls()
+        walker = Prefetch()
+        await walker.spawn(root)
+        assert counting.edge_calls() == {}
+        ctx._database = counting.inner
+        assert set(walker.seen) == {hub.id, a.id, b.id, f.id}
+
+    async def test_neighborhood_bfs(self, ctx):
+        hub, a, b, c, f = await _star(ctx)
+        far = await Village.create(name="far")
+        await a.connect(far)
+        hood = await hub.neighborhood(2)
+        assert {n.id for n in hood} == {a.id, b.id, f.id, far.id}
+
+
+class TestBackfill:
+    async def _legacy(self, ctx: GraphContext):
+        hub, a, b, c, f = await _star(ctx)
+        raw = await ctx.database.get("node", hub.id)
+        raw.pop("adjacency")
+        await ctx.database.save("node", raw)
+        await ctx.clear_cache()
+        return hub.id, {a.id, b.id, f.id}
+
+    async def test_missing_entries_resolve_and_persist_on_save(
+        self, ctx, count_db_calls
+    ):
+        hub_id, out_ids = await self._legacy(ctx)
+        hub = await Village.get(hub_id)
+        counting = count_db_calls()
+        assert {n.id for n in await hub.nodes()} == out_ids
+        assert set(counting.edge_calls()) == {"find_many:edge"}
+        ctx._database = counting.inner
+        await hub.save()
+        raw = await ctx.database.get("node", hub_id)
+        assert len(raw["adjacency"]) == 4
+
+    async def test_migrate_cli_backfills(self, ctx, monkeypatch):
+        hub_id, _ = await self._legacy(ctx)
+
+        class _StubManager:
+            def get_prime_database(self):
+                return ctx.database
+
+        monkeypatch.setattr(
+            "jvspatial.db.manager.get_database_manager", lambda: _StubManager()
+        )
+        from jvspatial.cli import _run_migrate, build_parser
+
+        args = build_parser().parse_args(
+            ["migrate", "--collection", "node", "--entity", "Village", "--apply"]
+        )
+        assert await _run_migrate(args) == 0
+        raw = await ctx.database.get("node", hub_id)
+        assert [e["id"] for e in raw["adjacency"]] == raw["edges"]
+
+
+def test_pull_accepts_query_condition():
+    doc = {"adjacency": [{"id": "e1"}, {"id": "e2"}, {"id": "e3"}], "n": [1, 5, 9]}
+    QueryEngine.apply_update(doc, {"$pull": {"adjacency": {"id": {"$in": ["e1"]}}}})
+    QueryEngine.apply_update(doc, {"$pull": {"adjacency": {"id": "e3"}}})
+    QueryEngine.apply_update(doc, {"$pull": {"n": {"$gte": 5}}})
+    assert doc == {"adjacency": [{"id": "e2"}], "n": [1]}
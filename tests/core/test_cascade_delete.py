@@ -0,0 +1,115 @@
+"""Set-based ``Node.delete`` cascades.
+
+Semantics are covered at length in ``test_entity_crud_and_cascade.py``;
+these tests pin the batching (round trips independent of graph size) and
+the in-memory dependent-set rule on SQLite and JsonDB.
+"""
+
+from typing import Dict, List
+
+from jvspatial.core.context import GraphContext
+from jvspatial.core.entities import Node
+from jvspatial.core.graph_delete import dependent_nodes
+from jvspatial.db.query import QueryEngine
+
+
+class Item(Node):
+    name: str = ""
+
+
+async def _edges_of(ctx: GraphContext, node_id: str) -> List[str]:
+    raw = await ctx.database.get("node", node_id)
+    return sorted(raw.get("edges") or [])
+
+
+def _e(source: str, target: str) -> Dict[str, str]:
+    return {"id": f"{source}-{target}", "source": source, "target": target}
+
+
+class TestDependentNodes:
+    def test_anchor_spreads_through_component(self):
+        # r -> a -> b, r -> c; x -> b anchors a and b but not c.
+        edges = [_e("r", "a"), _e("a", "b"), _e("r", "c"), _e("x", "b")]
+        assert dependent_nodes("r", {"r", "a", "b", "c"}, edges) == {"c"}
+
+    def test_edges_to_root_do_not_anchor(self):
+        edges = [_e("p", "r"), _e("r", "a"), _e("a", "r")]
+        assert dependent_nodes("r", {"r", "a"}, edges) == {"a"}
+
+
+class TestCascadeDelete:
+    async def test_round_trips_do_not_grow_with_fan_out(self, ctx, count_db_calls):
+        root = await Item.create(name="root")
+        children = [Item(name=f"c{i}") for i in range(30)]
+        grandchildren = [Item(name=f"g{i}") for i in range(30)]
+        await ctx.create_and_connect_many(
+            children + grandchildren,
+            [(root, c) for c in children]
+            + [(c, g) for c, g in zip(children, grandchildren)],
+        )
+        counting = count_db_calls()
+
+        await root.delete()
+
+        # One outgoing-edge query per BFS level (3 levels, the last one
+        # empty) and one incoming-edge query.
+        assert counting.calls.get("find:edge") == 4
+        assert counting.calls.get("delete_many:edge") == 1
+        assert counting.calls.get("delete_many:node") == 1
+        assert counting.calls.get("get:node") is None
+        assert counting.calls.get("delete:edge") is None
+        ctx._database = counting.inner
+        assert await ctx.database.find("node", {}) == []
+        assert await ctx.database.find("edge", {}) == []
+
+    async def test_survivors_lose_edge_ids_in_one_write(self, ctx, count_db_calls):
+        root = await Item.create(name="root")
+        parent = await Item.create(name="parent")
+        child = await Item.create(name="child")
+        outside = await Item.create(name="outside")
+        up = await parent.connect(root)
+        down = await root.connect(child)
+        kept = await outside.connect(child)
+
+        counting = count_db_calls()
+        await root.delete()
+        ctx._database = counting.inner
+
+        assert await Item.get(root.id) is None
+        assert await _edges_of(ctx, parent.id) == []
+        assert await _edges_of(ctx, child.id) == [kept.id]
+        assert counting.calls.get("bulk_save:node") == 1
+        for edge in (up, down):
+            assert await ctx.database.get("edge", edge.id) is None
+
+    async def test_deep_chain_is_fully_removed(self, ctx):
+        nodes = [Item(name=f"n{i}") for i in range(150)]
+        await ctx.create_and_connect_many(
+            nodes, [(a, b) for a, b in zip(nodes, nodes[1:])]
+        )
+        await nodes[0].delete()
+        assert await ctx.database.find("node", {}) == []
+        assert await ctx.database.find("edge", {}) == []
+
+    async def test_cycle_back_to_root(self, ctx):
+        root, a, b = [await Item.create(name=n) for n in ("root", "a", "b")]
+        await root.connect(a)
+        await a.connect(b)
+        await b.connect(root)
+        await root.delete()
+        assert await ctx.database.find("node", {}) == []
+
+    async def test_no_cascade_keeps_children(self, ctx):
+        root, child = [await Item.create(name=n) for n in ("root", "child")]
+        await root.connect(child)
+        await root.delete(cascade=False)
+        assert await Item.get(child.id) is not None
+        assert await _edges_of(ctx, child.id) == []
+        assert await ctx.database.find("edge", {}) == []
+
+
+def test_pull_accepts_value_and_in():
+    doc = {"edges": ["e1", "e2", "e3"]}
+    QueryEngine.apply_update(doc, {"$pull": {"edges": "e1"}})
+    QueryEngine.apply_update(doc, {"$pull": {"edges": {"$in": ["e3", "e9"]}}})
+    assert doc["edges"] == ["e2"]
@@ -0,0 +1,81 @@
+"""``Node.connect`` duplicate check: deterministic edge ids + indexed fallback."""
+
+from jvspatial.core.entities import Edge, Node
+
+
+class Town(Node):
+    name: str = ""
+
+
+class Road(Edge):
+    lanes: int = 2
+
+
+def test_deterministic_id_shape():
+    a = Road.deterministic_id("n.Town.1", "n.Town.2")
+    assert a == Road.deterministic_id("n.Town.1", "n.Town.2")
+    assert a != Road.deterministic_id("n.Town.2", "n.Town.1")
+    assert a != Edge.deterministic_id("n.Town.1", "n.Town.2")
+    kind, entity, digest = a.split(".")
+    assert (kind, entity, len(digest)) == ("e", "Road", 24)
+
+
+class TestConnect:
+    async def test_new_edge_uses_deterministic_id(self, ctx):
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        road = await a.connect(b, Road)
+        assert road.id == Road.deterministic_id(a.id, b.id)
+
+    async def test_repeat_is_a_primary_key_lookup(self, ctx, count_db_calls):
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        first = await a.connect(b, Road)
+        counting = count_db_calls()
+
+        assert (await a.connect(b, Road)).id == first.id
+        assert (await b.connect(a, Road, direction="both")).id == first.id
+        assert counting.calls.get("find_many:edge") == 2
+        assert counting.calls.get("find:edge") is None
+
+    async def test_new_pair_makes_no_edge_query_without_legacy_lookup(
+        self, ctx, count_db_calls, monkeypatch
+    ):
+        # With the fallback off the check is id-only: no scan of the edge
+        # collection on JsonDB, where the (source, target, entity) query is one.
+        monkeypatch.setenv("JVSPATIAL_EDGE_LEGACY_LOOKUP", "false")
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        counting = count_db_calls()
+        road = await a.connect(b, Road)
+        assert road.id == Road.deterministic_id(a.id, b.id)
+        assert counting.calls.get("find_many:edge") == 1
+        assert counting.calls.get("find:edge") is None
+
+    async def test_legacy_random_id_edge_is_found(self, ctx, count_db_calls):
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        legacy = await Road.create(source=a.id, target=b.id, direction="out")
+        counting = count_db_calls()
+        assert (await a.connect(b, Road)).id == legacy.id
+        assert counting.calls.get("find:edge") == 1
+        assert len(await ctx.database.find("edge", {})) == 1
+
+    async def test_connect_over_legacy_edge_writes_no_duplicate(self, ctx):
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        legacy = await Edge.create(source=a.id, target=b.id, direction="out")
+        assert (await a.connect(b)).id == legacy.id
+        assert (await b.connect(a, direction="both")).id == legacy.id
+        assert [e["id"] for e in await ctx.database.find("edge", {})] == [legacy.id]
+
+    async def test_same_endpoints_never_overwritten(self, ctx):
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        out = await a.connect(b, Road, lanes=6)
+        # "in" does not match an a->b edge, but the (source, target, entity)
+        # slot is taken, so the existing edge comes back untouched.
+        again = await a.connect(b, Road, direction="in", lanes=1)
+        assert again.id == out.id
+        stored = await Road.get(out.id)
+        assert stored.lanes == 6 and stored.bidirectional is False
+
+    async def test_connect_many_uses_same_ids(self, ctx):
+        a, b = await Town.create(name="a"), await Town.create(name="b")
+        (bulk,) = await ctx.connect_many([(a, b, Road)])
+        assert bulk.id == Road.deterministic_id(a.id, b.id)
+        assert (await a.connect(b, Road)).id == bulk.id
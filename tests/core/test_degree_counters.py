@@ -0,0 +1,195 @@
+"""Degree counters (``Node.__degree_counters__``).
+
+Runs against SQLite and JsonDB: opted-in nodes keep per-direction,
+per-entity edge counts current through ``connect``, ``disconnect``, edge
+and cascade deletes and the bulk connect paths, and ``count_neighbors``
+answers from them without a query.
+"""
+
+from typing import Any, Dict
+
+from jvspatial.core import degree_counters
+from jvspatial.core.adjacency import EdgeBuckets
+from jvspatial.core.context import GraphContext
+from jvspatial.core.entities import Edge, Node
+
+
+class Harbor(Node):
+    __degree_counters__ = True
+    name: str = ""
+
+
+class Dock(Node):
+    __degree_counters__ = True
+    name: str = ""
+
+
+class BucketHarbor(Node):
+    __degree_counters__ = True
+    __edge_buckets__ = EdgeBuckets(threshold=2, bucket_size=2)
+    name: str = ""
+
+
+class Ferry(Edge):
+    pass
+
+
+async def _port(ctx: GraphContext):
+    """``hub -> a, b (Ferry), d (Dock)``; ``c -> hub``."""
+    hub = await Harbor.create(name="hub")
+    a, b, c = [await Harbor.create(name=n) for n in "abc"]
+    d = await Dock.create(name="d")
+    await hub.connect(a, Ferry)
+    await hub.connect(b, Ferry)
+    await hub.connect(d)
+    await c.connect(hub)
+    return hub, a, b, c, d
+
+
+async def _stored(ctx: GraphContext, node_id: str) -> Dict[str, Any]:
+    return (await ctx.database.get("node", node_id))["degree"]
+
+
+class TestMaintenance:
+    async def test_connect_persists_counters(self, ctx):
+        hub, a, *_ = await _port(ctx)
+        assert await _stored(ctx, hub.id) == {
+            "total": 4,
+            "out": {"Ferry": {"Harbor": 2}, "Edge": {"Dock": 1}},
+            "in": {"Edge": {"Harbor": 1}},
+            "loop": {},
+        }
+        assert (await _stored(ctx, a.id))["in"] == {"Ferry": {"Harbor": 1}}
+
+    async def test_count_neighbors_issues_no_queries(self, ctx, count_db_calls):
+        hub, *_ = await _port(ctx)
+        await ctx.clear_cache()
+        loaded = await Harbor.get(hub.id)
+        counting = count_db_calls()
+        assert await loaded.count_neighbors() == 3
+        assert await loaded.count_neighbors(direction="in") == 1
+        assert await loaded.count_neighbors(direction="both") == 4
+        assert await loaded.count_neighbors(node="Dock") == 1
+        assert await loaded.count_neighbors(node=Harbor, edge=Ferry) == 2
+        assert await loaded.count_neighbors(edge=["Ferry", Edge]) == 3
+        assert counting.calls == {}
+        ctx._database = counting.inner
+
+    async def test_property_filters_take_the_query_path(self, ctx):
+        hub, *_ = await _port(ctx)
+        assert await hub.count_neighbors(name="a") == 1
+
+    async def test_disconnect_and_deletes_decrement(self, ctx):
+        hub, a, b, c, d = await _port(ctx)
+        assert await hub.disconnect(a)
+        edge = (await ctx.find_edges_between(c.id, hub.id))[0]
+        await ctx.delete(edge)
+        await d.delete()
+        stored = await _stored(ctx, hub.id)
+        assert stored["total"] == 1
+        assert degree_counters.count(stored, "both") == 1
+        assert (await _stored(ctx, a.id))["total"] == 0
+        assert await hub.count_neighbors(direction="both") == 1
+
+    async def test_self_loop_counts_once(self, ctx):
+        hub = await Harbor.create(name="hub")
+        await hub.connect(hub)
+        assert await hub.count_neighbors() == 1
+        assert await hub.count_neighbors(direction="both") == 1
+        assert (await _stored(ctx, hub.id))["total"] == 1
+
+    async def test_bulk_connect_counts(self, ctx):
+        hub = Harbor(name="hub")
+        docks = [Dock(name=f"d{i}") for i in range(4)]
+        await ctx.create_and_connect_many([hub, *docks], [(hub, d) for d in docks])
+        extra = await Harbor.create(name="extra")
+        await ctx.connect_many([(extra, hub, Ferry)])
+        stored = await _stored(ctx, hub.id)
+        assert stored["total"] == 5
+        assert stored["out"] == {"Edge": {"Dock": 4}}
+        assert stored["in"] == {"Ferry": {"Harbor": 1}}
+        assert (await _stored(ctx, docks[0].id))["total"] == 1
+
+    async def test_bucketed_nodes_keep_counters(self, ctx):
+        hub = await BucketHarbor.create(name="hub")
+        docks = [await Dock.create(name=f"d{i}") for i in range(5)]
+        for dock in docks:
+            await hub.connect(dock)
+        await hub.disconnect(docks[-1])
+        raw = await ctx.database.get("node", hub.id)
+        assert raw["edge_count"] == 4 and raw["degree"]["total"] == 4
+        assert degree_counters.directed(raw) == (4, 0)
+        await ctx.clear_cache()
+        loaded = await BucketHarbor.get(hub.id)
+        assert await loaded.count_neighbors(node=Dock) == 4
+
+
+class TestRecovery:
+    async def test_uncounted_write_marks_stale_and_rebuilds(self, ctx, count_db_calls):
+        hub, *_ = await _port(ctx)
+        late = await Dock.create(name="late")
+        edge = await Edge.create(source=hub.id, target=late.id)
+        await ctx.atomic_add_edge_id(hub.id, edge.id)
+        await ctx.clear_cache()
+        loaded = await Harbor.get(hub.id)
+        assert degree_counters.counters_of(loaded) is None
+
+        counting = count_db_calls()
+        assert await loaded.count_neighbors(node="Dock") == 2
+        assert counting.calls == {"find_many:edge": 1}
+        ctx._database = counting.inner
+        await loaded.save()
+        assert (await _stored(ctx, hub.id))["total"] == 5
+
+    async def test_legacy_records_rebuild_lazily(self, ctx):
+        hub, *_ = await _port(ctx)
+        raw = await ctx.database.get("node", hub.id)
+        raw.pop("degree")
+        await ctx.database.save("node", raw)
+        await ctx.clear_cache()
+        loaded = await Harbor.get(hub.id)
+        assert await loaded.count_neighbors(direction="both") == 4
+
+    async def test_repair_cli(self, ctx, monkeypatch):
+        hub, *_ = await _port(ctx)
+        raw = await ctx.database.get("node", hub.id)
+        raw["degree"] = {"total": 4, "out": {"Edge": {"Dock": 9}}}
+        await ctx.database.save("node", raw)
+
+        class _StubManager:
+            def get_prime_database(self):
+                return ctx.database
+
+        monkeypatch.setattr(
+            "jvspatial.db.manager.get_database_manager", lambda: _StubManager()
+        )
+        from jvspatial.cli import _run_repair_degrees, build_parser
+
+        args = build_parser().parse_args(
+            ["repair-degrees", "--entity", "Harbor", "--apply"]
+        )
+        assert await _run_repair_degrees(args) == 0
+        stored = await _stored(ctx, hub.id)
+        assert stored["out"] == {"Ferry": {"Harbor": 2}, "Edge": {"Dock": 1}}
+        assert stored["total"] == 4
+
+
+async def test_expand_node_reports_directed_degree(ctx):
+    hub, *_ = await _port(ctx)
+    page = await ctx.expand_node(hub.id)
+    center = next(n for n in page["nodes"] if n["id"] == hub.id)
+    assert (center["degree"], center["out_degree"], center["in_degree"]) == (4, 3, 1)
+
+
+async def test_conditional_increment_skips_known_edges(ctx):
+    hub = await Harbor.create(name="hub")
+    dock = await Dock.create(name="d")
+    edge = await hub.connect(dock)
+    entry = {"id": edge.id, "peer": dock.id, "dir": "out", "entity": "Edge"}
+    result = await ctx.database.find_one_and_update(
+        "node",
+        {"_id": hub.id, "edges": {"$not": {"$all": [edge.id]}}},
+        {"$inc": degree_counters.increments([(entry, 1)])},
+    )
+    assert result is None
+    assert (await _stored(ctx, hub.id))["total"] == 1
@@ -0,0 +1,221 @@
+"""Distributed walker execution (``DistributedWalk``) over work claims.
+
+Workers share one database: in-process tasks on SQLite and JsonDB, and
+spawned worker processes on a SQLite file. Every node of the graph must
+be visited exactly once per run unless a lease expires.
+"""
+
+import asyncio
+from typing import Any, List
+
+from jvspatial.core import DistributedWalk, on_visit, run_local_workers
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Edge, Node, Walker
+from jvspatial.db.sqlite import SQLiteDB
+from jvspatial.db.work_claim import claim_record
+
+
+class Atoll(Node):
+    name: str = ""
+
+
+class Cartographer(Walker):
+    @on_visit(Atoll)
+    async def chart(self, here):
+        await self.report({"name": here.name})
+        await self.visit(await here.nodes(direction="out"))
+
+
+class Castaway(Walker):
+    @on_visit(Atoll)
+    async def chart(self, here):
+        await self.report({"name": here.name})
+        await self.visit(await here.nodes(direction="out"))
+        if here.name == "stop":
+            self.pause("storm")
+
+
+class Ferryman(Walker):
+    """Crosses every edge explicitly: nodes queue edges, edges queue nodes."""
+
+    @on_visit(Atoll)
+    async def land(self, here):
+        await self.report({"name": here.name})
+        await self.visit(await here.edges(direction="out"))
+
+    @on_visit(Edge)
+    async def cross(self, here):
+        await self.report({"edge": here.id})
+        await self.visit([await Atoll.get(here.target)])
+
+
+async def _grid(size: int = 4) -> List[List[Atoll]]:
+    """``size x size`` grid with edges right and down: many paths per node."""
+    grid = [
+        [await Atoll.create(name=f"{r},{c}") for c in range(size)] for r in range(size)
+    ]
+    for r in range(size):
+        for c in range(size):
+            if c + 1 < size:
+                await grid[r][c].connect(grid[r][c + 1])
+            if r + 1 < size:
+                await grid[r][c].connect(grid[r + 1][c])
+    return grid
+
+
+def _names(reports: List[Any]) -> List[str]:
+    return sorted(r["name"] for r in reports if "name" in r)
+
+
+class TestDistributedWalk:
+    async def test_single_worker_visits_each_node_once(self, ctx):
+        grid = await _grid()
+        walk = DistributedWalk(Cartographer, context=ctx, batch_size=3)
+        assert await walk.seed([grid[0][0]]) == 1
+        assert await walk.seed([grid[0][0].id]) == 0
+
+        assert await walk.work(worker_id="w0") == 16
+        assert await walk.status() == {"pending": 0, "done": 16}
+        assert _names(await walk.results()) == sorted(
+            n.name for row in grid for n in row
+        )
+        assert await walk.visited(grid[3][3])
+
+    async def test_concurrent_workers_share_the_frontier(self, ctx):
+        grid = await _grid()
+        walks = [
+            DistributedWalk(Cartographer, "shared", context=ctx, batch_size=2)
+            for _ in range(3)
+        ]
+        await walks[0].seed([grid[0][0]])
+        counts = await asyncio.gather(
+            *(w.work(worker_id=f"w{i}") for i, w in enumerate(walks))
+        )
+        assert await walks[1].status() == {"pending": 0, "done": 16}
+        names = _names(await walks[1].results())
+        assert sorted(set(names)) == sorted(n.name for row in grid for n in row)
+        if isinstance(ctx.database, SQLiteDB):
+            # Atomic claims: no node is leased twice.
+            assert sum(counts) == len(names) == 16
+
+    async def test_queued_edges_are_visited(self, ctx):
+        grid = await _grid(2)
+        walk = DistributedWalk(Ferryman, context=ctx, batch_size=2)
+        await walk.seed([grid[0][0]])
+        # 4 nodes and the 4 edges between them.
+        assert await walk.work() == 8
+        reports = await walk.results()
+        assert len(_names(reports)) == 4
+        edge_ids = [r["edge"] for r in reports if "edge" in r]
+        assert len(set(edge_ids)) == len(edge_ids) == 4
+        assert await walk.visited(edge_ids[0])
+
+    async def test_discoveries_are_queued_in_one_write(self, ctx, monkeypatch):
+        grid = await _grid(3)
+        db = ctx.database
+        calls = {"bulk_save": 0, "find_one_and_update": 0}
+        bulk_save, find_one_and_update = db.bulk_save, db.find_one_and_update
+
+        async def counting_bulk_save(collection, records):
+            calls["bulk_save"] += collection == "walker_frontier"
+            return await bulk_save(collection, records)
+
+        async def counting_find_one_and_update(collection, query, update, **kw):
+            if "$setOnInsert" in update:
+                calls["find_one_and_update"] += 1
+            return await find_one_and_update(collection, query, update, **kw)
+
+        monkeypatch.setattr(db, "bulk_save", counting_bulk_save)
+        monkeypatch.setattr(db, "find_one_and_update", counting_find_one_and_update)
+        walk = DistributedWalk(Cartographer, context=ctx, batch_size=9)
+        assert await walk.seed([row[0] for row in grid]) == 3
+        assert calls == {"bulk_save": 1, "find_one_and_update": 0}
+        await walk.work(max_batches=1)
+        assert calls == {"bulk_save": 2, "find_one_and_update": 0}
+        assert await walk.status() == {"pending": 3, "done": 3}
+
+    async def test_max_batches_leaves_the_rest_pending(self, ctx):
+        grid = await _grid(3)
+        walk = DistributedWalk(Cartographer, context=ctx, batch_size=1)
+        await walk.seed([grid[0][0]])
+        assert await walk.work(max_batches=1) == 1
+        assert await walk.status() == {"pending": 2, "done": 1}
+        assert not await walk.visited(grid[0][1])
+
+    async def test_expired_lease_is_recovered(self, ctx):
+        grid = await _grid(2)
+        walk = DistributedWalk(
+            Cartographer, context=ctx, stale_seconds=0.05, poll_interval=0.01
+        )
+        await walk.seed([grid[0][0]])
+        record_id = f"frontier.{walk.run_id}.{grid[0][0].id}"
+        # A worker that leased the seed and died.
+        _, token = await claim_record(
+            ctx.database, "walker_frontier", record_id, stale_seconds=0.05
+        )
+        assert token is not None
+        assert await walk.work(max_batches=0) == 0
+
+        assert await walk.work() == 4
+        assert await walk.status() == {"pending": 0, "done": 4}
+
+    async def test_pause_stops_every_worker_until_resume(self, ctx):
+        start = await Atoll.create(name="start")
+        stop = await Atoll.create(name="stop")
+        after = await Atoll.create(name="after")
+        await start.connect(stop)
+        await stop.connect(after)
+
+        walk = DistributedWalk(Castaway, context=ctx, batch_size=1)
+        await walk.seed([start])
+        assert await walk.work() == 2
+        assert await walk.stopped()
+        assert await walk.status() == {"pending": 1, "done": 2}
+
+        await walk.resume()
+        assert await walk.work() == 1
+        assert _names(await walk.results()) == ["after", "start", "stop"]
+
+    async def test_clear_removes_the_run(self, ctx):
+        grid = await _grid(2)
+        walk = DistributedWalk(Cartographer, context=ctx)
+        await walk.seed([grid[0][0]])
+        await walk.work()
+        await walk.stop()
+        await walk.clear()
+        assert await walk.status() == {"pending": 0, "done": 0}
+        assert await walk.results() == []
+        assert not await walk.stopped()
+
+
+async def test_local_worker_processes(tmp_path):
+    path = str(tmp_path / "graph.db")
+    db = SQLiteDB(db_path=path)
+    context = GraphContext(database=db)
+    set_default_context(context)
+    try:
+        grid = await _grid()
+        walk = DistributedWalk(Cartographer, "procs", context=context)
+        await walk.seed([grid[0][0]])
+    finally:
+        await db.close()
+
+    counts = await run_local_workers(
+        Cartographer,
+        "procs",
+        db_type="sqlite",
+        db_options={"db_path": path},
+        processes=2,
+        batch_size=2,
+        poll_interval=0.05,
+    )
+    # At least once: two processes may queue the same node in one instant
+    assert sum(counts) >= 16
+
+    db = SQLiteDB(db_path=path)
+    try:
+        walk = DistributedWalk(Cartographer, "procs", context=GraphContext(database=db))
+        assert await walk.status() == {"pending": 0, "done": 16}
+        assert len(_names(await walk.results())) == 16
+    finally:
+        await db.close()
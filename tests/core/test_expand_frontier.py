@@ -0,0 +1,146 @@
+"""Frontier-batched multi-hop expansion (``GraphContext.expand_frontier``).
+
+Runs against SQLite and JsonDB, neither of which has a backend
+``traverse``: every hop must cost one edge query and at most one node
+batch fetch, whatever the frontier size.
+"""
+
+from jvspatial.core import on_visit
+from jvspatial.core.context import GraphContext
+from jvspatial.core.entities import Edge, Node, Walker
+
+
+class Station(Node):
+    name: str = ""
+    size: int = 0
+
+
+class Depot(Node):
+    name: str = ""
+
+
+class Junction(Node):
+    __adjacency_entries__ = True
+    name: str = ""
+
+
+class Rail(Edge):
+    gauge: int = 1
+
+
+async def _tree(ctx: GraphContext):
+    """``root -> s0..s2 (Rail, gauge=i)``; each ``si -> si_0, si_1``; ``s0 -> d``."""
+    root = await Station.create(name="root")
+    level1 = [await Station.create(name=f"s{i}", size=i) for i in range(3)]
+    level2 = []
+    for i, parent in enumerate(level1):
+        await root.connect(parent, Rail, gauge=i)
+        for j in range(2):
+            child = await Station.create(name=f"s{i}_{j}", size=10 + j)
+            await parent.connect(child)
+            level2.append(child)
+    depot = await Depot.create(name="d")
+    await level1[0].connect(depot)
+    return root, level1, level2, depot
+
+
+class TestExpandFrontier:
+    async def test_one_edge_query_and_one_batch_per_hop(self, ctx, count_db_calls):
+        root, level1, level2, depot = await _tree(ctx)
+        await ctx.clear_cache()
+        counting = count_db_calls()
+        rows = await ctx.expand_frontier([root.id], 3)
+        assert counting.calls == {"find:edge": 3, "find_many:node": 2}
+        ctx._database = counting.inner
+
+        by_id = {r["node_id"]: r for r in rows}
+        assert set(by_id) == {n.id for n in level1 + level2 + [depot]}
+        assert all(by_id[n.id]["depth"] == 1 for n in level1)
+        assert by_id[depot.id]["depth"] == 2
+        assert by_id[depot.id]["parent_id"] == level1[0].id
+        assert by_id[level1[2].id]["edge_id"].startswith("e.Rail.")
+        assert [r["depth"] for r in rows] == sorted(r["depth"] for r in rows)
+
+    async def test_many_sources_share_a_hop(self, ctx, count_db_calls):
+        root, level1, level2, depot = await _tree(ctx)
+        counting = count_db_calls()
+        rows = await ctx.expand_frontier(level1, 1)
+        assert counting.calls.get("find:edge") == 1
+        ctx._database = counting.inner
+        assert {r["node_id"] for r in rows} == {n.id for n in level2 + [depot]}
+
+    async def test_directions(self, ctx):
+        root, level1, level2, _ = await _tree(ctx)
+        up = await ctx.expand_frontier([level2[0].id], 2, direction="in")
+        assert [r["node_id"] for r in up] == [level1[0].id, root.id]
+        both = await ctx.expand_frontier([level1[1].id], 1, direction="both")
+        assert {r["node_id"] for r in both} == {root.id, *(n.id for n in level2[2:4])}
+
+    async def test_filters_apply_at_every_hop(self, ctx):
+        root, level1, level2, depot = await _tree(ctx)
+        wide = await ctx.expand_frontier(
+            [root.id], 1, edge=[{"Rail": {"context.gauge": {"$gte": 1}}}]
+        )
+        assert {r["node_id"] for r in wide} == {level1[1].id, level1[2].id}
+
+        depots = await ctx.expand_frontier([root.id], 2, node=[Station, "Depot"])
+        assert depot.id in {r["node_id"] for r in depots}
+        only_stations = await ctx.expand_frontier([root.id], 2, node="Station")
+        assert depot.id not in {r["node_id"] for r in only_stations}
+
+        big = await ctx.expand_frontier([root.id], 2, size=11)
+        assert big == []  # level-1 stations fail the filter, so nothing expands
+        small = await ctx.expand_frontier(
+            [root.id], 2, node=[{"Station": {"context.size": {"$lt": 2}}}]
+        )
+        assert {r["node_id"] for r in small} == {level1[0].id, level1[1].id}
+
+    async def test_limits(self, ctx):
+        root, *_ = await _tree(ctx)
+        assert len(await ctx.expand_frontier([root.id], 2, limit=4)) == 4
+        capped = await ctx.expand_frontier([root.id], 2, per_node_limit=1)
+        assert [r["depth"] for r in capped] == [1, 2]
+
+    async def test_typed_entries_skip_the_edge_query(self, ctx, count_db_calls):
+        hub = await Junction.create(name="hub")
+        spokes = [await Junction.create(name=f"j{i}") for i in range(3)]
+        for spoke in spokes:
+            await hub.connect(spoke, Rail)
+        await spokes[0].connect(hub)
+        counting = count_db_calls()
+        rows = await ctx.expand_frontier([hub], 2, edge=Rail)
+        assert "find:edge" not in counting.calls
+        ctx._database = counting.inner
+        assert {r["node_id"] for r in rows} == {s.id for s in spokes}
+        assert {r["depth"] for r in rows} == {1}
+
+
+class TestCallers:
+    async def test_neighborhood_batches_hops(self, ctx, count_db_calls):
+        root, level1, level2, depot = await _tree(ctx)
+        counting = count_db_calls()
+        hood = await root.neighborhood(2)
+        assert counting.calls.get("find:edge") == 2
+        ctx._database = counting.inner
+        assert {n.id for n in hood} == {n.id for n in level1 + level2 + [depot]}
+
+    async def test_walker_prefetch_uses_frontier(self, ctx, count_db_calls):
+        root, level1, level2, depot = await _tree(ctx)
+
+        class Sweep(Walker):
+            def __init__(self):
+                super().__init__(
+                    prefetch_neighbors=True, prefetch_depth=2, frontier_batch_size=8
+                )
+                self.seen: list = []
+
+            @on_visit()
+            async def visit_node(self, node):
+                self.seen.append(node.id)
+
+        counting = count_db_calls()
+        walker = Sweep()
+        await walker.spawn(root)
+        assert counting.calls.get("find:edge", 0) <= 6
+        ctx._database = counting.inner
+        assert set(walker.seen) == {n.id for n in [root, *level1, *level2, depot]}
@@ -0,0 +1,132 @@
+"""``GraphContext.connect_many`` / ``create_and_connect_many`` bulk imports.
+
+Runs against SQLite and JsonDB; a counting wrapper checks that edges go out
+through ``bulk_save`` and each node's edge list is written once.
+"""
+
+from typing import List
+
+import pytest
+
+from jvspatial.core.context import GraphContext
+from jvspatial.core.entities import Edge, Node
+
+
+class City(Node):
+    name: str = ""
+
+
+class Highway(Edge):
+    lanes: int = 2
+
+
+async def _edges_of(ctx: GraphContext, node_id: str) -> List[str]:
+    raw = await ctx.database.get("node", node_id)
+    return sorted(raw.get("edges") or [])
+
+
+class TestConnectMany:
+    async def test_creates_edges_and_updates_both_endpoints(self, ctx):
+        a, b, c = [await City.create(name=n) for n in "abc"]
+        edges = await ctx.connect_many(
+            [(a, b, Highway, {"lanes": 4}), (a, c), (b.id, c.id, Highway)]
+        )
+        assert [type(e) for e in edges] == [Highway, Edge, Highway]
+        assert edges[0].lanes == 4 and edges[0].bidirectional is False
+        assert (edges[2].source, edges[2].target) == (b.id, c.id)
+
+        assert await _edges_of(ctx, a.id) == sorted([edges[0].id, edges[1].id])
+        assert await _edges_of(ctx, c.id) == sorted([edges[1].id, edges[2].id])
+        assert sorted(a.edge_ids) == sorted([edges[0].id, edges[1].id])
+        assert {n.id for n in await a.nodes()} == {b.id, c.id}
+
+    async def test_idempotent_like_connect(self, ctx):
+        a, b = [await City.create(name=n) for n in "ab"]
+        existing = await a.connect(b, Highway)
+        again = await ctx.connect_many([(a, b, Highway), (a, b, Highway)])
+        assert [e.id for e in again] == [existing.id, existing.id]
+        assert len(await ctx.database.find("edge", {})) == 1
+
+        # "both" accepts an existing edge either way round.
+        (mutual,) = await ctx.connect_many([(b, a, Highway, {"direction": "both"})])
+        assert mutual.id == existing.id
+
+        # A different type or an "out" request in the reverse direction is new,
+        # exactly as Node.connect would decide.
+        more = await ctx.connect_many([(a, b), (b, a, Highway)])
+        assert len({e.id for e in more} | {existing.id}) == 3
+
+    async def test_repeats_inside_a_batch_collapse(self, ctx):
+        a, b = [await City.create(name=n) for n in "ab"]
+        edges = await ctx.connect_many([(a, b)] * 3)
+        assert len({e.id for e in edges}) == 1
+        assert await _edges_of(ctx, a.id) == [edges[0].id]
+
+    async def test_repairs_missing_edge_list_entries(self, ctx):
+        a, b = [await City.create(name=n) for n in "ab"]
+        edge = await Edge.create(source=a.id, target=b.id, direction="out")
+        assert await _edges_of(ctx, a.id) == []
+        (found,) = await ctx.connect_many([(a.id, b.id)])
+        assert found.id == edge.id
+        assert await _edges_of(ctx, a.id) == [edge.id]
+        assert await _edges_of(ctx, b.id) == [edge.id]
+
+    async def test_reuses_legacy_edges_without_duplicates(self, ctx):
+        a, b, c = [await City.create(name=n) for n in "abc"]
+        legacy = await Highway.create(source=a.id, target=b.id, direction="out")
+        edges = await ctx.connect_many(
+            [(a, b, Highway), (b, a, Highway, {"direction": "both"}), (a, c, Highway)]
+        )
+        assert [e.id for e in edges[:2]] == [legacy.id, legacy.id]
+        assert edges[2].id == Highway.deterministic_id(a.id, c.id)
+        assert len(await ctx.database.find("edge", {})) == 2
+
+    async def test_batched_round_trips(self, ctx, count_db_calls):
+        hub = await City.create(name="hub")
+        spokes = [await City.create(name=f"s{i}") for i in range(20)]
+        counting = count_db_calls()
+
+        await ctx.connect_many([(hub, s) for s in spokes])
+        assert counting.calls.get("find_many:edge") == 1
+        assert counting.calls.get("find:edge") == 1
+        assert counting.calls.get("bulk_save:edge") == 1
+        assert counting.calls.get("save:edge") is None
+        assert counting.calls.get("find_many:node") == 1
+        assert counting.calls.get("bulk_save:node") == 1
+        assert len(await _edges_of(ctx, hub.id)) == 20
+
+    async def test_bad_tuple_rejected(self, ctx):
+        with pytest.raises(ValueError):
+            await ctx.connect_many([("a",)])
+
+
+class TestCreateAndConnectMany:
+    async def test_new_nodes_written_once_with_full_edge_lists(
+        self, ctx, count_db_calls
+    ):
+        root = await City.create(name="root")
+        fresh = [City(name=f"c{i}") for i in range(5)]
+        counting = count_db_calls()
+
+        nodes, edges = await ctx.create_and_connect_many(
+            fresh,
+            [(root, n, Highway) for n in fresh] + [(fresh[0], fresh[1])],
+        )
+        assert nodes == fresh and len(edges) == 6
+        # Only pairs between pre-existing nodes need the duplicate lookup.
+        assert counting.calls.get("find:edge") is None
+        assert counting.calls.get("bulk_save:node") == 2
+
+        assert await _edges_of(ctx, fresh[0].id) == sorted([edges[0].id, edges[5].id])
+        assert len(await _edges_of(ctx, root.id)) == 5
+        loaded = await City.get(fresh[3].id)
+        assert loaded.name == "c3" and loaded.edge_ids == [edges[3].id]
+
+
+def test_add_to_set_each_unwraps():
+    from jvspatial.db.query import QueryEngine
+
+    doc = {"edges": ["e1"]}
+    QueryEngine.apply_update(doc, {"$addToSet": {"edges": {"$each": ["e1", "e2"]}}})
+    QueryEngine.apply_update(doc, {"$push": {"edges": {"$each": ["e3"]}}})
+    assert doc["edges"] == ["e1", "e2", "e3"]
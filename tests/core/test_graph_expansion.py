@@ -274,3 +274,62 @@ async def test_summary_omits_context_on_nodes_and_edges(graph_ctx: GraphContext)
     for e in out["edges"]:
         assert "context" not in e
         assert e["direction"] in ("undirected", "outgoing", "incoming", "loop")
+
+
+@pytest.mark.asyncio
+async def test_subgraph_bfs_fetches_one_batch_per_level(graph_ctx: GraphContext):
+    db = graph_ctx.database
+    # Root -> 3 children -> 2 grandchildren each.
+    root_edges = [f"e.r{i}" for i in range(3)]
+    await db.save("node", _node("n.R.r", root_edges))
+    for i in range(3):
+        kids = [f"e.c{i}{j}" for j in range(2)]
+        await db.save("node", _node(f"n.C.c{i}", [f"e.r{i}", *kids]))
+        await db.save("edge", _edge(f"e.r{i}", "n.R.r", f"n.C.c{i}"))
+        for j in range(2):
+            await db.save("node", _node(f"n.G.g{i}{j}", [f"e.c{i}{j}"]))
+            await db.save("edge", _edge(f"e.c{i}{j}", f"n.C.c{i}", f"n.G.g{i}{j}"))
+
+    calls = {"get": 0}
+    real_get = db.get
+
+    async def counting_get(collection, id):
+        calls["get"] += 1
+        return await real_get(collection, id)
+
+    db.get = counting_get
+    sub = await subgraph_bfs(graph_ctx, "n.R.r", max_depth=2, max_nodes=50)
+
+    assert sub["meta"]["node_count"] == 10
+    assert sub["meta"]["edge_count"] == 9
+    assert sub["meta"]["levels"] == 3
+    assert sub["meta"]["round_trips"] == {"node": 3, "edge": 2, "total": 5}
+    assert calls["get"] == 0
+
+
+@pytest.mark.asyncio
+async def test_subgraph_bfs_truncates_mid_level_in_bfs_order(graph_ctx: GraphContext):
+    db = graph_ctx.database
+    await db.save("node", _node("n.R.r", ["e1", "e2", "e3"]))
+    for i, name in enumerate("abc", start=1):
+        await db.save("node", _node(f"n.X.{name}", []))
+        await db.save("edge", _edge(f"e{i}", "n.R.r", f"n.X.{name}"))
+
+    sub = await subgraph_bfs(graph_ctx, "n.R.r", max_depth=3, max_nodes=3)
+    ids = {n["id"] for n in sub["nodes"]}
+    # Edge ids sort e1 < e2 < e3, so the BFS admits a then b before the cap.
+    assert ids == {"n.R.r", "n.X.a", "n.X.b"}
+    assert sub["meta"]["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_expand_node_reports_round_trips(graph_ctx: GraphContext):
+    db = graph_ctx.database
+    await db.save("node", _node("n.Hub.h", [f"e.{i}" for i in range(4)]))
+    for i in range(4):
+        await db.save("node", _node(f"n.T.{i}", [], entity="T"))
+        await db.save("edge", _edge(f"e.{i}", "n.Hub.h", f"n.T.{i}"))
+
+    out = await expand_node(graph_ctx, "n.Hub.h", limit=10)
+    assert len(out["nodes"]) == 5
+    assert out["meta"]["round_trips"] == {"node": 2, "edge": 1, "total": 3}
@@ -0,0 +1,245 @@
+"""Weighted shortest paths and k-hop reachability (``jvspatial.core.graph_paths``).
+
+Runs against SQLite, whose recursive-CTE ``shortest_path``/``reachable``
+answer bounded searches in one query, and JsonDB, where every search runs
+in process over batched edge queries.
+"""
+
+from typing import Dict
+
+import pytest
+
+from jvspatial.core import graph_paths
+from jvspatial.core.context import GraphContext, set_default_context
+from jvspatial.core.entities import Edge, Node
+from jvspatial.db.sqlite import SQLiteDB
+
+
+class Waypoint(Node):
+    name: str = ""
+    x: float = 0.0
+
+
+class Outpost(Node):
+    name: str = ""
+    x: float = 0.0
+
+
+class Route(Edge):
+    distance: float = 1.0
+
+
+class Shortcut(Edge):
+    distance: float = 1.0
+
+
+async def _map():
+    """``a -1-> b -1-> c -1-> e``, ``a -2-> d(Outpost) -5-> e``, ``a =10=> e``.
+
+    ``=>`` is a ``Shortcut``; the rest are ``Route`` edges.
+    """
+    a, b, c, e = [
+        await Waypoint.create(name=n, x=float(i))
+        for i, n in enumerate(["a", "b", "c", "e"])
+    ]
+    d = await Outpost.create(name="d", x=1.5)
+    await a.connect(b, Route, distance=1)
+    await b.connect(c, Route, distance=1)
+    await c.connect(e, Route, distance=1)
+    await a.connect(d, Route, distance=2)
+    await d.connect(e, Route, distance=5)
+    await a.connect(e, Shortcut, distance=10)
+    return a, b, c, d, e
+
+
+def _names(path) -> list:
+    return [n.name for n in path.nodes]
+
+
+async def test_unweighted_path_counts_hops(ctx):
+    a, _, _, _, e = await _map()
+    path = await a.shortest_path(e)
+    assert _names(path) == ["a", "e"]
+    assert path.cost == 1 and path.hops == 1
+    assert isinstance(path.edges[0], Shortcut)
+
+
+@pytest.mark.parametrize("max_depth", [None, 3, 8])
+async def test_weighted_path_prefers_cheap_detour(ctx, max_depth):
+    a, _, _, _, e = await _map()
+    path = await a.shortest_path(e, "context.distance", max_depth=max_depth)
+    assert _names(path) == ["a", "b", "c", "e"]
+    assert path.cost == 3
+    assert [edge.source for edge in path.edges] == path.node_ids[:-1]
+    assert [edge.target for edge in path.edges] == path.node_ids[1:]
+
+
+@pytest.mark.parametrize("max_depth", [2, 7])
+async def test_max_depth_bounds_weighted_path(ctx, max_depth):
+    a, _, _, _, e = await _map()
+    path = await a.shortest_path(e, "context.distance", max_depth=max_depth)
+    if max_depth == 2:
+        assert _names(path) == ["a", "d", "e"] and path.cost == 7
+    else:
+        assert path.cost == 3
+
+
+async def test_unreachable_within_depth_is_none(ctx):
+    a, _, c, _, e = await _map()
+    assert await e.shortest_path(a) is None
+    assert await a.shortest_path(c, max_depth=1) is None
+    assert await a.shortest_path(c, "context.distance", max_depth=1) is None
+
+
+async def test_source_equals_target(ctx):
+    a, *_ = await _map()
+    path = await a.shortest_path(a, "context.distance")
+    assert path.node_ids == [a.id] and path.edges == [] and path.cost == 0
+
+
+async def test_incoming_direction_walks_backwards(ctx):
+    a, _, _, _, e = await _map()
+    path = await e.shortest_path(a, "context.distance", direction="in")
+    assert _names(path) == ["e", "c", "b", "a"] and path.cost == 3
+    bounded = await ctx.shortest_path(
+        e.id, a.id, weight="context.distance", direction="in", max_depth=3
+    )
+    assert bounded.node_ids == path.node_ids
+
+
+async def test_both_direction_ignores_edge_orientation(ctx):
+    _, b, _, d, _ = await _map()
+    path = await b.shortest_path(d, direction="both")
+    assert _names(path) == ["b", "a", "d"]
+
+
+@pytest.mark.parametrize("max_depth", [None, 4])
+async def test_edge_filter(ctx, max_depth):
+    a, _, _, _, e = await _map()
+    path = await a.shortest_path(e, edge=[Route], max_depth=max_depth)
+    assert _names(path) == ["a", "d", "e"]
+    props = await a.shortest_path(
+        e,
+        "context.distance",
+        edge=[{"Route": {"context.distance": {"$lt": 5}}}],
+        max_depth=max_depth,
+    )
+    assert _names(props) == ["a", "b", "c", "e"]
+
+
+async def test_node_filter_restricts_intermediate_nodes(ctx):
+    a, _, _, _, e = await _map()
+    path = await a.shortest_path(e, edge="Route", node=["Outpost"])
+    assert _names(path) == ["a", "d", "e"]
+    assert await a.shortest_path(e, edge="Route", node="Waypoint", max_depth=2) is None
+
+
+async def test_heuristic_runs_astar(ctx):
+    a, _, _, _, e = await _map()
+    seen = []
+
+    def _h(node, goal):
+        seen.append(node.id)
+        return abs(goal.x - node.x)
+
+    path = await a.shortest_path(e, "context.distance", heuristic=_h)
+    assert _names(path) == ["a", "b", "c", "e"] and path.cost == 3
+    assert a.id in seen
+
+
+async def test_missing_weight_costs_one_and_negative_raises(ctx):
+    a, b, _, _, e = await _map()
+    assert (await a.shortest_path(e, "context.toll")).cost == 1
+    c = await Waypoint.create(name="neg")
+    await b.connect(c, Route, distance=-1)
+    with pytest.raises(ValueError):
+        await a.shortest_path(c, "context.distance")
+
+
+def _reference_cost(weights: Dict[tuple, float], source, target) -> float:
+    dist, todo = {source: 0.0}, [(0.0, source)]
+    while todo:
+        todo.sort()
+        cost, node = todo.pop(0)
+        if node == target:
+            return cost
+        for (u, v), w in weights.items():
+            if u == node and cost + w < dist.get(v, float("inf")):
+                dist[v] = cost + w
+                todo.append((cost + w, v))
+    raise AssertionError("unreachable")
+
+
+async def test_dijkstra_batches_edge_queries(ctx, count_db_calls):
+    """A 10x10 grid: prefetching cuts ~70 per-node edge queries to ~20."""
+    cells = {(r, c): Waypoint(name=f"{r}_{c}") for r in range(10) for c in range(10)}
+    weights = {}
+    connections = []
+    for (r, c), cell in cells.items():
+        for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            peer = cells.get((r + dr, c + dc))
+            if peer is not None:
+                w = float((r * 7 + c * 3 + dr + 2 * dc) % 5 + 1)
+                weights[((r, c), (r + dr, c + dc))] = w
+                connections.append((cell, peer, Route, {"distance": w}))
+    await ctx.create_and_connect_many(list(cells.values()), connections)
+    counting = count_db_calls()
+    try:
+        path = await cells[0, 0].shortest_path(cells[9, 9], "context.distance")
+    finally:
+        ctx._database = counting.inner
+    assert path.cost == _reference_cost(weights, (0, 0), (9, 9))
+    assert path.cost == sum(edge.distance for edge in path.edges)
+    assert counting.calls.get("find:edge", 0) <= 25
+
+
+async def test_reachable_hops(ctx):
+    a, b, c, d, e = await _map()
+    assert await a.reachable(1) == {b.id: 1, d.id: 1, e.id: 1}
+    assert await a.reachable(3, edge="Route") == {b.id: 1, d.id: 1, c.id: 2, e.id: 2}
+    assert await e.reachable(2, direction="in") == {
+        c.id: 1,
+        d.id: 1,
+        a.id: 1,
+        b.id: 2,
+    }
+    assert await a.reachable(0) == {}
+
+
+async def test_reachable_node_filter_prunes(ctx):
+    a, b, c, _, e = await _map()
+    hops = await a.reachable(3, edge=Route, node="Waypoint")
+    assert hops == {b.id: 1, c.id: 2, e.id: 3}
+
+
+async def test_reachable_query_count(ctx, count_db_calls):
+    a, *_ = await _map()
+    counting = count_db_calls()
+    try:
+        await a.reachable(3, edge="Route")
+    finally:
+        ctx._database = counting.inner
+    if isinstance(counting.inner, SQLiteDB):
+        assert counting.calls == {"reachable:edge": 1}
+    else:
+        assert counting.calls.get("find:edge", 0) == 3
+
+
+async def test_sqlite_cte_matches_in_process_search():
+    db = SQLiteDB(db_path=":memory:")
+    context = GraphContext(database=db)
+    set_default_context(context)
+    try:
+        a, _, _, _, e = await _map()
+        row = await db.shortest_path(
+            "edge", a.id, e.id, max_depth=4, weight="context.distance"
+        )
+        assert row["cost"] == 3 and len(row["edge_ids"]) == 3
+        assert await db.shortest_path("edge", e.id, a.id, max_depth=4) is None
+        with pytest.raises(NotImplementedError):
+            await db.reachable(
+                "edge", a.id, max_depth=2, edge_filter={"x": {"$where": "1"}}
+            )
+        assert graph_paths.PATH_CTE_MAX_DEPTH >= 4
+    finally:
+        await db.close()
@@ -0,0 +1,121 @@
+"""Thread/process-pool offload for ``@on_visit(executor=...)`` hooks.
+
+Offloaded hooks receive the visited entity's flat export and return field
+updates that the walker applies back on the event loop. Nodes are
+in-memory instances; nothing is saved.
+"""
+
+import os
+import threading
+import time
+from typing import List
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.core.entities._visit_hooks import dispatch_table
+from jvspatial.core.entities.walker_components.hook_offload import (
+    configure_hook_pools,
+)
+
+_active = {"now": 0, "peak": 0}
+_active_lock = threading.Lock()
+
+
+class Essay(Node):
+    text: str = ""
+    score: int = 0
+    words: int = 0
+    grader: str = ""
+    pid: int = 0
+
+    @on_visit("Grader", executor="process")
+    def count_words(record):
+        return {"words": len(record["text"].split()), "pid": os.getpid()}
+
+
+class Grader(Walker):
+    @on_visit(Essay, executor="thread")
+    def grade(record):
+        if record["text"] == "boom":
+            raise RuntimeError("cannot grade")
+        return {"score": len(record["text"]), "grader": threading.current_thread().name}
+
+
+class Proofreader(Walker):
+    @on_visit(Essay, executor="thread")
+    def slow(record):
+        with _active_lock:
+            _active["now"] += 1
+            _active["peak"] = max(_active["peak"], _active["now"])
+        time.sleep(0.02)
+        with _active_lock:
+            _active["now"] -= 1
+        return None
+
+    @on_visit(Essay, executor="thread")
+    def bad_return(record):
+        return ["not", "a", "mapping"]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def pools():
+    pools = configure_hook_pools(thread_workers=4, process_workers=2)
+    yield pools
+    pools.shutdown()
+
+
+async def _run(walker: Walker, nodes: List[Node]) -> List:
+    await walker.queue.append(nodes)
+    return await walker.run()
+
+
+async def test_thread_and_process_hooks_apply_updates():
+    essays = [Essay(text="one two three"), Essay(text="four five")]
+    walker = Grader()
+    report = await _run(walker, essays)
+    assert report == []
+    assert [e.score for e in essays] == [13, 9]
+    assert [e.words for e in essays] == [3, 2]
+    assert all(e.grader.startswith("jvspatial-hook") for e in essays)
+    assert all(e.pid not in (0, os.getpid()) for e in essays)
+
+
+async def test_offloaded_hooks_are_parallel_safe():
+    table = dispatch_table(Grader, Essay)
+    assert table.parallel_safe
+    assert [hook.__name__ for hook, _ in table.walker_hooks] == ["grade"]
+    assert all(is_async for _, is_async in table.walker_hooks + table.target_hooks)
+
+
+async def test_errors_are_reported_and_counted():
+    walker = Grader()
+    report = await _run(walker, [Essay(text="boom"), Essay(text="ok")])
+    assert report[0]["hook_name"] == "grade"
+    assert "cannot grade" in report[0]["hook_error"]
+    metrics = walker.hook_metrics()["Grader.grade"]
+    assert metrics["calls"] == 1 and metrics["errors"] == 1
+    assert metrics["p99_ms"] >= metrics["p50_ms"] >= 0
+
+
+async def test_non_mapping_result_is_reported():
+    walker = Proofreader()
+    report = await _run(walker, [Essay(text="x")])
+    assert any(item.get("hook_name") == "bad_return" for item in report)
+
+
+async def test_max_pending_bounds_in_flight_calls():
+    _active["peak"] = 0
+    walker = Proofreader(concurrency=8, offload_max_pending=2)
+    await _run(walker, [Essay(text=str(i)) for i in range(8)])
+    assert _active["peak"] == 2
+    metrics = walker.hook_metrics()["Proofreader.slow"]
+    assert metrics["calls"] == 8
+    assert metrics["mean_run_ms"] >= 15
+    assert metrics["max_ms"] >= metrics["p50_ms"]
+
+
+def test_unknown_executor_rejected():
+    with pytest.raises(ValueError):
+        on_visit(Essay, executor="gpu")
@@ -0,0 +1,144 @@
+"""Pipelined adjacency prefetch (``Walker(prefetch_pipeline=True)``).
+
+Walks run on SQLite and JsonDB and must report exactly what the same walk
+reports without the pipeline; the trail summary's ``prefetch`` counters
+show whether hooks were answered from the prefetched adjacency.
+"""
+
+import asyncio
+from typing import Any, List
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+
+
+class Mesa(Node):
+    name: str = ""
+
+
+class Prospector(Walker):
+    @on_visit(Mesa)
+    async def survey(self, here):
+        await self.report(here.name)
+        await self.visit(await here.nodes())
+
+
+class Trailblazer(Walker):
+    @on_visit(Mesa, parallel_safe=True)
+    async def survey(self, here):
+        await self.report(here.name)
+        await self.visit(await here.nodes())
+
+
+class Grower(Walker):
+    """The first child visited adds an edge to its already queued sibling."""
+
+    @on_visit(Mesa)
+    async def survey(self, here):
+        await self.report(here.name)
+        if here.name in ("a", "b") and not await Mesa.find({"context.name": "late"}):
+            other = "b" if here.name == "a" else "a"
+            sibling = (await Mesa.find({"context.name": other}))[0]
+            await sibling.connect(await Mesa.create(name="late"))
+        await self.visit(await here.nodes())
+
+
+class Passerby(Walker):
+    @on_visit(Mesa)
+    async def survey(self, here):
+        await self.report(here.name)
+
+
+async def _tree(depth: int = 3, fanout: int = 3) -> List[Mesa]:
+    """Tree of ``Mesa`` nodes; returns every node, root first."""
+    root = await Mesa.create(name="r")
+    nodes, level = [root], [root]
+    for _ in range(depth):
+        children = []
+        for parent in level:
+            for i in range(fanout):
+                child = await Mesa.create(name=f"{parent.name}{i}")
+                await parent.connect(child)
+                children.append(child)
+        nodes.extend(children)
+        level = children
+    return nodes
+
+
+async def _walk(walker: Walker, root: Node) -> List[Any]:
+    await walker.spawn(root)
+    return await walker.get_report()
+
+
+class TestPrefetchPipeline:
+    async def test_hooks_are_answered_from_the_pipeline(self, ctx):
+        nodes = await _tree()
+        expected = await _walk(Prospector(), nodes[0])
+
+        walker = Prospector(prefetch_pipeline=True, frontier_batch_size=4)
+        # Neighbor order is not defined by ``nodes()``; the set visited is.
+        assert sorted(await _walk(walker, nodes[0])) == sorted(expected)
+        stats = walker.get_trail_summary()["prefetch"]
+        assert stats["hits"] == len(nodes)
+        assert stats["misses"] == 0
+        assert stats["wasted"] == 0
+        assert 1 <= stats["depth"] <= 4
+
+    async def test_concurrent_frontier_uses_the_pipeline(self, ctx):
+        nodes = await _tree()
+        walker = Trailblazer(
+            prefetch_pipeline=True, concurrency=4, frontier_batch_size=4
+        )
+        reports = await _walk(walker, nodes[0])
+        assert sorted(reports) == sorted(n.name for n in nodes)
+        assert walker.get_trail_summary()["prefetch"]["hits"] == len(nodes)
+
+    async def test_unused_adjacency_counts_as_wasted(self, ctx):
+        nodes = await _tree(depth=2)
+        walker = Passerby(prefetch_pipeline=True, frontier_batch_size=2)
+        await walker.queue.append(nodes)
+        await walker.run()
+        stats = walker.get_trail_summary()["prefetch"]
+        assert stats["hits"] == 0
+        assert stats["wasted"] > 0
+        assert stats["fetches"] > 0
+
+    async def test_connect_invalidates_prefetched_adjacency(self, ctx):
+        root = await Mesa.create(name="r")
+        for name in ("a", "b"):
+            await root.connect(await Mesa.create(name=name))
+
+        walker = Grower(prefetch_pipeline=True, frontier_batch_size=1)
+        assert sorted(await _walk(walker, root)) == ["a", "b", "late", "r"]
+
+    async def test_in_flight_queries_are_bounded(self, ctx, monkeypatch):
+        nodes = await _tree()
+        bulk = ctx.nodes_bulk
+        running, peak = 0, 0
+
+        async def slow_bulk(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                await asyncio.sleep(0.005)
+                return await bulk(*args, **kwargs)
+            finally:
+                running -= 1
+
+        monkeypatch.setattr(ctx, "nodes_bulk", slow_bulk)
+        walker = Prospector(
+            prefetch_pipeline=True,
+            frontier_batch_size=2,
+            prefetch_max_in_flight=1,
+            prefetch_batches=2,
+        )
+        assert len(await _walk(walker, nodes[0])) == len(nodes)
+        assert peak == 1
+        assert walker.get_trail_summary()["prefetch"]["depth"] <= 2
+
+    async def test_summary_has_no_prefetch_section_when_disabled(self, ctx):
+        nodes = await _tree(depth=1)
+        walker = Prospector()
+        await _walk(walker, nodes[0])
+        assert "prefetch" not in walker.get_trail_summary()
@@ -0,0 +1,189 @@
+"""Heap-backed priority queue mode (``Walker(queue="priority")``).
+
+The queue itself is exercised directly with in-memory nodes; the walker
+tests check best-first order through frontier batching, neighbor
+prefetch (SQLite and JsonDB) and the concurrent requeue path.
+"""
+
+from typing import Any, List
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, PriorityWalkerQueue, Walker
+
+
+class Lantern(Node):
+    name: str = ""
+    cost: float = 0.0
+
+
+class Lamplighter(Walker):
+    seen: List[str] = []
+
+    @on_visit(Lantern)
+    async def light(self, here):
+        self.seen.append(here.name)
+
+
+class Ranger(Walker):
+    seen: List[str] = []
+
+    @on_visit(Lantern, parallel_safe=True)
+    async def patrol(self, here):
+        self.seen.append(here.name)
+        if here.name == "pause":
+            self.pause("hold")
+
+
+def _lanterns(*costs: float) -> List[Lantern]:
+    return [Lantern(name=f"n{c:g}", cost=c) for c in costs]
+
+
+def _names(nodes: List[Any]) -> List[str]:
+    return [n.name for n in nodes]
+
+
+class TestPriorityWalkerQueue:
+    async def test_pops_lowest_priority_first_with_fifo_ties(self):
+        queue = PriorityWalkerQueue(key=lambda n: n.cost)
+        a, b, c, d = _lanterns(3, 1, 2, 1)
+        d.name = "n1b"
+        await queue.append([a, b, c, d])
+        assert len(queue) == 4
+        assert _names(queue.peek(2)) == ["n1", "n1b"]
+        assert _names(queue.to_list()) == ["n1", "n1b", "n2", "n3"]
+        assert [queue.popleft().name for _ in range(4)] == ["n1", "n1b", "n2", "n3"]
+        assert not queue
+        with pytest.raises(IndexError):
+            queue.popleft()
+
+    async def test_explicit_priority_overrides_key(self):
+        queue = PriorityWalkerQueue(key=lambda n: n.cost)
+        a, b = _lanterns(1, 2)
+        await queue.append([a])
+        await queue.visit([b], priority=0)
+        assert queue.popleft() is b
+
+    async def test_decrease_key_keeps_lower_priority(self):
+        queue = PriorityWalkerQueue()
+        a, b, c = _lanterns(0, 0, 0)
+        await queue.append([a], priority=5)
+        await queue.append([b], priority=3)
+        await queue.append([c], priority=4)
+        await queue.append([a], priority=1)
+        await queue.append([b], priority=9)
+        assert len(queue) == 3
+        assert queue.priority_of(a) == 1
+        assert queue.priority_of(b) == 3
+        assert [queue.popleft() for _ in range(3)] == [a, b, c]
+        assert not queue
+
+    async def test_stale_entries_are_compacted(self):
+        queue = PriorityWalkerQueue()
+        node = Lantern(name="x")
+        for priority in range(1000, 0, -1):
+            await queue.append([node], priority=priority)
+        assert len(queue) == 1
+        assert len(queue._heap) <= 2 * len(queue) + 65
+        assert queue.popleft() is node
+
+    async def test_dequeue_and_contains(self):
+        queue = PriorityWalkerQueue(key=lambda n: n.cost)
+        a, b, c = _lanterns(1, 2, 3)
+        await queue.append([a, b, c])
+        assert b in queue
+        assert await queue.dequeue([b, Lantern()]) == [b]
+        assert b not in queue
+        assert [queue.popleft() for _ in range(2)] == [a, c]
+
+    async def test_max_size_drops_new_nodes_but_allows_decrease_key(self):
+        queue = PriorityWalkerQueue(max_size=2, key=lambda n: n.cost)
+        a, b, c = _lanterns(5, 6, 1)
+        await queue.append([a, b, c])
+        assert len(queue) == 2
+        assert c not in queue
+        await queue.append([b], priority=0)
+        assert queue.popleft() is b
+
+    async def test_prepend_goes_first_in_given_order(self):
+        queue = PriorityWalkerQueue(key=lambda n: n.cost)
+        a, b, c, d = _lanterns(0, 7, 8, 9)
+        await queue.append([a])
+        await queue.prepend([b, c])
+        await queue.add_next([d])
+        assert [queue.popleft() for _ in range(4)] == [d, b, c, a]
+
+    async def test_positional_inserts_are_rejected(self):
+        queue = PriorityWalkerQueue()
+        a, b = _lanterns(1, 2)
+        await queue.append([a])
+        with pytest.raises(NotImplementedError):
+            await queue.insert_after(a, [b])
+        with pytest.raises(NotImplementedError):
+            await queue.insert_before(a, [b])
+
+
+class TestPriorityWalker:
+    async def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            Lamplighter(queue="lifo")
+
+    async def test_priority_requires_priority_mode(self):
+        walker = Lamplighter()
+        with pytest.raises(ValueError):
+            await walker.visit(Lantern(), priority=1)
+
+    @pytest.mark.parametrize("batch", [1, 3])
+    async def test_runs_best_first(self, batch):
+        walker = Lamplighter(
+            queue="priority",
+            queue_key=lambda n: n.cost,
+            frontier_batch_size=batch,
+            seen=[],
+        )
+        nodes = _lanterns(4, 2, 5, 1, 3)
+        await walker.visit(nodes)
+        await walker.run()
+        assert walker.seen == ["n1", "n2", "n3", "n4", "n5"]
+
+    async def test_concurrent_pause_requeues_remaining_batch(self):
+        walker = Ranger(
+            queue="priority",
+            queue_key=lambda n: n.cost,
+            concurrency=2,
+            frontier_batch_size=4,
+            seen=[],
+        )
+        pause = Lantern(name="pause", cost=2)
+        await walker.visit([*_lanterns(4, 3, 1), pause])
+        await walker.run()
+        assert walker.paused
+        assert walker.seen == ["n1", "pause"]
+        assert _names(await walker.get_queue()) == ["n3", "n4"]
+        walker.seen = []
+        await walker.resume()
+        assert walker.seen == ["n3", "n4"]
+        assert not walker.queue
+
+
+async def test_best_first_with_neighbor_prefetch(ctx):
+    """``root -> a(5), b(1), c(3)``; ``b -> d(0)``: cheapest frontier first."""
+    root = await Lantern.create(name="root", cost=0)
+    a = await Lantern.create(name="a", cost=5)
+    b = await Lantern.create(name="b", cost=1)
+    c = await Lantern.create(name="c", cost=3)
+    d = await Lantern.create(name="d", cost=0)
+    for child in (a, b, c):
+        await root.connect(child)
+    await b.connect(d)
+
+    walker = Lamplighter(
+        queue="priority",
+        queue_key=lambda n: n.cost,
+        prefetch_neighbors=True,
+        speculative_prefetch=True,
+        seen=[],
+    )
+    await walker.spawn(root)
+    assert walker.seen == ["root", "b", "d", "c", "a"]
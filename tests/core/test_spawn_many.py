@@ -0,0 +1,159 @@
+"""Batch spawning (``Walker.spawn_many``) over a shared request-scoped cache.
+
+The process-wide entity cache is disabled so every read that is not
+answered by the request identity map reaches the database.
+"""
+
+import asyncio
+from collections import Counter
+from typing import ClassVar, List
+
+import pytest
+
+from jvspatial.cache.memory import MemoryCache
+from jvspatial.core import on_visit
+from jvspatial.core.context import (
+    _request_identity_map,
+    begin_request_identity_map,
+    end_request_identity_map,
+)
+from jvspatial.core.entities import Node, Walker
+from jvspatial.exceptions import WalkerExecutionError
+
+
+class Orbit(Node):
+    name: str = ""
+
+
+class Comet(Node):
+    name: str = ""
+
+
+class Stargazer(Walker):
+    @on_visit(Orbit)
+    async def observe(self, here):
+        await self.report(here.name)
+        await self.visit(await here.nodes())
+
+
+class Tracker(Walker):
+    running: ClassVar[int] = 0
+    peak: ClassVar[int] = 0
+
+    @on_visit(Orbit)
+    async def observe(self, here):
+        Tracker.running += 1
+        Tracker.peak = max(Tracker.peak, Tracker.running)
+        await asyncio.sleep(0.002)
+        Tracker.running -= 1
+        await self.visit(await here.nodes())
+
+
+@pytest.fixture
+def graph_cache():
+    """No process-wide entity cache: every miss reaches the database."""
+    return MemoryCache(max_size=0)
+
+
+async def _chain(length: int = 6) -> List[Orbit]:
+    """``o0 -> o1 -> ... -> o{length-1}``: later starts overlap earlier ones."""
+    nodes = [await Orbit.create(name=f"o{i}") for i in range(length)]
+    for a, b in zip(nodes, nodes[1:]):
+        await a.connect(b)
+    return nodes
+
+
+def _count_reads(ctx, monkeypatch) -> Counter:
+    """Count node ids read from the database by ``get``/``get_batch``."""
+    reads: Counter = Counter()
+    read_batch, load = ctx._read_batch, ctx._load
+
+    async def counting_read_batch(entity_class, ids, out):
+        reads.update(ids)
+        await read_batch(entity_class, ids, out)
+
+    async def counting_load(entity_class, entity_id):
+        reads[entity_id] += 1
+        return await load(entity_class, entity_id)
+
+    monkeypatch.setattr(ctx, "_read_batch", counting_read_batch)
+    monkeypatch.setattr(ctx, "_load", counting_load)
+    return reads
+
+
+class TestSpawnMany:
+    async def test_reports_come_back_per_walker_in_order(self, ctx):
+        nodes = await _chain()
+        reports = await Walker.spawn_many(
+            [(Stargazer(), node) for node in nodes], concurrency=3
+        )
+        assert reports == [[f"o{i}" for i in range(s, 6)] for s in range(6)]
+        assert _request_identity_map.get() is None
+
+    async def test_each_entity_is_read_once(self, ctx, monkeypatch):
+        nodes = await _chain()
+        reads = _count_reads(ctx, monkeypatch)
+        for node in nodes:
+            await Stargazer().spawn(node)
+        assert reads[nodes[1].id] == 1
+        assert reads[nodes[5].id] == 5
+
+        reads.clear()
+        await Walker.spawn_many([(Stargazer(), node) for node in nodes])
+        assert set(reads.values()) == {1}
+        assert set(reads) == {node.id for node in nodes[1:]}
+
+    async def test_concurrency_bounds_running_walkers(self, ctx):
+        nodes = await _chain(3)
+        Tracker.running = Tracker.peak = 0
+        await Walker.spawn_many(
+            [(Tracker(), nodes[0]) for _ in range(6)], concurrency=2
+        )
+        assert Tracker.peak == 2
+
+    async def test_reuses_an_active_identity_map(self, ctx):
+        nodes = await _chain(3)
+        token = begin_request_identity_map()
+        try:
+            await Walker.spawn_many([(Stargazer(), nodes[0])])
+            imap = _request_identity_map.get()
+            assert nodes[2].id in imap
+        finally:
+            end_request_identity_map(token)
+
+    async def test_a_failing_walker_cancels_the_rest(self, ctx):
+        nodes = await _chain()
+        with pytest.raises(WalkerExecutionError):
+            await Walker.spawn_many(
+                [(Stargazer(max_steps=2), nodes[0]), (Tracker(), nodes[0])]
+            )
+        assert _request_identity_map.get() is None
+
+
+async def test_concurrent_gets_share_one_read(ctx, monkeypatch):
+    node = await Orbit.create(name="shared")
+    reads = _count_reads(ctx, monkeypatch)
+    token = begin_request_identity_map()
+    try:
+        loaded = await asyncio.gather(
+            *(ctx.get(Orbit, node.id) for _ in range(5)),
+            ctx.get_batch(Orbit, [node.id]),
+        )
+    finally:
+        end_request_identity_map(token)
+    assert reads[node.id] == 1
+    assert {entity.name for entity in loaded[:5]} == {"shared"}
+    assert [entity.name for entity in loaded[5]] == ["shared"]
+
+
+async def test_batch_skips_an_in_flight_read_of_another_class(ctx):
+    node = await Orbit.create(name="shared")
+    token = begin_request_identity_map()
+    try:
+        as_orbit, as_comet = await asyncio.gather(
+            ctx.get(Orbit, node.id), ctx.get_batch(Comet, [node.id])
+        )
+    finally:
+        end_request_identity_map(token)
+    assert as_orbit.name == "shared"
+    assert as_comet == []
@@ -7,15 +7,20 @@ Covers:
   external service).
 * Walker.restore() rehydrates the trail and the in-process counter so
   subsequent steps continue past the persisted history.
+* DBTrailStore buffering: batched ``bulk_save`` writes, bounded
+  in-flight writes, and flushes at ``run()`` exit and pause.
 """
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from typing import Iterator
 
 import pytest
 
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node
 from jvspatial.core.entities.walker import Walker
 from jvspatial.core.entities.walker_components.trail_store import (
     DBTrailStore,
@@ -141,6 +146,8 @@ class TestWalkerRestore:
         w = Walker(trail_store=store)
         await w._trail_tracker.arecord_step("n.A")
         await w._trail_tracker.arecord_step("n.B")
+        # Steps are buffered; ``Walker.run()`` flushes on exit.
+        await w._trail_tracker.flush()
 
         # Simulate cold start: discard the old store-counter cache by
         # constructing a fresh DBTrailStore wrapping the same DB.
@@ -162,3 +169,110 @@ class TestWalkerRestore:
         # store + walker_id.
         w._trail_tracker.record_step("n.A")
         assert w._trail_tracker.get_length() == 1
+
+
+# ---- DBTrailStore buffering ------------------------------------------------
+
+
+class _RecordingDB:
+    """JsonDB proxy counting writes and tracking concurrent ``bulk_save``."""
+
+    def __init__(self, inner: JsonDB, delay: float = 0.0) -> None:
+        self.inner = inner
+        self.delay = delay
+        self.calls: dict = {}
+        self.in_flight = 0
+        self.peak = 0
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def save(self, collection, record):
+        self._count("save")
+        return await self.inner.save(collection, record)
+
+    async def bulk_save(self, collection, records):
+        self._count("bulk_save")
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return await self.inner.bulk_save(collection, records)
+        finally:
+            self.in_flight -= 1
+
+    def find_iter(self, collection, query, **kwargs):
+        self._count("find_iter")
+        return self.inner.find_iter(collection, query, **kwargs)
+
+    async def find(self, collection, query, **kwargs):
+        self._count("find")
+        return await self.inner.find(collection, query, **kwargs)
+
+    async def delete(self, collection, rec_id):
+        return await self.inner.delete(collection, rec_id)
+
+
+class Waystation(Node):
+    name: str = ""
+
+
+class Pilgrim(Walker):
+    @on_visit(Waystation)
+    async def rest(self, here):
+        if here.name == "pause":
+            self.pause("hold")
+
+
+class TestDBTrailStoreBuffering:
+    async def test_appends_are_written_in_batches(self, jsondb_fixture: JsonDB) -> None:
+        db = _RecordingDB(jsondb_fixture)
+        store = DBTrailStore(db, batch_size=100, flush_interval=60)
+        for i in range(250):
+            await store.append("w.1", {"node": f"n.{i}"})
+        await asyncio.sleep(0)  # let the background writes start
+        assert db.calls == {"bulk_save": 2}
+        loaded = await store.load("w.1", since=120)
+        assert [s["node"] for s in loaded] == [f"n.{i}" for i in range(120, 250)]
+        assert db.calls["bulk_save"] == 3
+        assert db.calls["find_iter"] == 1
+        assert "save" not in db.calls and "find" not in db.calls
+
+    async def test_flush_interval_bounds_buffer_age(
+        self, jsondb_fixture: JsonDB
+    ) -> None:
+        db = _RecordingDB(jsondb_fixture)
+        store = DBTrailStore(db, batch_size=1000, flush_interval=0)
+        for i in range(3):
+            await store.append("w.1", {"node": f"n.{i}"})
+        await store.flush("w.1")
+        assert db.calls["bulk_save"] == 3
+
+    async def test_in_flight_writes_are_bounded(self, jsondb_fixture: JsonDB) -> None:
+        db = _RecordingDB(jsondb_fixture, delay=0.02)
+        store = DBTrailStore(db, batch_size=5, max_in_flight=2)
+        for i in range(60):
+            await store.append("w.1", {"node": f"n.{i}"})
+        assert db.peak <= 2
+        assert len(store._in_flight) <= 2
+        assert len(await store.load("w.1")) == 60
+
+    async def test_run_flushes_for_restore(self, jsondb_fixture: JsonDB) -> None:
+        db = _RecordingDB(jsondb_fixture)
+        walker = Pilgrim(trail_store=DBTrailStore(db, batch_size=64))
+        await walker.queue.append([Waystation(name=str(i)) for i in range(150)])
+        await walker.run()
+        assert db.calls == {"bulk_save": 3}
+
+        restored = await Walker.restore(walker.id, store=DBTrailStore(jsondb_fixture))
+        assert restored.get_trail() == walker.get_trail()
+        assert restored.get_trail_length() == 150
+
+    async def test_pause_flushes(self, jsondb_fixture: JsonDB) -> None:
+        walker = Pilgrim(trail_store=DBTrailStore(jsondb_fixture))
+        nodes = [Waystation(name="a"), Waystation(name="pause"), Waystation()]
+        await walker.queue.append(nodes)
+        await walker.run()
+        assert walker.paused
+        persisted = await DBTrailStore(jsondb_fixture).load(walker.id)
+        assert [s["node"] for s in persisted] == [nodes[0].id, nodes[1].id]
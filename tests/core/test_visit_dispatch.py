@@ -0,0 +1,128 @@
+"""Cached visit-hook dispatch tables (``_visit_hooks.dispatch_table``).
+
+``Walker._execute_visit_hooks`` resolves its hooks once per (walker class,
+target class). These tests pin the resolution order and deduplication the
+per-visit lookup used to do, and check the cache is dropped when classes
+are defined or hook registries are edited.
+"""
+
+from typing import List
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.core.entities._visit_hooks import (
+    _dispatch_tables,
+    dispatch_table,
+    invalidate_dispatch_tables,
+)
+
+
+class Beacon(Node):
+    name: str = ""
+
+    @on_visit("Scout")
+    def by_name(self, visitor):
+        visitor.calls.append("node:name")
+
+    @on_visit
+    async def any_walker(self, visitor):
+        visitor.calls.append("node:any")
+
+
+class Relay(Beacon):
+    @on_visit("Scout")
+    async def relay_only(self, visitor):
+        visitor.calls.append("node:relay")
+        await visitor.skip()
+
+
+class Scout(Walker):
+    calls: List[str] = []
+
+    @on_visit(Relay)
+    async def on_relay(self, here):
+        self.calls.append("walker:relay")
+
+    @on_visit(Beacon)
+    def on_beacon(self, here):
+        self.calls.append("walker:beacon")
+
+    @on_visit("Beacon")
+    def on_beacon_name(self, here):
+        self.calls.append("walker:beacon-name")
+
+    @on_visit
+    async def on_anything(self, here):
+        self.calls.append("walker:any")
+
+
+def _names(hooks) -> List[str]:
+    return [hook.__name__ for hook, _ in hooks]
+
+
+def test_table_order_and_async_flags():
+    table = dispatch_table(Scout, Relay)
+    # Exact class, then bases, then the class-name key, then None.
+    assert _names(table.walker_hooks) == ["on_relay", "on_beacon", "on_anything"]
+    assert [is_async for _, is_async in table.walker_hooks] == [True, False, True]
+    assert _names(dispatch_table(Scout, Beacon).walker_hooks) == [
+        "on_beacon",
+        "on_beacon_name",
+        "on_anything",
+    ]
+    assert set(_names(table.target_hooks)) == {"by_name", "relay_only", "any_walker"}
+
+
+def test_table_is_cached_until_invalidated():
+    table = dispatch_table(Scout, Beacon)
+    assert dispatch_table(Scout, Beacon) is table
+    invalidate_dispatch_tables()
+    assert (Scout, Beacon) not in _dispatch_tables
+    assert dispatch_table(Scout, Beacon) == table
+
+
+def test_defining_a_class_invalidates():
+    dispatch_table(Scout, Beacon)
+
+    class LateScout(Scout):
+        pass
+
+    assert _dispatch_tables == {}
+    assert _names(dispatch_table(LateScout, Beacon).walker_hooks) == [
+        "on_beacon",
+        "on_beacon_name",
+        "on_anything",
+    ]
+
+
+async def test_runtime_registration_after_invalidate():
+    extra_calls = []
+
+    def extra(walker, here):
+        extra_calls.append(here.name)
+
+    walker = Scout(calls=[])
+    await walker._execute_visit_hooks(Beacon(name="b"))
+    Scout._visit_hooks.setdefault(Beacon, []).append(extra)
+    try:
+        invalidate_dispatch_tables()
+        await walker._execute_visit_hooks(Beacon(name="b"))
+    finally:
+        Scout._visit_hooks[Beacon].remove(extra)
+        invalidate_dispatch_tables()
+    assert extra_calls == ["b"]
+
+
+async def test_execute_runs_walker_then_node_hooks():
+    walker = Scout(calls=[])
+    await walker._execute_visit_hooks(Beacon(name="b"))
+    assert walker.calls[:3] == ["walker:beacon", "walker:beacon-name", "walker:any"]
+    assert sorted(walker.calls[3:]) == ["node:any", "node:name"]
+
+
+async def test_node_hook_skip_stops_remaining_hooks():
+    walker = Scout(calls=[])
+    await walker._execute_visit_hooks(Relay(name="r"))
+    assert walker.calls[:3] == ["walker:relay", "walker:beacon", "walker:any"]
+    assert "node:relay" in walker.calls
+    assert len(walker.calls) <= 5
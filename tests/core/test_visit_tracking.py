@@ -0,0 +1,175 @@
+"""Compact visit counters and the columnar trail (``visit_tracking=``).
+
+``"compact"`` must behave exactly like the default dict tracking;
+``"bloom"`` may over-count but never under-count. Nodes are in-memory
+instances, so only the walker machinery is exercised.
+"""
+
+from typing import List
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.core.entities.walker_components import (
+    CompactWalkerTrail,
+    CountingBloomFilter,
+    IdInterner,
+    VisitCounter,
+    WalkerTrail,
+)
+from jvspatial.core.entities.walker_components.trail_store import (
+    InMemoryTrailStore,
+)
+from jvspatial.exceptions import InfiniteLoopError
+
+
+class Milestone(Node):
+    name: str = ""
+
+
+class Surveyor(Walker):
+    seen: List[str] = []
+
+    @on_visit(Milestone)
+    async def survey(self, here):
+        self.seen.append(here.name)
+
+
+class TestVisitCounter:
+    def test_counts_discards_and_enumerates(self):
+        counter = VisitCounter()
+        assert counter.add("a") == 1
+        assert counter.add("a") == 2
+        assert counter.add("b") == 1
+        assert len(counter) == 2
+        assert "a" in counter and "z" not in counter
+        counter.discard("b")
+        counter.discard("z")
+        assert counter.count("b") == 0
+        assert dict(counter.items()) == {"a": 2}
+        counter.clear()
+        assert len(counter) == 0 and counter.count("a") == 0
+
+    def test_counts_saturate_at_uint16_max(self):
+        counter = VisitCounter()
+        for _ in range(0xFFFF + 5):
+            counter.add("hot")
+        assert counter.count("hot") == 0xFFFF
+
+    def test_counters_share_an_interner(self):
+        interner = IdInterner()
+        first, second = VisitCounter(interner), VisitCounter(interner)
+        first.add("a")
+        second.add("b")
+        second.add("a")
+        assert len(interner) == 2
+        assert first.count("a") == 1 and first.count("b") == 0
+        assert dict(second.items()) == {"a": 1, "b": 1}
+
+
+class TestCountingBloomFilter:
+    def test_rejects_bad_parameters(self):
+        with pytest.raises(ValueError):
+            CountingBloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            CountingBloomFilter(fp_rate=1.5)
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = CountingBloomFilter(capacity=5000, fp_rate=0.01)
+        ids = [f"n.Milestone.{i}" for i in range(5000)]
+        for node_id in ids:
+            bloom.add(node_id)
+        assert all(node_id in bloom for node_id in ids)
+        misses = sum(f"n.Other.{i}" in bloom for i in range(20000))
+        assert misses / 20000 < 0.03
+        assert bloom.nbytes() < 5000 * 12
+
+    def test_counts_are_upper_bounds_and_discard(self):
+        bloom = CountingBloomFilter(capacity=100, fp_rate=0.01)
+        for _ in range(3):
+            bloom.add("a")
+        assert bloom.count("a") >= 3
+        bloom.discard("a")
+        assert bloom.count("a") >= 2
+        bloom.discard("never")
+        assert list(bloom.items()) == []
+        bloom.clear()
+        assert "a" not in bloom
+
+
+class TestCompactWalkerTrail:
+    async def test_matches_dict_trail(self):
+        dict_trail, compact = WalkerTrail(), CompactWalkerTrail()
+        for trail in (dict_trail, compact):
+            trail.record_step("a")
+            trail.record_step("b", edge_id="e1", cost=2)
+            trail.record_step("a")
+        assert compact.get_trail() == dict_trail.get_trail()
+        assert await compact.get_recent(2) == await dict_trail.get_recent(2)
+        assert await compact.detect_cycles() == await dict_trail.detect_cycles()
+        assert compact.visit_count("a") == dict_trail.visit_count("a") == 2
+
+    async def test_ring_evicts_oldest_steps_and_their_counts(self):
+        trail = CompactWalkerTrail(max_length=3)
+        for node_id in ["a", "b", "a", "c", "d"]:
+            trail.record_step(node_id, tag=node_id)
+        assert trail.get_length() == 3
+        assert [step["node"] for step in trail.get_trail()] == ["a", "c", "d"]
+        assert trail.get_trail()[0]["tag"] == "a"
+        assert trail.visit_count("a") == 1
+        assert trail.visit_count("b") == 0
+        trail.clear_trail()
+        assert trail.get_length() == 0 and trail.visit_count("d") == 0
+
+    async def test_hydrates_from_store(self):
+        store = InMemoryTrailStore()
+        writer = CompactWalkerTrail(store=store, walker_id="w1")
+        for node_id in ["a", "b", "a"]:
+            await writer.arecord_step(node_id)
+        reader = CompactWalkerTrail(store=store, walker_id="w1")
+        assert await reader.hydrate_from_store() == 3
+        assert reader.get_trail() == writer.get_trail()
+        assert reader.visit_count("a") == 2
+
+
+class TestWalkerVisitTracking:
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            Surveyor(visit_tracking="sparse")
+
+    @pytest.mark.parametrize("mode", ["dict", "compact", "bloom"])
+    async def test_walk_reports_the_same_visits(self, mode):
+        a, b, c = (Milestone(name=n) for n in "abc")
+        walker = Surveyor(visit_tracking=mode, seen=[])
+        await walker.queue.append([a, b, a, c, b, a])
+        await walker.run()
+        assert walker.seen == list("abacba")
+        assert walker.get_trail() == [n.id for n in [a, b, a, c, b, a]]
+        assert walker.has_visited(c.id)
+        assert not walker.has_visited(Milestone().id)
+        assert await walker.get_visit_count(a.id) == 3
+        assert walker.is_visited(b)
+        assert walker.get_trail_summary()["unique_nodes"] == 3
+        if mode == "bloom":
+            assert walker.node_visit_counts == {}
+        else:
+            assert walker.node_visit_counts == {a.id: 3, b.id: 2, c.id: 1}
+
+    @pytest.mark.parametrize("mode", ["compact", "bloom"])
+    async def test_max_visits_per_node_still_enforced(self, mode):
+        node = Milestone(name="loop")
+        walker = Surveyor(visit_tracking=mode, max_visits_per_node=3, seen=[])
+        await walker.queue.append([node] * 5)
+        with pytest.raises(InfiniteLoopError):
+            await walker.run()
+        assert walker.seen == ["loop", "loop"]
+
+    async def test_bounded_trail_forgets_evicted_visits(self):
+        nodes = [Milestone(name=str(i)) for i in range(5)]
+        walker = Surveyor(visit_tracking="compact", max_trail_length=2, seen=[])
+        await walker.queue.append(nodes)
+        await walker.run()
+        assert walker.get_trail() == [n.id for n in nodes[-2:]]
+        assert not walker.has_visited(nodes[0].id)
+        assert walker.node_visit_counts[nodes[0].id] == 1
@@ -0,0 +1,157 @@
+"""Concurrent frontier execution (``Walker(concurrency=N)``).
+
+Visits whose hooks are all ``@on_visit(parallel_safe=True)`` overlap up to
+``concurrency`` at a time; everything else keeps sequential semantics.
+Nodes are in-memory instances, so only the walker machinery is exercised.
+"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from jvspatial.core import on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.exceptions import WalkerExecutionError
+
+
+class Parcel(Node):
+    name: str = ""
+    delay: float = 0.0
+
+
+class Locker(Node):
+    name: str = ""
+
+    @on_visit
+    async def unsafe(self, visitor):
+        visitor.seen.append(f"locker:{self.name}")
+
+
+class Courier(Walker):
+    seen: List[str] = []
+    in_flight: int = 0
+    peak: int = 0
+
+    @on_visit(Parcel, Locker, parallel_safe=True)
+    async def deliver(self, here):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            assert self.current_node is here
+            if here.name == "skip":
+                await self.skip()
+            if here.name == "stop":
+                await self.disengage()
+            if here.name == "pause":
+                self.pause("hold")
+            await asyncio.sleep(getattr(here, "delay", 0.0))
+            assert self.current_node is here
+            self.seen.append(here.name)
+            await self.report(here.name)
+        finally:
+            self.in_flight -= 1
+
+
+class Sorter(Courier):
+    @on_visit(Parcel)
+    async def sort(self, here):
+        self.seen.append("sorted")
+
+
+async def _run(walker: Walker, nodes: List[Node]) -> List:
+    await walker.queue.append(nodes)
+    return await walker.run()
+
+
+async def test_parallel_safe_hooks_overlap():
+    parcels = [Parcel(name=str(i), delay=0.05) for i in range(8)]
+    walker = Courier(concurrency=8, seen=[])
+    started = time.perf_counter()
+    await _run(walker, parcels)
+    assert time.perf_counter() - started < 0.3
+    assert walker.peak == 8
+    assert sorted(walker.seen) == sorted(p.name for p in parcels)
+
+
+async def test_concurrency_bounds_in_flight_visits():
+    parcels = [Parcel(name=str(i), delay=0.01) for i in range(10)]
+    walker = Courier(concurrency=3, frontier_batch_size=10, seen=[])
+    await _run(walker, parcels)
+    assert walker.peak == 3
+    assert len(walker.seen) == 10
+
+
+async def test_reports_merge_in_frontier_order():
+    parcels = [Parcel(name=str(i), delay=0.04 - 0.005 * i) for i in range(8)]
+    walker = Courier(concurrency=4, frontier_batch_size=8, seen=[])
+    report = await _run(walker, parcels)
+    assert walker.seen != [p.name for p in parcels]
+    assert report == [p.name for p in parcels]
+
+
+async def test_unsafe_hook_runs_alone():
+    nodes: List[Node] = [Parcel(name="a", delay=0.01), Parcel(name="b", delay=0.01)]
+    nodes.append(Locker(name="l"))
+    nodes.extend(Parcel(name=c, delay=0.01) for c in "cd")
+    walker = Courier(concurrency=4, seen=[])
+    await _run(walker, nodes)
+    # The locker visit waits for a and b, and c/d wait for it.
+    assert walker.seen.index("locker:l") == 3
+    assert set(walker.seen[:2]) == {"a", "b"}
+    assert walker.seen[2] == "l"
+
+    sorter = Sorter(concurrency=4, seen=[])
+    await _run(sorter, [Parcel(name=str(i), delay=0.01) for i in range(4)])
+    assert sorter.peak == 1
+
+
+async def test_default_concurrency_is_sequential():
+    walker = Courier(seen=[])
+    await _run(walker, [Parcel(name=str(i), delay=0.001) for i in range(4)])
+    assert walker.peak == 1
+    assert walker.seen == ["0", "1", "2", "3"]
+
+
+async def test_skip_is_per_visit():
+    walker = Courier(concurrency=4, seen=[])
+    report = await _run(walker, [Parcel(name=n) for n in ["a", "skip", "b"]])
+    assert report == ["a", "b"]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_max_steps_stops_at_same_node(concurrency):
+    walker = Courier(
+        concurrency=concurrency, frontier_batch_size=8, max_steps=5, seen=[]
+    )
+    parcels = [Parcel(name=str(i), delay=0.01) for i in range(8)]
+    with pytest.raises(WalkerExecutionError):
+        await _run(walker, parcels)
+    assert sorted(walker.seen) == ["0", "1", "2", "3"]
+    assert walker._report == ["0", "1", "2", "3"]
+
+
+async def test_disengage_stops_starting_visits():
+    parcels = [Parcel(name="stop")] + [
+        Parcel(name=str(i), delay=0.02) for i in range(5)
+    ]
+    walker = Courier(concurrency=2, seen=[])
+    await _run(walker, parcels)
+    assert walker.seen == ["stop", "0"]
+    assert not walker.queue
+
+
+async def test_pause_requeues_unstarted_visits():
+    parcels = [Parcel(name="pause")] + [
+        Parcel(name=str(i), delay=0.02) for i in range(5)
+    ]
+    walker = Courier(concurrency=2, seen=[])
+    report = await _run(walker, parcels)
+    assert walker.paused
+    assert walker.seen == ["0"]
+    assert [p.name for p in walker.queue.to_list()] == ["1", "2", "3", "4"]
+    assert any("hook_error" in str(item) for item in report)
+
+    await walker.resume()
+    assert walker.seen == ["0", "1", "2", "3", "4"]
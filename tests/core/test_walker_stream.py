@@ -0,0 +1,93 @@
+"""Streaming walker reports (``Walker.stream``).
+
+Nodes are in-memory instances, so only the walker machinery is exercised:
+item order, backpressure on a slow consumer, cancellation when the
+consumer leaves, and errors raised by the traversal.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from jvspatial.core import on_exit, on_visit
+from jvspatial.core.entities import Node, Walker
+from jvspatial.exceptions import WalkerExecutionError
+
+
+class Buoy(Node):
+    name: str = ""
+
+
+class Skipper(Walker):
+    @on_visit(Buoy)
+    async def log(self, here):
+        await self.report(here.name)
+
+    @on_exit
+    async def moor(self):
+        await self.report("moored")
+
+
+class Deckhand(Walker):
+    @on_visit(Buoy, parallel_safe=True)
+    async def log(self, here):
+        await asyncio.sleep(0.001 * (len(here.name) % 3))
+        await self.report(here.name)
+
+
+def _buoys(count: int) -> List[Buoy]:
+    return [Buoy(name=str(i)) for i in range(count)]
+
+
+async def test_yields_reports_in_order_without_keeping_them():
+    walker = Skipper()
+    await walker.queue.append(_buoys(5))
+    assert [item async for item in walker.stream()] == ["0", "1", "2", "3", "4"]
+    assert await walker.get_report() == []
+
+
+async def test_start_node_spawns_and_streams_exit_reports():
+    walker = Skipper()
+    start = Buoy(name="start")
+    assert [item async for item in walker.stream(start)] == ["start", "moored"]
+
+
+async def test_slow_consumer_holds_back_the_traversal():
+    walker = Skipper()
+    await walker.queue.append(_buoys(100))
+    items = walker.stream(buffer=2)
+    assert await items.__anext__() == "0"
+    await asyncio.sleep(0.05)
+    # One item taken, two buffered, one blocked in report().
+    assert walker.get_trail_length() <= 4
+    await items.aclose()
+
+
+async def test_leaving_early_cancels_the_traversal():
+    walker = Skipper()
+    await walker.queue.append(_buoys(100))
+    async for item in walker.stream(buffer=1):
+        if item == "2":
+            break
+    await asyncio.sleep(0.01)
+    assert walker.get_trail_length() < 10
+    assert walker._report_sink is None
+
+
+async def test_concurrent_visits_stream_in_frontier_order():
+    walker = Deckhand(concurrency=4)
+    await walker.queue.append(_buoys(12))
+    assert [item async for item in walker.stream(buffer=1)] == [
+        str(i) for i in range(12)
+    ]
+
+
+async def test_traversal_errors_follow_the_items_before_them():
+    walker = Skipper(max_steps=3)
+    await walker.queue.append(_buoys(10))
+    seen = []
+    with pytest.raises(WalkerExecutionError):
+        async for item in walker.stream():
+            seen.append(item)
+    assert seen == ["0", "1"]
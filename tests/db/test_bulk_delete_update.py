@@ -0,0 +1,235 @@
+"""``delete_many`` / ``update_many`` correctness across adapters.
+
+JsonDB and SQLite run for real; MongoDB is exercised against a mocked
+motor collection (same pattern as ``test_mongodb.py``). The cache and
+observability wrappers are checked against an in-memory backend that
+only implements the abstract surface, so the base-class defaults are
+covered too.
+"""
+
+import tempfile
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from jvspatial.db._cache import CachingDatabase
+from jvspatial.db._observable import ObservableDatabase
+from jvspatial.db.database import Database
+from jvspatial.db.jsondb import JsonDB
+from jvspatial.db.query import QueryEngine
+from jvspatial.db.sqlite import SQLiteDB
+
+
+def _records(n: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": f"n{i}", "v": i, "category": "even" if i % 2 == 0 else "odd"}
+        for i in range(n)
+    ]
+
+
+class _MemoryBackend(Database):
+    """Abstract surface only -- exercises the base-class defaults."""
+
+    def __init__(self) -> None:
+        self.store: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.deletes: List[str] = []
+
+    async def save(self, collection, data):
+        self.store[(collection, str(data["id"]))] = dict(data)
+        return data
+
+    async def get(self, collection, id):
+        rec = self.store.get((collection, str(id)))
+        return dict(rec) if rec is not None else None
+
+    async def delete(self, collection, id):
+        self.deletes.append(id)
+        self.store.pop((collection, str(id)), None)
+
+    async def find(self, collection, query, *, limit=None, sort=None):
+        return [
+            dict(v)
+            for (c, _), v in self.store.items()
+            if c == collection and QueryEngine.match(v, query)
+        ]
+
+
+@pytest.fixture(params=["memory", "jsondb", "sqlite"])
+async def db(request) -> AsyncIterator[Database]:
+    if request.param == "memory":
+        yield _MemoryBackend()
+    elif request.param == "jsondb":
+        with tempfile.TemporaryDirectory() as tmp:
+            yield JsonDB(base_path=tmp)
+    else:
+        sqlite = SQLiteDB(db_path=":memory:")
+        try:
+            yield sqlite
+        finally:
+            await sqlite.close()
+
+
+class TestDeleteMany:
+    async def test_delete_by_query(self, db):
+        await db.bulk_save("node", _records(10))
+        deleted = await db.delete_many("node", {"category": "odd"})
+        assert deleted == 5
+        remaining = await db.find("node", {})
+        assert sorted(r["v"] for r in remaining) == [0, 2, 4, 6, 8]
+
+    async def test_delete_by_ids_skips_missing_and_duplicates(self, db):
+        await db.bulk_save("node", _records(5))
+        deleted = await db.delete_many("node", ["n1", "n1", "n3", "missing"])
+        assert deleted == 2
+        assert set((await db.find_many("node", ["n1", "n3", "n4"])).keys()) == {"n4"}
+
+    async def test_empty_id_list_is_noop(self, db):
+        await db.bulk_save("node", _records(3))
+        assert await db.delete_many("node", []) == 0
+        assert await db.count("node") == 3
+
+    async def test_scoped_to_collection(self, db):
+        await db.bulk_save("node", _records(3))
+        await db.bulk_save("edge", _records(3))
+        assert await db.delete_many("node", {}) == 3
+        assert await db.count("node") == 0
+        assert await db.count("edge") == 3
+
+    async def test_underscore_id_query(self, db):
+        await db.bulk_save("node", _records(3))
+        assert await db.delete_many("node", {"_id": "n2"}) == 1
+        assert await db.get("node", "n2") is None
+
+    async def test_untranslatable_query_falls_back(self, db):
+        await db.bulk_save("node", _records(12))
+        deleted = await db.delete_many("node", {"id": {"$regex": "^n1"}})
+        # n1, n10, n11
+        assert deleted == 3
+        assert await db.count("node") == 9
+
+
+class TestUpdateMany:
+    async def test_set_and_inc(self, db):
+        await db.bulk_save("node", _records(6))
+        updated = await db.update_many(
+            "node",
+            {"category": "even"},
+            {"$set": {"flag": True}, "$inc": {"v": 100}},
+        )
+        assert updated == 3
+        evens = await db.find("node", {"flag": True})
+        assert sorted(r["v"] for r in evens) == [100, 102, 104]
+        odd = await db.get("node", "n1")
+        assert odd["v"] == 1 and "flag" not in odd
+
+    async def test_no_match_returns_zero(self, db):
+        await db.bulk_save("node", _records(2))
+        assert await db.update_many("node", {"v": 99}, {"$set": {"x": 1}}) == 0
+
+    async def test_set_on_insert_ignored(self, db):
+        await db.bulk_save("node", _records(2))
+        await db.update_many("node", {}, {"$setOnInsert": {"born": 1}})
+        assert "born" not in await db.get("node", "n0")
+
+
+class TestSQLiteDeleteManyPushdown:
+    async def test_translated_query_never_loads_rows(self):
+        db = SQLiteDB(db_path=":memory:")
+        try:
+            await db.bulk_save("node", _records(4))
+            with patch.object(
+                db, "find", side_effect=AssertionError("find should not run")
+            ):
+                assert await db.delete_many("node", {"v": {"$gte": 2}}) == 2
+            assert await db.count("node") == 2
+        finally:
+            await db.close()
+
+
+class TestMongoDBBulkOps:
+    @pytest.fixture
+    def mongodb(self):
+        from jvspatial.db.mongodb import MongoDB
+
+        with patch("jvspatial.db.mongodb.AsyncIOMotorClient"):
+            db = MongoDB(uri="mongodb://localhost:27017/test", db_name="test_db")
+        db._client = MagicMock()
+        db._db = MagicMock()
+        collection = AsyncMock()
+        db._db.__getitem__.return_value = collection
+        return db, collection
+
+    async def test_delete_many_ids_use_in_clause(self, mongodb):
+        db, collection = mongodb
+        collection.delete_many.return_value = MagicMock(deleted_count=2)
+        assert await db.delete_many("node", ["a", "b", "a"]) == 2
+        collection.delete_many.assert_called_once_with({"_id": {"$in": ["a", "b"]}})
+
+    async def test_update_many_native(self, mongodb):
+        db, collection = mongodb
+        collection.update_many.return_value = MagicMock(matched_count=4)
+        n = await db.update_many("node", {"v": 1}, {"$set": {"x": 1}})
+        assert n == 4
+        collection.update_many.assert_called_once_with({"v": 1}, {"$set": {"x": 1}})
+
+
+class TestWrappers:
+    async def test_caching_delete_many_ids_invalidates(self):
+        backend = _MemoryBackend()
+        cached = CachingDatabase(backend, max_entries=16, ttl_seconds=60)
+        await backend.bulk_save("node", _records(3))
+        await cached.get("node", "n0")
+        await cached.get("node", "n1")
+
+        assert await cached.delete_many("node", ["n0"]) == 1
+        assert await cached.get("node", "n0") is None
+        assert (await cached.get("node", "n1"))["v"] == 1
+
+    async def test_caching_query_ops_drop_collection(self):
+        backend = _MemoryBackend()
+        cached = CachingDatabase(backend, max_entries=16, ttl_seconds=60)
+        await backend.bulk_save("node", _records(4))
+        await backend.save("edge", {"id": "e0", "v": 0})
+        for rid in ("n0", "n1", "n2"):
+            await cached.get("node", rid)
+        await cached.get("edge", "e0")
+
+        await cached.update_many("node", {"category": "even"}, {"$set": {"v": -1}})
+        assert (await cached.get("node", "n0"))["v"] == -1
+        await cached.delete_many("node", {"category": "odd"})
+        assert await cached.get("node", "n1") is None
+        # Other collections keep their entries.
+        assert cached.cache_stats()["size"] >= 1
+
+    async def test_observable_passthrough(self):
+        backend = _MemoryBackend()
+        observed = ObservableDatabase(backend)
+        await backend.bulk_save("node", _records(4))
+        assert await observed.update_many("node", {}, {"$set": {"seen": 1}}) == 4
+        assert await observed.delete_many("node", {"category": "even"}) == 2
+        assert await backend.count("node") == 2
+
+
+class TestGraphContextDeleteBatch:
+    async def test_delete_batch_issues_one_delete_many(self):
+        from jvspatial.core.context import GraphContext
+        from jvspatial.core.entities import Object
+
+        class BulkThing(Object):
+            n: int = 0
+
+        backend = _MemoryBackend()
+        ctx = GraphContext(database=backend)
+        things = [BulkThing(n=i) for i in range(5)]
+        for t in things:
+            await ctx.save(t)
+
+        with patch.object(
+            backend, "delete_many", wraps=backend.delete_many
+        ) as delete_many:
+            await ctx.delete_batch(things[:3])
+
+        delete_many.assert_called_once()
+        assert await backend.count("object") == 2
+        assert await ctx.get(BulkThing, things[0].id) is None
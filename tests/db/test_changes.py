@@ -0,0 +1,337 @@
+"""``Database.changes`` change-data-capture streams.
+
+SQLite and JsonDB run for real. MongoDB uses a mocked motor change stream;
+Postgres uses a stubbed pool and skips when asyncpg is not installed.
+"""
+
+import asyncio
+import contextlib
+import json
+import tempfile
+from typing import Any, AsyncIterator, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from jvspatial.db import ShardedDatabase
+from jvspatial.db._cache import CachingDatabase
+from jvspatial.db._observable import ObservableDatabase
+from jvspatial.db.database import ChangeEvent, Database, encode_cursor
+from jvspatial.db.jsondb import JsonDB
+from jvspatial.db.sqlite import SQLiteDB
+
+
+async def _drain(db: Database, **kwargs: Any) -> List[ChangeEvent]:
+    return [e async for e in db.changes(follow=False, **kwargs)]
+
+
+async def _write_workload(db: Database) -> None:
+    await db.save("node", {"id": "a", "v": 1})
+    await db.save("node", {"id": "a", "v": 2})
+    await db.bulk_save("edge", [{"id": "e1"}, {"id": "e2"}])
+    await db.update_many("edge", {"id": "e2"}, {"$set": {"w": 5}})
+    await db.delete_many("edge", ["e1"])
+    await db.delete("node", "a")
+
+
+EXPECTED = [
+    ("save", "node", "a"),
+    ("save", "node", "a"),
+    ("save", "edge", "e1"),
+    ("save", "edge", "e2"),
+    ("save", "edge", "e2"),
+    ("delete", "edge", "e1"),
+    ("delete", "node", "a"),
+]
+
+
+@pytest.fixture
+async def sqlite() -> AsyncIterator[SQLiteDB]:
+    db = SQLiteDB(db_path=":memory:", capture_changes=True)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+@pytest.fixture
+def db_options() -> Dict[str, Any]:
+    return {"capture_changes": True}
+
+
+@pytest.fixture
+def captured(graph_db) -> Database:
+    return graph_db
+
+
+class TestLocalAdapters:
+    async def test_every_write_path_is_captured_in_order(self, captured):
+        start = await captured.change_cursor()
+        await _write_workload(captured)
+        events = await _drain(captured, since=start)
+        # bulk_save is concurrent on JsonDB, so compare the bulk pair as a set.
+        got = [(e.op, e.collection, e.id) for e in events]
+        assert got[:2] == EXPECTED[:2]
+        assert sorted(got[2:4]) == EXPECTED[2:4]
+        assert got[4:] == EXPECTED[4:]
+        assert events[4].document == {"id": "e2", "w": 5}
+        assert events[-1].document is None
+        assert all(e.timestamp for e in events)
+
+    async def test_resume_from_event_cursor(self, captured):
+        start = await captured.change_cursor()
+        await _write_workload(captured)
+        events = await _drain(captured, since=start)
+        rest = await _drain(captured, since=events[4].cursor)
+        assert [(e.op, e.id) for e in rest] == [("delete", "e1"), ("delete", "a")]
+        assert await _drain(captured, since=events[-1].cursor) == []
+
+    async def test_collection_filter_and_batching(self, captured):
+        start = await captured.change_cursor()
+        await _write_workload(captured)
+        events = await _drain(captured, collections=["node"], since=start, batch_size=1)
+        assert [(e.op, e.id) for e in events] == [
+            ("save", "a"),
+            ("save", "a"),
+            ("delete", "a"),
+        ]
+
+    async def test_none_starts_at_end_and_empty_replays(self, captured):
+        await captured.save("node", {"id": "old"})
+        assert await _drain(captured) == []
+        assert [e.id for e in await _drain(captured, since=b"")] == ["old"]
+
+    async def test_follow_picks_up_later_writes(self, captured):
+        stream = captured.changes(
+            since=await captured.change_cursor(), poll_interval=0.01
+        )
+        nxt = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        assert not nxt.done()
+        await captured.save("node", {"id": "late"})
+        event = await asyncio.wait_for(nxt, timeout=2)
+        assert event.id == "late"
+        await stream.aclose()
+
+    async def test_foreign_cursor_rejected(self, captured):
+        with pytest.raises(ValueError):
+            await _drain(captured, since=encode_cursor({"token": {"_data": "x"}}))
+
+    async def test_event_dict_is_json(self, captured):
+        start = await captured.change_cursor()
+        await captured.save("node", {"id": "x"})
+        (event,) = await _drain(captured, since=start)
+        assert json.loads(json.dumps(event.to_dict()))["id"] == "x"
+
+
+class TestSQLiteCapture:
+    async def test_prune(self, sqlite):
+        start = await sqlite.change_cursor()
+        await _write_workload(sqlite)
+        events = await _drain(sqlite, since=start)
+        assert await sqlite.prune_changes(events[2].cursor) == 3
+        assert len(await _drain(sqlite, since=b"")) == len(EXPECTED) - 3
+
+    async def test_capture_off_drops_triggers(self, tmp_path):
+        path = tmp_path / "cdc.db"
+        on = SQLiteDB(db_path=path, capture_changes=True)
+        await on.save("node", {"id": "a"})
+        await on.close()
+        off = SQLiteDB(db_path=path)
+        try:
+            await off.save("node", {"id": "b"})
+            with pytest.raises(NotImplementedError):
+                await off.change_cursor()
+            conn = await off._get_connection()
+            cur = await conn.execute("SELECT id FROM record_changes")
+            assert [r[0] for r in await cur.fetchall()] == ["a"]
+        finally:
+            await off.close()
+
+
+class TestCapabilityAndWrappers:
+    async def test_default_adapter_raises(self):
+        db = JsonDB(base_path=tempfile.mkdtemp())
+        assert db.supports_changes is False
+        with pytest.raises(NotImplementedError):
+            await _drain(db)
+
+    async def test_wrappers_delegate(self, sqlite):
+        wrapped = ObservableDatabase(CachingDatabase(sqlite, max_entries=8))
+        assert wrapped.supports_changes is True
+        start = await wrapped.change_cursor()
+        await wrapped.save("node", {"id": "w"})
+        assert [e.id for e in await _drain(wrapped, since=start)] == ["w"]
+
+    async def test_sharded_composite_cursor(self):
+        children = [
+            SQLiteDB(db_path=":memory:", capture_changes=True) for _ in range(3)
+        ]
+        try:
+            db = ShardedDatabase(children)
+            assert db.supports_changes is True
+            start = await db.change_cursor()
+            await db.bulk_save("node", [{"id": f"n{i}"} for i in range(12)])
+            events = await _drain(db, since=start)
+            assert sorted(e.id for e in events) == sorted(f"n{i}" for i in range(12))
+
+            await db.delete("node", "n0")
+            tail = await _drain(db, since=events[-1].cursor)
+            assert [(e.op, e.id) for e in tail] == [("delete", "n0")]
+            assert await db.prune_changes(events[-1].cursor) == 12
+
+            with pytest.raises(ValueError):
+                await _drain(ShardedDatabase(children[:2]), since=start)
+        finally:
+            for c in children:
+                await c.close()
+
+
+class _Stream:
+    def __init__(self, changes: List[Any]) -> None:
+        self._changes = list(changes)
+        self.resume_token = {"_data": "now"}
+
+    async def __aenter__(self) -> "_Stream":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def try_next(self) -> Any:
+        return self._changes.pop(0) if self._changes else None
+
+
+class TestMongoChanges:
+    async def test_change_stream_mapping_and_resume(self):
+        from jvspatial.db.mongodb import MongoDB
+
+        with patch("jvspatial.db.mongodb.AsyncIOMotorClient"):
+            db = MongoDB(uri="mongodb://localhost:27017/test", db_name="test_db")
+        db._client = MagicMock()
+        db._db = MagicMock()
+        db._ensure_connected = AsyncMock()
+        stream = _Stream(
+            [
+                {
+                    "_id": {"_data": "t1"},
+                    "operationType": "update",
+                    "ns": {"db": "test_db", "coll": "node"},
+                    "documentKey": {"_id": "a"},
+                    "fullDocument": {"_id": "a", "id": "a", "v": 2},
+                    "clusterTime": MagicMock(time=1700000000),
+                },
+                {
+                    "_id": {"_data": "t2"},
+                    "operationType": "delete",
+                    "ns": {"db": "test_db", "coll": "node"},
+                    "documentKey": {"_id": "b"},
+                },
+            ]
+        )
+        db._db.watch.return_value = stream
+
+        start = await db.change_cursor()
+        events = await _drain(db, collections=["node"], since=start)
+        assert [(e.op, e.id) for e in events] == [("save", "a"), ("delete", "b")]
+        assert events[0].document["v"] == 2 and events[1].document is None
+        assert events[0].timestamp == 1700000000
+
+        pipeline, kwargs = db._db.watch.call_args
+        assert pipeline[0][0]["$match"]["ns.coll"] == {"$in": ["node"]}
+        assert kwargs["resume_after"] == {"_data": "now"}
+        assert kwargs["full_document"] == "updateLookup"
+
+        await _drain(db, since=events[0].cursor)
+        assert db._db.watch.call_args[1]["resume_after"] == {"_data": "t1"}
+
+
+class TestPostgresChanges:
+    async def test_reads_committed_prefix_in_txid_order(self):
+        pytest.importorskip("asyncpg")
+        from jvspatial.db.postgres import PostgresDB
+
+        sent: List[Any] = []
+        rows: List[Dict[str, Any]] = [
+            {
+                "seq": 7,
+                "txid": 100,
+                "collection": "node",
+                "id": "a",
+                "op": "save",
+                "data": json.dumps({"id": "a"}),
+                "ts": 1.5,
+            },
+            {
+                "seq": 9,
+                "txid": 101,
+                "collection": "node",
+                "id": "a",
+                "op": "delete",
+                "data": None,
+                "ts": 2.5,
+            },
+        ]
+
+        class _Conn:
+            async def execute(self, sql, *params):
+                sent.append((sql, params))
+                return "DELETE 2"
+
+            async def fetchval(self, sql, *params):
+                return 100
+
+            async def fetch(self, sql, *params):
+                sent.append((sql, params))
+                batch, rows[:] = list(rows), []
+                return batch
+
+        class _Pool:
+            @contextlib.asynccontextmanager
+            async def acquire(self):
+                yield _Conn()
+
+        async def _ensure_pool():
+            return _Pool()
+
+        db = PostgresDB(dsn="postgresql://stub/stub", capture_changes=True)
+        db._ensure_pool = _ensure_pool
+
+        events = await _drain(db, collections=["node"])
+        assert [(e.op, e.id) for e in events] == [("save", "a"), ("delete", "a")]
+        assert events[0].document == {"id": "a"} and events[1].document is None
+
+        reads = [(s, p) for s, p in sent if s.startswith("SELECT seq")]
+        sql, params = reads[0]
+        assert "txid < txid_snapshot_xmin(txid_current_snapshot())" in sql
+        assert "ORDER BY txid, seq" in sql
+        assert params == (100, 0, 100, ["node"])
+        # Second poll resumes after the last row delivered.
+        assert reads[1][1][:2] == (101, 9)
+
+        assert await db.prune_changes(events[0].cursor) == 2
+        assert any("CREATE TABLE IF NOT EXISTS public.jv_changes" in s for s, _ in sent)
+
+    async def test_bootstrap_installs_trigger(self):
+        pytest.importorskip("asyncpg")
+        from jvspatial.db.postgres import PostgresDB
+
+        sent: List[str] = []
+
+        class _Conn:
+            async def execute(self, sql, *params):
+                sent.append(sql)
+
+        class _Pool:
+            @contextlib.asynccontextmanager
+            async def acquire(self):
+                yield _Conn()
+
+        async def _ensure_pool():
+            return _Pool()
+
+        db = PostgresDB(dsn="postgresql://stub/stub", capture_changes=True)
+        db._ensure_pool = _ensure_pool
+        await db._bootstrap_collection("Node")
+        trigger = [s for s in sent if "CREATE TRIGGER Node_jv_changes" in s]
+        assert trigger and "jv_capture_change('Node')" in trigger[0]
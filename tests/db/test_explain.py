@@ -0,0 +1,259 @@
+"""``Database.explain`` plans across adapters.
+
+SQLite and JsonDB run for real. MongoDB uses a mocked motor collection
+(same pattern as ``test_mongodb.py``); Postgres and DynamoDB use stubbed
+connections and skip when their optional drivers are not installed.
+"""
+
+import contextlib
+import json
+import tempfile
+from typing import Any, AsyncIterator, Dict, Iterator, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from jvspatial.db import ShardedDatabase
+from jvspatial.db._cache import CachingDatabase
+from jvspatial.db._observable import ObservableDatabase
+from jvspatial.db.database import Database, QueryPlan
+from jvspatial.db.jsondb import JsonDB
+from jvspatial.db.query import QueryEngine
+from jvspatial.db.sqlite import SQLiteDB
+
+
+def _records(n: int) -> List[Dict[str, Any]]:
+    return [{"id": f"n{i}", "context": {"v": i, "tag": f"t{i % 2}"}} for i in range(n)]
+
+
+@pytest.fixture
+async def sqlite() -> AsyncIterator[SQLiteDB]:
+    db = SQLiteDB(db_path=":memory:")
+    try:
+        await db.bulk_save("node", _records(6))
+        yield db
+    finally:
+        await db.close()
+
+
+@pytest.fixture
+def jsondb() -> Iterator[JsonDB]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield JsonDB(base_path=tmp)
+
+
+class TestSQLiteExplain:
+    async def test_translated_query_uses_declared_index(self, sqlite):
+        await sqlite.create_index("node", [("context.tag", 1)])
+        plan = await sqlite.explain("node", {"context.tag": "t1"}, limit=2)
+        assert plan.strategy == "sql"
+        assert plan.pushed_down is True
+        assert plan.index == "idx_node_context_tag"
+        assert plan.limit_pushed_down is True
+        assert "LIMIT ?" in plan.request["sql"]
+        assert plan.request["params"] == ["node", "t1", 2]
+
+    async def test_untranslatable_clause_is_named(self, sqlite):
+        plan = await sqlite.explain(
+            "node",
+            {"context.tag": "t1", "id": {"$regex": "^n"}},
+            sort=[("context.v", -1)],
+            limit=3,
+        )
+        assert plan.strategy == "full_scan"
+        assert plan.pushed_down is False
+        assert plan.pushed_filter == {"context.tag": "t1"}
+        assert plan.residual_filter == {"id": {"$regex": "^n"}}
+        assert plan.sort_pushed_down is False
+        assert plan.limit_pushed_down is False
+        assert "WHERE collection = ?" in plan.request["sql"]
+
+    async def test_untranslatable_sort_withholds_limit(self, sqlite):
+        plan = await sqlite.explain("node", {}, sort=[("bad-field", 1)], limit=2)
+        assert plan.strategy == "sql"
+        assert plan.sort_pushed_down is False
+        assert plan.limit_pushed_down is False
+        assert plan.pushed_down is False
+
+    async def test_plan_matches_find(self, sqlite):
+        query, sort = {"context.v": {"$gte": 2}}, [("context.v", 1)]
+        plan = await sqlite.explain("node", query, sort=sort, limit=2)
+        assert plan.sort_pushed_down is True
+        rows = await sqlite.find("node", query, sort=sort, limit=2)
+        assert [r["context"]["v"] for r in rows] == [2, 3]
+        json.dumps(plan.to_dict())
+
+
+class TestJsonDBExplain:
+    async def test_full_scan_with_file_count(self, jsondb):
+        await jsondb.bulk_save("node", _records(4))
+        plan = await jsondb.explain("node", {"context.v": 1}, sort=[("id", 1)], limit=1)
+        assert plan.strategy == "full_scan"
+        assert plan.pushed_down is False
+        assert plan.residual_filter == {"context.v": 1}
+        assert plan.sort_pushed_down is False and plan.limit_pushed_down is False
+        assert plan.estimated_rows == 4
+
+    async def test_missing_collection(self, jsondb):
+        assert (await jsondb.explain("nothing", {})).estimated_rows == 0
+
+
+class _Minimal(Database):
+    async def save(self, collection, data):
+        return data
+
+    async def get(self, collection, id):
+        return None
+
+    async def delete(self, collection, id):
+        return None
+
+    async def find(self, collection, query, *, limit=None, sort=None):
+        return [r for r in [] if QueryEngine.match(r, query)]
+
+
+class TestDefaultsAndWrappers:
+    async def test_base_default_is_unknown(self):
+        plan = await _Minimal().explain("node", {"a": 1})
+        assert isinstance(plan, QueryPlan)
+        assert plan.strategy == "unknown" and plan.pushed_down is None
+
+    async def test_wrappers_delegate(self, sqlite):
+        wrapped = ObservableDatabase(CachingDatabase(sqlite, max_entries=8))
+        plan = await wrapped.explain("node", {"context.tag": "t0"})
+        assert plan.backend == "SQLiteDB" and plan.pushed_down is True
+
+    async def test_sharded_summarizes_children(self, jsondb):
+        children = [SQLiteDB(db_path=":memory:") for _ in range(2)]
+        try:
+            db = ShardedDatabase(children)
+            await db.bulk_save("node", _records(6))
+            plan = await db.explain("node", {"context.tag": "t0"}, limit=2)
+            assert plan.strategy == "fan_out"
+            assert plan.pushed_down is True
+            assert [s["shard"] for s in plan.details["shards"]] == [0, 1]
+
+            mixed = ShardedDatabase([children[0], jsondb])
+            assert (await mixed.explain("node", {"a": 1})).pushed_down is False
+        finally:
+            for c in children:
+                await c.close()
+
+
+class TestMongoExplain:
+    async def test_ixscan_reported(self):
+        from jvspatial.db.mongodb import MongoDB
+
+        with patch("jvspatial.db.mongodb.AsyncIOMotorClient"):
+            db = MongoDB(uri="mongodb://localhost:27017/test", db_name="test_db")
+        db._client = MagicMock()
+        db._db = MagicMock()
+        cursor = MagicMock()
+        cursor.sort.return_value = cursor
+        cursor.limit.return_value = cursor
+        cursor.explain = AsyncMock(
+            return_value={
+                "queryPlanner": {
+                    "winningPlan": {
+                        "stage": "LIMIT",
+                        "inputStage": {
+                            "stage": "FETCH",
+                            "inputStage": {"stage": "IXSCAN", "indexName": "tag_1"},
+                        },
+                    }
+                },
+                "executionStats": {"nReturned": 7},
+            }
+        )
+        db._db.__getitem__.return_value.find.return_value = cursor
+
+        plan = await db.explain("node", {"tag": "x"}, sort=[("v", 1)], limit=5)
+        assert plan.strategy == "index_scan"
+        assert plan.index == "tag_1"
+        assert plan.estimated_rows == 7
+        assert plan.sort_pushed_down is True and plan.limit_pushed_down is True
+        assert plan.details["stages"] == ["LIMIT", "FETCH", "IXSCAN"]
+        cursor.sort.assert_called_once_with([("v", 1)])
+        cursor.limit.assert_called_once_with(5)
+
+
+class TestPostgresExplain:
+    async def test_explain_json_plan(self):
+        pytest.importorskip("asyncpg")
+        from jvspatial.db.postgres import PostgresDB
+
+        sent: List[str] = []
+
+        class _Conn:
+            async def fetchval(self, sql, *params):
+                sent.append(sql)
+                return json.dumps(
+                    [
+                        {
+                            "Plan": {
+                                "Node Type": "Limit",
+                                "Plan Rows": 12,
+                                "Plans": [
+                                    {"Node Type": "Index Scan", "Index Name": "ix_tag"}
+                                ],
+                            }
+                        }
+                    ]
+                )
+
+            async def execute(self, *_a, **_k):
+                return None
+
+        class _Pool:
+            @contextlib.asynccontextmanager
+            async def acquire(self):
+                yield _Conn()
+
+        async def _ensure_pool():
+            return _Pool()
+
+        db = PostgresDB(dsn="postgresql://stub/stub")
+        db._ensure_pool = _ensure_pool
+        db._collections_bootstrapped.add("node")
+
+        plan = await db.explain("node", {"context.tag": "x"}, limit=3)
+        assert sent[0].startswith("EXPLAIN (FORMAT JSON) SELECT data FROM")
+        assert plan.index == "ix_tag"
+        assert plan.estimated_rows == 12
+        assert plan.limit_pushed_down is True
+        assert plan.pushed_down is True
+
+
+class TestDynamoDBExplain:
+    async def test_gsi_query_vs_scan(self):
+        pytest.importorskip("aioboto3")
+        from jvspatial.db.dynamodb import DynamoDB
+
+        db = DynamoDB(table_name="t", region_name="us-east-1")
+        db._ensure_table_exists = AsyncMock(return_value="t_node")
+        db._indexed_fields["node"] = {
+            "context.tag": {"gsi_name": "gsi_tag", "attr_name": "idx_tag"}
+        }
+        client = MagicMock()
+        client.describe_table = AsyncMock(
+            return_value={
+                "Table": {
+                    "ItemCount": 100,
+                    "GlobalSecondaryIndexes": [
+                        {"IndexName": "gsi_tag", "ItemCount": 40}
+                    ],
+                }
+            }
+        )
+        db._get_client = AsyncMock(return_value=client)
+
+        plan = await db.explain("node", {"context.tag": "x", "v": {"$gt": 1}})
+        assert plan.strategy == "gsi_query" and plan.index == "gsi_tag"
+        assert plan.request["operation"] == "Query"
+        assert plan.residual_filter == {"v": {"$gt": 1}}
+        assert plan.estimated_rows == 40
+
+        scan = await db.explain("node", {"v": 1}, sort=[("v", 1)], limit=5)
+        assert scan.strategy == "scan" and scan.pushed_down is False
+        assert "Limit" not in scan.request
+        assert scan.estimated_rows == 100
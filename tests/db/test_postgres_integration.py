@@ -375,6 +375,41 @@ class TestPostgresTraverse:
         assert depths["n.E"] == 2
 
 
+class TestPostgresGraphPaths:
+    async def test_reachable_min_depth(self, pg_db: "PostgresDB") -> None:
+        await _seed_graph(pg_db)
+        out = await pg_db.reachable("edge", "n.A", direction="out", max_depth=3)
+        assert {row["node_id"]: row["depth"] for row in out} == {
+            "n.B": 1,
+            "n.D": 1,
+            "n.C": 2,
+            "n.E": 2,
+        }
+
+    async def test_shortest_path_weighted(self, pg_db: "PostgresDB") -> None:
+        await _seed_graph(pg_db)
+        await pg_db.save(
+            "edge",
+            {
+                "id": "e.ce",
+                "entity": "e",
+                "context": {"distance": 1},
+                "source": "n.C",
+                "target": "n.E",
+            },
+        )
+        hops = await pg_db.shortest_path("edge", "n.A", "n.E", max_depth=3)
+        assert hops["node_ids"] == ["n.A", "n.D", "n.E"]
+        assert hops["cost"] == 2
+        # Missing weights count 1: A-B-C-E costs 3, A-D-E costs 2.
+        weighted = await pg_db.shortest_path(
+            "edge", "n.A", "n.E", max_depth=3, weight="context.distance"
+        )
+        assert weighted["node_ids"] == ["n.A", "n.D", "n.E"]
+        assert weighted["cost"] == 2
+        assert await pg_db.shortest_path("edge", "n.E", "n.A", max_depth=3) is None
+
+
 # ---- Multi-tenant RLS ------------------------------------------------------
 
 
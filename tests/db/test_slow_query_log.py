@@ -0,0 +1,196 @@
+"""Slow-query ring buffer, pushdown reporting and the index advisor.
+
+``slow_query_ms=0`` makes every operation "slow", so the wrapper records
+deterministically without relying on wall-clock timing.
+"""
+
+import json
+import tempfile
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from jvspatial.api.endpoints.db_status import slow_query_report
+from jvspatial.cli import _run_slow_queries, build_parser
+from jvspatial.db._cache import CachingDatabase
+from jvspatial.db._observable import ObservableDatabase, find_observable
+from jvspatial.db._slow_query import (
+    SlowQuery,
+    SlowQueryLog,
+    index_fields_for,
+    normalize_query_shape,
+    suggest_indexes,
+)
+from jvspatial.db.jsondb import JsonDB
+from jvspatial.db.sqlite import SQLiteDB
+
+
+@pytest.fixture
+def jsondb() -> Iterator[JsonDB]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield JsonDB(base_path=tmp)
+
+
+@pytest.fixture
+async def sqlite() -> AsyncIterator[SQLiteDB]:
+    db = SQLiteDB(db_path=":memory:")
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def _entry(shape, *, sort=None, ms=10.0, pushed=False, collection="node"):
+    return SlowQuery(
+        timestamp=0.0,
+        backend="JsonDB",
+        op="find",
+        collection=collection,
+        duration_ms=ms,
+        shape=normalize_query_shape(shape),
+        sort=sort,
+        pushed_down=pushed,
+    )
+
+
+class TestShape:
+    def test_literals_replaced_and_keys_sorted(self):
+        a = normalize_query_shape({"b": 1, "a": {"$gt": 5, "$lt": 9}})
+        b = normalize_query_shape({"a": {"$lt": 0, "$gt": 1}, "b": "x"})
+        assert a == b == {"a": {"$gt": "?", "$lt": "?"}, "b": "?"}
+
+    def test_logical_branches_dedupe(self):
+        shape = normalize_query_shape({"$or": [{"x": 1}, {"x": 2}, {"y": 3}]})
+        assert shape == {"$or": [{"x": "?"}, {"y": "?"}]}
+
+    def test_in_list_collapses(self):
+        assert normalize_query_shape({"k": {"$in": [1, 2, 3]}}) == {"k": {"$in": "?"}}
+
+
+class TestRing:
+    def test_bounded_and_counts_drops(self):
+        log = SlowQueryLog(maxlen=2)
+        for i in range(5):
+            log.record(backend="b", op="find", collection="c", duration_ms=i)
+        assert [e.duration_ms for e in log.entries()] == [3, 4]
+        assert log.dropped == 3
+
+    def test_zero_capacity_disables(self):
+        log = SlowQueryLog(maxlen=0)
+        log.record(backend="b", op="find", collection="c", duration_ms=1)
+        assert len(log) == 0
+
+    def test_round_trip_dict(self):
+        e = _entry({"a": 1}, sort=[("b", -1)])
+        assert SlowQuery.from_dict(json.loads(json.dumps(e.to_dict()))) == e
+
+
+class TestAdvisor:
+    def test_esr_order(self):
+        fields = index_fields_for(
+            normalize_query_shape({"context.age": {"$gte": 1}, "entity": "User"}),
+            [("context.name", -1)],
+        )
+        assert fields == [("entity", 1), ("context.name", -1), ("context.age", 1)]
+
+    def test_id_and_or_are_ignored(self):
+        assert index_fields_for(normalize_query_shape({"id": "x"})) == []
+        assert index_fields_for(normalize_query_shape({"$or": [{"a": 1}]})) == []
+
+    def test_aggregates_and_folds_prefix(self):
+        entries = [
+            _entry({"entity": "A"}, ms=5),
+            _entry({"entity": "B", "context.k": {"$gt": 1}}, ms=20),
+            _entry({"entity": "C", "context.k": {"$lt": 1}}, ms=20, pushed=True),
+            _entry({"v": 1}, ms=1, collection="edge"),
+        ]
+        out = suggest_indexes(entries)
+        assert [s.collection for s in out] == ["node", "edge"]
+        top = out[0]
+        assert top.fields == [("entity", 1), ("context.k", 1)]
+        assert top.occurrences == 3 and top.scans == 2
+        assert top.declaration == (
+            "await db.create_index('node', [('entity', 1), ('context.k', 1)])"
+        )
+        assert out[1].declaration == "await db.create_index('edge', 'v')"
+        assert suggest_indexes(entries, min_occurrences=2) == [top]
+
+
+class TestPushdownStatus:
+    async def test_sqlite(self, sqlite):
+        assert sqlite.pushdown_status("node", {"context.a": 1}) is True
+        assert sqlite.pushdown_status("node", {"a": {"$regex": "x"}}) is False
+        assert sqlite.pushdown_status("node", {}, sort=[("context.a", 1)]) is True
+
+    def test_jsondb_never_pushes_down(self, jsondb):
+        assert jsondb.pushdown_status("node", {"a": 1}) is False
+
+    def test_wrappers_delegate(self, jsondb):
+        wrapped = ObservableDatabase(CachingDatabase(jsondb, max_entries=4))
+        assert wrapped.pushdown_status("node", {"a": 1}) is False
+        assert find_observable(wrapped) is wrapped
+        assert find_observable(CachingDatabase(wrapped, max_entries=4)) is wrapped
+        assert find_observable(jsondb) is None
+
+
+class TestObservableRecording:
+    async def test_slow_ops_recorded_with_shape_and_pushdown(self, sqlite):
+        db = ObservableDatabase(sqlite, slow_query_ms=0)
+        await db.bulk_save("node", [{"id": f"n{i}", "v": i} for i in range(5)])
+        await db.find("node", {"v": {"$gte": 2}}, sort=[("v", -1)], limit=2)
+        await db.count("node", {"v": {"$regex": "1"}})
+        await db.get("node", "n1")
+
+        by_op = {e.op: e for e in db.slow_queries.entries()}
+        find = by_op["find"]
+        assert find.shape == {"v": {"$gte": "?"}}
+        assert find.sort == [("v", -1)]
+        assert find.result_count == 2
+        assert find.pushed_down is True
+        assert by_op["count"].pushed_down is False
+        assert by_op["get"].shape is None and by_op["get"].pushed_down is None
+
+        fields = sorted(s.fields for s in db.suggest_indexes())
+        assert fields == [[("v", -1)], [("v", 1)]]
+
+    async def test_fast_ops_not_recorded(self, jsondb):
+        db = ObservableDatabase(jsondb, slow_query_ms=10_000)
+        await db.find("node", {"a": 1})
+        assert len(db.slow_queries) == 0
+
+    def test_negative_log_size_rejected(self, jsondb):
+        with pytest.raises(ValueError):
+            ObservableDatabase(jsondb, slow_query_log_size=-1)
+
+
+class TestSurfaces:
+    async def test_report_payload(self, jsondb):
+        db = ObservableDatabase(jsondb, slow_query_ms=0)
+        await db.find("node", {"context.name": "a"})
+        report = slow_query_report(db)
+        assert report["enabled"] is True
+        assert report["backend"] == "JsonDB"
+        assert report["entries"][0]["pushed_down"] is False
+        assert report["suggestions"][0]["fields"] == [["context.name", 1]]
+        assert slow_query_report(None)["enabled"] is False
+
+    async def test_cli_reads_saved_report(self, jsondb, tmp_path, capsys):
+        db = ObservableDatabase(jsondb, slow_query_ms=0)
+        for _ in range(2):
+            await db.find("node", {"entity": "User"}, sort=[("context.age", 1)])
+        path = tmp_path / "slow.json"
+        path.write_text(json.dumps(slow_query_report(db)))
+
+        args = build_parser().parse_args(
+            ["slow-queries", "--file", str(path), "--min-occurrences", "2"]
+        )
+        assert _run_slow_queries(args) == 0
+        out = capsys.readouterr().out
+        assert "2 slow operation(s)" in out
+        assert "create_index('node', [('entity', 1), ('context.age', 1)])" in out
+
+    def test_cli_reports_disabled(self, tmp_path):
+        path = tmp_path / "slow.json"
+        path.write_text(json.dumps(slow_query_report(None)))
+        args = build_parser().parse_args(["slow-queries", "--file", str(path)])
+        assert _run_slow_queries(args) == 1
@@ -293,6 +293,24 @@ class TestSQLiteBasicOperations:
         assert result["updated_at"] == 1.0
         assert await sqlite_db.get("batch", "new_sender") is not None
 
+    @pytest.mark.asyncio
+    async def test_find_one_and_update_is_atomic(self, sqlite_db):
+        """Test concurrent conditional updates let exactly one caller win."""
+        await sqlite_db.save("jobs", {"id": "job", "owner": None})
+        results = await asyncio.gather(
+            *(
+                sqlite_db.find_one_and_update(
+                    "jobs",
+                    {"_id": "job", "owner": None},
+                    {"$set": {"owner": f"w{i}"}},
+                )
+                for i in range(8)
+            )
+        )
+        winners = [r for r in results if r is not None]
+        assert len(winners) == 1
+        assert (await sqlite_db.get("jobs", "job"))["owner"] == winners[0]["owner"]
+
     @pytest.mark.asyncio
     async def test_update_record(self, sqlite_db):
         """Test updating records by saving again."""
@@ -9,6 +9,8 @@ from jvspatial.db.work_claim import (
     _CLAIM_FIELD,
     _CLAIM_UNTIL_FIELD,
     claim_record,
+    claimable_query,
+    complete_claim,
     delete_claimed_record,
     release_claim,
 )
@@ -74,6 +76,28 @@ async def test_release_claim_does_not_raise_on_failure():
     await release_claim(db, "col", "id", "tok")  # should not raise
 
 
+@pytest.mark.asyncio
+async def test_complete_claim_merges_update_with_unset():
+    db = _make_db({"_id": "x"})
+    assert await complete_claim(db, "col", "x", "tok", {"$set": {"state": "done"}})
+    query, update = db.find_one_and_update.call_args[0][1:3]
+    assert query == {"_id": "x", _CLAIM_FIELD: "tok"}
+    assert update["$set"] == {"state": "done"}
+    assert set(update["$unset"]) == {_CLAIM_FIELD, _CLAIM_UNTIL_FIELD}
+
+
+@pytest.mark.asyncio
+async def test_complete_claim_false_when_lease_lost():
+    db = _make_db(None)
+    assert await complete_claim(db, "col", "x", "tok") is False
+
+
+def test_claimable_query_matches_unclaimed_or_expired():
+    query = claimable_query(now=100.0)
+    assert {_CLAIM_FIELD: {"$exists": False}} in query["$or"]
+    assert {_CLAIM_UNTIL_FIELD: {"$lt": 100.0}} in query["$or"]
+
+
 @pytest.mark.asyncio
 async def test_delete_claimed_record_success():
     db = _make_db({"_id": "x"})
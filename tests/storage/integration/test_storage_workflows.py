@@ -406,13 +406,13 @@ class TestExpiredProxyCleanup:
             },
         ]
 
-        mock_context.database.find = AsyncMock(return_value=expired_data)
+        mock_context.database.delete_many = AsyncMock(return_value=len(expired_data))
 
         # Run cleanup
         count = await proxy_manager.cleanup_expired()
 
         assert count == 2
-        assert mock_context.database.delete.call_count == 2
+        mock_context.database.delete_many.assert_awaited_once()
 
 
 class TestMultipleFileOperations:
@@ -112,6 +112,7 @@ def mock_context():
     context.database = AsyncMock()
     context.database.find = AsyncMock(return_value=[])
     context.database.delete = AsyncMock()
+    context.database.delete_many = AsyncMock(return_value=0)
     context.database.save = AsyncMock()
     context.database.create_index = AsyncMock()
     context.save = AsyncMock()
@@ -504,17 +505,20 @@ class TestProxyCleanup:
             {"id": "proxy2", "context": {"expires_at": now - timedelta(hours=1)}},
         ]
 
-        mock_context.database.find = AsyncMock(return_value=expired_data)
+        mock_context.database.delete_many = AsyncMock(return_value=len(expired_data))
 
         count = await proxy_manager.cleanup_expired()
 
         assert count == 2
-        assert mock_context.database.delete.call_count == 2
+        mock_context.database.delete_many.assert_awaited_once()
+        collection, query = mock_context.database.delete_many.call_args.args
+        assert collection == "url_proxy"
+        assert {"context.active": False} in query["$or"]
 
     @pytest.mark.asyncio
     async def test_cleanup_no_expired_proxies(self, proxy_manager, mock_context):
         """Test cleanup when no expired proxies exist."""
-        mock_context.database.find = AsyncMock(return_value=[])
+        mock_context.database.delete_many = AsyncMock(return_value=0)
 
         count = await proxy_manager.cleanup_expired()
 
@@ -523,21 +527,14 @@ class TestProxyCleanup:
 
     @pytest.mark.asyncio
     async def test_cleanup_handles_errors(self, proxy_manager, mock_context):
-        """Test cleanup handles individual deletion errors gracefully."""
-        expired_data = [
-            {"id": "proxy1"},
-            {"id": "proxy2"},
-        ]
-
-        mock_context.database.find = AsyncMock(return_value=expired_data)
-        mock_context.database.delete = AsyncMock(
-            side_effect=[None, Exception("Delete failed")]
+        """Test cleanup reports zero when the bulk delete fails."""
+        mock_context.database.delete_many = AsyncMock(
+            side_effect=Exception("Delete failed")
         )
 
         count = await proxy_manager.cleanup_expired()
 
-        # Should still clean up the first proxy despite second failing
-        assert count == 1
+        assert count == 0
 
 
 # ============================================================================
@@ -919,13 +916,13 @@ class TestIntegrationWorkflows:
             {"id": "proxy2", "context": {"expires_at": now - timedelta(hours=1)}},
         ]
 
-        mock_context.database.find = AsyncMock(return_value=expired_data)
+        mock_context.database.delete_many = AsyncMock(return_value=len(expired_data))
 
         # Cleanup expired proxies
         count = await proxy_manager.cleanup_expired()
 
         assert count == 2
-        assert mock_context.database.delete.call_count == 2
+        mock_context.database.delete_many.assert_awaited_once()
 
     @pytest.mark.asyncio
     @patch("jvspatial.storage.managers.proxy.URLProxy", MockURLProxy)